@@ -0,0 +1,145 @@
+"""partition audit_logs by month, JSONB changes and composite indexes
+
+Revision ID: alp001_audit_log_partitions
+Revises: uma001_user_model_access
+Create Date: 2026-10-17
+
+Adds the indexes behind the audit log listing: (entity_type, entity_id,
+timestamp) for entity histories, (user_id, timestamp) for per-user activity
+and (timestamp, log_id) for the keyset-paginated unfiltered listing.
+
+On PostgreSQL audit_logs is also rebuilt as a table partitioned by
+RANGE ("timestamp"), one partition per calendar month from the oldest row to
+three months ahead plus a DEFAULT partition; app/core/audit_partitions.py
+creates later months at startup. The primary key becomes (log_id, timestamp),
+since a partitioned table's keys must include the partition column; log_id
+keeps its sequence. ``changes`` becomes JSONB with a GIN index so key lookups
+inside it (``changes ? 'status'``) are indexed.
+"""
+from datetime import date
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'alp001_audit_log_partitions'
+down_revision: Union[str, None] = 'uma001_user_model_access'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+COMPOSITE_INDEXES = (
+    ('ix_audit_logs_entity_timestamp', ['entity_type', 'entity_id', 'timestamp']),
+    ('ix_audit_logs_user_timestamp', ['user_id', 'timestamp']),
+    ('ix_audit_logs_timestamp_log_id', ['timestamp', 'log_id']),
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_month_partitions(first: date, last: date) -> None:
+    month = first
+    while month <= last:
+        op.execute(
+            f'CREATE TABLE audit_logs_y{month.year:04d}m{month.month:02d} PARTITION OF audit_logs '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    op.execute('CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT')
+
+
+def _create_indexes() -> None:
+    for name, columns in COMPOSITE_INDEXES:
+        op.create_index(name, 'audit_logs', columns)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        _create_indexes()
+        return
+
+    # Move the current table aside, freeing its constraint and index names
+    op.rename_table('audit_logs', 'audit_logs_unpartitioned')
+    op.execute('ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey')
+    op.execute('ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_user_id_fkey TO audit_logs_unpartitioned_user_id_fkey')
+    op.drop_index('ix_audit_logs_log_id', table_name='audit_logs_unpartitioned')
+
+    op.create_table(
+        'audit_logs',
+        sa.Column('log_id', sa.Integer(), nullable=False,
+                  server_default=sa.text("nextval('audit_logs_log_id_seq'::regclass)")),
+        sa.Column('entity_type', sa.String(50), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('action', sa.String(50), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('changes', postgresql.JSONB(), nullable=True),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], name='audit_logs_user_id_fkey'),
+        sa.PrimaryKeyConstraint('log_id', 'timestamp', name='audit_logs_pkey'),
+        postgresql_partition_by='RANGE ("timestamp")',
+    )
+    # Dropping the old table must not drop the sequence with it
+    op.execute('ALTER SEQUENCE audit_logs_log_id_seq OWNED BY audit_logs.log_id')
+
+    oldest = bind.execute(sa.text('SELECT min("timestamp") FROM audit_logs_unpartitioned')).scalar()
+    this_month = date.today().replace(day=1)
+    first = oldest.date().replace(day=1) if oldest is not None else this_month
+    _create_month_partitions(min(first, this_month), _add_months(this_month, MONTHS_AHEAD))
+
+    op.execute("""
+        INSERT INTO audit_logs (log_id, entity_type, entity_id, action, user_id, changes, "timestamp")
+        SELECT log_id, entity_type, entity_id, action, user_id, changes::jsonb, "timestamp"
+        FROM audit_logs_unpartitioned
+    """)
+    op.drop_table('audit_logs_unpartitioned')
+
+    # Indexes on the parent are created on every partition
+    op.create_index('ix_audit_logs_log_id', 'audit_logs', ['log_id'])
+    _create_indexes()
+    op.create_index('ix_audit_logs_changes', 'audit_logs', ['changes'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        for name, _ in COMPOSITE_INDEXES:
+            op.drop_index(name, table_name='audit_logs')
+        return
+
+    op.rename_table('audit_logs', 'audit_logs_partitioned')
+    op.execute('ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey')
+    op.execute('ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_user_id_fkey TO audit_logs_partitioned_user_id_fkey')
+    op.drop_index('ix_audit_logs_log_id', table_name='audit_logs_partitioned')
+    for name, _ in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name='audit_logs_partitioned')
+    op.drop_index('ix_audit_logs_changes', table_name='audit_logs_partitioned')
+
+    op.create_table(
+        'audit_logs',
+        sa.Column('log_id', sa.Integer(), nullable=False,
+                  server_default=sa.text("nextval('audit_logs_log_id_seq'::regclass)")),
+        sa.Column('entity_type', sa.String(50), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('action', sa.String(50), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('changes', sa.JSON(), nullable=True),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], name='audit_logs_user_id_fkey'),
+        sa.PrimaryKeyConstraint('log_id', name='audit_logs_pkey'),
+    )
+    op.execute('ALTER SEQUENCE audit_logs_log_id_seq OWNED BY audit_logs.log_id')
+    op.execute("""
+        INSERT INTO audit_logs (log_id, entity_type, entity_id, action, user_id, changes, "timestamp")
+        SELECT log_id, entity_type, entity_id, action, user_id, changes::json, "timestamp"
+        FROM audit_logs_partitioned
+    """)
+    # Drops every partition with the parent
+    op.drop_table('audit_logs_partitioned')
+    op.create_index('ix_audit_logs_log_id', 'audit_logs', ['log_id'])
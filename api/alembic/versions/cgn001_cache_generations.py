@@ -0,0 +1,35 @@
+"""shared generation counters for in-process caches
+
+Revision ID: cgn001_cache_generations
+Revises: mae001_model_activity_indexes
+Create Date: 2026-10-19
+
+Worker processes cache taxonomy values and user principals in memory. Writes
+bump the cache's row in cache_generations in the same transaction and readers
+compare generations, so every worker drops stale entries on its next request
+instead of waiting for a TTL (app/core/cache_generations.py).
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cgn001_cache_generations'
+down_revision: Union[str, None] = 'mae001_model_activity_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cache_generations',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cache_generations')
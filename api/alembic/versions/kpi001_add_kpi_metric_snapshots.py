@@ -0,0 +1,61 @@
+"""add kpi_metric_snapshots
+
+Revision ID: kpi001_kpi_metric_snapshots
+Revises: bf001_backfill_risk_tiers
+Create Date: 2026-10-16
+
+Materialized daily KPI metric values per region/team scope, written by the
+KPI snapshot job and read by GET /kpi-report/history.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'kpi001_kpi_metric_snapshots'
+down_revision: Union[str, None] = 'bf001_backfill_risk_tiers'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'kpi_metric_snapshots',
+        sa.Column('snapshot_id', sa.Integer(), primary_key=True),
+        sa.Column('as_of_date', sa.Date(), nullable=False),
+        sa.Column('region_id', sa.Integer(), nullable=True, comment='NULL = All Regions'),
+        sa.Column('team_id', sa.Integer(), nullable=True, comment='NULL = All Teams, 0 = Unassigned'),
+        sa.Column('region_name', sa.String(200), nullable=False),
+        sa.Column('team_name', sa.String(200), nullable=False),
+        sa.Column('metric_id', sa.String(20), nullable=False),
+        sa.Column('metric_name', sa.String(255), nullable=False),
+        sa.Column('category', sa.String(100), nullable=False),
+        sa.Column('metric_type', sa.String(20), nullable=False),
+        sa.Column('count_value', sa.Integer(), nullable=True),
+        sa.Column('duration_value', sa.Float(), nullable=True),
+        sa.Column('numerator', sa.Integer(), nullable=True),
+        sa.Column('denominator', sa.Integer(), nullable=True),
+        sa.Column('percentage', sa.Float(), nullable=True),
+        sa.Column('breakdown', sa.JSON(), nullable=True),
+        sa.Column('total_active_models', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('report_generated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_kpi_metric_snapshots_scope_date',
+        'kpi_metric_snapshots',
+        ['region_id', 'team_id', 'as_of_date'],
+    )
+    op.create_index(
+        'ix_kpi_metric_snapshots_metric_date',
+        'kpi_metric_snapshots',
+        ['metric_id', 'as_of_date'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_kpi_metric_snapshots_metric_date', table_name='kpi_metric_snapshots')
+    op.drop_index('ix_kpi_metric_snapshots_scope_date', table_name='kpi_metric_snapshots')
+    op.drop_table('kpi_metric_snapshots')
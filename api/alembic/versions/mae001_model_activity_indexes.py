@@ -0,0 +1,45 @@
+"""(owner, time) indexes behind the model activity stream
+
+Revision ID: mae001_model_activity_indexes
+Revises: alp001_audit_log_partitions
+Create Date: 2026-10-18
+
+The model activity timeline and the dashboard news feed read one keyset page
+of a UNION ALL over the workflow tables (app/core/model_activity.py). These
+indexes let each branch read its newest rows for a model, or for a parent
+request, in index order instead of scanning and sorting the whole history.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'mae001_model_activity_indexes'
+down_revision: Union[str, None] = 'alp001_audit_log_partitions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVITY_INDEXES = (
+    ('model_versions', 'model_id', 'created_at'),
+    ('model_submission_comments', 'model_id', 'created_at'),
+    ('decommissioning_requests', 'model_id', 'created_at'),
+    ('decommissioning_status_history', 'request_id', 'changed_at'),
+    ('model_delegates', 'model_id', 'delegated_at'),
+    ('version_deployment_tasks', 'model_id', 'confirmed_at'),
+    ('model_exceptions', 'model_id', 'detected_at'),
+    ('model_pending_edits', 'model_id', 'requested_at'),
+    ('model_approval_status_history', 'model_id', 'changed_at'),
+    ('attestation_records', 'model_id', 'attested_at'),
+    ('validation_status_history', 'request_id', 'changed_at'),
+    ('recommendation_status_history', 'recommendation_id', 'changed_at'),
+)
+
+
+def upgrade() -> None:
+    for table, owner, occurred_at in ACTIVITY_INDEXES:
+        op.create_index(f'ix_{table}_{owner}_{occurred_at}', table, [owner, occurred_at])
+
+
+def downgrade() -> None:
+    for table, owner, occurred_at in reversed(ACTIVITY_INDEXES):
+        op.drop_index(f'ix_{table}_{owner}_{occurred_at}', table_name=table)
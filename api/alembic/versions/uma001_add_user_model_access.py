@@ -0,0 +1,61 @@
+"""add user_model_access table for materialized row-level security
+
+Revision ID: uma001_user_model_access
+Revises: vdd001_validation_due_dates
+Create Date: 2026-10-17
+
+One row per (user, model) pair visible to a non-privileged user: owner,
+developer, shared owner, shared developer or active delegate of an approved
+model, or the model's submitter. RLS filters semi-join this table instead of
+evaluating the rules per query; app/core/model_access.py keeps it current on
+ORM writes. The table is filled from existing data here.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'uma001_user_model_access'
+down_revision: Union[str, None] = 'vdd001_validation_due_dates'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_model_access',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('model_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['model_id'], ['models.model_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'model_id'),
+    )
+    op.create_index('ix_user_model_access_model_id', 'user_model_access', ['model_id'])
+
+    op.execute("""
+        INSERT INTO user_model_access (user_id, model_id)
+        SELECT owner_id, model_id FROM models
+            WHERE row_approval_status IS NULL AND owner_id IS NOT NULL
+        UNION
+        SELECT developer_id, model_id FROM models
+            WHERE row_approval_status IS NULL AND developer_id IS NOT NULL
+        UNION
+        SELECT shared_owner_id, model_id FROM models
+            WHERE row_approval_status IS NULL AND shared_owner_id IS NOT NULL
+        UNION
+        SELECT shared_developer_id, model_id FROM models
+            WHERE row_approval_status IS NULL AND shared_developer_id IS NOT NULL
+        UNION
+        SELECT d.user_id, d.model_id FROM model_delegates d
+            JOIN models m ON m.model_id = d.model_id
+            WHERE m.row_approval_status IS NULL AND d.revoked_at IS NULL
+        UNION
+        SELECT submitted_by_user_id, model_id FROM models
+            WHERE submitted_by_user_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_model_access_model_id', table_name='user_model_access')
+    op.drop_table('user_model_access')
@@ -0,0 +1,65 @@
+"""add materialized due-date columns to validation_requests
+
+Revision ID: vdd001_validation_due_dates
+Revises: kpi001_kpi_metric_snapshots
+Create Date: 2026-10-16
+
+Stores the values of ValidationRequest's computed due-date properties so
+overdue dashboards can filter with an indexed range query. Existing rows keep
+due_dates_refreshed_at NULL until backfill_validation_due_dates.py runs; the
+dashboards treat such rows as candidates and compute them live.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'vdd001_validation_due_dates'
+down_revision: Union[str, None] = 'kpi001_kpi_metric_snapshots'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('validation_requests', sa.Column(
+        'effective_submission_due_date', sa.Date(), nullable=True,
+        comment='Materialized get_submission_due_date() (override applied)'))
+    op.add_column('validation_requests', sa.Column(
+        'grace_period_end_date', sa.Date(), nullable=True,
+        comment='Materialized submission_grace_period_end'))
+    op.add_column('validation_requests', sa.Column(
+        'validation_due_date', sa.Date(), nullable=True,
+        comment='Materialized model_validation_due_date'))
+    op.add_column('validation_requests', sa.Column(
+        'team_sla_due_date', sa.Date(), nullable=True,
+        comment='Materialized validation_team_sla_due_date (before hold adjustment)'))
+    op.add_column('validation_requests', sa.Column(
+        'lead_time_days', sa.Integer(), nullable=True,
+        comment='Materialized applicable_lead_time_days'))
+    op.add_column('validation_requests', sa.Column(
+        'residual_risk_rating', sa.String(50), nullable=True,
+        comment='Materialized residual_risk'))
+    op.add_column('validation_requests', sa.Column(
+        'due_dates_refreshed_at', sa.DateTime(), nullable=True,
+        comment='When the materialized due-date columns were last recomputed (NULL = never)'))
+
+    op.create_index('ix_validation_requests_effective_submission_due_date',
+                    'validation_requests', ['effective_submission_due_date'])
+    op.create_index('ix_validation_requests_grace_period_end_date',
+                    'validation_requests', ['grace_period_end_date'])
+    op.create_index('ix_validation_requests_validation_due_date',
+                    'validation_requests', ['validation_due_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_validation_requests_validation_due_date', table_name='validation_requests')
+    op.drop_index('ix_validation_requests_grace_period_end_date', table_name='validation_requests')
+    op.drop_index('ix_validation_requests_effective_submission_due_date', table_name='validation_requests')
+    op.drop_column('validation_requests', 'due_dates_refreshed_at')
+    op.drop_column('validation_requests', 'residual_risk_rating')
+    op.drop_column('validation_requests', 'lead_time_days')
+    op.drop_column('validation_requests', 'team_sla_due_date')
+    op.drop_column('validation_requests', 'validation_due_date')
+    op.drop_column('validation_requests', 'grace_period_end_date')
+    op.drop_column('validation_requests', 'effective_submission_due_date')
@@ -13,12 +13,12 @@ import sqlparse
 from sqlparse.sql import Function
 from sqlparse.tokens import Comment, DML, Keyword, Newline, Punctuation, Whitespace, DDL, Name
 
-from app.core.database import get_db, SessionLocal
+from app.core.audit import create_audit_log
+from app.core.database import get_db, ReportingSessionLocal
 from app.core.config import settings
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
 from app.models.user import User
-from app.models.audit_log import AuditLog
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -171,7 +171,8 @@ def _audit_query(
     row_count: int,
     error_detail: str | None,
 ) -> None:
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="AnalyticsQuery",
         entity_id=0,
         action="EXECUTE",
@@ -184,9 +185,8 @@ def _audit_query(
             "row_count": row_count,
             "max_rows": MAX_RESULT_ROWS,
             "error": error_detail[:200] if error_detail else None,
-        },
+        }
     )
-    db.add(audit_log)
     db.commit()
 
 
@@ -298,8 +298,11 @@ def execute_query(
     safe_query = request.query
     safe_params: Dict[str, Any] = {}
 
+    # Return the primary-pool connection used for authentication while the
+    # query runs on the reporting pool; the audit entry below takes a new one
+    db.close()
     try:
-        with SessionLocal() as analytics_db:
+        with ReportingSessionLocal() as analytics_db:
             try:
                 if ANALYTICS_DB_ROLE:
                     role = _validate_role_name(ANALYTICS_DB_ROLE, "analytics role")
@@ -0,0 +1,71 @@
+"""Native async variants of the dashboard news feed and monitoring tasks.
+
+Mounted ahead of the sync routers when ``ASYNC_DB_ENABLED`` is set, so these
+take over the same paths. They run the same steps functions as the sync
+routes (see ``app.core.query_steps``) but await every query on the async
+driver, so a request holds no threadpool worker while it waits on the
+database. The news feed's sections are independent and load concurrently,
+each on its own session.
+
+``/models/``, ``/reports/my-portfolio`` and ``/kpi-report/`` stay sync: their
+ORM code relies on lazy loads throughout and has not been ported.
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api import dashboard, monitoring
+from app.core.database import get_async_db, get_async_session_factory
+from app.core.deps import get_current_user_async
+from app.core.model_access import accessible_model_ids_select
+from app.core.model_activity import activity_page_steps
+from app.core.query_steps import gather_steps, run_steps_async
+from app.core.rls import can_see_all_data
+from app.models.user import User
+from app.schemas.monitoring import MyMonitoringTaskResponse
+
+router = APIRouter()
+
+
+@router.get("/dashboard/news-feed")
+async def get_news_feed_async(
+    cursor: Optional[str] = Query(None, description="cursor of the last entry of the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    factory: async_sessionmaker = Depends(get_async_session_factory),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Async variant of ``GET /dashboard/news-feed``."""
+    after = dashboard.decode_news_feed_cursor(cursor)
+
+    if can_see_all_data(current_user):
+        visible_model_ids = None
+        model_filter = None
+    else:
+        visible_model_ids = frozenset(
+            (await db.execute(accessible_model_ids_select(current_user))).scalars()
+        )
+        if not visible_model_ids:
+            return []
+        model_filter = accessible_model_ids_select(current_user)
+
+    page = await run_steps_async(db, factory, activity_page_steps(
+        dashboard.NEWS_FEED_EVENT_TYPES, model_filter, limit, cursor=after, distinct=True
+    ))
+    entries: dashboard.FeedEntries = {}
+    await gather_steps(factory, *dashboard.news_feed_section_steps(page, visible_model_ids, entries))
+    return dashboard.news_feed_entries(page, entries)
+
+
+@router.get("/monitoring/my-tasks", response_model=List[MyMonitoringTaskResponse])
+async def get_my_monitoring_tasks_async(
+    include_closed: bool = Query(default=False),
+    db: AsyncSession = Depends(get_async_db),
+    factory: async_sessionmaker = Depends(get_async_session_factory),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Async variant of ``GET /monitoring/my-tasks``."""
+    return await run_steps_async(
+        db, factory, monitoring.my_monitoring_task_steps(current_user.user_id, include_closed)
+    )
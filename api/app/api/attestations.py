@@ -11,12 +11,12 @@ from app.core.deps import get_current_user
 from app.core.exception_detection import detect_type2_for_response
 from app.models.user import User
 from app.core.roles import is_admin, is_validator
+from app.core.audit import create_audit_log
 from app.models.model import Model
 from app.models.region import Region
 from app.models.taxonomy import Taxonomy, TaxonomyValue
 from app.models.model_delegate import ModelDelegate
 from app.models.model_pending_edit import ModelPendingEdit
-from app.models.audit_log import AuditLog
 from app.models.attestation import (
     AttestationCycle,
     AttestationCycleStatus,
@@ -108,25 +108,6 @@ router = APIRouter()
 # HELPERS
 # ============================================================================
 
-def create_audit_log(
-    db: Session,
-    entity_type: str,
-    entity_id: int,
-    action: str,
-    user_id: int,
-    changes: dict | None = None
-):
-    """Create an audit log entry for attestation changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def is_clean_attestation(responses: list, decision_comment: Optional[str]) -> bool:
     """
     Check if an attestation is "clean" and should be auto-accepted.
@@ -1,7 +1,10 @@
 """Audit logs routes."""
+from datetime import datetime, timezone
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy import and_, func, or_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session, joinedload
 from app.core.database import get_db
 from app.core.deps import get_current_user
@@ -61,12 +64,33 @@ def list_audit_logs(
     entity_id: Optional[int] = Query(None, description="Filter by specific entity ID"),
     action: Optional[str] = Query(None, description="Filter by action (CREATE, UPDATE, DELETE)"),
     user_id: Optional[int] = Query(None, description="Filter by user who made the change"),
+    changed_field: Optional[str] = Query(
+        None, pattern=r"^[A-Za-z0-9_]+$", description="Only logs whose changes include this top-level key"
+    ),
+    before_timestamp: Optional[datetime] = Query(None, description="Keyset cursor: timestamp of the last log of the previous page"),
+    before_log_id: Optional[int] = Query(None, ge=0, description="Keyset cursor: log_id of the last log of the previous page"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    offset: int = Query(0, ge=0, description="Number of results to skip (deprecated, use the keyset cursor)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List audit logs with optional filters."""
+    """List audit logs with optional filters, newest first.
+
+    Pages are ordered by (timestamp, log_id) descending. Pass the timestamp and
+    log_id of the last log of a page as before_timestamp/before_log_id to fetch
+    the next page; a page shorter than limit is the last one. Unlike offset,
+    the cursor seeks straight to the page through the (timestamp, log_id) index.
+    """
+    if (before_timestamp is None) != (before_log_id is None):
+        raise HTTPException(
+            status_code=400, detail="before_timestamp and before_log_id must be given together"
+        )
+    if before_log_id is not None and offset:
+        raise HTTPException(status_code=400, detail="offset cannot be combined with a keyset cursor")
+    if before_timestamp is not None and before_timestamp.tzinfo is not None:
+        # Stored timestamps are naive UTC
+        before_timestamp = before_timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
     query = db.query(AuditLog).options(joinedload(AuditLog.user))
 
     # Apply filters
@@ -78,11 +102,22 @@ def list_audit_logs(
         query = query.filter(AuditLog.action == action)
     if user_id is not None:
         query = query.filter(AuditLog.user_id == user_id)
-
-    # Order by most recent first, then apply pagination
-    logs = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit).all()
-
-    return logs
+    if changed_field:
+        if db.get_bind().dialect.name == "postgresql":
+            # jsonb ? key, served by the GIN index on changes
+            query = query.filter(type_coerce(AuditLog.changes, JSONB).has_key(changed_field))
+        else:
+            query = query.filter(func.json_type(AuditLog.changes, f'$."{changed_field}"').isnot(None))
+    if before_log_id is not None:
+        query = query.filter(or_(
+            AuditLog.timestamp < before_timestamp,
+            and_(AuditLog.timestamp == before_timestamp, AuditLog.log_id < before_log_id),
+        ))
+
+    query = query.order_by(AuditLog.timestamp.desc(), AuditLog.log_id.desc())
+    if offset:
+        query = query.offset(offset)
+    return query.limit(limit).all()
 
 
 @router.get("/entity-types", response_model=List[str])
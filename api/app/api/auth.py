@@ -1,12 +1,10 @@
 """Authentication routes."""
-import csv
-import io
 import uuid
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_
+from app.core.csv_export import CSVColumn, csv_streaming_response, stream_query
 from app.core.database import get_db
 from app.core.security import verify_password, create_access_token, get_password_hash
 from app.core.deps import get_current_user
@@ -16,7 +14,6 @@ from app.models.model import Model
 from app.models.entra_user import EntraUser
 from app.models.region import Region
 from app.models.lob import LOBUnit
-from app.models.audit_log import AuditLog
 from app.core.roles import (
     RoleCode,
     resolve_role_code,
@@ -25,6 +22,7 @@ from app.core.roles import (
     get_role_display,
     is_admin,
 )
+from app.core.audit import create_audit_log
 from app.schemas.user import (
     LoginRequest,
     Token,
@@ -46,25 +44,6 @@ from app.schemas.model import ModelDetailResponse
 router = APIRouter()
 
 
-def create_audit_log(
-    db: Session,
-    entity_type: str,
-    entity_id: int,
-    action: str,
-    user_id: int,
-    changes: dict | None = None
-):
-    """Create an audit log entry for user management operations."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def get_lob_full_path(db: Session, lob: LOBUnit) -> str:
     """Build full path string from root to this LOB node."""
     path_parts = []
@@ -922,6 +901,29 @@ def delete_entra_user(
     return None
 
 
+def _user_export_columns(db: Session) -> List[CSVColumn]:
+    """User CSV columns; LOB paths are resolved once per LOB."""
+    lob_paths = {}
+
+    def lob_path(user: User) -> str:
+        if not user.lob:
+            return ""
+        if user.lob.lob_id not in lob_paths:
+            lob_paths[user.lob.lob_id] = get_lob_full_path(db, user.lob)
+        return lob_paths[user.lob.lob_id]
+
+    return [
+        CSVColumn("user_id", "User ID", lambda u: u.user_id),
+        CSVColumn("email", "Email", lambda u: u.email),
+        CSVColumn("full_name", "Full Name", lambda u: u.full_name),
+        CSVColumn("role", "Role",
+                  lambda u: u.role_display or get_role_display(get_user_role_code(u))),
+        CSVColumn("lob_code", "LOB Code", lambda u: u.lob.code if u.lob else ""),
+        CSVColumn("lob_name", "LOB Name", lambda u: u.lob.name if u.lob else ""),
+        CSVColumn("lob_path", "LOB Path", lob_path),
+    ]
+
+
 @router.get("/users/export/csv")
 def export_users_csv(
     db: Session = Depends(get_db),
@@ -929,49 +931,11 @@ def export_users_csv(
 ):
     """Export all users to CSV."""
     require_admin_user(current_user)
-    users = db.query(User).options(joinedload(User.lob)).all()
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        "User ID",
-        "Email",
-        "Full Name",
-        "Role",
-        "LOB Code",
-        "LOB Name",
-        "LOB Path"
-    ])
-
-    # Write data rows
-    for user in users:
-        lob_code = user.lob.code if user.lob else ""
-        lob_name = user.lob.name if user.lob else ""
-        lob_path = get_lob_full_path(db, user.lob) if user.lob else ""
-        role_display = user.role_display or get_role_display(get_user_role_code(user))
-        writer.writerow([
-            user.user_id,
-            user.email,
-            user.full_name,
-            role_display,
-            lob_code,
-            lob_name,
-            lob_path
-        ])
-
-    # Reset stream position
-    output.seek(0)
-
-    # Return as streaming response
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=users_export.csv"
-        }
+    users = db.query(User).options(
+        joinedload(User.lob), joinedload(User.role_ref)
+    ).order_by(User.user_id)
+    return csv_streaming_response(
+        stream_query(users), _user_export_columns(db), "users_export.csv", db=db
     )
 
 
@@ -1,26 +1,19 @@
 """Dashboard routes."""
-from typing import List, Any
+from typing import AbstractSet, Dict, List, Any, Optional, Tuple
 from datetime import date
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.models.model import Model
 from app.models.model_submission_comment import ModelSubmissionComment
 from app.models.decommissioning import DecommissioningStatusHistory, DecommissioningRequest
-from app.models.monitoring import (
-    MonitoringCycle,
-    MonitoringCycleApproval,
-    MonitoringCycleModelScope,
-    MonitoringPlanModelSnapshot,
-    MonitoringResult,
-)
-from app.core.monitoring_scope import get_cycle_scope_models
+from app.models.monitoring import MonitoringCycle, MonitoringCycleApproval
+from app.core.monitoring_scope import cycle_scope_model_steps
 from app.models.validation import (
-    ValidationApproval, ValidationRequest, validation_request_models,
-    ValidationStatusHistory
+    ValidationApproval, ValidationRequest, ValidationStatusHistory
 )
 from app.models.recommendation import Recommendation, RecommendationStatusHistory
 from app.models.model_approval_status_history import ModelApprovalStatusHistory
@@ -30,7 +23,10 @@ from app.models.model_exception import ModelException, ModelExceptionStatusHisto
 from app.models.mrsa_review_policy import MRSAReviewPolicy, MRSAReviewException
 from app.models.irp import IRP
 from app.models.taxonomy import TaxonomyValue
-from app.core.rls import apply_model_rls
+from app.core.model_access import accessible_model_ids, accessible_model_ids_select
+from app.core.model_activity import ActivityEvent, activity_page, decode_cursor, source_ids_by_type
+from app.core.query_steps import Steps, run_steps
+from app.core.rls import apply_model_rls, can_see_all_data
 from app.core.mrsa_review_utils import get_mrsa_review_details
 from app.core.rls import apply_model_rls
 from app.schemas.mrsa_review_policy import (
@@ -40,54 +36,26 @@ from app.schemas.mrsa_review_policy import (
 router = APIRouter()
 
 
-@router.get("/news-feed")
-def get_news_feed(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """
-    Get news feed for the dashboard.
+FeedEntries = Dict[Tuple[str, int], dict]
 
-    Returns recent activity for models the user has access to, including:
-    - Comments and actions
-    - Decommissioning status changes
-    - Monitoring cycle completions and approvals
-    - Validation workflow approvals and status changes
-    - Recommendation status changes
-    - Model approval status changes
-    - Attestation submissions and reviews
-    - Model version creations
-    - Model exceptions (detected, acknowledged, closed)
-    """
-    # Get models user has access to
-    models_query = db.query(Model)
-    models_query = apply_model_rls(models_query, current_user, db)
-    accessible_model_ids = [m.model_id for m in models_query.all()]
 
-    if not accessible_model_ids:
-        return []
+def _is_visible(visible_model_ids: Optional[AbstractSet[int]], model_id: int) -> bool:
+    return visible_model_ids is None or model_id in visible_model_ids
+
 
-    # Get recent comments/activities for these models
-    comments = db.query(ModelSubmissionComment).options(
+def _comment_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Comments and actions on the models."""
+    if not ids.get("comment_added"):
+        return
+    comments = (yield select(ModelSubmissionComment).options(
         joinedload(ModelSubmissionComment.user),
         joinedload(ModelSubmissionComment.model)
-    ).filter(
-        ModelSubmissionComment.model_id.in_(accessible_model_ids)
-    ).order_by(ModelSubmissionComment.created_at.desc()).limit(50).all()
+    ).where(ModelSubmissionComment.comment_id.in_(ids["comment_added"]))).scalars().all()
 
-    # Get recent decommissioning status changes for accessible models
-    decom_history = db.query(DecommissioningStatusHistory).options(
-        joinedload(DecommissioningStatusHistory.changed_by),
-        joinedload(DecommissioningStatusHistory.request).joinedload(DecommissioningRequest.model),
-        joinedload(DecommissioningStatusHistory.request).joinedload(DecommissioningRequest.reason)
-    ).join(DecommissioningRequest).filter(
-        DecommissioningRequest.model_id.in_(accessible_model_ids)
-    ).order_by(DecommissioningStatusHistory.changed_at.desc()).limit(50).all()
-
-    # Format response
-    feed = []
     for comment in comments:
-        feed.append({
+        feed[("comment_added", comment.comment_id)] = {
             "id": comment.comment_id,
             "type": "comment" if not comment.action_taken else "action",
             "action": comment.action_taken,
@@ -97,115 +65,120 @@ def get_news_feed(
             "model_id": comment.model_id,
             "entity_link": f"/models/{comment.model_id}",
             "created_at": comment.created_at
-        })
+        }
+
+
+def _decommissioning_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Decommissioning status changes."""
+    if not ids.get("decommissioning_history"):
+        return
+    decom_history = (yield select(DecommissioningStatusHistory).options(
+        joinedload(DecommissioningStatusHistory.changed_by),
+        joinedload(DecommissioningStatusHistory.request).joinedload(DecommissioningRequest.model),
+        joinedload(DecommissioningStatusHistory.request).joinedload(DecommissioningRequest.reason)
+    ).where(DecommissioningStatusHistory.history_id.in_(ids["decommissioning_history"]))).scalars().all()
 
-    # Add decommissioning activity to feed
     for history in decom_history:
-        action_text = _format_decom_action(history)
-        feed.append({
+        feed[("decommissioning_history", history.history_id)] = {
             "id": f"decom_{history.history_id}",
             "type": "decommissioning",
             "action": history.new_status,
-            "text": action_text,
+            "text": _format_decom_action(history),
             "user_name": history.changed_by.full_name,
             "model_name": history.request.model.model_name,
             "model_id": history.request.model_id,
             "entity_link": "/pending-decommissioning",
             "created_at": history.changed_at
-        })
-
-    # Get recent monitoring cycle completions for accessible models
-    accessible_model_id_set = set(accessible_model_ids)
-    scope_exists = db.query(MonitoringCycleModelScope.cycle_id).filter(
-        MonitoringCycleModelScope.cycle_id == MonitoringCycle.cycle_id,
-        MonitoringCycleModelScope.model_id.in_(accessible_model_ids)
-    ).exists()
-    snapshot_exists = db.query(MonitoringPlanModelSnapshot.snapshot_id).filter(
-        MonitoringPlanModelSnapshot.version_id == MonitoringCycle.plan_version_id,
-        MonitoringPlanModelSnapshot.model_id.in_(accessible_model_ids)
-    ).exists()
-    result_exists = db.query(MonitoringResult.result_id).filter(
-        MonitoringResult.cycle_id == MonitoringCycle.cycle_id,
-        MonitoringResult.model_id.in_(accessible_model_ids)
-    ).exists()
-
-    monitoring_cycles = db.query(MonitoringCycle).options(
+        }
+
+
+def _monitoring_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Monitoring cycle completions and approvals."""
+    completed_ids = ids.get("monitoring_cycle_completed", [])
+    approvals = []
+    if ids.get("monitoring_cycle_approval"):
+        approvals = (yield select(MonitoringCycleApproval).options(
+            joinedload(MonitoringCycleApproval.approver),
+            joinedload(MonitoringCycleApproval.region)
+        ).where(MonitoringCycleApproval.approval_id.in_(ids["monitoring_cycle_approval"]))).scalars().all()
+    cycle_ids = set(completed_ids) | {approval.cycle_id for approval in approvals}
+    if not cycle_ids:
+        return
+
+    cycles = (yield select(MonitoringCycle).options(
         joinedload(MonitoringCycle.plan),
-        joinedload(MonitoringCycle.submitted_by),
-        joinedload(MonitoringCycle.completed_by),
-        joinedload(MonitoringCycle.approvals).joinedload(MonitoringCycleApproval.approver),
-        joinedload(MonitoringCycle.approvals).joinedload(MonitoringCycleApproval.region)
-    ).filter(
-        or_(scope_exists, snapshot_exists, result_exists)
-    ).order_by(MonitoringCycle.updated_at.desc()).limit(50).all()
-
-    # Add monitoring activity to feed
-    for cycle in monitoring_cycles:
-        plan_name = cycle.plan.name if cycle.plan else "Unknown Plan"
-        period_text = f"{cycle.period_start_date} to {cycle.period_end_date}"
-
-        # Get model names for context (may be multiple models in a plan)
+        joinedload(MonitoringCycle.completed_by)
+    ).where(MonitoringCycle.cycle_id.in_(cycle_ids))).scalars().all()
+    monitoring_cycles = {cycle.cycle_id: cycle for cycle in cycles}
+
+    # Model names for context (may be multiple models in a plan)
+    cycle_context = {}
+    for cycle in monitoring_cycles.values():
+        cycle_scope = yield from cycle_scope_model_steps(cycle)
         scope_models = [
-            entry for entry in get_cycle_scope_models(db, cycle)
-            if entry["model_id"] in accessible_model_id_set
+            entry for entry in cycle_scope
+            if _is_visible(visible_model_ids, entry["model_id"])
         ]
         model_names = [entry["model_name"] for entry in scope_models if entry.get("model_name")]
         model_context = model_names[0] if len(model_names) == 1 else f"{len(scope_models)} models"
         first_model_id = scope_models[0]["model_id"] if scope_models else None
+        plan_name = cycle.plan.name if cycle.plan else "Unknown Plan"
+        cycle_context[cycle.cycle_id] = (plan_name, model_context, first_model_id)
+
+    for cycle_id in completed_ids:
+        cycle = monitoring_cycles[cycle_id]
+        plan_name, model_context, first_model_id = cycle_context[cycle_id]
+        period_text = f"{cycle.period_start_date} to {cycle.period_end_date}"
+        feed[("monitoring_cycle_completed", cycle_id)] = {
+            "id": f"monitoring_cycle_{cycle_id}",
+            "type": "monitoring",
+            "action": "completed",
+            "text": f"Monitoring cycle completed: {plan_name} ({period_text})",
+            "user_name": cycle.completed_by.full_name if cycle.completed_by else None,
+            "model_name": model_context,
+            "model_id": first_model_id,
+            "entity_link": f"/monitoring/cycles/{cycle_id}",
+            "created_at": cycle.completed_at
+        }
+
+    for approval in approvals:
+        plan_name, model_context, first_model_id = cycle_context[approval.cycle_id]
+        region_text = f" ({approval.region.name})" if approval.region else ""
+        approval_status = "approved" if approval.approval_status == "Approved" else "rejected"
+        feed[("monitoring_cycle_approval", approval.approval_id)] = {
+            "id": f"monitoring_approval_{approval.approval_id}",
+            "type": "monitoring",
+            "action": approval_status,
+            "text": f"Monitoring {approval.approval_type}{region_text} {approval_status}: {plan_name}",
+            "user_name": approval.approver.full_name if approval.approver else None,
+            "model_name": model_context,
+            "model_id": first_model_id,
+            "entity_link": f"/monitoring/cycles/{approval.cycle_id}",
+            "created_at": approval.approved_at
+        }
 
-        # Add completed/approved cycles
-        if cycle.status == "APPROVED" and cycle.completed_at:
-            feed.append({
-                "id": f"monitoring_cycle_{cycle.cycle_id}",
-                "type": "monitoring",
-                "action": "completed",
-                "text": f"Monitoring cycle completed: {plan_name} ({period_text})",
-                "user_name": cycle.completed_by.full_name if cycle.completed_by else None,
-                "model_name": model_context,
-                "model_id": first_model_id,
-                "entity_link": f"/monitoring/cycles/{cycle.cycle_id}",
-                "created_at": cycle.completed_at
-            })
-
-        # Add individual approvals
-        for approval in cycle.approvals:
-            if approval.approved_at and approval.approval_status in ["Approved", "Rejected"]:
-                region_text = f" ({approval.region.name})" if approval.region else ""
-                approval_status = "approved" if approval.approval_status == "Approved" else "rejected"
-                feed.append({
-                    "id": f"monitoring_approval_{approval.approval_id}",
-                    "type": "monitoring",
-                    "action": approval_status,
-                    "text": f"Monitoring {approval.approval_type}{region_text} {approval_status}: {plan_name}",
-                    "user_name": approval.approver.full_name if approval.approver else None,
-                    "model_name": model_context,
-                    "model_id": first_model_id,
-                    "entity_link": f"/monitoring/cycles/{cycle.cycle_id}",
-                    "created_at": approval.approved_at
-                })
-
-    # Get recent validation workflow approvals for accessible models
-    validation_approvals = db.query(ValidationApproval).options(
+
+def _validation_approval_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Validation workflow approvals."""
+    if not ids.get("validation_decision"):
+        return
+    validation_approvals = (yield select(ValidationApproval).options(
         joinedload(ValidationApproval.approver),
         joinedload(ValidationApproval.request).joinedload(ValidationRequest.models),
         joinedload(ValidationApproval.represented_region)
-    ).join(
-        ValidationRequest, ValidationApproval.request_id == ValidationRequest.request_id
-    ).join(
-        validation_request_models,
-        ValidationRequest.request_id == validation_request_models.c.request_id
-    ).filter(
-        validation_request_models.c.model_id.in_(accessible_model_ids),
-        ValidationApproval.approval_status.in_(["Approved", "Rejected", "Sent Back"]),
-        ValidationApproval.approved_at.isnot(None)
-    ).order_by(ValidationApproval.approved_at.desc()).limit(50).all()
-
-    # Add validation workflow approvals to feed
+    ).where(ValidationApproval.approval_id.in_(ids["validation_decision"]))).unique().scalars().all()
+
     for approval in validation_approvals:
         # Get model names for context
-        model_names = [m.model_name for m in approval.request.models if m.model_id in accessible_model_ids]
-        model_context = model_names[0] if len(model_names) == 1 else f"{len(model_names)} models"
-        first_model_id = next((m.model_id for m in approval.request.models if m.model_id in accessible_model_ids), None)
+        models = [m for m in approval.request.models if _is_visible(visible_model_ids, m.model_id)]
+        model_context = models[0].model_name if len(models) == 1 else f"{len(models)} models"
+        first_model_id = models[0].model_id if models else None
 
         # Build approval description
         # Map status to display action (keeping "rejected" for historical records)
@@ -221,7 +194,7 @@ def get_news_feed(
         if approval.represented_region and approval.represented_region.code not in role_text:
             role_text = f"{role_text} ({approval.represented_region.name})"
 
-        feed.append({
+        feed[("validation_decision", approval.approval_id)] = {
             "id": f"validation_approval_{approval.approval_id}",
             "type": "validation",
             "action": approval_status,
@@ -231,25 +204,27 @@ def get_news_feed(
             "model_id": first_model_id,
             "entity_link": f"/validation-workflow/{approval.request_id}",
             "created_at": approval.approved_at
-        })
+        }
+
 
-    # =========================================================================
-    # RECOMMENDATION STATUS CHANGES (P1 - Critical)
-    # =========================================================================
-    recommendation_events = db.query(RecommendationStatusHistory).options(
+def _recommendation_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Recommendation status changes."""
+    if not ids.get("recommendation_status_change"):
+        return
+    recommendation_events = (yield select(RecommendationStatusHistory).options(
         joinedload(RecommendationStatusHistory.recommendation).joinedload(Recommendation.model),
         joinedload(RecommendationStatusHistory.changed_by),
         joinedload(RecommendationStatusHistory.old_status),
         joinedload(RecommendationStatusHistory.new_status)
-    ).join(Recommendation).filter(
-        Recommendation.model_id.in_(accessible_model_ids)
-    ).order_by(RecommendationStatusHistory.changed_at.desc()).limit(50).all()
+    ).where(RecommendationStatusHistory.history_id.in_(ids["recommendation_status_change"]))).scalars().all()
 
     for event in recommendation_events:
         rec = event.recommendation
         old_status_label = event.old_status.label if event.old_status else "Created"
         new_status_label = event.new_status.label if event.new_status else "Unknown"
-        feed.append({
+        feed[("recommendation_status_change", event.history_id)] = {
             "id": f"recommendation_{event.history_id}",
             "type": "recommendation",
             "action": new_status_label.lower().replace(" ", "_"),
@@ -259,33 +234,31 @@ def get_news_feed(
             "model_id": rec.model_id,
             "entity_link": f"/recommendations/{rec.recommendation_id}",
             "created_at": event.changed_at
-        })
+        }
 
-    # =========================================================================
-    # VALIDATION STATUS CHANGES (P2 - High)
-    # Note: This captures workflow progress, not just final approvals
-    # =========================================================================
-    validation_status_events = db.query(ValidationStatusHistory).options(
+
+def _validation_status_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Validation request status changes (workflow progress, not just final approvals)."""
+    if not ids.get("validation_status_change"):
+        return
+    validation_status_events = (yield select(ValidationStatusHistory).options(
         joinedload(ValidationStatusHistory.request).joinedload(ValidationRequest.models),
         joinedload(ValidationStatusHistory.changed_by),
         joinedload(ValidationStatusHistory.old_status),
         joinedload(ValidationStatusHistory.new_status)
-    ).join(ValidationRequest).join(
-        validation_request_models,
-        ValidationRequest.request_id == validation_request_models.c.request_id
-    ).filter(
-        validation_request_models.c.model_id.in_(accessible_model_ids)
-    ).order_by(ValidationStatusHistory.changed_at.desc()).limit(50).all()
+    ).where(ValidationStatusHistory.history_id.in_(ids["validation_status_change"]))).unique().scalars().all()
 
     for event in validation_status_events:
-        model_names = [m.model_name for m in event.request.models if m.model_id in accessible_model_ids]
-        model_context = model_names[0] if len(model_names) == 1 else f"{len(model_names)} models"
-        first_model_id = next((m.model_id for m in event.request.models if m.model_id in accessible_model_ids), None)
+        models = [m for m in event.request.models if _is_visible(visible_model_ids, m.model_id)]
+        model_context = models[0].model_name if len(models) == 1 else f"{len(models)} models"
+        first_model_id = models[0].model_id if models else None
 
         old_status_label = event.old_status.label if event.old_status else "Created"
         new_status_label = event.new_status.label if event.new_status else "Unknown"
 
-        feed.append({
+        feed[("validation_status_change", event.history_id)] = {
             "id": f"validation_status_{event.history_id}",
             "type": "validation_status",
             "action": new_status_label.lower().replace(" ", "_"),
@@ -295,16 +268,18 @@ def get_news_feed(
             "model_id": first_model_id,
             "entity_link": f"/validation-workflow/{event.request.request_id}",
             "created_at": event.changed_at
-        })
+        }
+
 
-    # =========================================================================
-    # MODEL APPROVAL STATUS CHANGES (P3 - Medium)
-    # =========================================================================
-    approval_status_events = db.query(ModelApprovalStatusHistory).options(
+def _approval_status_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Model approval status changes."""
+    if not ids.get("model_approval_status_change"):
+        return
+    approval_status_events = (yield select(ModelApprovalStatusHistory).options(
         joinedload(ModelApprovalStatusHistory.model)
-    ).filter(
-        ModelApprovalStatusHistory.model_id.in_(accessible_model_ids)
-    ).order_by(ModelApprovalStatusHistory.changed_at.desc()).limit(50).all()
+    ).where(ModelApprovalStatusHistory.history_id.in_(ids["model_approval_status_change"]))).scalars().all()
 
     for event in approval_status_events:
         old_status = event.old_status
@@ -314,7 +289,7 @@ def get_news_feed(
             status_text = f"Model approval status: {old_status} → {new_status}"
         else:
             status_text = f"Model approval status set to {new_status}"
-        feed.append({
+        feed[("model_approval_status_change", event.history_id)] = {
             "id": f"approval_status_{event.history_id}",
             "type": "approval_status",
             "action": new_status.lower(),
@@ -324,25 +299,28 @@ def get_news_feed(
             "model_id": event.model_id,
             "entity_link": f"/models/{event.model_id}",
             "created_at": event.changed_at
-        })
+        }
+
 
-    # =========================================================================
-    # ATTESTATION EVENTS (P4 - Medium)
-    # =========================================================================
-    attestation_events = db.query(AttestationRecord).options(
+def _attestation_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Attestation submissions and reviews."""
+    attestation_ids = set(ids.get("attestation_submitted", [])) | set(ids.get("attestation_reviewed", []))
+    if not attestation_ids:
+        return
+    attestation_events = (yield select(AttestationRecord).options(
         joinedload(AttestationRecord.model),
         joinedload(AttestationRecord.attesting_user),
         joinedload(AttestationRecord.reviewed_by),
         joinedload(AttestationRecord.cycle)
-    ).filter(
-        AttestationRecord.model_id.in_(accessible_model_ids)
-    ).order_by(AttestationRecord.updated_at.desc()).limit(50).all()
+    ).where(AttestationRecord.attestation_id.in_(attestation_ids))).scalars().all()
 
     for record in attestation_events:
         cycle_name = record.cycle.cycle_name if record.cycle else "Unknown Cycle"
         # Submission event
         if record.attested_at:
-            feed.append({
+            feed[("attestation_submitted", record.attestation_id)] = {
                 "id": f"attestation_submit_{record.attestation_id}",
                 "type": "attestation",
                 "action": "submitted",
@@ -352,11 +330,11 @@ def get_news_feed(
                 "model_id": record.model_id,
                 "entity_link": f"/attestations/{record.attestation_id}",
                 "created_at": record.attested_at
-            })
+            }
         # Admin review event
         if record.reviewed_at:
             review_action = "accepted" if record.status == "ACCEPTED" else "reviewed"
-            feed.append({
+            feed[("attestation_reviewed", record.attestation_id)] = {
                 "id": f"attestation_review_{record.attestation_id}",
                 "type": "attestation",
                 "action": review_action,
@@ -366,20 +344,22 @@ def get_news_feed(
                 "model_id": record.model_id,
                 "entity_link": f"/attestations/{record.attestation_id}",
                 "created_at": record.reviewed_at
-            })
+            }
 
-    # =========================================================================
-    # MODEL VERSION EVENTS (P5 - Lower)
-    # =========================================================================
-    version_events = db.query(ModelVersion).options(
+
+def _version_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Model version creations."""
+    if not ids.get("version_created"):
+        return
+    version_events = (yield select(ModelVersion).options(
         joinedload(ModelVersion.model),
         joinedload(ModelVersion.created_by)
-    ).filter(
-        ModelVersion.model_id.in_(accessible_model_ids)
-    ).order_by(ModelVersion.created_at.desc()).limit(50).all()
+    ).where(ModelVersion.version_id.in_(ids["version_created"]))).scalars().all()
 
     for version in version_events:
-        feed.append({
+        feed[("version_created", version.version_id)] = {
             "id": f"version_{version.version_id}",
             "type": "version",
             "action": "created",
@@ -389,18 +369,25 @@ def get_news_feed(
             "model_id": version.model_id,
             "entity_link": f"/models/{version.model_id}/versions/{version.version_id}",
             "created_at": version.created_at
-        })
-
-    # =========================================================================
-    # MODEL EXCEPTION EVENTS (P6 - Risk Alerts)
-    # =========================================================================
-    exception_events = db.query(ModelException).options(
+        }
+
+
+def _exception_events(
+    ids: Dict[str, List[int]], visible_model_ids: Optional[AbstractSet[int]], feed: FeedEntries
+) -> Steps[None]:
+    """Model exceptions detected, acknowledged and closed."""
+    exception_ids = (
+        set(ids.get("exception_detected", []))
+        | set(ids.get("exception_acknowledged", []))
+        | set(ids.get("exception_closed", []))
+    )
+    if not exception_ids:
+        return
+    exception_events = (yield select(ModelException).options(
         joinedload(ModelException.model),
         joinedload(ModelException.acknowledged_by),
         joinedload(ModelException.closed_by)
-    ).filter(
-        ModelException.model_id.in_(accessible_model_ids)
-    ).order_by(ModelException.detected_at.desc()).limit(50).all()
+    ).where(ModelException.exception_id.in_(exception_ids))).scalars().all()
 
     exception_type_labels = {
         "UNMITIGATED_PERFORMANCE": "Unmitigated Performance Problem",
@@ -412,7 +399,7 @@ def get_news_feed(
         type_label = exception_type_labels.get(exc.exception_type, exc.exception_type)
 
         # Exception detected event
-        feed.append({
+        feed[("exception_detected", exc.exception_id)] = {
             "id": f"exception_detected_{exc.exception_id}",
             "type": "exception",
             "action": "detected",
@@ -422,11 +409,11 @@ def get_news_feed(
             "model_id": exc.model_id,
             "entity_link": f"/models/{exc.model_id}",
             "created_at": exc.detected_at
-        })
+        }
 
         # Exception acknowledged event
         if exc.acknowledged_at:
-            feed.append({
+            feed[("exception_acknowledged", exc.exception_id)] = {
                 "id": f"exception_acknowledged_{exc.exception_id}",
                 "type": "exception",
                 "action": "acknowledged",
@@ -436,12 +423,12 @@ def get_news_feed(
                 "model_id": exc.model_id,
                 "entity_link": f"/models/{exc.model_id}",
                 "created_at": exc.acknowledged_at
-            })
+            }
 
         # Exception closed event
         if exc.closed_at:
             close_method = "auto-closed" if exc.auto_closed else "closed"
-            feed.append({
+            feed[("exception_closed", exc.exception_id)] = {
                 "id": f"exception_closed_{exc.exception_id}",
                 "type": "exception",
                 "action": close_method,
@@ -451,11 +438,114 @@ def get_news_feed(
                 "model_id": exc.model_id,
                 "entity_link": f"/models/{exc.model_id}",
                 "created_at": exc.closed_at
-            })
+            }
+
+
+# Event kinds in the news feed (see app/core/model_activity.py)
+NEWS_FEED_EVENT_TYPES = (
+    "comment_added",
+    "decommissioning_history",
+    "monitoring_cycle_completed",
+    "monitoring_cycle_approval",
+    "validation_decision",
+    "recommendation_status_change",
+    "validation_status_change",
+    "model_approval_status_change",
+    "attestation_submitted",
+    "attestation_reviewed",
+    "version_created",
+    "exception_detected",
+    "exception_acknowledged",
+    "exception_closed",
+)
+
+# Each section loads the page's events of its kinds and formats them into feed entries
+NEWS_FEED_SECTIONS = (
+    _comment_events,
+    _decommissioning_events,
+    _monitoring_events,
+    _validation_approval_events,
+    _recommendation_events,
+    _validation_status_events,
+    _approval_status_events,
+    _attestation_events,
+    _version_events,
+    _exception_events,
+)
+
+
+def decode_news_feed_cursor(cursor: Optional[str]) -> Optional[ActivityEvent]:
+    """The event a news feed page continues after; 400 when ``cursor`` is malformed."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def news_feed_section_steps(
+    page: List[ActivityEvent], visible_model_ids: Optional[AbstractSet[int]], entries: FeedEntries
+) -> List[Steps[None]]:
+    """Steps of every section loading the page's source rows into ``entries``.
+
+    The sections are independent, so the async route runs them concurrently.
+    """
+    ids = source_ids_by_type(page)
+    return [section(ids, visible_model_ids, entries) for section in NEWS_FEED_SECTIONS]
+
+
+def news_feed_entries(page: List[ActivityEvent], entries: FeedEntries) -> List[dict]:
+    """The page's formatted entries in page order, each with its ``cursor``."""
+    feed = []
+    for event in page:
+        entry = entries.get((event.event_type, event.source_id))
+        if entry is not None:
+            feed.append({**entry, "cursor": event.cursor})
+    return feed
+
 
-    # Sort combined feed by created_at descending and limit to 50
-    feed.sort(key=lambda x: x["created_at"], reverse=True)
-    return feed[:50]
+@router.get("/news-feed")
+def get_news_feed(
+    cursor: Optional[str] = Query(None, description="cursor of the last entry of the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get news feed for the dashboard, newest first.
+
+    Returns recent activity for models the user has access to, including:
+    - Comments and actions
+    - Decommissioning status changes
+    - Monitoring cycle completions and approvals
+    - Validation workflow approvals and status changes
+    - Recommendation status changes
+    - Model approval status changes
+    - Attestation submissions and reviews
+    - Model version creations
+    - Model exceptions (detected, acknowledged, closed)
+
+    Each entry carries a ``cursor``; pass the last one back to get the next page.
+    """
+    after = decode_news_feed_cursor(cursor)
+
+    if can_see_all_data(current_user):
+        visible_model_ids = None
+        model_filter = None
+    else:
+        visible_model_ids = accessible_model_ids(db, current_user)
+        if not visible_model_ids:
+            return []
+        model_filter = accessible_model_ids_select(current_user)
+
+    page = activity_page(
+        db, NEWS_FEED_EVENT_TYPES, model_filter, limit, cursor=after, distinct=True
+    )
+    entries: FeedEntries = {}
+    for section in news_feed_section_steps(page, visible_model_ids, entries):
+        run_steps(db, section)
+    return news_feed_entries(page, entries)
 
 
 # ============================================================================
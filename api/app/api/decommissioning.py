@@ -5,15 +5,16 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, or_
 
+from app.core.audit import create_audit_log
 from app.core.database import get_db
 from app.core.time import utc_now
 from app.core.deps import get_current_user
 from app.core.rls import apply_model_rls, can_access_model, can_submit_owner_actions
+from app.core.taxonomy_registry import taxonomy_registry
 from app.models import (
     User, Model, ModelStatus, ModelVersion, ModelRegion, Region,
     Taxonomy, TaxonomyValue,
-    DecommissioningRequest, DecommissioningStatusHistory, DecommissioningApproval,
-    AuditLog
+    DecommissioningRequest, DecommissioningStatusHistory, DecommissioningApproval
 )
 from app.core.roles import is_admin, is_validator, is_global_approver, is_regional_approver
 from app.schemas.decommissioning import (
@@ -55,14 +56,7 @@ def get_model_implementation_date(db: Session, model_id: int) -> Optional[date]:
 
 def get_model_status_id(db: Session, code: str) -> Optional[int]:
     """Get the status_id for a Model Status taxonomy value by code."""
-    taxonomy = db.query(Taxonomy).filter(Taxonomy.name == "Model Status").first()
-    if not taxonomy:
-        return None
-    value = db.query(TaxonomyValue).filter(
-        TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
-        TaxonomyValue.code == code
-    ).first()
-    return value.value_id if value else None
+    return taxonomy_registry.value_id(db, "Model Status", code)
 
 
 def get_reason_code(db: Session, reason_id: int) -> Optional[str]:
@@ -349,7 +343,8 @@ def create_decommissioning_request(
     model.status = ModelStatus.PENDING_DECOMMISSION
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="DecommissioningRequest",
         entity_id=decom_request.request_id,
         action="CREATE",
@@ -363,7 +358,6 @@ def create_decommissioning_request(
             "owner_approval_required": owner_approval_required
         }
     )
-    db.add(audit_log)
 
     db.commit()
 
@@ -751,7 +745,8 @@ def update_decommissioning_request(
 
     # Only create audit log if there were actual changes
     if changes:
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="DecommissioningRequest",
             entity_id=request_id,
             action="UPDATE",
@@ -761,7 +756,6 @@ def update_decommissioning_request(
                 "fields_changed": changes
             }
         )
-        db.add(audit_log)
 
     db.commit()
 
@@ -856,7 +850,8 @@ def submit_validator_review(
         model.status = ModelStatus.ACTIVE
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="DecommissioningRequest",
         entity_id=request_id,
         action="VALIDATOR_REVIEW",
@@ -869,7 +864,6 @@ def submit_validator_review(
             "model_name": request.model.model_name if request.model else None
         }
     )
-    db.add(audit_log)
 
     db.commit()
 
@@ -966,7 +960,8 @@ def submit_owner_review(
         model.status = ModelStatus.ACTIVE
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="DecommissioningRequest",
         entity_id=request_id,
         action="OWNER_REVIEW",
@@ -979,7 +974,6 @@ def submit_owner_review(
             "model_name": request.model.model_name if request.model else None
         }
     )
-    db.add(audit_log)
 
     db.commit()
 
@@ -1084,7 +1078,8 @@ def submit_approval(
         region_name = region.name if region else None
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="DecommissioningRequest",
         entity_id=request_id,
         action="STAGE2_APPROVAL",
@@ -1098,7 +1093,6 @@ def submit_approval(
             "model_name": model_for_audit.model_name if model_for_audit else None
         }
     )
-    db.add(audit_log)
 
     db.commit()
 
@@ -1148,7 +1142,8 @@ def withdraw_request(
         model.status = ModelStatus.ACTIVE
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="DecommissioningRequest",
         entity_id=request_id,
         action="WITHDRAW",
@@ -1160,7 +1155,6 @@ def withdraw_request(
             "model_name": model.model_name if model else None
         }
     )
-    db.add(audit_log)
 
     db.commit()
 
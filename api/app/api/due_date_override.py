@@ -10,6 +10,7 @@ from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
 from app.core.time import utc_now
+from app.core.audit import create_audit_log
 from app.models import (
     User, Model, ValidationRequest, ValidationRequestModelVersion,
     AuditLog, TaxonomyValue, Taxonomy
@@ -27,18 +28,6 @@ from app.schemas.due_date_override import (
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def get_current_validation_request(db: Session, model_id: int) -> Optional[ValidationRequest]:
     """Get the current/open validation request for a model."""
     # Get terminal status codes (APPROVED, CANCELLED)
@@ -21,7 +21,7 @@ from app.models.user import User
 from app.core.roles import is_admin
 from app.models.model import Model
 from app.models.model_region import ModelRegion
-from app.models.audit_log import AuditLog
+from app.core.audit import create_audit_log
 from app.models.taxonomy import Taxonomy, TaxonomyValue
 from app.models.model_exception import ModelException, ModelExceptionStatusHistory
 from app.schemas.model_exception import (
@@ -230,7 +230,6 @@ def list_exceptions(
         query = query.filter(func.date(ModelException.detected_at) <= detected_to)
     if region_id:
         # Join through Model -> ModelRegion to filter by region
-        # Note: Model join may already exist from RLS, but SQLAlchemy handles duplicates
         query = query.join(Model, ModelException.model_id == Model.model_id, isouter=True).join(
             ModelRegion, Model.model_id == ModelRegion.model_id
         ).filter(ModelRegion.region_id == region_id)
@@ -328,7 +327,8 @@ def create_exception(
     db.add(history)
 
     # Log audit
-    db.add(AuditLog(
+    create_audit_log(
+        db,
         entity_type="ModelException",
         entity_id=exception.exception_id,
         action="CREATED",
@@ -339,8 +339,8 @@ def create_exception(
             "initial_status": request.initial_status,
             "description": request.description[:100] + "..." if len(request.description) > 100 else request.description,
             "manually_created": True,
-        },
-    ))
+        }
+    )
     db.commit()
 
     # Reload with relationships
@@ -477,13 +477,14 @@ def acknowledge_exception_endpoint(
     db.refresh(exc)
 
     # Log audit
-    db.add(AuditLog(
+    create_audit_log(
+        db,
         entity_type="ModelException",
         entity_id=exc.exception_id,
         action="ACKNOWLEDGED",
         user_id=current_user.user_id,
-        changes={"old_status": "OPEN", "new_status": "ACKNOWLEDGED", "notes": request.notes},
-    ))
+        changes={"old_status": "OPEN", "new_status": "ACKNOWLEDGED", "notes": request.notes}
+    )
     db.commit()
 
     # Reload with relationships
@@ -571,7 +572,8 @@ def close_exception_endpoint(
     db.refresh(exc)
 
     # Log audit
-    db.add(AuditLog(
+    create_audit_log(
+        db,
         entity_type="ModelException",
         entity_id=exc.exception_id,
         action="CLOSED",
@@ -581,8 +583,8 @@ def close_exception_endpoint(
             "new_status": "CLOSED",
             "closure_narrative": request.closure_narrative,
             "closure_reason_id": request.closure_reason_id,
-        },
-    ))
+        }
+    )
     db.commit()
 
     # Reload with relationships
@@ -655,7 +657,8 @@ def detect_exceptions_for_model(
 
     # Log audit for detection run
     if all_created:
-        db.add(AuditLog(
+        create_audit_log(
+            db,
             entity_type="ModelException",
             entity_id=model_id,
             action="DETECTION_RUN",
@@ -666,8 +669,8 @@ def detect_exceptions_for_model(
                 "type1_count": type1_count,
                 "type2_count": type2_count,
                 "type3_count": type3_count,
-            },
-        ))
+            }
+        )
         db.commit()
 
     # Build response
@@ -740,7 +743,8 @@ def detect_exceptions_all_models(
             all_created.extend(model_created)
     except Exception as exc:
         db.rollback()
-        db.add(AuditLog(
+        create_audit_log(
+            db,
             entity_type="ModelException",
             entity_id=0,
             action="BATCH_DETECTION_RUN",
@@ -755,13 +759,14 @@ def detect_exceptions_all_models(
                 "offset": offset,
                 "failed_model_id": current_model_id,
                 "error": str(exc),
-            },
-        ))
+            }
+        )
         db.commit()
         raise
 
     # Log audit for batch detection run (always, for traceability)
-    db.add(AuditLog(
+    create_audit_log(
+        db,
         entity_type="ModelException",
         entity_id=0,  # Batch operation, no specific entity
         action="BATCH_DETECTION_RUN",
@@ -774,8 +779,8 @@ def detect_exceptions_all_models(
             "type3_count": type3_count,
             "limit": limit,
             "offset": offset,
-        },
-    ))
+        }
+    )
     db.commit()
 
     # Build response (limit to first 100 for performance)
@@ -8,12 +8,12 @@ from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
 from app.core.rls import apply_model_rls, can_see_all_data
+from app.core.audit import create_audit_log
 from app.models.user import User
 from app.models.model import Model
 from app.models.irp import IRP, IRPReview, IRPCertification
 from app.models.mrsa_review_policy import MRSAReviewPolicy, MRSAReviewException
 from app.models.taxonomy import TaxonomyValue
-from app.models.audit_log import AuditLog
 from app.schemas.irp import (
     IRPCreate, IRPUpdate, IRPResponse, IRPDetailResponse,
     IRPReviewCreate, IRPReviewResponse,
@@ -47,26 +47,6 @@ def _require_irp_access(irp: IRP, accessible_mrsa_ids: set[int] | None) -> None:
         )
 
 
-def create_audit_log(
-    db: Session,
-    entity_type: str,
-    entity_id: int,
-    action: str,
-    user_id: int,
-    changes: Optional[dict] = None
-):
-    """Create an audit log entry for IRP operations."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-    db.flush()
-
-
 def _build_irp_response(irp: IRP) -> dict:
     """Build IRP response with computed fields."""
     response = {
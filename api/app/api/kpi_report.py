@@ -1,14 +1,22 @@
 """KPI Report API endpoint - computes model risk management metrics."""
 from datetime import date, datetime, timedelta
-import time
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException, status
 from dateutil.relativedelta import relativedelta
-from sqlalchemy.orm import Session, joinedload, aliased
+from sqlalchemy.orm import Session, joinedload, aliased, sessionmaker
 from sqlalchemy import func, and_, or_, case
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.database import get_db, get_reporting_db, get_session_factory
+from app.core.deps import get_current_reporting_user, get_current_user
+from app.core.kpi_cache import get_kpi_cache
+from app.core.kpi_snapshots import (
+    get_kpi_metric_history,
+    list_snapshot_scopes,
+    load_kpi_report_snapshot,
+    run_kpi_snapshot_job,
+    stale_snapshot_scopes,
+)
+from app.core.roles import is_admin
 from app.core.time import utc_now
 from app.models import (
     Model,
@@ -43,11 +51,12 @@ from app.schemas.kpi_report import (
     KPIBreakdown,
     KPIMetric,
     KPIReportResponse,
+    KPIHistoryResponse,
+    KPISnapshotRunResponse,
 )
 
 router = APIRouter(prefix="/kpi-report", tags=["reports"])
 KPI_CACHE_TTL_SECONDS = 600
-_KPI_CACHE: Dict[tuple[Optional[int], Optional[int]], Dict[str, Any]] = {}
 
 
 # Metric definitions from METRICS.json (excluding 4.13, 4.15, 4.26; merging 4.7/4.28)
@@ -273,17 +282,16 @@ def _safe_percentage(numerator: int, denominator: int) -> float:
 
 
 def _get_cached_report(key: tuple[Optional[int], Optional[int]]) -> Optional[KPIReportResponse]:
-    entry = _KPI_CACHE.get(key)
-    if not entry:
-        return None
-    if entry["expires_at"] <= time.time():
-        _KPI_CACHE.pop(key, None)
-        return None
-    return entry["value"]
+    cached = get_kpi_cache().get(("kpi_report", *key))
+    return KPIReportResponse.model_validate(cached) if cached is not None else None
 
 
-def _set_cached_report(key: tuple[Optional[int], Optional[int]], value: KPIReportResponse) -> None:
-    _KPI_CACHE[key] = {"value": value, "expires_at": time.time() + KPI_CACHE_TTL_SECONDS}
+def _set_cached_report(
+    key: tuple[Optional[int], Optional[int]], value: KPIReportResponse, generation: int
+) -> None:
+    get_kpi_cache().set(
+        ("kpi_report", *key), value.model_dump(mode="json"), KPI_CACHE_TTL_SECONDS, generation
+    )
 
 
 def _compute_metric_4_1(db: Session, active_models: List[Model]) -> KPIMetric:
@@ -1196,27 +1204,12 @@ def _compute_metric_4_28(db: Session, active_models: List[Model]) -> KPIMetric:
     ))
 
 
-@router.get("/", response_model=KPIReportResponse)
-def get_kpi_report(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    region_id: Optional[int] = Query(None, description="Filter metrics by region (models deployed to this region)"),
-    team_id: Optional[int] = Query(None, description="Filter metrics by team ID (0 = Unassigned)"),
-):
-    """
-    Generate the KPI Report with all model risk management metrics.
-
-    This endpoint computes 21 metrics from METRICS.json, providing:
-    - Count metrics (simple integer counts)
-    - Ratio metrics (with numerator/denominator decomposition)
-    - Duration metrics (average days)
-    - Breakdown metrics (distribution by category)
-
-    Two metrics are flagged as Key Risk Indicators (KRI): 4.7 and 4.27.
-
-    Optionally filter by region_id to scope metrics to models deployed in that region.
-    Optionally filter by team_id to scope metrics to models owned within a team.
-    """
+def compute_kpi_report(
+    db: Session,
+    region_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+) -> KPIReportResponse:
+    """Compute the KPI report from live data for one region/team scope (uncached)."""
     # Handle region filtering
     region_name = "All Regions"
     region_model_subquery = None
@@ -1233,11 +1226,6 @@ def get_kpi_report(
             ModelRegion.region_id == region_id
         ).distinct().scalar_subquery()
 
-    cache_key = (region_id, team_id)
-    cached_report = _get_cached_report(cache_key)
-    if cached_report:
-        return cached_report
-
     # Get all active models with necessary relationships
     active_models_query = db.query(Model).options(
         joinedload(Model.risk_tier),
@@ -1344,5 +1332,126 @@ def get_kpi_report(
         team_id=team_id,
         team_name=team_name,
     )
-    _set_cached_report(cache_key, report)
     return report
+
+
+@router.get("/", response_model=KPIReportResponse)
+def get_kpi_report(
+    db: Session = Depends(get_reporting_db),
+    current_user: User = Depends(get_current_reporting_user),
+    region_id: Optional[int] = Query(None, description="Filter metrics by region (models deployed to this region)"),
+    team_id: Optional[int] = Query(None, description="Filter metrics by team ID (0 = Unassigned)"),
+    as_of_date: Optional[date] = Query(
+        None,
+        description="Serve a past report from the stored KPI snapshots; today serves the live report",
+    ),
+):
+    """
+    Generate the KPI Report with all model risk management metrics.
+
+    This endpoint computes 21 metrics from METRICS.json, providing:
+    - Count metrics (simple integer counts)
+    - Ratio metrics (with numerator/denominator decomposition)
+    - Duration metrics (average days)
+    - Breakdown metrics (distribution by category)
+
+    Two metrics are flagged as Key Risk Indicators (KRI): 4.7 and 4.27.
+
+    Optionally filter by region_id to scope metrics to models deployed in that region.
+    Optionally filter by team_id to scope metrics to models owned within a team.
+    Pass a past as_of_date to read the report from kpi_metric_snapshots instead of
+    recomputing it; 404 if no snapshot was taken for that date and scope. An
+    as_of_date of today serves the live report; a future date is rejected (400).
+    """
+    if as_of_date is not None and as_of_date > date.today():
+        raise HTTPException(status_code=400, detail="as_of_date cannot be in the future")
+    if as_of_date is not None and as_of_date < date.today():
+        snapshot = load_kpi_report_snapshot(db, as_of_date, region_id, team_id)
+        if snapshot is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No KPI snapshot available for {as_of_date.isoformat()}"
+            )
+        return snapshot
+
+    cache_key = (region_id, team_id)
+    cached_report = _get_cached_report(cache_key)
+    if cached_report:
+        return cached_report
+
+    # Read before computing: a write committed meanwhile must not be cached as fresh
+    generation = get_kpi_cache().generation()
+    report = compute_kpi_report(db, region_id, team_id)
+    _set_cached_report(cache_key, report, generation)
+    return report
+
+
+@router.get("/history", response_model=KPIHistoryResponse)
+def get_kpi_report_history(
+    db: Session = Depends(get_reporting_db),
+    current_user: User = Depends(get_current_reporting_user),
+    region_id: Optional[int] = Query(None, description="Region scope (None = All Regions)"),
+    team_id: Optional[int] = Query(None, description="Team scope (0 = Unassigned, None = All Teams)"),
+    metric_ids: Optional[str] = Query(None, description="Comma-separated metric IDs (default: all)"),
+    start_date: Optional[date] = Query(None, description="Window start (default: 24 months before end_date)"),
+    end_date: Optional[date] = Query(None, description="Window end (default: today)"),
+):
+    """
+    KPI metric trends served from stored snapshots.
+
+    Reads kpi_metric_snapshots only; nothing is recomputed. Dates without a
+    snapshot simply have no point in the series.
+    """
+    end_date = end_date or date.today()
+    start_date = start_date or (end_date - relativedelta(months=24))
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be on or before end_date")
+
+    requested_metrics = None
+    if metric_ids:
+        requested_metrics = [m.strip() for m in metric_ids.split(",") if m.strip()]
+
+    return KPIHistoryResponse(
+        region_id=region_id,
+        team_id=team_id,
+        start_date=start_date,
+        end_date=end_date,
+        metrics=get_kpi_metric_history(
+            db, start_date, end_date, region_id, team_id, requested_metrics
+        ),
+    )
+
+
+@router.post(
+    "/snapshots",
+    response_model=KPISnapshotRunResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def run_kpi_snapshot(
+    background_tasks: BackgroundTasks,
+    force: bool = Query(False, description="Recompute every scope, not only those changed since the last snapshot"),
+    db: Session = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Queue a snapshot of today's KPI metrics (Admin only).
+
+    Only scopes without a snapshot for today, or whose snapshot predates the
+    last audited write, are recomputed unless force is set. The work runs as a
+    background job after the response is sent; normally it runs nightly via
+    snapshot_kpi_metrics.py.
+    """
+    if not is_admin(current_user):
+        raise HTTPException(status_code=403, detail="Only administrators can run KPI snapshots")
+
+    as_of_date = date.today()
+    scopes = list_snapshot_scopes(db)
+    queued = scopes if force else stale_snapshot_scopes(db, as_of_date, scopes)
+    if queued:
+        background_tasks.add_task(run_kpi_snapshot_job, session_factory, as_of_date, force)
+    return KPISnapshotRunResponse(
+        as_of_date=as_of_date,
+        scopes=len(queued),
+        scopes_up_to_date=len(scopes) - len(queued),
+    )
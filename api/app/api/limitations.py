@@ -4,13 +4,14 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.audit import create_audit_log
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.time import utc_now
 from app.core.roles import is_admin, is_validator
 from app.models import (
     User, Model, ModelLimitation, ValidationRequest, ModelVersion,
-    Recommendation, TaxonomyValue, Taxonomy, AuditLog, Region, ModelRegion
+    Recommendation, TaxonomyValue, Taxonomy, Region, ModelRegion
 )
 
 
@@ -81,14 +82,14 @@ def _log_audit(
     if new_values:
         changes["new"] = new_values
 
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type=entity_type,
         entity_id=entity_id,
         action=action,
         user_id=user_id,
         changes=changes if changes else None
     )
-    db.add(audit_log)
 
 
 # ==================== MODEL LIMITATIONS CRUD ====================
@@ -3,20 +3,21 @@ import csv
 import io
 import re
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple, Union, Sequence
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 
+from app.core.csv_export import CSVColumn, csv_streaming_response
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
 from app.models.user import User
 from app.models.lob import LOBUnit
 from app.models.team import Team
-from app.models.audit_log import AuditLog
 from app.core.team_utils import build_lob_team_map
+from app.core.audit import create_audit_log
 from app.schemas.lob import (
     LOBUnitCreate,
     LOBUnitUpdate,
@@ -89,18 +90,6 @@ class LOBPlaceholder:
 LOBEntry = Union[LOBUnit, LOBPlaceholder]
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for LOB operations."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def get_full_path(db: Session, lob: LOBUnit) -> str:
     """Build full path string from root to this node."""
     path_parts = []
@@ -401,41 +390,30 @@ def export_lob_csv(
     parent_ids = {lob.parent_id for lob in lobs if lob.parent_id}
     leaf_lobs = [lob for lob in lobs if lob.lob_id not in parent_ids]
 
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    header = ["SBU"] + [f"LOB{i}" for i in range(1, max_level)]
-    writer.writerow(header)
-
-    # Write rows
-    for leaf in leaf_lobs:
-        # Build path from leaf to root
-        path = []
-        current = leaf
-        while current:
-            path.insert(0, f"{current.name} ({current.code})")
-            if current.parent_id and current.parent_id in lob_map:
-                current = lob_map[current.parent_id]
-            else:
-                current = None
-
-        # Pad to max_level columns
-        while len(path) < max_level:
-            path.append("")
+    def leaf_paths():
+        for leaf in leaf_lobs:
+            # Build path from leaf to root
+            path = []
+            current = leaf
+            while current:
+                path.insert(0, f"{current.name} ({current.code})")
+                if current.parent_id and current.parent_id in lob_map:
+                    current = lob_map[current.parent_id]
+                else:
+                    current = None
 
-        writer.writerow(path)
+            # Pad to max_level columns
+            while len(path) < max_level:
+                path.append("")
 
-    output.seek(0)
+            yield path
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=lob_hierarchy_export.csv"
-        }
-    )
+    headers = ["SBU"] + [f"LOB{i}" for i in range(1, max_level)]
+    columns = [
+        CSVColumn(header, header, itemgetter(index))
+        for index, header in enumerate(headers)
+    ]
+    return csv_streaming_response(leaf_paths(), columns, "lob_hierarchy_export.csv")
 
 
 @router.get("/{lob_id}", response_model=LOBUnitWithAncestors)
@@ -681,7 +659,7 @@ def is_enterprise_format(headers: Sequence[str]) -> bool:
 
 
 @router.post("/import-csv", response_model=Union[LOBImportPreview, LOBImportResult])
-async def import_lob_csv(
+def import_lob_csv(
     file: UploadFile = File(...),
     dry_run: bool = Query(False, description="Preview changes without committing"),
     db: Session = Depends(get_db),
@@ -6,8 +6,8 @@ from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.core.roles import is_admin
+from app.core.audit import create_audit_log
 from app.models.model_change_taxonomy import ModelChangeCategory, ModelChangeType
-from app.models.audit_log import AuditLog
 from app.schemas.model_change_taxonomy import (
     ModelChangeCategoryResponse,
     ModelChangeTypeResponse,
@@ -17,18 +17,6 @@ from app.schemas.model_change_taxonomy import (
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for taxonomy changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def require_admin(current_user: User = Depends(get_current_user)):
     """Dependency to require admin role."""
     if not is_admin(current_user):
@@ -7,10 +7,10 @@ from app.core.database import get_db
 from app.core.time import utc_now
 from app.core.deps import get_current_user
 from app.core.roles import is_admin, is_validator
+from app.core.audit import create_audit_log
 from app.models.user import User
 from app.models.model import Model
 from app.models.model_delegate import ModelDelegate
-from app.models.audit_log import AuditLog
 from app.schemas.model_delegate import (
     ModelDelegateCreate,
     ModelDelegateUpdate,
@@ -23,18 +23,6 @@ from app.schemas.model_delegate import (
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def can_manage_delegates(model: Model, user: User) -> bool:
     """Check if user can manage delegates for this model.
 
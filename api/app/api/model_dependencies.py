@@ -1,18 +1,19 @@
 """Model dependency routes - feeder-consumer data flow relationships with cycle detection."""
 from typing import List, Optional, Set
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.pdf_jobs import queue_pdf_job, render_pdf_cached
 from app.core.roles import is_admin
+from app.core.audit import create_audit_log
 from app.models.user import User
 from app.models.model import Model
 from app.models.model_feed_dependency import ModelFeedDependency
 from app.models.model_application import ModelApplication
 from app.models.model_hierarchy import ModelHierarchy
 from app.models.taxonomy import TaxonomyValue
-from app.models.audit_log import AuditLog
 from app.schemas.model_relationships import (
     ModelFeedDependencyCreate,
     ModelFeedDependencyUpdate,
@@ -29,18 +30,6 @@ from fpdf import FPDF
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for model dependency changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def check_admin(user: User):
     """Check if user is admin."""
     if not is_admin(user):
@@ -1253,6 +1242,22 @@ def build_lineage_paths(lineage_data: dict) -> list[list[dict]]:
     return full_paths
 
 
+def render_lineage_pdf(full_paths: list[list[dict]], include_hierarchy: bool) -> bytes:
+    """Render lineage paths as a landscape PDF."""
+    pdf = LineagePDF(orientation='L', unit='mm', format='A4')
+    pdf.add_page()
+
+    # Draw legend if hierarchy is included
+    if include_hierarchy:
+        pdf.draw_legend()
+
+    # Draw paths
+    for idx, path in enumerate(full_paths, 1):
+        pdf.draw_path(path, idx, include_hierarchy=include_hierarchy)
+
+    return bytes(pdf.output())
+
+
 @router.get("/models/{model_id}/dependencies/lineage/pdf")
 def export_lineage_pdf(
     model_id: int,
@@ -1260,6 +1265,7 @@ def export_lineage_pdf(
     max_depth: int = 10,
     include_inactive: bool = False,
     include_hierarchy: bool = False,
+    background: bool = Query(False, description="Queue the render and return a PDF job instead of the PDF"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -1268,6 +1274,7 @@ def export_lineage_pdf(
 
     Parameters:
     - include_hierarchy: Include parent/sub-model hierarchy in the diagram (default False)
+    - background: Queue the render and return 202 with a PDF job (poll /pdf-jobs/{job_id})
     """
     # Fetch lineage data
     lineage_data = get_dependency_lineage(
@@ -1280,27 +1287,18 @@ def export_lineage_pdf(
         current_user=current_user
     )
 
-    full_paths = build_lineage_paths(lineage_data)
-
-    # Create PDF in Landscape
-    pdf = LineagePDF(orientation='L', unit='mm', format='A4')
-    pdf.add_page()
-
-    # Draw legend if hierarchy is included
-    if include_hierarchy:
-        pdf.draw_legend()
+    payload = {
+        "paths": build_lineage_paths(lineage_data),
+        "include_hierarchy": include_hierarchy,
+    }
+    filename = f"lineage_chain_{model_id}.pdf"
 
-    # Draw paths
-    for idx, path in enumerate(full_paths, 1):
-        pdf.draw_path(path, idx, include_hierarchy=include_hierarchy)
+    if background:
+        return queue_pdf_job("lineage", payload, filename, current_user.user_id)
 
-    # Output
-    pdf_bytes = pdf.output()
-    buffer = io.BytesIO(pdf_bytes)
+    buffer = io.BytesIO(render_pdf_cached("lineage", payload))
     buffer.seek(0)
 
-    filename = f"lineage_chain_{model_id}.pdf"
-
     return StreamingResponse(
         buffer,
         media_type="application/pdf",
@@ -6,11 +6,11 @@ from sqlalchemy.orm import Session, joinedload
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
+from app.core.audit import create_audit_log
 from app.models.user import User
 from app.models.model import Model
 from app.models.model_hierarchy import ModelHierarchy
 from app.models.taxonomy import TaxonomyValue
-from app.models.audit_log import AuditLog
 from app.schemas.model_relationships import (
     ModelHierarchyCreate,
     ModelHierarchyUpdate,
@@ -23,18 +23,6 @@ from app.schemas.model_relationships import (
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for model hierarchy changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def check_admin(user: User):
     """Check if user is admin."""
     if not is_admin(user):
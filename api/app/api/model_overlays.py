@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
 from sqlalchemy import or_
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.audit import create_audit_log
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin, is_validator
@@ -72,14 +73,14 @@ def _log_audit(
         changes["old"] = old_values
     if new_values is not None:
         changes["new"] = new_values
-    from app.models.audit_log import AuditLog
-    db.add(AuditLog(
+    create_audit_log(
+        db,
         entity_type="ModelOverlay",
         entity_id=entity_id,
         action=action,
         user_id=user_id,
         changes=changes if changes else None
-    ))
+    )
 
 
 def _validate_region(db: Session, region_id: int) -> None:
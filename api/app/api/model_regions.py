@@ -7,25 +7,12 @@ from app.core.deps import get_current_user
 from app.core.rls import can_manage_model_region
 from app.models import ModelRegion as ModelRegionModel, Model, Region, User
 from app.core.roles import is_admin
-from app.models.audit_log import AuditLog
+from app.core.audit import create_audit_log
 from app.schemas.model_region import ModelRegion, ModelRegionCreate, ModelRegionUpdate
 
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-    # Note: commit happens with the main transaction
-
-
 @router.get("/models/{model_id}/regions", response_model=List[ModelRegion])
 def get_model_regions(
     model_id: int,
@@ -1,5 +1,4 @@
 """Model versions routes."""
-import csv
 import io
 from typing import List
 from datetime import date
@@ -7,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import desc
+from app.core.csv_export import CSVColumn, csv_streaming_response, stream_query
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin, is_validator
@@ -14,11 +14,11 @@ from app.core.validation_conflicts import (
     find_active_validation_conflicts,
     build_validation_conflict_message
 )
+from app.core.audit import create_audit_log
 from app.models.user import User
 from app.models.model import Model
 from app.models.model_version import ModelVersion
 from app.models.model_delegate import ModelDelegate
-from app.models.audit_log import AuditLog
 from app.models.model_change_taxonomy import ModelChangeType, ModelChangeCategory
 from app.models.validation import ValidationRequest, ValidationWorkflowSLA, ValidationRequestModelVersion
 from app.models.taxonomy import Taxonomy, TaxonomyValue
@@ -38,18 +38,6 @@ from fpdf import FPDF
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def generate_next_version_number(db: Session, model_id: int, change_type: str) -> str:
     """Auto-generate the next version number based on the latest version and change type."""
     # Get the latest version (highest version_id = most recent)
@@ -957,6 +945,26 @@ def delete_version(
     return None
 
 
+MODEL_VERSION_EXPORT_COLUMNS = [
+    CSVColumn("version_id", "Version ID", lambda v: v.version_id),
+    CSVColumn("version_number", "Version Number", lambda v: v.version_number),
+    CSVColumn("change_type", "Change Type", lambda v: v.change_type),
+    CSVColumn("change_category", "Change Category",
+              lambda v: v.change_type_detail.category.name
+              if v.change_type_detail and v.change_type_detail.category else ""),
+    CSVColumn("change_type_detail", "Change Type Detail",
+              lambda v: v.change_type_detail.name if v.change_type_detail else ""),
+    CSVColumn("status", "Status", lambda v: v.status),
+    CSVColumn("change_description", "Change Description", lambda v: v.change_description),
+    CSVColumn("created_by", "Created By", lambda v: v.created_by.full_name if v.created_by else ""),
+    CSVColumn("created_at", "Created At",
+              lambda v: v.created_at.strftime("%Y-%m-%d %H:%M:%S") if v.created_at else ""),
+    CSVColumn("production_date", "Production Date",
+              lambda v: v.production_date.strftime("%Y-%m-%d") if v.production_date else ""),
+    CSVColumn("validation_request_id", "Validation Request ID", lambda v: v.validation_request_id or ""),
+]
+
+
 @router.get("/models/{model_id}/versions/export/csv")
 def export_model_versions_csv(
     model_id: int,
@@ -987,63 +995,16 @@ def export_model_versions_csv(
             detail="Model not found"
         )
 
-    # Get all versions with relationships
     versions = db.query(ModelVersion).options(
         joinedload(ModelVersion.change_type_detail).joinedload(
             ModelChangeType.category),
-        joinedload(ModelVersion.created_by),
-        # Eager-load for affected_region_ids property
-        joinedload(ModelVersion.affected_regions_assoc)
+        joinedload(ModelVersion.created_by)
     ).filter(
         ModelVersion.model_id == model_id
-    ).order_by(desc(ModelVersion.created_at)).all()
+    ).order_by(desc(ModelVersion.created_at))
 
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        "Version ID",
-        "Version Number",
-        "Change Type",
-        "Change Category",
-        "Change Type Detail",
-        "Status",
-        "Change Description",
-        "Created By",
-        "Created At",
-        "Production Date",
-        "Validation Request ID"
-    ])
-
-    # Write data rows
-    for version in versions:
-        writer.writerow([
-            version.version_id,
-            version.version_number,
-            version.change_type,
-            version.change_type_detail.category.name if version.change_type_detail and version.change_type_detail.category else "",
-            version.change_type_detail.name if version.change_type_detail else "",
-            version.status,
-            version.change_description,
-            version.created_by.full_name if version.created_by else "",
-            version.created_at.strftime(
-                "%Y-%m-%d %H:%M:%S") if version.created_at else "",
-            version.production_date.strftime(
-                "%Y-%m-%d") if version.production_date else "",
-            version.validation_request_id or ""
-        ])
-
-    # Prepare response
-    output.seek(0)
     filename = f"model_{model_id}_versions_{date.today().strftime('%Y-%m-%d')}.csv"
-
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return csv_streaming_response(stream_query(versions), MODEL_VERSION_EXPORT_COLUMNS, filename, db=db)
 
 
 @router.get("/models/{model_id}/versions/export/pdf")
@@ -1,17 +1,22 @@
 """Models routes."""
-import csv
-import io
 import json
 from datetime import datetime, date, timedelta
-from typing import List, Optional, Dict, Any, cast
+from typing import List, Optional, Dict, Any, Set, Tuple, cast
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import or_, select
 from app.core.database import get_db
 from app.core.time import utc_now
+from app.core.columnar_export import ExportFormat, TypedColumn, export_response
+from app.core.csv_export import (
+    CSVColumn,
+    export_view_columns,
+    select_columns,
+    stream_query,
+)
 from app.core.deps import get_current_user
+from app.core.model_activity import activity_page, decode_cursor, source_ids_by_type
 from app.core.roles import is_admin
 from app.core.validation_conflicts import (
     find_active_validation_conflicts,
@@ -34,14 +39,11 @@ from app.models.monitoring import (
     MonitoringCycle,
     MonitoringCycleApproval,
     MonitoringPlan,
-    MonitoringCycleModelScope,
-    MonitoringPlanModelSnapshot,
-    MonitoringResult,
 )
 from app.models.methodology import Methodology
 from app.models.risk_assessment import ModelRiskAssessment
 from app.models.irp import IRP
-from app.models.model_exception import ModelException, ModelExceptionStatusHistory
+from app.models.model_exception import ModelException
 from app.models.team import Team
 from app.models.tag import ModelTag, Tag, TagCategory
 from app.schemas.model_exception import ModelExceptionListResponse
@@ -63,6 +65,7 @@ from app.schemas.model_bulk import (
 from app.schemas.user_lookup import ModelAssigneeResponse
 from app.core.lob_utils import get_user_lob_rollup_name
 from app.core.team_utils import build_lob_team_map
+from app.core.audit import AuditBatch, audit_batch, create_audit_log
 from app.schemas.submission_action import SubmissionAction, SubmissionFeedback, SubmissionCommentCreate
 from app.schemas.activity_timeline import ActivityTimelineItem, ActivityTimelineResponse
 from app.models.model_name_history import ModelNameHistory
@@ -71,19 +74,6 @@ from app.api.risk_assessment import get_global_assessment_status
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-    # Note: commit happens with the main transaction
-
-
 def _get_initial_version(db: Session, model_id: int) -> Optional[ModelVersion]:
     """Get the initial model version (change_type_id=1) with a fallback to earliest version."""
     initial_version = db.query(ModelVersion).filter(
@@ -504,42 +494,129 @@ def _build_user_list_item(user: Optional[User]) -> Optional[dict]:
     }
 
 
+# Relationship-backed fields of ModelListResponse and the loaders each one needs.
+# GET /models/?fields=... only adds loaders for the requested entries; scalar
+# columns are always returned.
+MODEL_LIST_FIELD_LOADERS: Dict[str, List[Any]] = {
+    "owner": [
+        joinedload(Model.owner).joinedload(User.lob).joinedload(LOBUnit.parent)
+        .joinedload(LOBUnit.parent).joinedload(LOBUnit.parent)
+    ],
+    "developer": [joinedload(Model.developer).joinedload(User.lob)],
+    "shared_owner": [joinedload(Model.shared_owner).joinedload(User.lob)],
+    "shared_developer": [joinedload(Model.shared_developer).joinedload(User.lob)],
+    "monitoring_manager": [joinedload(Model.monitoring_manager).joinedload(User.lob)],
+    "vendor": [joinedload(Model.vendor)],
+    "risk_tier": [joinedload(Model.risk_tier)],
+    "mrsa_risk_level": [joinedload(Model.mrsa_risk_level)],
+    "model_type": [joinedload(Model.model_type)],
+    "methodology": [joinedload(Model.methodology).joinedload(Methodology.category)],
+    "wholly_owned_region": [joinedload(Model.wholly_owned_region)],
+    "ownership_type": [joinedload(Model.ownership_type)],
+    "usage_frequency": [joinedload(Model.usage_frequency)],
+    # Collections: use selectinload to avoid Cartesian product explosion
+    "users": [selectinload(Model.users).joinedload(User.lob)],
+    "regulatory_categories": [selectinload(Model.regulatory_categories)],
+    "regions": [
+        selectinload(Model.model_regions).joinedload(ModelRegion.region),
+        selectinload(Model.model_regions).joinedload(ModelRegion.shared_model_owner).joinedload(User.lob),
+    ],
+    "model_last_updated": [selectinload(Model.versions)],
+    # IRPs for MRSAs - load contact user for display
+    "irps": [selectinload(Model.irps).joinedload(IRP.contact_user)],
+    # Tags for categorization - load tag and category for display
+    "tags": [selectinload(Model.model_tags).joinedload(ModelTag.tag).joinedload(Tag.category)],
+}
+
+# Response fields derived from another relationship's data
+MODEL_LIST_DERIVED_FIELDS: Dict[str, str] = {
+    "business_line_name": "owner",
+    "is_aiml": "methodology",
+    "team": "owner",
+}
+
+
+def _parse_model_list_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Parse the ``fields`` query parameter into the set of requested fields.
+
+    Returns None when all fields are requested. Raises 400 for unknown names.
+    """
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(ModelListResponse.model_fields.keys())
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    # Derived fields need the relationship they are computed from
+    for field, source in MODEL_LIST_DERIVED_FIELDS.items():
+        if field in requested:
+            requested.add(source)
+    return requested
+
+
+def _model_list_loader_options(fields: Optional[Set[str]]) -> List[Any]:
+    """Eager-load options for the requested list fields (all when fields is None)."""
+    options: List[Any] = []
+    for field, loaders in MODEL_LIST_FIELD_LOADERS.items():
+        if fields is None or field in fields:
+            options.extend(loaders)
+    return options
+
+
 def _build_model_list_response(
     model: Model,
     include_computed_fields: bool,
     db: Session,
-    team_map: Optional[Dict[int, Optional[dict]]] = None
+    team_map: Optional[Dict[int, Optional[dict]]] = None,
+    approval_statuses: Optional[Dict[int, Any]] = None,
+    risk_rankings: Optional[Dict[int, Optional[dict]]] = None,
+    fields: Optional[Set[str]] = None
 ) -> dict:
-    """Build lightweight model response dict without Pydantic validation overhead."""
+    """Build lightweight model response dict without Pydantic validation overhead.
+
+    approval_statuses / risk_rankings: optional precomputed results of
+    compute_model_approval_statuses and compute_final_model_risk_rankings;
+    computed per model when omitted.
+    fields: relationship-backed fields to populate (see MODEL_LIST_FIELD_LOADERS);
+    all when None. Skipped fields keep their empty defaults and are never lazy-loaded.
+    """
+    def wants(field: str) -> bool:
+        return fields is None or field in fields
+
     # Build lightweight nested objects directly
-    owner_dict = _build_user_list_item(model.owner)
-    developer_dict = _build_user_list_item(model.developer)
-    shared_owner_dict = _build_user_list_item(model.shared_owner)
-    shared_developer_dict = _build_user_list_item(model.shared_developer)
-    monitoring_manager_dict = _build_user_list_item(model.monitoring_manager)
+    owner_dict = _build_user_list_item(model.owner) if wants("owner") else None
+    developer_dict = _build_user_list_item(model.developer) if wants("developer") else None
+    shared_owner_dict = _build_user_list_item(model.shared_owner) if wants("shared_owner") else None
+    shared_developer_dict = _build_user_list_item(model.shared_developer) if wants("shared_developer") else None
+    monitoring_manager_dict = (
+        _build_user_list_item(model.monitoring_manager) if wants("monitoring_manager") else None
+    )
 
     vendor_dict = None
-    if model.vendor:
+    if wants("vendor") and model.vendor:
         vendor_dict = {"vendor_id": model.vendor.vendor_id, "name": model.vendor.name}
 
     risk_tier_dict = None
-    if model.risk_tier:
+    if wants("risk_tier") and model.risk_tier:
         risk_tier_dict = {"value_id": model.risk_tier.value_id, "label": model.risk_tier.label, "code": model.risk_tier.code}
 
     methodology_dict = None
-    if model.methodology:
+    if wants("methodology") and model.methodology:
         methodology_dict = {"methodology_id": model.methodology.methodology_id, "name": model.methodology.name}
 
     ownership_type_dict = None
-    if model.ownership_type:
+    if wants("ownership_type") and model.ownership_type:
         ownership_type_dict = {"value_id": model.ownership_type.value_id, "label": model.ownership_type.label, "code": model.ownership_type.code}
 
     model_type_dict = None
-    if model.model_type:
+    if wants("model_type") and model.model_type:
         model_type_dict = {"type_id": model.model_type.type_id, "name": model.model_type.name}
 
     wholly_owned_region_dict = None
-    if model.wholly_owned_region:
+    if wants("wholly_owned_region") and model.wholly_owned_region:
         wholly_owned_region_dict = {
             "region_id": model.wholly_owned_region.region_id,
             "region_code": model.wholly_owned_region.code,
@@ -548,7 +625,7 @@ def _build_model_list_response(
 
     # Build regions list from model_regions relationship
     regions_list = []
-    for mr in model.model_regions:
+    for mr in (model.model_regions if wants("regions") else []):
         if mr.region:
             regions_list.append({
                 "region_id": mr.region.region_id,
@@ -562,16 +639,16 @@ def _build_model_list_response(
     users_list = [
         user_item for user_item in (_build_user_list_item(u) for u in model.users)
         if user_item
-    ] if model.users else []
+    ] if wants("users") and model.users else []
 
     # Build regulatory categories list
     reg_cats_list = []
-    for rc in model.regulatory_categories:
+    for rc in (model.regulatory_categories if wants("regulatory_categories") else []):
         reg_cats_list.append({"value_id": rc.value_id, "label": rc.label, "code": rc.code})
 
     # Build MRSA risk level dict
     mrsa_risk_level_dict = None
-    if model.mrsa_risk_level:
+    if wants("mrsa_risk_level") and model.mrsa_risk_level:
         mrsa_risk_level_dict = {
             "value_id": model.mrsa_risk_level.value_id,
             "label": model.mrsa_risk_level.label,
@@ -581,7 +658,7 @@ def _build_model_list_response(
 
     # Build usage frequency dict
     usage_frequency_dict = None
-    if model.usage_frequency:
+    if wants("usage_frequency") and model.usage_frequency:
         usage_frequency_dict = {
             "value_id": model.usage_frequency.value_id,
             "label": model.usage_frequency.label,
@@ -590,7 +667,7 @@ def _build_model_list_response(
 
     # Build IRPs list for MRSAs
     irps_list = []
-    for irp in model.irps:
+    for irp in (model.irps if wants("irps") else []):
         irp_dict = {
             "irp_id": irp.irp_id,
             "process_name": irp.process_name,
@@ -609,7 +686,7 @@ def _build_model_list_response(
 
     # Build tags list
     tags_list = []
-    for mt in model.model_tags:
+    for mt in (model.model_tags if wants("tags") else []):
         if mt.tag:
             tag = mt.tag
             tags_list.append({
@@ -624,12 +701,12 @@ def _build_model_list_response(
 
     # Compute business_line_name from owner's LOB chain
     business_line = None
-    if model.owner:
+    if wants("owner") and model.owner:
         business_line = get_user_lob_rollup_name(model.owner)
 
     # Compute is_aiml from methodology category
     is_aiml = None
-    if model.methodology and model.methodology.category:
+    if wants("methodology") and model.methodology and model.methodology.category:
         is_aiml = model.methodology.category.name == "AI/ML"
 
     result = {
@@ -650,7 +727,7 @@ def _build_model_list_response(
         "mrsa_risk_rationale": model.mrsa_risk_rationale,
         "row_approval_status": model.row_approval_status,
         "business_line_name": business_line,
-        "model_last_updated": get_model_last_updated(model),
+        "model_last_updated": get_model_last_updated(model) if wants("model_last_updated") else None,
         "team": team_map.get(model.model_id) if team_map else None,
         "owner_id": model.owner_id,
         "developer_id": model.developer_id,
@@ -692,12 +769,18 @@ def _build_model_list_response(
         from app.core.final_rating import compute_final_model_risk_ranking
         from app.core.model_approval_status import compute_model_approval_status, get_status_label
 
-        risk_ranking = compute_final_model_risk_ranking(db, model.model_id)
+        if risk_rankings is not None and model.model_id in risk_rankings:
+            risk_ranking = risk_rankings[model.model_id]
+        else:
+            risk_ranking = compute_final_model_risk_ranking(db, model.model_id)
         if risk_ranking:
             result['scorecard_outcome'] = risk_ranking.get('original_scorecard')
             result['residual_risk'] = risk_ranking.get('final_rating')
 
-        status_code, context = compute_model_approval_status(model, db)
+        if approval_statuses is not None and model.model_id in approval_statuses:
+            status_code, context = approval_statuses[model.model_id]
+        else:
+            status_code, context = compute_model_approval_status(model, db)
         result['approval_status'] = status_code
         result['approval_status_label'] = get_status_label(status_code)
 
@@ -711,6 +794,9 @@ def list_models(
     model_ids: Optional[str] = Query(None, description="Comma-separated model IDs to filter (for KPI drill-down)"),
     is_mrsa: Optional[bool] = Query(None, description="Filter by MRSA status: True=MRSAs only, False=Models only, None=All"),
     team_id: Optional[int] = Query(None, description="Filter by team ID (0 = Unassigned)"),
+    after_id: Optional[int] = Query(None, ge=0, description="Keyset cursor: return models with model_id greater than this"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of models to return (ordered by model_id)"),
+    fields: Optional[str] = Query(None, description="Comma-separated response fields to populate (default: all)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -728,35 +814,16 @@ def list_models(
     - model_ids: Comma-separated model IDs to filter (for KPI drill-down links)
     - is_mrsa: Filter by MRSA status - True shows only MRSAs, False shows only models, None shows all
     - team_id: Filter by effective team ID (0 = Unassigned)
+    - after_id / limit: Keyset pagination ordered by model_id. Pass the last model_id of a
+      page as after_id to fetch the next page; a page shorter than limit is the last one.
+    - fields: Sparse fieldset, e.g. "owner,risk_tier,tags". Scalar columns are always returned;
+      relationship-backed fields not listed are left empty and their loaders are skipped.
     """
     from app.core.rls import apply_model_rls
-    from app.models.lob import LOBUnit
 
-    query = db.query(Model).options(
-        # Single-value relationships: use joinedload (efficient for 1:1/N:1)
-        joinedload(Model.owner).joinedload(User.lob).joinedload(LOBUnit.parent).joinedload(LOBUnit.parent).joinedload(LOBUnit.parent),
-        joinedload(Model.developer).joinedload(User.lob),
-        joinedload(Model.shared_owner).joinedload(User.lob),
-        joinedload(Model.shared_developer).joinedload(User.lob),
-        joinedload(Model.monitoring_manager).joinedload(User.lob),
-        joinedload(Model.vendor),
-        joinedload(Model.risk_tier),
-        joinedload(Model.mrsa_risk_level),
-        joinedload(Model.model_type),
-        joinedload(Model.methodology).joinedload(Methodology.category),
-        joinedload(Model.wholly_owned_region),
-        joinedload(Model.ownership_type),
-        # Collections: use selectinload to avoid Cartesian product explosion
-        selectinload(Model.users).joinedload(User.lob),
-        selectinload(Model.regulatory_categories),
-        selectinload(Model.model_regions).joinedload(ModelRegion.region),
-        selectinload(Model.model_regions).joinedload(ModelRegion.shared_model_owner).joinedload(User.lob),
-        selectinload(Model.versions),
-        # IRPs for MRSAs - load contact user for display
-        selectinload(Model.irps).joinedload(IRP.contact_user),
-        # Tags for categorization - load tag and category for display
-        selectinload(Model.model_tags).joinedload(ModelTag.tag).joinedload(Tag.category)
-    )
+    requested_fields = _parse_model_list_fields(fields)
+
+    query = db.query(Model).options(*_model_list_loader_options(requested_fields))
 
     # Apply row-level security filtering
     query = apply_model_rls(query, current_user, db)
@@ -771,55 +838,79 @@ def list_models(
     if is_mrsa is not None:
         query = query.filter(Model.is_mrsa == is_mrsa)
 
-    models = query.all()
-
     # Build LOB → Team map once for this request
     lob_team_map = build_lob_team_map(db)
 
-    # Apply team filter if requested
+    # Apply team filter if requested (effective team comes from the owner's LOB)
     if team_id is not None:
         if team_id == 0:
-            models = [
-                model for model in models
-                if not (model.owner and lob_team_map.get(model.owner.lob_id))
-            ]
+            assigned_lob_ids = [lob_id for lob_id, mapped in lob_team_map.items() if mapped]
+            query = query.filter(~Model.owner_id.in_(
+                select(User.user_id).where(User.lob_id.in_(assigned_lob_ids))
+            ))
         else:
-            models = [
-                model for model in models
-                if model.owner and lob_team_map.get(model.owner.lob_id) == team_id
-            ]
+            team_lob_ids = [lob_id for lob_id, mapped in lob_team_map.items() if mapped == team_id]
+            query = query.filter(Model.owner_id.in_(
+                select(User.user_id).where(User.lob_id.in_(team_lob_ids))
+            ))
 
     # Filter out sub-models if requested
     if exclude_sub_models:
         from sqlalchemy import func
-        sub_model_ids = db.query(ModelHierarchy.child_model_id).filter(
-            (ModelHierarchy.end_date == None) | (
-                ModelHierarchy.end_date >= func.current_date())
-        ).distinct().all()
-        sub_model_ids = [row[0] for row in sub_model_ids]
-        models = [m for m in models if m.model_id not in sub_model_ids]
+        query = query.filter(~Model.model_id.in_(
+            select(ModelHierarchy.child_model_id).where(
+                (ModelHierarchy.end_date == None) | (
+                    ModelHierarchy.end_date >= func.current_date())
+            )
+        ))
+
+    # Keyset pagination
+    if after_id is not None:
+        query = query.filter(Model.model_id > after_id)
+    if after_id is not None or limit is not None:
+        query = query.order_by(Model.model_id)
+    if limit is not None:
+        query = query.limit(limit)
+
+    models = query.all()
 
     # Build lightweight responses without Pydantic validation overhead
-    team_ids = set()
-    model_team_ids: Dict[int, Optional[int]] = {}
-    for model in models:
-        owner_lob_id = model.owner.lob_id if model.owner else None
-        effective_team_id = lob_team_map.get(owner_lob_id) if owner_lob_id else None
-        model_team_ids[model.model_id] = effective_team_id
-        if effective_team_id:
-            team_ids.add(effective_team_id)
-
-    team_info = {}
-    if team_ids:
-        teams = db.query(Team).filter(Team.team_id.in_(team_ids)).all()
-        team_info = {team.team_id: {"team_id": team.team_id, "name": team.name} for team in teams}
-
-    model_team_map = {
-        model_id: team_info.get(team_id) if team_id else None
-        for model_id, team_id in model_team_ids.items()
-    }
+    model_team_map = None
+    if requested_fields is None or "team" in requested_fields:
+        team_ids = set()
+        model_team_ids: Dict[int, Optional[int]] = {}
+        for model in models:
+            owner_lob_id = model.owner.lob_id if model.owner else None
+            effective_team_id = lob_team_map.get(owner_lob_id) if owner_lob_id else None
+            model_team_ids[model.model_id] = effective_team_id
+            if effective_team_id:
+                team_ids.add(effective_team_id)
+
+        team_info = {}
+        if team_ids:
+            teams = db.query(Team).filter(Team.team_id.in_(team_ids)).all()
+            team_info = {team.team_id: {"team_id": team.team_id, "name": team.name} for team in teams}
+
+        model_team_map = {
+            model_id: team_info.get(team_id) if team_id else None
+            for model_id, team_id in model_team_ids.items()
+        }
 
-    results = [_build_model_list_response(m, include_computed_fields, db, model_team_map) for m in models]
+    approval_statuses = None
+    risk_rankings = None
+    if include_computed_fields and models:
+        from app.core.final_rating import compute_final_model_risk_rankings
+        from app.core.model_approval_status import compute_model_approval_statuses
+        approval_statuses = compute_model_approval_statuses(models, db)
+        risk_rankings = compute_final_model_risk_rankings(db, [m.model_id for m in models])
+
+    results = [
+        _build_model_list_response(
+            m, include_computed_fields, db, model_team_map, approval_statuses, risk_rankings,
+            requested_fields
+        )
+        for m in models
+    ]
 
     # Batch compute revalidation fields (only when include_computed_fields is True)
     if include_computed_fields and models:
@@ -1236,7 +1327,8 @@ def create_model(
             db.add(status_history)
 
             # Create audit log for validation request
-            validation_audit = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationRequest",
                 entity_id=validation_request.request_id,
                 action="CREATE",
@@ -1245,10 +1337,8 @@ def create_model(
                     "model_id": model.model_id,
                     "model_name": model.model_name,
                     "auto_created": True
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(validation_audit)
             db.commit()
 
     # Reload with relationships
@@ -1486,7 +1576,7 @@ def bulk_compute_approval_status(
     - Whether the model is overdue for revalidation
     - Days until next validation due
     """
-    from app.core.model_approval_status import compute_model_approval_status, get_status_label
+    from app.core.model_approval_status import compute_model_approval_statuses, get_status_label
 
     max_model_ids = 200
     if len(request.model_ids) > max_model_ids:
@@ -1500,6 +1590,13 @@ def bulk_compute_approval_status(
     ).all()
     models_by_id = {model.model_id: model for model in models}
 
+    batch_error: Optional[str] = None
+    try:
+        approval_statuses = compute_model_approval_statuses(models, db)
+    except Exception as e:
+        approval_statuses = {}
+        batch_error = str(e)
+
     results = []
     found_count = 0
 
@@ -1515,8 +1612,16 @@ def bulk_compute_approval_status(
 
         found_count += 1
 
+        if batch_error is not None:
+            results.append(BulkApprovalStatusItem(
+                model_id=model_id,
+                model_name=model.model_name,
+                error=batch_error
+            ))
+            continue
+
         try:
-            status_code, context = compute_model_approval_status(model, db)
+            status_code, context = approval_statuses[model_id]
             results.append(BulkApprovalStatusItem(
                 model_id=model_id,
                 model_name=model.model_name,
@@ -2709,8 +2814,64 @@ def delete_model(
     return None
 
 
+def _join_labels(items, attribute: str) -> str:
+    return ", ".join(getattr(item, attribute) for item in items) if items else ""
+
+
+MODEL_EXPORT_COLUMNS = [
+    CSVColumn("model_id", "Model ID", lambda m: m.model_id),
+    CSVColumn("model_name", "Model Name", lambda m: m.model_name),
+    CSVColumn("description", "Description", lambda m: m.description or ""),
+    CSVColumn("products_covered", "Products Covered", lambda m: m.products_covered or ""),
+    CSVColumn("development_type", "Development Type", lambda m: m.development_type),
+    CSVColumn("model_type", "Model Type", lambda m: m.model_type.label if m.model_type else ""),
+    CSVColumn("status", "Status", lambda m: m.status),
+    CSVColumn("owner", "Owner", lambda m: m.owner.full_name if m.owner else ""),
+    CSVColumn("owner_email", "Owner Email", lambda m: m.owner.email if m.owner else ""),
+    CSVColumn("developer", "Developer", lambda m: m.developer.full_name if m.developer else ""),
+    CSVColumn("developer_email", "Developer Email", lambda m: m.developer.email if m.developer else ""),
+    CSVColumn("vendor", "Vendor", lambda m: m.vendor.name if m.vendor else ""),
+    CSVColumn("risk_tier", "Risk Tier", lambda m: m.risk_tier.label if m.risk_tier else ""),
+    CSVColumn("validation_type", "Validation Type", lambda m: m.validation_type.label if m.validation_type else ""),
+    CSVColumn("regulatory_categories", "Regulatory Categories", lambda m: _join_labels(m.regulatory_categories, "label")),
+    CSVColumn("users", "Model Users", lambda m: _join_labels(m.users, "full_name")),
+    CSVColumn("created_at", "Created At", lambda m: m.created_at.isoformat() if m.created_at else ""),
+    CSVColumn("updated_at", "Updated At", lambda m: m.updated_at.isoformat() if m.updated_at else ""),
+]
+
+
+def _labels(items, attribute: str) -> List[str]:
+    return [getattr(item, attribute) for item in items] if items else []
+
+
+MODEL_TYPED_EXPORT_COLUMNS = [
+    TypedColumn("model_id", "Model ID", "int", lambda m: m.model_id),
+    TypedColumn("model_name", "Model Name", "string", lambda m: m.model_name),
+    TypedColumn("description", "Description", "string", lambda m: m.description),
+    TypedColumn("products_covered", "Products Covered", "string", lambda m: m.products_covered),
+    TypedColumn("development_type", "Development Type", "string", lambda m: m.development_type),
+    TypedColumn("model_type", "Model Type", "string", lambda m: m.model_type.label if m.model_type else None),
+    TypedColumn("status", "Status", "string", lambda m: m.status),
+    TypedColumn("owner", "Owner", "string", lambda m: m.owner.full_name if m.owner else None),
+    TypedColumn("owner_email", "Owner Email", "string", lambda m: m.owner.email if m.owner else None),
+    TypedColumn("developer", "Developer", "string", lambda m: m.developer.full_name if m.developer else None),
+    TypedColumn("developer_email", "Developer Email", "string", lambda m: m.developer.email if m.developer else None),
+    TypedColumn("vendor", "Vendor", "string", lambda m: m.vendor.name if m.vendor else None),
+    TypedColumn("risk_tier", "Risk Tier", "string", lambda m: m.risk_tier.label if m.risk_tier else None),
+    TypedColumn("validation_type", "Validation Type", "string",
+                lambda m: m.validation_type.label if m.validation_type else None),
+    TypedColumn("regulatory_categories", "Regulatory Categories", "string_list",
+                lambda m: _labels(m.regulatory_categories, "label")),
+    TypedColumn("users", "Model Users", "string_list", lambda m: _labels(m.users, "full_name")),
+    TypedColumn("created_at", "Created At", "timestamp", lambda m: m.created_at),
+    TypedColumn("updated_at", "Updated At", "timestamp", lambda m: m.updated_at),
+]
+
+
 @router.get("/export/csv")
 def export_models_csv(
+    view_id: Optional[int] = Query(None, description="Saved export view (entity type 'models') selecting the columns"),
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="csv, parquet or arrow"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -2720,9 +2881,16 @@ def export_models_csv(
     Row-Level Security:
     - Admin, Validator, Global Approver, Regional Approver: Export all models
     - User: Export only models where they are owner, developer, or delegate
+
+    Rows are streamed in batches, so memory use does not grow with the number
+    of models. Pass view_id to export only (and in the order of) the columns
+    of a saved export view, and format=parquet or format=arrow for a typed
+    columnar file instead of CSV.
     """
     from app.core.rls import apply_model_rls
 
+    view_keys = export_view_columns(db, view_id, current_user, "models")
+
     query = db.query(Model).options(
         joinedload(Model.owner),
         joinedload(Model.developer),
@@ -2730,80 +2898,20 @@ def export_models_csv(
         joinedload(Model.risk_tier),
         joinedload(Model.validation_type),
         joinedload(Model.model_type),
-        joinedload(Model.users),
-        joinedload(Model.regulatory_categories)
+        selectinload(Model.users),
+        selectinload(Model.regulatory_categories)
     )
 
     # Apply row-level security filtering
-    query = apply_model_rls(query, current_user, db)
-    models = query.all()
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        "Model ID",
-        "Model Name",
-        "Description",
-        "Products Covered",
-        "Development Type",
-        "Model Type",
-        "Status",
-        "Owner",
-        "Owner Email",
-        "Developer",
-        "Developer Email",
-        "Vendor",
-        "Risk Tier",
-        "Validation Type",
-        "Regulatory Categories",
-        "Model Users",
-        "Created At",
-        "Updated At"
-    ])
-
-    # Write data rows
-    for model in models:
-        # Format model users as comma-separated list
-        model_users_str = ", ".join(
-            [u.full_name for u in model.users]) if model.users else ""
-        # Format regulatory categories as comma-separated list
-        reg_categories_str = ", ".join(
-            [c.label for c in model.regulatory_categories]) if model.regulatory_categories else ""
-
-        writer.writerow([
-            model.model_id,
-            model.model_name,
-            model.description or "",
-            model.products_covered or "",
-            model.development_type,
-            model.model_type.label if model.model_type else "",
-            model.status,
-            model.owner.full_name if model.owner else "",
-            model.owner.email if model.owner else "",
-            model.developer.full_name if model.developer else "",
-            model.developer.email if model.developer else "",
-            model.vendor.name if model.vendor else "",
-            model.risk_tier.label if model.risk_tier else "",
-            model.validation_type.label if model.validation_type else "",
-            reg_categories_str,
-            model_users_str,
-            model.created_at.isoformat() if model.created_at else "",
-            model.updated_at.isoformat() if model.updated_at else ""
-        ])
-
-    # Reset stream position
-    output.seek(0)
-
-    # Return as streaming response
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=models_export.csv"
-        }
+    query = apply_model_rls(query, current_user, db).order_by(Model.model_id)
+
+    return export_response(
+        stream_query(query),
+        export_format,
+        "models_export",
+        select_columns(MODEL_TYPED_EXPORT_COLUMNS, view_keys),
+        csv_columns=select_columns(MODEL_EXPORT_COLUMNS, view_keys),
+        db=db,
     )
 
 
@@ -3173,183 +3281,217 @@ def resubmit_model(
     return model
 
 
-@router.get("/{model_id}/activity-timeline", response_model=ActivityTimelineResponse)
-def get_model_activity_timeline(
-    model_id: int,
-    limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """
-    Get comprehensive activity timeline for a model.
+# Event kinds shown on a model's activity timeline (see app/core/model_activity.py)
+TIMELINE_EVENT_TYPES = (
+    "model_audit",
+    "version_created",
+    "validation_request_created",
+    "validation_status_change",
+    "validation_approval",
+    "delegate_added",
+    "delegate_removed",
+    "comment_added",
+    "deployment_confirmed",
+    "decommissioning_request_created",
+    "decommissioning_validator_review",
+    "decommissioning_owner_review",
+    "decommissioning_status_change",
+    "decommissioning_approval",
+    "monitoring_cycle_created",
+    "monitoring_cycle_submitted",
+    "monitoring_cycle_completed",
+    "monitoring_cycle_approval",
+    "risk_assessment_audit",
+    "exception_detected",
+    "exception_acknowledged",
+    "exception_closed",
+    "pending_edit_submitted",
+    "pending_edit_reviewed",
+)
 
-    Includes:
-    - Model created/updated (audit logs)
-    - Versions created
-    - Validation requests created/status changes
-    - Validation approvals
-    - Delegates added/removed
-    - Comments added
-    - Deployment tasks confirmed
-    - Decommissioning requests/reviews/approvals
-    - Monitoring cycles (created/submitted/completed/approvals)
-    - Risk assessment changes
-    - Model exceptions (detected/acknowledged/closed)
-    - Pending edits (submitted/approved/rejected)
-    """
-    from app.core.rls import can_access_model
-    from app.models.model_delegate import ModelDelegate
-    from app.models.model_submission_comment import ModelSubmissionComment
-    from app.models.validation import ValidationRequest, ValidationStatusHistory, ValidationApproval
-    from app.models.version_deployment_task import VersionDeploymentTask
+TimelineItems = Dict[Tuple[str, int], ActivityTimelineItem]
 
-    # Check model exists and user has access
-    model = db.query(Model).filter(Model.model_id == model_id).first()
-    if not model:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Model not found"
-        )
 
-    if not can_access_model(model.model_id, current_user, db):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this model"
-        )
+def _model_audit_item(audit: AuditLog, model_id: int, db: Session) -> ActivityTimelineItem:
+    icon = "📝"
+    title = f"Model {audit.action.lower()}"
+    description = None
+    if audit.action == "CREATE":
+        title = "Model created"
+        icon = "✨"
+    elif audit.action == "UPDATE":
+        title = "Model updated"
+        icon = "📝"
+        # Format change details for display
+        description = _format_audit_changes(audit.changes, db)
+    elif audit.action == "SUBMIT":
+        title = "Model submitted for approval"
+        icon = "📤"
+    elif audit.action == "APPROVE":
+        title = "Model approved"
+        icon = "✅"
+    elif audit.action == "REJECT":
+        title = "Model submission rejected"
+        icon = "❌"
+    elif audit.action == "RESUBMIT":
+        title = "Model resubmitted"
+        icon = "🔄"
+    elif audit.action == "TAGS_ADDED":
+        icon = "🏷️"
+        tags_added = audit.changes.get("tags_added", []) if audit.changes else []
+        if tags_added:
+            tag_list = ", ".join(tags_added)
+            title = f"Tags added: {tag_list}"
+        else:
+            title = "Tags added"
+    elif audit.action == "TAG_REMOVED":
+        icon = "🏷️"
+        tag_removed = audit.changes.get("tag_removed", "") if audit.changes else ""
+        if tag_removed:
+            title = f"Tag removed: {tag_removed}"
+        else:
+            title = "Tag removed"
+    # Due date override actions
+    elif audit.action == "due_date_override_created":
+        icon = "📅"
+        override_date = audit.changes.get("override_date", "") if audit.changes else ""
+        override_type = audit.changes.get("override_type", "") if audit.changes else ""
+        type_label = "one-time" if override_type == "ONE_TIME" else "permanent"
+        title = f"Due date override created ({type_label})"
+        if override_date:
+            description = f"New due date: {override_date}"
+    elif audit.action == "due_date_override_cleared":
+        icon = "🗑️"
+        title = "Due date override cleared (manual)"
+        clear_reason = audit.changes.get("clear_reason", "") if audit.changes else ""
+        if clear_reason:
+            description = f"Reason: {clear_reason}"
+    elif audit.action == "due_date_override_auto_cleared":
+        icon = "✅"
+        title = "Due date override auto-cleared (validation approved)"
+        clear_reason = audit.changes.get("clear_reason", "") if audit.changes else ""
+        if clear_reason:
+            description = clear_reason
+    elif audit.action == "due_date_override_rolled_forward":
+        icon = "🔄"
+        new_date = audit.changes.get("new_override_date", "") if audit.changes else ""
+        title = "Due date override rolled forward"
+        if new_date:
+            description = f"New override date: {new_date}"
+    elif audit.action == "due_date_override_promoted":
+        icon = "⬆️"
+        title = "Due date override promoted to current request"
+        request_id = audit.changes.get("validation_request_id", "") if audit.changes else ""
+        if request_id:
+            description = f"Linked to validation request #{request_id}"
+    elif audit.action == "due_date_override_voided":
+        icon = "⚠️"
+        title = "Due date override voided (request cancelled)"
+        clear_reason = audit.changes.get("clear_reason", "") if audit.changes else ""
+        if clear_reason:
+            description = clear_reason
+    elif audit.action == "BULK_UPDATE":
+        icon = "📋"
+        # Count the fields that were changed
+        field_count = len(audit.changes) if audit.changes else 0
+        if field_count == 1:
+            # Single field - show which field
+            field_key = list(audit.changes.keys())[0]
+            field_name = {
+                "owner_id": "Owner",
+                "developer_id": "Developer",
+                "shared_owner_id": "Shared Owner",
+                "shared_developer_id": "Shared Developer",
+                "monitoring_manager_id": "Monitoring Manager",
+                "products_covered": "Products Covered",
+                "user_ids": "Model Users",
+                "regulatory_category_ids": "Regulatory Categories",
+            }.get(field_key, field_key)
+            title = f"Bulk update: {field_name} changed"
+        else:
+            title = f"Bulk update: {field_count} fields changed"
+        # Use existing formatter for detailed description
+        description = _format_audit_changes(audit.changes, db)
+    return ActivityTimelineItem(
+        timestamp=audit.timestamp,
+        activity_type=f"model_{audit.action.lower()}",
+        title=title,
+        description=description,
+        user_name=audit.user.full_name if audit.user else None,
+        user_id=audit.user_id,
+        entity_type="Model",
+        entity_id=model_id,
+        icon=icon
+    )
+
 
-    activities = []
+def _timeline_audit_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    if ids.get("model_audit"):
+        model_audits = db.query(AuditLog).options(
+            joinedload(AuditLog.user)
+        ).filter(AuditLog.log_id.in_(ids["model_audit"])).all()
+        for audit in model_audits:
+            items[("model_audit", audit.log_id)] = _model_audit_item(audit, model_id, db)
 
-    # 1. Model audit logs (created, updated)
-    model_audits = db.query(AuditLog).options(
+    if not ids.get("risk_assessment_audit"):
+        return
+    risk_audits = db.query(AuditLog).options(
         joinedload(AuditLog.user)
+    ).filter(AuditLog.log_id.in_(ids["risk_assessment_audit"])).all()
+
+    # assessment_id -> region name for better titles
+    assessments = db.query(ModelRiskAssessment).options(
+        joinedload(ModelRiskAssessment.region)
     ).filter(
-        AuditLog.entity_type == "Model",
-        AuditLog.entity_id == model_id
+        ModelRiskAssessment.assessment_id.in_({audit.entity_id for audit in risk_audits})
     ).all()
+    assessment_region_map = {}
+    for a in assessments:
+        if a.region_id:
+            assessment_region_map[a.assessment_id] = a.region.name if a.region else f"Region #{a.region_id}"
+        else:
+            assessment_region_map[a.assessment_id] = "Global"
+
+    for audit in risk_audits:
+        region_name = assessment_region_map.get(audit.entity_id, "")
+        scope_text = f" ({region_name})" if region_name else ""
 
-    for audit in model_audits:
-        icon = "📝"
-        title = f"Model {audit.action.lower()}"
-        description = None
         if audit.action == "CREATE":
-            title = "Model created"
-            icon = "✨"
+            title = f"Risk assessment created{scope_text}"
+            icon = "📊"
         elif audit.action == "UPDATE":
-            title = "Model updated"
-            icon = "📝"
-            # Format change details for display
-            description = _format_audit_changes(audit.changes, db)
-        elif audit.action == "SUBMIT":
-            title = "Model submitted for approval"
-            icon = "📤"
-        elif audit.action == "APPROVE":
-            title = "Model approved"
-            icon = "✅"
-        elif audit.action == "REJECT":
-            title = "Model submission rejected"
-            icon = "❌"
-        elif audit.action == "RESUBMIT":
-            title = "Model resubmitted"
-            icon = "🔄"
-        elif audit.action == "TAGS_ADDED":
-            icon = "🏷️"
-            tags_added = audit.changes.get("tags_added", []) if audit.changes else []
-            if tags_added:
-                tag_list = ", ".join(tags_added)
-                title = f"Tags added: {tag_list}"
-            else:
-                title = "Tags added"
-        elif audit.action == "TAG_REMOVED":
-            icon = "🏷️"
-            tag_removed = audit.changes.get("tag_removed", "") if audit.changes else ""
-            if tag_removed:
-                title = f"Tag removed: {tag_removed}"
-            else:
-                title = "Tag removed"
-        # Due date override actions
-        elif audit.action == "due_date_override_created":
-            icon = "📅"
-            override_date = audit.changes.get("override_date", "") if audit.changes else ""
-            override_type = audit.changes.get("override_type", "") if audit.changes else ""
-            type_label = "one-time" if override_type == "ONE_TIME" else "permanent"
-            title = f"Due date override created ({type_label})"
-            if override_date:
-                description = f"New due date: {override_date}"
-        elif audit.action == "due_date_override_cleared":
+            title = f"Risk assessment updated{scope_text}"
+            icon = "📊"
+        elif audit.action == "DELETE":
+            title = f"Risk assessment deleted{scope_text}"
             icon = "🗑️"
-            title = "Due date override cleared (manual)"
-            clear_reason = audit.changes.get("clear_reason", "") if audit.changes else ""
-            if clear_reason:
-                description = f"Reason: {clear_reason}"
-        elif audit.action == "due_date_override_auto_cleared":
-            icon = "✅"
-            title = "Due date override auto-cleared (validation approved)"
-            clear_reason = audit.changes.get("clear_reason", "") if audit.changes else ""
-            if clear_reason:
-                description = clear_reason
-        elif audit.action == "due_date_override_rolled_forward":
-            icon = "🔄"
-            new_date = audit.changes.get("new_override_date", "") if audit.changes else ""
-            title = "Due date override rolled forward"
-            if new_date:
-                description = f"New override date: {new_date}"
-        elif audit.action == "due_date_override_promoted":
-            icon = "⬆️"
-            title = "Due date override promoted to current request"
-            request_id = audit.changes.get("validation_request_id", "") if audit.changes else ""
-            if request_id:
-                description = f"Linked to validation request #{request_id}"
-        elif audit.action == "due_date_override_voided":
-            icon = "⚠️"
-            title = "Due date override voided (request cancelled)"
-            clear_reason = audit.changes.get("clear_reason", "") if audit.changes else ""
-            if clear_reason:
-                description = clear_reason
-        elif audit.action == "BULK_UPDATE":
-            icon = "📋"
-            # Count the fields that were changed
-            field_count = len(audit.changes) if audit.changes else 0
-            if field_count == 1:
-                # Single field - show which field
-                field_key = list(audit.changes.keys())[0]
-                field_name = {
-                    "owner_id": "Owner",
-                    "developer_id": "Developer",
-                    "shared_owner_id": "Shared Owner",
-                    "shared_developer_id": "Shared Developer",
-                    "monitoring_manager_id": "Monitoring Manager",
-                    "products_covered": "Products Covered",
-                    "user_ids": "Model Users",
-                    "regulatory_category_ids": "Regulatory Categories",
-                }.get(field_key, field_key)
-                title = f"Bulk update: {field_name} changed"
-            else:
-                title = f"Bulk update: {field_count} fields changed"
-            # Use existing formatter for detailed description
-            description = _format_audit_changes(audit.changes, db)
+        else:
+            title = f"Risk assessment {audit.action.lower()}{scope_text}"
+            icon = "📊"
 
-        activities.append(ActivityTimelineItem(
+        items[("risk_assessment_audit", audit.log_id)] = ActivityTimelineItem(
             timestamp=audit.timestamp,
-            activity_type=f"model_{audit.action.lower()}",
+            activity_type=f"risk_assessment_{audit.action.lower()}",
             title=title,
-            description=description,
+            description=_format_risk_assessment_changes(audit.changes, audit.action, db),
             user_name=audit.user.full_name if audit.user else None,
             user_id=audit.user_id,
-            entity_type="Model",
-            entity_id=model_id,
+            entity_type="ModelRiskAssessment",
+            entity_id=audit.entity_id,
             icon=icon
-        ))
+        )
 
-    # 2. Model versions created
+
+def _timeline_version_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    if not ids.get("version_created"):
+        return
     versions = db.query(ModelVersion).options(
         joinedload(ModelVersion.created_by)
-    ).filter(
-        ModelVersion.model_id == model_id
-    ).all()
+    ).filter(ModelVersion.version_id.in_(ids["version_created"])).all()
 
     for version in versions:
         scope_text = f" ({version.scope})" if version.scope != "GLOBAL" else ""
-        activities.append(ActivityTimelineItem(
+        items[("version_created", version.version_id)] = ActivityTimelineItem(
             timestamp=version.created_at,
             activity_type="version_created",
             title=f"Version {version.version_number} created{scope_text}",
@@ -3359,92 +3501,81 @@ def get_model_activity_timeline(
             entity_type="ModelVersion",
             entity_id=version.version_id,
             icon="🚀"
-        ))
+        )
 
-    # 3. Validation requests for this model
-    validation_requests = db.query(ValidationRequest).options(
-        joinedload(ValidationRequest.requestor),
-        joinedload(ValidationRequest.current_status)
-    ).join(
-        ValidationRequest.models
-    ).filter(
-        Model.model_id == model_id
-    ).all()
 
-    for req in validation_requests:
-        activities.append(ActivityTimelineItem(
-            timestamp=req.created_at,
-            activity_type="validation_request_created",
-            title=f"Validation request #{req.request_id} created",
-            description=None,
-            user_name=req.requestor.full_name if req.requestor else None,
-            user_id=req.requestor_id,
-            entity_type="ValidationRequest",
-            entity_id=req.request_id,
-            icon="🔍"
-        ))
+def _timeline_validation_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    from app.models.validation import ValidationRequest, ValidationStatusHistory, ValidationApproval
+
+    if ids.get("validation_request_created"):
+        validation_requests = db.query(ValidationRequest).options(
+            joinedload(ValidationRequest.requestor)
+        ).filter(ValidationRequest.request_id.in_(ids["validation_request_created"])).all()
+        for req in validation_requests:
+            items[("validation_request_created", req.request_id)] = ActivityTimelineItem(
+                timestamp=req.created_at,
+                activity_type="validation_request_created",
+                title=f"Validation request #{req.request_id} created",
+                description=None,
+                user_name=req.requestor.full_name if req.requestor else None,
+                user_id=req.requestor_id,
+                entity_type="ValidationRequest",
+                entity_id=req.request_id,
+                icon="🔍"
+            )
 
-        # Get status history for this request
+    if ids.get("validation_status_change"):
         status_history = db.query(ValidationStatusHistory).options(
             joinedload(ValidationStatusHistory.changed_by),
             joinedload(ValidationStatusHistory.new_status)
-        ).filter(
-            ValidationStatusHistory.request_id == req.request_id
-        ).all()
-
+        ).filter(ValidationStatusHistory.history_id.in_(ids["validation_status_change"])).all()
         for history in status_history:
-            activities.append(ActivityTimelineItem(
+            items[("validation_status_change", history.history_id)] = ActivityTimelineItem(
                 timestamp=history.changed_at,
                 activity_type="validation_status_change",
-                title=f"Validation #{req.request_id} status changed to {history.new_status.label if history.new_status else 'Unknown'}",
+                title=f"Validation #{history.request_id} status changed to {history.new_status.label if history.new_status else 'Unknown'}",
                 description=history.change_reason,
                 user_name=history.changed_by.full_name if history.changed_by else None,
                 user_id=history.changed_by_id,
                 entity_type="ValidationRequest",
-                entity_id=req.request_id,
+                entity_id=history.request_id,
                 icon="🔄"
-            ))
+            )
 
-    # 4. Validation approvals
-    approvals = db.query(ValidationApproval).options(
-        joinedload(ValidationApproval.approver),
-        joinedload(ValidationApproval.request)
-    ).join(
-        ValidationApproval.request
-    ).join(
-        ValidationRequest.models
-    ).filter(
-        Model.model_id == model_id,
-        ValidationApproval.approved_at.isnot(None)
-    ).all()
+    if ids.get("validation_approval"):
+        approvals = db.query(ValidationApproval).options(
+            joinedload(ValidationApproval.approver)
+        ).filter(ValidationApproval.approval_id.in_(ids["validation_approval"])).all()
+        for approval in approvals:
+            status_icon = "✅" if approval.approval_status == "Approved" else "❌"
+            approved_at = cast(datetime, approval.approved_at)
+            items[("validation_approval", approval.approval_id)] = ActivityTimelineItem(
+                timestamp=approved_at,
+                activity_type="validation_approval",
+                title=f"Validation #{approval.request_id} {approval.approval_status.lower()}",
+                description=approval.comments,
+                user_name=approval.approver.full_name if approval.approver else None,
+                user_id=approval.approver_id,
+                entity_type="ValidationApproval",
+                entity_id=approval.approval_id,
+                icon=status_icon
+            )
 
-    for approval in approvals:
-        status_icon = "✅" if approval.approval_status == "Approved" else "❌"
-        approved_at = cast(datetime, approval.approved_at)
-        activities.append(ActivityTimelineItem(
-            timestamp=approved_at,
-            activity_type="validation_approval",
-            title=f"Validation #{approval.request_id} {approval.approval_status.lower()}",
-            description=approval.comments,
-            user_name=approval.approver.full_name if approval.approver else None,
-            user_id=approval.approver_id,
-            entity_type="ValidationApproval",
-            entity_id=approval.approval_id,
-            icon=status_icon
-        ))
 
-    # 5. Delegates added/removed
+def _timeline_delegate_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    from app.models.model_delegate import ModelDelegate
+
+    delegate_ids = set(ids.get("delegate_added", [])) | set(ids.get("delegate_removed", []))
+    if not delegate_ids:
+        return
     delegates = db.query(ModelDelegate).options(
         joinedload(ModelDelegate.user),
         joinedload(ModelDelegate.delegated_by),
         joinedload(ModelDelegate.revoked_by)
-    ).filter(
-        ModelDelegate.model_id == model_id
-    ).all()
+    ).filter(ModelDelegate.delegate_id.in_(delegate_ids)).all()
 
     for delegate in delegates:
-        # Delegate added
-        activities.append(ActivityTimelineItem(
+        items[("delegate_added", delegate.delegate_id)] = ActivityTimelineItem(
             timestamp=delegate.delegated_at,
             activity_type="delegate_added",
             title=f"{delegate.user.full_name} added as delegate",
@@ -3454,11 +3585,9 @@ def get_model_activity_timeline(
             entity_type="ModelDelegate",
             entity_id=delegate.delegate_id,
             icon="👤"
-        ))
-
-        # Delegate removed (if revoked)
+        )
         if delegate.revoked_at:
-            activities.append(ActivityTimelineItem(
+            items[("delegate_removed", delegate.delegate_id)] = ActivityTimelineItem(
                 timestamp=delegate.revoked_at,
                 activity_type="delegate_removed",
                 title=f"{delegate.user.full_name} removed as delegate",
@@ -3468,17 +3597,20 @@ def get_model_activity_timeline(
                 entity_type="ModelDelegate",
                 entity_id=delegate.delegate_id,
                 icon="👤"
-            ))
+            )
+
+
+def _timeline_comment_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    from app.models.model_submission_comment import ModelSubmissionComment
 
-    # 6. Submission comments
+    if not ids.get("comment_added"):
+        return
     comments = db.query(ModelSubmissionComment).options(
         joinedload(ModelSubmissionComment.user)
-    ).filter(
-        ModelSubmissionComment.model_id == model_id
-    ).all()
+    ).filter(ModelSubmissionComment.comment_id.in_(ids["comment_added"])).all()
 
     for comment in comments:
-        activities.append(ActivityTimelineItem(
+        items[("comment_added", comment.comment_id)] = ActivityTimelineItem(
             timestamp=comment.created_at,
             activity_type="comment_added",
             title=f"Comment added by {comment.user.full_name if comment.user else 'Unknown'}",
@@ -3489,22 +3621,24 @@ def get_model_activity_timeline(
             entity_type="ModelSubmissionComment",
             entity_id=comment.comment_id,
             icon="💬"
-        ))
+        )
+
 
-    # 7. Deployment tasks confirmed
+def _timeline_deployment_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    from app.models.version_deployment_task import VersionDeploymentTask
+
+    if not ids.get("deployment_confirmed"):
+        return
     deployment_tasks = db.query(VersionDeploymentTask).options(
         joinedload(VersionDeploymentTask.version),
         joinedload(VersionDeploymentTask.confirmed_by),
         joinedload(VersionDeploymentTask.region)
-    ).filter(
-        VersionDeploymentTask.model_id == model_id,
-        VersionDeploymentTask.confirmed_at.isnot(None)
-    ).all()
+    ).filter(VersionDeploymentTask.task_id.in_(ids["deployment_confirmed"])).all()
 
     for task in deployment_tasks:
         region_text = f" to {task.region.name}" if task.region else ""
         confirmed_at = cast(datetime, task.confirmed_at)
-        activities.append(ActivityTimelineItem(
+        items[("deployment_confirmed", task.task_id)] = ActivityTimelineItem(
             timestamp=confirmed_at,
             activity_type="deployment_confirmed",
             title=f"Version {task.version.version_number} deployed{region_text}",
@@ -3514,72 +3648,71 @@ def get_model_activity_timeline(
             entity_type="VersionDeploymentTask",
             entity_id=task.task_id,
             icon="🚀"
-        ))
-
-    # 8. Decommissioning requests
-    from app.models.decommissioning import DecommissioningRequest, DecommissioningStatusHistory, DecommissioningApproval
+        )
 
-    decom_requests = db.query(DecommissioningRequest).options(
-        joinedload(DecommissioningRequest.created_by),
-        joinedload(DecommissioningRequest.reason),
-        joinedload(DecommissioningRequest.validator_reviewed_by),
-        joinedload(DecommissioningRequest.owner_reviewed_by),
-        joinedload(DecommissioningRequest.status_history).joinedload(
-            DecommissioningStatusHistory.changed_by),
-        joinedload(DecommissioningRequest.approvals).joinedload(
-            DecommissioningApproval.approved_by)
-    ).filter(
-        DecommissioningRequest.model_id == model_id
-    ).all()
 
-    for decom in decom_requests:
-        # Decommissioning request created
-        reason_text = decom.reason.label if decom.reason else "Unknown reason"
-        activities.append(ActivityTimelineItem(
-            timestamp=decom.created_at,
-            activity_type="decommissioning_request_created",
-            title=f"Decommissioning request #{decom.request_id} created",
-            description=f"Reason: {reason_text}",
-            user_name=decom.created_by.full_name if decom.created_by else None,
-            user_id=decom.created_by_id,
-            entity_type="DecommissioningRequest",
-            entity_id=decom.request_id,
-            icon="🗑️"
-        ))
+def _timeline_decommissioning_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    from app.models.decommissioning import DecommissioningRequest, DecommissioningStatusHistory, DecommissioningApproval
 
-        # Validator review (if completed)
-        if decom.validator_reviewed_at:
-            activities.append(ActivityTimelineItem(
-                timestamp=decom.validator_reviewed_at,
-                activity_type="decommissioning_validator_review",
-                title=f"Decommissioning #{decom.request_id} validator review",
-                description=decom.validator_comment,
-                user_name=decom.validator_reviewed_by.full_name if decom.validator_reviewed_by else None,
-                user_id=decom.validator_reviewed_by_id,
+    request_ids = (
+        set(ids.get("decommissioning_request_created", []))
+        | set(ids.get("decommissioning_validator_review", []))
+        | set(ids.get("decommissioning_owner_review", []))
+    )
+    if request_ids:
+        decom_requests = db.query(DecommissioningRequest).options(
+            joinedload(DecommissioningRequest.created_by),
+            joinedload(DecommissioningRequest.reason),
+            joinedload(DecommissioningRequest.validator_reviewed_by),
+            joinedload(DecommissioningRequest.owner_reviewed_by)
+        ).filter(DecommissioningRequest.request_id.in_(request_ids)).all()
+
+        for decom in decom_requests:
+            reason_text = decom.reason.label if decom.reason else "Unknown reason"
+            items[("decommissioning_request_created", decom.request_id)] = ActivityTimelineItem(
+                timestamp=decom.created_at,
+                activity_type="decommissioning_request_created",
+                title=f"Decommissioning request #{decom.request_id} created",
+                description=f"Reason: {reason_text}",
+                user_name=decom.created_by.full_name if decom.created_by else None,
+                user_id=decom.created_by_id,
                 entity_type="DecommissioningRequest",
                 entity_id=decom.request_id,
-                icon="✍️"
-            ))
+                icon="🗑️"
+            )
 
-        # Owner review (if completed and was required)
-        if decom.owner_approval_required and decom.owner_reviewed_at:
-            activities.append(ActivityTimelineItem(
-                timestamp=decom.owner_reviewed_at,
-                activity_type="decommissioning_owner_review",
-                title=f"Decommissioning #{decom.request_id} owner review",
-                description=decom.owner_comment,
-                user_name=decom.owner_reviewed_by.full_name if decom.owner_reviewed_by else None,
-                user_id=decom.owner_reviewed_by_id,
-                entity_type="DecommissioningRequest",
-                entity_id=decom.request_id,
-                icon="👤"
-            ))
+            if decom.validator_reviewed_at:
+                items[("decommissioning_validator_review", decom.request_id)] = ActivityTimelineItem(
+                    timestamp=decom.validator_reviewed_at,
+                    activity_type="decommissioning_validator_review",
+                    title=f"Decommissioning #{decom.request_id} validator review",
+                    description=decom.validator_comment,
+                    user_name=decom.validator_reviewed_by.full_name if decom.validator_reviewed_by else None,
+                    user_id=decom.validator_reviewed_by_id,
+                    entity_type="DecommissioningRequest",
+                    entity_id=decom.request_id,
+                    icon="✍️"
+                )
 
-        # Status changes (from history)
-        for history in decom.status_history:
-            # Skip the initial creation record (already covered above)
-            if history.old_status is None:
-                continue
+            if decom.owner_approval_required and decom.owner_reviewed_at:
+                items[("decommissioning_owner_review", decom.request_id)] = ActivityTimelineItem(
+                    timestamp=decom.owner_reviewed_at,
+                    activity_type="decommissioning_owner_review",
+                    title=f"Decommissioning #{decom.request_id} owner review",
+                    description=decom.owner_comment,
+                    user_name=decom.owner_reviewed_by.full_name if decom.owner_reviewed_by else None,
+                    user_id=decom.owner_reviewed_by_id,
+                    entity_type="DecommissioningRequest",
+                    entity_id=decom.request_id,
+                    icon="👤"
+                )
+
+    if ids.get("decommissioning_status_change"):
+        status_history = db.query(DecommissioningStatusHistory).options(
+            joinedload(DecommissioningStatusHistory.changed_by)
+        ).filter(DecommissioningStatusHistory.history_id.in_(ids["decommissioning_status_change"])).all()
+
+        for history in status_history:
             status_icon = "🔄"
             if history.new_status == "APPROVED":
                 status_icon = "✅"
@@ -3590,186 +3723,131 @@ def get_model_activity_timeline(
             elif history.new_status == "VALIDATOR_APPROVED":
                 status_icon = "📋"
 
-            activities.append(ActivityTimelineItem(
+            items[("decommissioning_status_change", history.history_id)] = ActivityTimelineItem(
                 timestamp=history.changed_at,
                 activity_type="decommissioning_status_change",
-                title=f"Decommissioning #{decom.request_id} status: {history.new_status}",
+                title=f"Decommissioning #{history.request_id} status: {history.new_status}",
                 description=history.notes,
                 user_name=history.changed_by.full_name if history.changed_by else None,
                 user_id=history.changed_by_id,
                 entity_type="DecommissioningRequest",
-                entity_id=decom.request_id,
+                entity_id=history.request_id,
                 icon=status_icon
-            ))
-
-        # Stage 2 approvals (Global/Regional)
-        for approval in decom.approvals:
-            if approval.approved_at:
-                region_text = f" ({approval.region.name})" if approval.region else ""
-                approval_status = "approved" if approval.is_approved else "rejected"
-                activities.append(ActivityTimelineItem(
-                    timestamp=approval.approved_at,
-                    activity_type="decommissioning_approval",
-                    title=f"Decommissioning #{decom.request_id} {approval.approver_type}{region_text} {approval_status}",
-                    description=approval.comment,
-                    user_name=approval.approved_by.full_name if approval.approved_by else None,
-                    user_id=approval.approved_by_id,
-                    entity_type="DecommissioningApproval",
-                    entity_id=approval.approval_id,
-                    icon="✅" if approval.is_approved else "❌"
-                ))
-
-    # 9. Monitoring cycles (performance monitoring)
-    # Find monitoring plans that include this model
-    scope_exists = db.query(MonitoringCycleModelScope.cycle_id).filter(
-        MonitoringCycleModelScope.cycle_id == MonitoringCycle.cycle_id,
-        MonitoringCycleModelScope.model_id == model_id
-    ).exists()
-    snapshot_exists = db.query(MonitoringPlanModelSnapshot.snapshot_id).filter(
-        MonitoringPlanModelSnapshot.version_id == MonitoringCycle.plan_version_id,
-        MonitoringPlanModelSnapshot.model_id == model_id
-    ).exists()
-    result_exists = db.query(MonitoringResult.result_id).filter(
-        MonitoringResult.cycle_id == MonitoringCycle.cycle_id,
-        MonitoringResult.model_id == model_id
-    ).exists()
-
-    monitoring_cycles = db.query(MonitoringCycle).options(
-        joinedload(MonitoringCycle.plan),
-        joinedload(MonitoringCycle.submitted_by),
-        joinedload(MonitoringCycle.completed_by),
-        joinedload(MonitoringCycle.approvals).joinedload(MonitoringCycleApproval.approver),
-        joinedload(MonitoringCycle.approvals).joinedload(MonitoringCycleApproval.region)
-    ).filter(
-        or_(scope_exists, snapshot_exists, result_exists)
-    ).all()
+            )
 
-    for cycle in monitoring_cycles:
-        plan_name = cycle.plan.name if cycle.plan else "Unknown Plan"
-        period_text = f"{cycle.period_start_date} to {cycle.period_end_date}"
-
-        # Cycle created
-        activities.append(ActivityTimelineItem(
-            timestamp=cycle.created_at,
-            activity_type="monitoring_cycle_created",
-            title=f"Monitoring cycle started: {plan_name}",
-            description=f"Period: {period_text}",
-            user_name=None,
-            user_id=None,
-            entity_type="MonitoringCycle",
-            entity_id=cycle.cycle_id,
-            icon="📊"
-        ))
+    if ids.get("decommissioning_approval"):
+        approvals = db.query(DecommissioningApproval).options(
+            joinedload(DecommissioningApproval.approved_by),
+            joinedload(DecommissioningApproval.region)
+        ).filter(DecommissioningApproval.approval_id.in_(ids["decommissioning_approval"])).all()
+
+        for approval in approvals:
+            region_text = f" ({approval.region.name})" if approval.region else ""
+            approval_status = "approved" if approval.is_approved else "rejected"
+            items[("decommissioning_approval", approval.approval_id)] = ActivityTimelineItem(
+                timestamp=cast(datetime, approval.approved_at),
+                activity_type="decommissioning_approval",
+                title=f"Decommissioning #{approval.request_id} {approval.approver_type}{region_text} {approval_status}",
+                description=approval.comment,
+                user_name=approval.approved_by.full_name if approval.approved_by else None,
+                user_id=approval.approved_by_id,
+                entity_type="DecommissioningApproval",
+                entity_id=approval.approval_id,
+                icon="✅" if approval.is_approved else "❌"
+            )
 
-        # Cycle submitted (if submitted)
-        if cycle.submitted_at:
-            activities.append(ActivityTimelineItem(
-                timestamp=cycle.submitted_at,
-                activity_type="monitoring_cycle_submitted",
-                title=f"Monitoring data submitted: {plan_name}",
-                description=f"Period: {period_text}",
-                user_name=cycle.submitted_by.full_name if cycle.submitted_by else None,
-                user_id=cycle.submitted_by_user_id,
-                entity_type="MonitoringCycle",
-                entity_id=cycle.cycle_id,
-                icon="📤"
-            ))
 
-        # Cycle completed/approved (if completed)
-        if cycle.completed_at and cycle.status == "APPROVED":
-            activities.append(ActivityTimelineItem(
-                timestamp=cycle.completed_at,
-                activity_type="monitoring_cycle_completed",
-                title=f"Monitoring cycle completed: {plan_name}",
+def _timeline_monitoring_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    cycle_ids = (
+        set(ids.get("monitoring_cycle_created", []))
+        | set(ids.get("monitoring_cycle_submitted", []))
+        | set(ids.get("monitoring_cycle_completed", []))
+    )
+    if cycle_ids:
+        monitoring_cycles = db.query(MonitoringCycle).options(
+            joinedload(MonitoringCycle.plan),
+            joinedload(MonitoringCycle.submitted_by),
+            joinedload(MonitoringCycle.completed_by)
+        ).filter(MonitoringCycle.cycle_id.in_(cycle_ids)).all()
+
+        for cycle in monitoring_cycles:
+            plan_name = cycle.plan.name if cycle.plan else "Unknown Plan"
+            period_text = f"{cycle.period_start_date} to {cycle.period_end_date}"
+
+            items[("monitoring_cycle_created", cycle.cycle_id)] = ActivityTimelineItem(
+                timestamp=cycle.created_at,
+                activity_type="monitoring_cycle_created",
+                title=f"Monitoring cycle started: {plan_name}",
                 description=f"Period: {period_text}",
-                user_name=cycle.completed_by.full_name if cycle.completed_by else None,
-                user_id=cycle.completed_by_user_id,
+                user_name=None,
+                user_id=None,
                 entity_type="MonitoringCycle",
                 entity_id=cycle.cycle_id,
-                icon="✅"
-            ))
-
-        # Individual approvals
-        for approval in cycle.approvals:
-            if approval.approved_at and approval.approval_status in ["Approved", "Rejected"]:
-                region_text = f" ({approval.region.name})" if approval.region else ""
-                approval_status = "approved" if approval.approval_status == "Approved" else "rejected"
-                activities.append(ActivityTimelineItem(
-                    timestamp=approval.approved_at,
-                    activity_type="monitoring_cycle_approval",
-                    title=f"Monitoring {approval.approval_type}{region_text} {approval_status}: {plan_name}",
-                    description=approval.comments,
-                    user_name=approval.approver.full_name if approval.approver else None,
-                    user_id=approval.approver_id,
-                    entity_type="MonitoringCycleApproval",
-                    entity_id=approval.approval_id,
-                    icon="✅" if approval.approval_status == "Approved" else "❌"
-                ))
-
-    # 10. Risk assessment changes
-    # Get all assessments for this model
-    assessments = db.query(ModelRiskAssessment).filter(
-        ModelRiskAssessment.model_id == model_id
-    ).all()
-
-    assessment_ids = [a.assessment_id for a in assessments]
+                icon="📊"
+            )
 
-    if assessment_ids:
-        risk_audits = db.query(AuditLog).options(
-            joinedload(AuditLog.user)
-        ).filter(
-            AuditLog.entity_type == "ModelRiskAssessment",
-            AuditLog.entity_id.in_(assessment_ids)
-        ).all()
+            if cycle.submitted_at:
+                items[("monitoring_cycle_submitted", cycle.cycle_id)] = ActivityTimelineItem(
+                    timestamp=cycle.submitted_at,
+                    activity_type="monitoring_cycle_submitted",
+                    title=f"Monitoring data submitted: {plan_name}",
+                    description=f"Period: {period_text}",
+                    user_name=cycle.submitted_by.full_name if cycle.submitted_by else None,
+                    user_id=cycle.submitted_by_user_id,
+                    entity_type="MonitoringCycle",
+                    entity_id=cycle.cycle_id,
+                    icon="📤"
+                )
 
-        # Build assessment_id -> region lookup for better titles
-        assessment_region_map = {}
-        for a in assessments:
-            if a.region_id:
-                region = db.query(Region).filter(Region.region_id == a.region_id).first()
-                assessment_region_map[a.assessment_id] = region.name if region else f"Region #{a.region_id}"
-            else:
-                assessment_region_map[a.assessment_id] = "Global"
-
-        for audit in risk_audits:
-            region_name = assessment_region_map.get(audit.entity_id, "")
-            scope_text = f" ({region_name})" if region_name else ""
-
-            if audit.action == "CREATE":
-                title = f"Risk assessment created{scope_text}"
-                icon = "📊"
-            elif audit.action == "UPDATE":
-                title = f"Risk assessment updated{scope_text}"
-                icon = "📊"
-            elif audit.action == "DELETE":
-                title = f"Risk assessment deleted{scope_text}"
-                icon = "🗑️"
-            else:
-                title = f"Risk assessment {audit.action.lower()}{scope_text}"
-                icon = "📊"
+            if cycle.completed_at and cycle.status == "APPROVED":
+                items[("monitoring_cycle_completed", cycle.cycle_id)] = ActivityTimelineItem(
+                    timestamp=cycle.completed_at,
+                    activity_type="monitoring_cycle_completed",
+                    title=f"Monitoring cycle completed: {plan_name}",
+                    description=f"Period: {period_text}",
+                    user_name=cycle.completed_by.full_name if cycle.completed_by else None,
+                    user_id=cycle.completed_by_user_id,
+                    entity_type="MonitoringCycle",
+                    entity_id=cycle.cycle_id,
+                    icon="✅"
+                )
 
-            description = _format_risk_assessment_changes(audit.changes, audit.action, db)
+    if ids.get("monitoring_cycle_approval"):
+        approvals = db.query(MonitoringCycleApproval).options(
+            joinedload(MonitoringCycleApproval.cycle).joinedload(MonitoringCycle.plan),
+            joinedload(MonitoringCycleApproval.approver),
+            joinedload(MonitoringCycleApproval.region)
+        ).filter(MonitoringCycleApproval.approval_id.in_(ids["monitoring_cycle_approval"])).all()
+
+        for approval in approvals:
+            plan_name = approval.cycle.plan.name if approval.cycle.plan else "Unknown Plan"
+            region_text = f" ({approval.region.name})" if approval.region else ""
+            approval_status = "approved" if approval.approval_status == "Approved" else "rejected"
+            items[("monitoring_cycle_approval", approval.approval_id)] = ActivityTimelineItem(
+                timestamp=cast(datetime, approval.approved_at),
+                activity_type="monitoring_cycle_approval",
+                title=f"Monitoring {approval.approval_type}{region_text} {approval_status}: {plan_name}",
+                description=approval.comments,
+                user_name=approval.approver.full_name if approval.approver else None,
+                user_id=approval.approver_id,
+                entity_type="MonitoringCycleApproval",
+                entity_id=approval.approval_id,
+                icon="✅" if approval.approval_status == "Approved" else "❌"
+            )
 
-            activities.append(ActivityTimelineItem(
-                timestamp=audit.timestamp,
-                activity_type=f"risk_assessment_{audit.action.lower()}",
-                title=title,
-                description=description,
-                user_name=audit.user.full_name if audit.user else None,
-                user_id=audit.user_id,
-                entity_type="ModelRiskAssessment",
-                entity_id=audit.entity_id,
-                icon=icon
-            ))
 
-    # 11. Model exceptions (opened, acknowledged, closed)
+def _timeline_exception_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
+    exception_ids = (
+        set(ids.get("exception_detected", []))
+        | set(ids.get("exception_acknowledged", []))
+        | set(ids.get("exception_closed", []))
+    )
+    if not exception_ids:
+        return
     exceptions = db.query(ModelException).options(
         joinedload(ModelException.acknowledged_by),
-        joinedload(ModelException.closed_by),
-        joinedload(ModelException.status_history).joinedload(ModelExceptionStatusHistory.changed_by)
-    ).filter(
-        ModelException.model_id == model_id
-    ).all()
+        joinedload(ModelException.closed_by)
+    ).filter(ModelException.exception_id.in_(exception_ids)).all()
 
     exception_type_labels = {
         "UNMITIGATED_PERFORMANCE": "Unmitigated Performance Problem",
@@ -3780,8 +3858,7 @@ def get_model_activity_timeline(
     for exc in exceptions:
         type_label = exception_type_labels.get(exc.exception_type, exc.exception_type)
 
-        # Exception created (detected)
-        activities.append(ActivityTimelineItem(
+        items[("exception_detected", exc.exception_id)] = ActivityTimelineItem(
             timestamp=exc.detected_at,
             activity_type="exception_detected",
             title=f"Exception detected: {type_label}",
@@ -3791,11 +3868,10 @@ def get_model_activity_timeline(
             entity_type="ModelException",
             entity_id=exc.exception_id,
             icon="🚨"
-        ))
+        )
 
-        # Exception acknowledged (if acknowledged)
         if exc.acknowledged_at:
-            activities.append(ActivityTimelineItem(
+            items[("exception_acknowledged", exc.exception_id)] = ActivityTimelineItem(
                 timestamp=exc.acknowledged_at,
                 activity_type="exception_acknowledged",
                 title=f"Exception #{exc.exception_code} acknowledged",
@@ -3805,12 +3881,11 @@ def get_model_activity_timeline(
                 entity_type="ModelException",
                 entity_id=exc.exception_id,
                 icon="👁️"
-            ))
+            )
 
-        # Exception closed (if closed)
         if exc.closed_at:
             close_method = "Auto-closed" if exc.auto_closed else "Closed"
-            activities.append(ActivityTimelineItem(
+            items[("exception_closed", exc.exception_id)] = ActivityTimelineItem(
                 timestamp=exc.closed_at,
                 activity_type="exception_closed",
                 title=f"Exception #{exc.exception_code} {close_method.lower()}",
@@ -3820,25 +3895,27 @@ def get_model_activity_timeline(
                 entity_type="ModelException",
                 entity_id=exc.exception_id,
                 icon="✅"
-            ))
+            )
+
 
-    # 12. Model pending edits (edit requests and their outcomes)
+def _timeline_pending_edit_items(db: Session, model_id: int, ids: Dict[str, List[int]], items: TimelineItems) -> None:
     from app.models.model_pending_edit import ModelPendingEdit
 
+    pending_edit_ids = set(ids.get("pending_edit_submitted", [])) | set(ids.get("pending_edit_reviewed", []))
+    if not pending_edit_ids:
+        return
     pending_edits = db.query(ModelPendingEdit).options(
         joinedload(ModelPendingEdit.requested_by),
         joinedload(ModelPendingEdit.reviewed_by)
-    ).filter(
-        ModelPendingEdit.model_id == model_id
-    ).all()
+    ).filter(ModelPendingEdit.pending_edit_id.in_(pending_edit_ids)).all()
 
     for pe in pending_edits:
         pending_edit_any = cast(Any, pe)
+        pending_edit_id = cast(int, pending_edit_any.pending_edit_id)
         requested_at = cast(Optional[datetime], pending_edit_any.requested_at)
         reviewed_at = cast(Optional[datetime], pending_edit_any.reviewed_at)
         pending_status = cast(Optional[str], pending_edit_any.status)
 
-        # Pending edit submitted
         if requested_at:
             # Summarize the fields being changed
             proposed_changes_raw = pending_edit_any.proposed_changes
@@ -3848,7 +3925,7 @@ def get_model_activity_timeline(
             if len(changed_fields) > 3:
                 field_summary += f" (+{len(changed_fields) - 3} more)"
 
-            activities.append(ActivityTimelineItem(
+            items[("pending_edit_submitted", pending_edit_id)] = ActivityTimelineItem(
                 timestamp=requested_at,
                 activity_type="pending_edit_submitted",
                 title="Model edit submitted for approval",
@@ -3856,11 +3933,10 @@ def get_model_activity_timeline(
                 user_name=pending_edit_any.requested_by.full_name if pending_edit_any.requested_by else None,
                 user_id=pending_edit_any.requested_by.user_id if pending_edit_any.requested_by else None,
                 entity_type="ModelPendingEdit",
-                entity_id=cast(int, pending_edit_any.pending_edit_id),
+                entity_id=pending_edit_id,
                 icon="📝"
-            ))
+            )
 
-        # Pending edit reviewed (approved or rejected)
         if reviewed_at and pending_status in ("approved", "rejected"):
             if pending_status == "approved":
                 title = "Model edit approved and applied"
@@ -3869,7 +3945,7 @@ def get_model_activity_timeline(
                 title = "Model edit rejected"
                 icon = "❌"
 
-            activities.append(ActivityTimelineItem(
+            items[("pending_edit_reviewed", pending_edit_id)] = ActivityTimelineItem(
                 timestamp=reviewed_at,
                 activity_type=f"pending_edit_{pending_status}",
                 title=title,
@@ -3877,21 +3953,102 @@ def get_model_activity_timeline(
                 user_name=pending_edit_any.reviewed_by.full_name if pending_edit_any.reviewed_by else None,
                 user_id=pending_edit_any.reviewed_by.user_id if pending_edit_any.reviewed_by else None,
                 entity_type="ModelPendingEdit",
-                entity_id=cast(int, pending_edit_any.pending_edit_id),
+                entity_id=pending_edit_id,
                 icon=icon
-            ))
+            )
 
-    # Sort all activities by timestamp (newest first)
-    activities.sort(key=lambda x: x.timestamp, reverse=True)
 
-    # Apply limit
-    activities = activities[:limit]
+_TIMELINE_ITEM_LOADERS = (
+    _timeline_audit_items,
+    _timeline_version_items,
+    _timeline_validation_items,
+    _timeline_delegate_items,
+    _timeline_comment_items,
+    _timeline_deployment_items,
+    _timeline_decommissioning_items,
+    _timeline_monitoring_items,
+    _timeline_exception_items,
+    _timeline_pending_edit_items,
+)
+
+
+@router.get("/{model_id}/activity-timeline", response_model=ActivityTimelineResponse)
+def get_model_activity_timeline(
+    model_id: int,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get comprehensive activity timeline for a model, newest first.
+
+    Includes:
+    - Model created/updated (audit logs)
+    - Versions created
+    - Validation requests created/status changes
+    - Validation approvals
+    - Delegates added/removed
+    - Comments added
+    - Deployment tasks confirmed
+    - Decommissioning requests/reviews/approvals
+    - Monitoring cycles (created/submitted/completed/approvals)
+    - Risk assessment changes
+    - Model exceptions (detected/acknowledged/closed)
+    - Pending edits (submitted/approved/rejected)
+
+    One page is read from the model activity stream; pass ``next_cursor`` as
+    ``cursor`` to get the next page.
+    """
+    from app.core.rls import can_access_model
+
+    # Check model exists and user has access
+    model = db.query(Model).filter(Model.model_id == model_id).first()
+    if not model:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Model not found"
+        )
+
+    if not can_access_model(model.model_id, current_user, db):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this model"
+        )
+
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
+    # One extra row tells whether another page follows
+    page = activity_page(db, TIMELINE_EVENT_TYPES, [model_id], limit + 1, cursor=after)
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    items: TimelineItems = {}
+    ids = source_ids_by_type(page)
+    for load_items in _TIMELINE_ITEM_LOADERS:
+        load_items(db, model_id, ids, items)
+
+    activities = [
+        items[(event.event_type, event.source_id)]
+        for event in page
+        if (event.event_type, event.source_id) in items
+    ]
 
     return ActivityTimelineResponse(
         model_id=model_id,
         model_name=model.model_name,
         activities=activities,
-        total_count=len(activities)
+        page_count=len(activities),
+        total_count=len(activities),
+        next_cursor=page[-1].cursor if has_more else None
     )
 
 
@@ -4943,10 +5100,11 @@ def bulk_update_fields(
     skipped_count = 0
     failed_count = 0
 
+    audit = audit_batch(db, "Model", "BULK_UPDATE", current_user.user_id)
     for model in models:
         try:
             error = _validate_and_apply_bulk_update(
-                db, model, payload_dict, current_user
+                db, model, payload_dict, audit
             )
             if error:
                 results.append(BulkUpdateResultItem(
@@ -4989,7 +5147,7 @@ def _validate_and_apply_bulk_update(
     db: Session,
     model: Model,
     payload_dict: dict,
-    current_user: User
+    audit: AuditBatch
 ) -> Optional[str]:
     """
     Validate and apply bulk update to a single model.
@@ -5105,13 +5263,6 @@ def _validate_and_apply_bulk_update(
     # Create audit log entry if any changes were made
     if changes_applied:
         model.updated_at = utc_now()
-        create_audit_log(
-            db=db,
-            entity_type="Model",
-            entity_id=model.model_id,
-            action="BULK_UPDATE",
-            user_id=current_user.user_id,
-            changes=changes_applied
-        )
+        audit.add(model.model_id, changes_applied)
 
     return None  # Success
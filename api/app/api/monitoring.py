@@ -6,13 +6,29 @@ from typing import List, Optional, Union
 from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_, case
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from sqlalchemy import func, or_, case, select
+from app.core.columnar_export import ExportFormat, TypedColumn, export_response
+from app.core.csv_export import CSVColumn, csv_streaming_response, select_columns, stream_query
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.query_steps import Steps, run_steps
 from app.core.time import utc_now
 from app.core.deps import get_current_user
-from app.core.rls import apply_model_rls, can_access_model
+from app.core.model_access import accessible_model_ids
+from app.core.rls import can_access_model, can_see_all_data
+from app.core.monitoring_import import (
+    ImportRow,
+    ResultWriter,
+    evaluate_outcomes,
+    iter_chunks,
+    load_import_context,
+    parse_import_rows,
+    preview_action,
+    preview_row,
+)
 from app.core.monitoring_membership import MonitoringMembershipService
+from app.core.monitoring_outcomes import calculate_outcome, resolve_threshold_sources
 from app.core.monitoring_scope import (
     get_cycle_scope_models,
     get_cycle_scope_model_ids,
@@ -32,7 +48,6 @@ from app.models.user import User
 from app.core.roles import is_admin, is_global_approver, is_regional_approver, is_validator
 from app.models.model import Model
 from app.models.kpm import Kpm
-from app.models.audit_log import AuditLog
 from app.models.region import Region
 from app.models.taxonomy import Taxonomy, TaxonomyValue
 from app.models.recommendation import Recommendation, RecommendationStatusHistory
@@ -118,11 +133,13 @@ from app.core.exception_detection import (
     detect_type1_unmitigated_performance,
     detect_type1_persistent_red_for_model,
     autoclose_type1_on_improved_result,
+    autoclose_type1_on_improved_results,
 )
+from app.core.audit import create_audit_log
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-MAX_MONITORING_IMPORT_BYTES = 5 * 1024 * 1024
+MAX_MONITORING_IMPORT_BYTES = settings.MONITORING_IMPORT_MAX_BYTES
 
 
 class LimitedStream:
@@ -168,25 +185,6 @@ class LimitedStream:
         return getattr(self.raw, name)
 
 
-def create_audit_log(
-    db: Session,
-    entity_type: str,
-    entity_id: int,
-    action: str,
-    user_id: int,
-    changes: Optional[dict] = None
-):
-    """Create an audit log entry for monitoring changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def get_non_terminal_recommendation_status_ids(db: Session) -> List[int]:
     """Return recommendation status IDs that are considered open."""
     status_taxonomy = db.query(Taxonomy).filter(
@@ -334,9 +332,9 @@ def _get_accessible_model_ids(db: Session, current_user: User) -> Optional[set[i
     """Return model IDs the user can access; None for admin/validator (full access)."""
     if is_admin(current_user) or is_validator(current_user):
         return None
-    query = db.query(Model.model_id)
-    query = apply_model_rls(query, current_user, db)
-    return {row[0] for row in query.all()}
+    if not can_see_all_data(current_user):
+        return set(accessible_model_ids(db, current_user))
+    return {row[0] for row in db.query(Model.model_id).all()}
 
 
 def _can_view_plan(
@@ -2059,6 +2057,24 @@ def publish_plan_version(
     }
 
 
+def _blank_if_none(value):
+    return value if value is not None else ""
+
+
+METRIC_SNAPSHOT_EXPORT_COLUMNS = [
+    CSVColumn("kpm_id", "KPM ID", lambda s: s.kpm_id),
+    CSVColumn("kpm_name", "KPM Name", lambda s: s.kpm_name),
+    CSVColumn("category", "Category", lambda s: s.kpm_category_name or ""),
+    CSVColumn("evaluation_type", "Evaluation Type", lambda s: s.evaluation_type),
+    CSVColumn("yellow_min", "Yellow Min", lambda s: _blank_if_none(s.yellow_min)),
+    CSVColumn("yellow_max", "Yellow Max", lambda s: _blank_if_none(s.yellow_max)),
+    CSVColumn("red_min", "Red Min", lambda s: _blank_if_none(s.red_min)),
+    CSVColumn("red_max", "Red Max", lambda s: _blank_if_none(s.red_max)),
+    CSVColumn("qualitative_guidance", "Qualitative Guidance", lambda s: s.qualitative_guidance or ""),
+    CSVColumn("sort_order", "Sort Order", lambda s: s.sort_order),
+]
+
+
 @router.get("/monitoring/plans/{plan_id}/versions/{version_id}/export")
 def export_version_metrics(
     plan_id: int,
@@ -2067,12 +2083,7 @@ def export_version_metrics(
     current_user: User = Depends(get_current_user)
 ):
     """Export version metrics as CSV for manual comparison."""
-    from fastapi.responses import StreamingResponse
-    import csv
-    import io
-
     version = db.query(MonitoringPlanVersion).options(
-        joinedload(MonitoringPlanVersion.metric_snapshots),
         joinedload(MonitoringPlanVersion.plan).joinedload(
             MonitoringPlan.team).joinedload(MonitoringTeam.members),
         joinedload(MonitoringPlanVersion.plan).joinedload(
@@ -2093,43 +2104,15 @@ def export_version_metrics(
         _require_plan_view_access(
             version.plan, current_user, accessible_model_ids)
 
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow([
-        "KPM ID", "KPM Name", "Category", "Evaluation Type",
-        "Yellow Min", "Yellow Max", "Red Min", "Red Max",
-        "Qualitative Guidance", "Sort Order"
-    ])
-
-    # Data rows
-    for s in sorted(version.metric_snapshots, key=lambda x: x.sort_order):
-        writer.writerow([
-            s.kpm_id,
-            s.kpm_name,
-            s.kpm_category_name or "",
-            s.evaluation_type,
-            s.yellow_min if s.yellow_min is not None else "",
-            s.yellow_max if s.yellow_max is not None else "",
-            s.red_min if s.red_min is not None else "",
-            s.red_max if s.red_max is not None else "",
-            s.qualitative_guidance or "",
-            s.sort_order
-        ])
-
-    output.seek(0)
+    snapshots = db.query(MonitoringPlanMetricSnapshot).filter(
+        MonitoringPlanMetricSnapshot.version_id == version_id
+    ).order_by(MonitoringPlanMetricSnapshot.sort_order, MonitoringPlanMetricSnapshot.snapshot_id)
 
     # Generate filename
     plan_name = version.plan.name.replace(" ", "_")[:30]
     filename = f"{plan_name}_v{version.version_number}_{version.effective_date}.csv"
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return csv_streaming_response(stream_query(snapshots), METRIC_SNAPSHOT_EXPORT_COLUMNS, filename, db=db)
 
 
 @router.get("/monitoring/plans/{plan_id}/active-cycles-warning", response_model=ActiveCyclesWarning)
@@ -2553,6 +2536,16 @@ def get_my_monitoring_tasks(
     By default, returns only active cycles (not APPROVED or CANCELLED).
     Set include_closed=true to include completed or cancelled cycles.
     """
+    return run_steps(db, my_monitoring_task_steps(current_user.user_id, include_closed))
+
+
+def my_monitoring_task_steps(user_id: int, include_closed: bool) -> Steps[List[dict]]:
+    """Steps (see ``app.core.query_steps``) reading ``GET /monitoring/my-tasks``.
+
+    The three role queries are independent and yielded together, then the
+    result and pending approval counts of all those cycles are read grouped
+    by cycle.
+    """
     # Import locally to avoid circular imports
     from app.models.monitoring import MonitoringCycle, MonitoringCycleStatus
 
@@ -2574,127 +2567,64 @@ def get_my_monitoring_tasks(
     cycle_statuses = active_statuses + \
         closed_statuses if include_closed else active_statuses
 
-    # Query 1: Cycles where user is the data provider for the plan
-    data_provider_cycles = db.query(MonitoringCycle).options(
+    cycles = select(MonitoringCycle).options(
         joinedload(MonitoringCycle.plan)
-    ).join(
-        MonitoringPlan, MonitoringCycle.plan_id == MonitoringPlan.plan_id
-    ).filter(
-        MonitoringPlan.data_provider_user_id == current_user.user_id,
-        MonitoringCycle.status.in_(cycle_statuses)
-    ).all()
-
-    for cycle in data_provider_cycles:
-        action = _get_data_provider_action(cycle.status)
-        if cycle.status in closed_statuses:
-            is_overdue = False
-            days_until_due = None
-        elif cycle.status == MonitoringCycleStatus.ON_HOLD.value:
-            is_overdue = False
-            days_until_due = None
-        else:
-            is_overdue = cycle.submission_due_date < today
-            days_until_due = (cycle.submission_due_date -
-                              today).days if not is_overdue else None
-
-        # Count results
-        result_count = db.query(func.count(MonitoringResult.result_id)).filter(
-            MonitoringResult.cycle_id == cycle.cycle_id
-        ).scalar() or 0
-
-        tasks.append({
-            "cycle_id": cycle.cycle_id,
-            "plan_id": cycle.plan_id,
-            "plan_name": cycle.plan.name,
-            "period_start_date": cycle.period_start_date,
-            "period_end_date": cycle.period_end_date,
-            "submission_due_date": cycle.submission_due_date,
-            "report_due_date": cycle.report_due_date,
-            "status": cycle.status,
-            "user_role": "data_provider",
-            "action_needed": action,
-            "result_count": result_count,
-            "pending_approval_count": 0,
-            "is_overdue": is_overdue,
-            "days_until_due": days_until_due,
-        })
-
-    # Query 2: Cycles where user is assigned_to
-    assigned_cycles = db.query(MonitoringCycle).options(
-        joinedload(MonitoringCycle.plan)
-    ).filter(
-        MonitoringCycle.assigned_to_user_id == current_user.user_id,
-        MonitoringCycle.status.in_(cycle_statuses)
-    ).all()
-
-    # Track cycle_ids we've already added to avoid duplicates
-    added_cycle_ids = {t["cycle_id"] for t in tasks}
-
-    for cycle in assigned_cycles:
-        if cycle.cycle_id in added_cycle_ids:
-            continue
-
-        action = _get_assignee_action(cycle.status)
-        if cycle.status in closed_statuses:
-            is_overdue = False
-            days_until_due = None
-        elif cycle.status == MonitoringCycleStatus.ON_HOLD.value:
-            is_overdue = False
-            days_until_due = None
-        else:
-            is_overdue = cycle.submission_due_date < today
-            days_until_due = (cycle.submission_due_date -
-                              today).days if not is_overdue else None
-
-        result_count = db.query(func.count(MonitoringResult.result_id)).filter(
-            MonitoringResult.cycle_id == cycle.cycle_id
-        ).scalar() or 0
-
-        tasks.append({
-            "cycle_id": cycle.cycle_id,
-            "plan_id": cycle.plan_id,
-            "plan_name": cycle.plan.name,
-            "period_start_date": cycle.period_start_date,
-            "period_end_date": cycle.period_end_date,
-            "submission_due_date": cycle.submission_due_date,
-            "report_due_date": cycle.report_due_date,
-            "status": cycle.status,
-            "user_role": "assignee",
-            "action_needed": action,
-            "result_count": result_count,
-            "pending_approval_count": 0,
-            "is_overdue": is_overdue,
-            "days_until_due": days_until_due,
-        })
-        added_cycle_ids.add(cycle.cycle_id)
-
-    # Query 3: Cycles where user is a monitoring team member (risk function)
-    # These users review and approve results
-    team_member_plans = db.query(MonitoringPlan.plan_id).join(
+    ).where(MonitoringCycle.status.in_(cycle_statuses))
+    # Plans whose monitoring team (risk function) the user is on
+    team_member_plans = select(MonitoringPlan.plan_id).join(
         MonitoringTeam, MonitoringPlan.monitoring_team_id == MonitoringTeam.team_id
     ).join(
         monitoring_team_members,
         MonitoringTeam.team_id == monitoring_team_members.c.team_id
-    ).filter(
-        monitoring_team_members.c.user_id == current_user.user_id
-    ).all()
-
-    team_plan_ids = [p[0] for p in team_member_plans]
-
-    if team_plan_ids:
-        team_cycles = db.query(MonitoringCycle).options(
-            joinedload(MonitoringCycle.plan)
-        ).filter(
-            MonitoringCycle.plan_id.in_(team_plan_ids),
-            MonitoringCycle.status.in_(cycle_statuses)
-        ).all()
+    ).where(
+        monitoring_team_members.c.user_id == user_id
+    )
+    data_provider_result, assigned_result, team_result = yield [
+        # Query 1: Cycles where user is the data provider for the plan
+        cycles.join(
+            MonitoringPlan, MonitoringCycle.plan_id == MonitoringPlan.plan_id
+        ).where(MonitoringPlan.data_provider_user_id == user_id),
+        # Query 2: Cycles where user is assigned_to
+        cycles.where(MonitoringCycle.assigned_to_user_id == user_id),
+        # Query 3: Cycles where user is a monitoring team member (risk function)
+        # These users review and approve results
+        cycles.where(MonitoringCycle.plan_id.in_(team_member_plans)),
+    ]
+    data_provider_cycles = data_provider_result.scalars().all()
+    assigned_cycles = assigned_result.scalars().all()
+    team_cycles = team_result.scalars().all()
 
-        for cycle in team_cycles:
+    cycle_ids = {
+        cycle.cycle_id for cycle in [*data_provider_cycles, *assigned_cycles, *team_cycles]
+    }
+    if not cycle_ids:
+        return tasks
+    result_counts, pending_approval_counts = yield [
+        select(MonitoringResult.cycle_id, func.count(MonitoringResult.result_id)).where(
+            MonitoringResult.cycle_id.in_(cycle_ids)
+        ).group_by(MonitoringResult.cycle_id),
+        select(MonitoringCycleApproval.cycle_id, func.count(MonitoringCycleApproval.approval_id)).where(
+            MonitoringCycleApproval.cycle_id.in_({cycle.cycle_id for cycle in team_cycles}),
+            MonitoringCycleApproval.approval_status == "Pending"
+        ).group_by(MonitoringCycleApproval.cycle_id),
+    ]
+    result_counts = dict(result_counts.all())
+    pending_approval_counts = dict(pending_approval_counts.all())
+
+    # A cycle is listed once, under the first role it matched
+    added_cycle_ids = set()
+    roles = (
+        ("data_provider", data_provider_cycles, _get_data_provider_action),
+        ("assignee", assigned_cycles, _get_assignee_action),
+        ("team_member", team_cycles, _get_team_member_action),
+    )
+    for user_role, role_cycles, get_action in roles:
+        for cycle in role_cycles:
             if cycle.cycle_id in added_cycle_ids:
                 continue
 
-            action = _get_team_member_action(cycle.status)
             # Team members care about report due date
+            due_date = cycle.report_due_date if user_role == "team_member" else cycle.submission_due_date
             if cycle.status in closed_statuses:
                 is_overdue = False
                 days_until_due = None
@@ -2702,18 +2632,8 @@ def get_my_monitoring_tasks(
                 is_overdue = False
                 days_until_due = None
             else:
-                is_overdue = cycle.report_due_date < today
-                days_until_due = (cycle.report_due_date -
-                                  today).days if not is_overdue else None
-
-            result_count = db.query(func.count(MonitoringResult.result_id)).filter(
-                MonitoringResult.cycle_id == cycle.cycle_id
-            ).scalar() or 0
-
-            pending_approval_count = db.query(func.count(MonitoringCycleApproval.approval_id)).filter(
-                MonitoringCycleApproval.cycle_id == cycle.cycle_id,
-                MonitoringCycleApproval.approval_status == "Pending"
-            ).scalar() or 0
+                is_overdue = due_date < today
+                days_until_due = (due_date - today).days if not is_overdue else None
 
             tasks.append({
                 "cycle_id": cycle.cycle_id,
@@ -2724,10 +2644,12 @@ def get_my_monitoring_tasks(
                 "submission_due_date": cycle.submission_due_date,
                 "report_due_date": cycle.report_due_date,
                 "status": cycle.status,
-                "user_role": "team_member",
-                "action_needed": action,
-                "result_count": result_count,
-                "pending_approval_count": pending_approval_count,
+                "user_role": user_role,
+                "action_needed": get_action(cycle.status),
+                "result_count": result_counts.get(cycle.cycle_id, 0),
+                "pending_approval_count": (
+                    pending_approval_counts.get(cycle.cycle_id, 0) if user_role == "team_member" else 0
+                ),
                 "is_overdue": is_overdue,
                 "days_until_due": days_until_due,
             })
@@ -2735,7 +2657,6 @@ def get_my_monitoring_tasks(
 
     # Sort by due date (most urgent first)
     tasks.sort(key=lambda t: (not t["is_overdue"], t["submission_due_date"]))
-
     return tasks
 
 
@@ -3054,40 +2975,6 @@ def calculate_period_dates(frequency: MonitoringFrequency, from_date: Optional[d
     return period_start, period_end
 
 
-def calculate_outcome(
-    value: float,
-    metric: Union[MonitoringPlanMetric, MonitoringPlanMetricSnapshot]
-) -> str:
-    """Calculate outcome (GREEN, YELLOW, RED, UNCONFIGURED) based on thresholds."""
-    if value is None:
-        return OUTCOME_NA
-
-    # Check if any thresholds are configured
-    has_thresholds = any([
-        metric.red_min is not None,
-        metric.red_max is not None,
-        metric.yellow_min is not None,
-        metric.yellow_max is not None,
-    ])
-    if not has_thresholds:
-        return OUTCOME_UNCONFIGURED
-
-    # Check red thresholds first (highest severity)
-    if metric.red_min is not None and value < metric.red_min:
-        return OUTCOME_RED
-    if metric.red_max is not None and value > metric.red_max:
-        return OUTCOME_RED
-
-    # Check yellow thresholds
-    if metric.yellow_min is not None and value < metric.yellow_min:
-        return OUTCOME_YELLOW
-    if metric.yellow_max is not None and value > metric.yellow_max:
-        return OUTCOME_YELLOW
-
-    # If passed all threshold checks, it's green
-    return OUTCOME_GREEN
-
-
 def resolve_threshold_source(
     db: Session,
     cycle: MonitoringCycle,
@@ -4186,7 +4073,10 @@ def import_cycle_results_csv(
     - narrative: Optional text narrative
 
     When dry_run=true (default): Returns preview of what would be created/updated
-    When dry_run=false: Actually imports the data and returns counts
+    When dry_run=false: Actually imports the data and returns counts; invalid
+    rows are skipped and reported in error_messages
+
+    Rows are processed in chunks with bulk writes (see core/monitoring_import.py).
     """
     # Check cycle exists and get version details
     cycle = db.query(MonitoringCycle).options(
@@ -4208,80 +4098,20 @@ def import_cycle_results_csv(
             detail=f"Cannot import results when cycle is in {cycle.status} status"
         )
 
-    # Get valid models for this plan
-    valid_model_ids = set()
-    model_names = {}
     model_scope = get_cycle_scope_models(db, cycle)
     if not model_scope:
         raise HTTPException(
             status_code=400,
             detail="Cannot import results: Cycle has no model scope."
         )
-    for entry in model_scope:
-        model_id = entry["model_id"]
-        valid_model_ids.add(model_id)
-        model_names[model_id] = entry.get("model_name") or f"Model {model_id}"
-
-    # Get valid metrics for this plan
-    valid_metric_ids = set()
-    metric_names = {}
-    # Store snapshot info for threshold calculation in locked versions
-    metric_snapshots_by_id: dict[int, MonitoringPlanMetricSnapshot] = {}
-
-    if cycle.plan_version_id:
-        # Use metric snapshots from locked version
-        metric_snapshots = db.query(MonitoringPlanMetricSnapshot).filter(
-            MonitoringPlanMetricSnapshot.version_id == cycle.plan_version_id
-        ).all()
-        for snapshot in metric_snapshots:
-            if snapshot.original_metric_id:
-                valid_metric_ids.add(snapshot.original_metric_id)
-                metric_names[snapshot.original_metric_id] = snapshot.kpm_name
-                metric_snapshots_by_id[snapshot.original_metric_id] = snapshot
-    else:
-        # Use live plan metrics
-        metrics = db.query(MonitoringPlanMetric).options(
-            joinedload(MonitoringPlanMetric.kpm)
-        ).filter(
-            MonitoringPlanMetric.plan_id == cycle.plan_id,
-            MonitoringPlanMetric.is_active == True
-        ).all()
-        for metric in metrics:
-            valid_metric_ids.add(metric.metric_id)
-            metric_names[
-                metric.metric_id] = metric.kpm.name if metric.kpm else f"Metric {metric.metric_id}"
 
-    # Build metrics lookup for threshold calculation
-    metrics_by_id: dict[int, MonitoringPlanMetric] = {}
-    if not cycle.plan_version_id:
-        for metric in metrics:
-            metrics_by_id[metric.metric_id] = metric
-
-    # Build outcome_value_id lookup for qualitative metrics
-    # Maps outcome code (GREEN, YELLOW, RED) to taxonomy value_id
-    outcome_code_to_value_id: dict[str, int] = {}
-    qualitative_outcome_taxonomy = db.query(Taxonomy).filter(
-        Taxonomy.name == QUALITATIVE_OUTCOME_TAXONOMY_NAME
-    ).first()
-    if qualitative_outcome_taxonomy:
-        outcome_values = db.query(TaxonomyValue).filter(
-            TaxonomyValue.taxonomy_id == qualitative_outcome_taxonomy.taxonomy_id,
-            TaxonomyValue.is_active == True
-        ).all()
-        for ov in outcome_values:
-            outcome_code_to_value_id[ov.code.upper()] = ov.value_id
-
-    # Get existing results for this cycle
-    existing_results = db.query(MonitoringResult).filter(
-        MonitoringResult.cycle_id == cycle_id
-    ).all()
-    existing_map = {}
-    for r in existing_results:
-        key = (r.model_id, r.plan_metric_id)
-        existing_map[key] = r
+    if not dry_run:
+        # Serialize imports into the cycle so the preloaded result keys stay accurate
+        db.query(MonitoringCycle.cycle_id).filter(
+            MonitoringCycle.cycle_id == cycle_id
+        ).with_for_update().one()
 
-    # Valid outcome codes (VALID_OUTCOME_CODES + empty string for blank values)
-    valid_outcomes = VALID_OUTCOME_CODES | {''}  # Union with empty string
+    context = load_import_context(db, cycle, model_scope)
 
     # Read and parse CSV (streaming with size enforcement)
     try:
@@ -4295,226 +4125,45 @@ def import_cycle_results_csv(
         raise HTTPException(
             status_code=400, detail=f"Failed to parse CSV: {str(e)}")
 
+    # Only the first MONITORING_IMPORT_PREVIEW_ROWS valid and error rows are
+    # returned; the counts cover every row
+    preview_limit = settings.MONITORING_IMPORT_PREVIEW_ROWS
     valid_rows = []
     error_rows = []
-    row_number = 0
-
-    for row in reader:
-        row_number += 1
-
-        # Parse model_id
-        try:
-            model_id = int(row.get('model_id', '').strip())
-        except (ValueError, AttributeError):
-            error_rows.append(CSVImportPreviewRow(
-                row_number=row_number,
-                model_id=0,
-                metric_id=0,
-                action="skip",
-                error="Invalid or missing model_id"
-            ))
-            continue
-
-        # Parse metric_id
-        try:
-            metric_id = int(row.get('metric_id', '').strip())
-        except (ValueError, AttributeError):
-            error_rows.append(CSVImportPreviewRow(
-                row_number=row_number,
-                model_id=model_id,
-                model_name=model_names.get(model_id),
-                metric_id=0,
-                action="skip",
-                error="Invalid or missing metric_id"
-            ))
-            continue
-
-        # Validate model is in plan
-        if model_id not in valid_model_ids:
-            error_rows.append(CSVImportPreviewRow(
-                row_number=row_number,
-                model_id=model_id,
-                metric_id=metric_id,
-                action="skip",
-                error=f"Model {model_id} is not in this monitoring plan"
-            ))
-            continue
-
-        # Validate metric is in plan
-        if metric_id not in valid_metric_ids:
-            error_rows.append(CSVImportPreviewRow(
-                row_number=row_number,
-                model_id=model_id,
-                model_name=model_names.get(model_id),
-                metric_id=metric_id,
-                action="skip",
-                error=f"Metric {metric_id} is not in this monitoring plan"
-            ))
-            continue
-
-        # Parse value
-        value_str = row.get('value', '').strip()
-        value = None
-        if value_str:
-            try:
-                value = float(value_str)
-            except ValueError:
-                error_rows.append(CSVImportPreviewRow(
-                    row_number=row_number,
-                    model_id=model_id,
-                    model_name=model_names.get(model_id),
-                    metric_id=metric_id,
-                    metric_name=metric_names.get(metric_id),
-                    action="skip",
-                    error=f"Invalid numeric value: {value_str}"
-                ))
-                continue
-
-        # Parse outcome
-        outcome = row.get('outcome', '').strip().upper()
-        if outcome and outcome not in valid_outcomes:
-            error_rows.append(CSVImportPreviewRow(
-                row_number=row_number,
-                model_id=model_id,
-                model_name=model_names.get(model_id),
-                metric_id=metric_id,
-                metric_name=metric_names.get(metric_id),
-                value=value,
-                action="skip",
-                error=f"Invalid outcome: {outcome}. Must be GREEN, YELLOW, or RED"
-            ))
-            continue
-
-        # SECURITY: Quantitative metrics MUST derive outcome from numeric value
-        # Check metric type and enforce the rule
-        metric = metrics_by_id.get(metric_id)
-        snapshot = metric_snapshots_by_id.get(metric_id)
-        is_quantitative = (
-            (metric and metric.kpm and metric.kpm.evaluation_type == "Quantitative") or
-            (snapshot and snapshot.evaluation_type == "Quantitative")
-        )
-
-        if is_quantitative:
-            if value is None:
-                error_rows.append(CSVImportPreviewRow(
-                    row_number=row_number,
-                    model_id=model_id,
-                    model_name=model_names.get(model_id),
-                    metric_id=metric_id,
-                    metric_name=metric_names.get(metric_id),
-                    action="skip",
-                    error="Quantitative metrics require a numeric value; outcome cannot be set directly"
-                ))
-                continue
-            # Clear any explicit outcome - will be calculated from thresholds
-            if outcome:
-                outcome = None  # Silently ignore explicit outcome for quantitative metrics
-
-        # Parse narrative
-        narrative = row.get('narrative', '').strip()
-
-        # Determine action
-        key = (model_id, metric_id)
-        action = "update" if key in existing_map else "create"
-
-        valid_rows.append(CSVImportPreviewRow(
-            row_number=row_number,
-            model_id=model_id,
-            model_name=model_names.get(model_id),
-            metric_id=metric_id,
-            metric_name=metric_names.get(metric_id),
-            value=value,
-            outcome=outcome if outcome else None,
-            narrative=narrative if narrative else None,
-            action=action
-        ))
+    row_count = 0
+    error_count = 0
+    action_counts = {"create": 0, "update": 0}
+    writer = ResultWriter(db, context, current_user.user_id)
+
+    for chunk in iter_chunks(parse_import_rows(reader, context), settings.MONITORING_IMPORT_CHUNK_ROWS):
+        row_count += len(chunk)
+        rows = [row for row in chunk if isinstance(row, ImportRow)]
+        chunk_errors = [row for row in chunk if not isinstance(row, ImportRow)]
+        error_count += len(chunk_errors)
+        error_rows.extend(chunk_errors[:preview_limit - len(error_rows)])
+        if dry_run:
+            for row in rows:
+                action_counts[preview_action(row, context)] += 1
+            valid_rows.extend(preview_row(row, context) for row in rows[:preview_limit - len(valid_rows)])
+        elif rows:
+            writer.write(rows, evaluate_outcomes(rows, context))
 
     # If dry_run, return preview
     if dry_run:
-        create_count = sum(1 for r in valid_rows if r.action == "create")
-        update_count = sum(1 for r in valid_rows if r.action == "update")
-
         return CSVImportPreviewResponse(
             valid_rows=valid_rows,
             error_rows=error_rows,
             summary=CSVImportPreviewSummary(
-                total_rows=row_number,
-                create_count=create_count,
-                update_count=update_count,
+                total_rows=row_count,
+                create_count=action_counts["create"],
+                update_count=action_counts["update"],
                 skip_count=0,
-                error_count=len(error_rows)
+                error_count=error_count,
+                rows_truncated=row_count > len(valid_rows) + len(error_rows),
             )
         )
 
-    # Actually import the data
-    created = 0
-    updated = 0
-    skipped = 0
-    error_messages = []
-
-    for row in valid_rows:
-        try:
-            key = (row.model_id, row.metric_id)
-
-            # Calculate outcome from thresholds and resolve outcome_value_id
-            calculated_outcome = None
-            outcome_value_id = None
-            if row.value is not None:
-                # Try live metric first, then snapshot
-                metric = metrics_by_id.get(row.metric_id)
-                snapshot = metric_snapshots_by_id.get(row.metric_id)
-
-                if metric and metric.kpm and metric.kpm.evaluation_type == "Quantitative":
-                    calculated_outcome = calculate_outcome(row.value, metric)
-                elif snapshot and snapshot.evaluation_type == "Quantitative":
-                    # Use snapshot thresholds (duck typing - snapshot has same threshold attrs)
-                    calculated_outcome = calculate_outcome(row.value, snapshot)
-
-                # Also set outcome_value_id for quantitative metrics (taxonomy linkage)
-                if calculated_outcome:
-                    outcome_value_id = outcome_code_to_value_id.get(
-                        calculated_outcome)
-            elif row.outcome:
-                # CSV outcome override for qualitative metrics
-                calculated_outcome = row.outcome.upper()
-                # Look up the taxonomy value_id for this outcome code
-                outcome_value_id = outcome_code_to_value_id.get(
-                    calculated_outcome)
-
-            if key in existing_map:
-                # Update existing result
-                result = existing_map[key]
-                if row.value is not None:
-                    result.numeric_value = row.value
-                if calculated_outcome:
-                    result.calculated_outcome = calculated_outcome
-                if outcome_value_id:
-                    result.outcome_value_id = outcome_value_id
-                if row.narrative:
-                    result.narrative = row.narrative
-                # NOTE: Don't update entered_by_user_id on updates (preserve original entry user)
-                result.updated_at = utc_now()
-                updated += 1
-            else:
-                # Create new result
-                result = MonitoringResult(
-                    cycle_id=cycle_id,
-                    plan_metric_id=row.metric_id,
-                    model_id=row.model_id,
-                    numeric_value=row.value,
-                    calculated_outcome=calculated_outcome,
-                    outcome_value_id=outcome_value_id,
-                    narrative=row.narrative,
-                    entered_by_user_id=current_user.user_id
-                    # entered_at uses default=utc_now
-                )
-                db.add(result)
-                existing_map[key] = result
-                created += 1
-
-        except Exception as e:
-            error_messages.append(f"Row {row.row_number}: {str(e)}")
-            skipped += 1
+    error_messages = [f"Row {row.row_number}: {row.error}" for row in error_rows]
 
     # Create audit log for bulk import (same transaction)
     create_audit_log(
@@ -4524,20 +4173,23 @@ def import_cycle_results_csv(
         action="BULK_IMPORT",
         user_id=current_user.user_id,
         changes={
-            "created": created,
-            "updated": updated,
-            "skipped": skipped,
-            "errors": len(error_messages)
+            "created": writer.created,
+            "updated": writer.updated,
+            "skipped": error_count,
+            "errors": error_count
         }
     )
 
+    # Auto-close Type 1 exceptions for metrics that improved to GREEN or YELLOW
+    autoclose_type1_on_improved_results(db, cycle_id, writer.outcomes)
+
     db.commit()
     return CSVImportResultResponse(
-        success=len(error_messages) == 0,
-        created=created,
-        updated=updated,
-        skipped=skipped,
-        errors=len(error_messages),
+        success=error_count == 0,
+        created=writer.created,
+        updated=writer.updated,
+        skipped=error_count,
+        errors=error_count,
         error_messages=error_messages
     )
 
@@ -5816,20 +5468,70 @@ def get_performance_summary(
     )
 
 
+def _result_metric_category(result: MonitoringResult) -> str:
+    metric = result.plan_metric
+    return metric.kpm.category.name if metric and metric.kpm and metric.kpm.category else ""
+
+
+def _result_metric_name(result: MonitoringResult) -> str:
+    metric = result.plan_metric
+    return metric.kpm.name if metric and metric.kpm else f"Metric {result.plan_metric_id}"
+
+
+CYCLE_RESULT_EXPORT_COLUMNS = [
+    CSVColumn("category", "Category", _result_metric_category),
+    CSVColumn("metric", "Metric", _result_metric_name),
+    CSVColumn("model", "Model", lambda r: r.model.model_name if r.model else "All Models"),
+    CSVColumn("numeric_value", "Numeric Value",
+              lambda r: r.numeric_value if r.numeric_value is not None else ""),
+    CSVColumn("outcome", "Outcome", lambda r: r.calculated_outcome or OUTCOME_NA),
+    CSVColumn("narrative", "Narrative", lambda r: r.narrative or ""),
+    CSVColumn("entered_by", "Entered By", lambda r: r.entered_by.full_name if r.entered_by else ""),
+    CSVColumn("entered_at", "Entered At",
+              lambda r: r.entered_at.strftime("%Y-%m-%d %H:%M") if r.entered_at else ""),
+]
+
+
+RESULT_TYPED_EXPORT_COLUMNS = [
+    TypedColumn("result_id", "Result ID", "int", lambda r: r.result_id),
+    TypedColumn("plan_id", "Plan ID", "int", lambda r: r.cycle.plan_id),
+    TypedColumn("cycle_id", "Cycle ID", "int", lambda r: r.cycle_id),
+    TypedColumn("period_start_date", "Period Start", "date", lambda r: r.cycle.period_start_date),
+    TypedColumn("period_end_date", "Period End", "date", lambda r: r.cycle.period_end_date),
+    TypedColumn("cycle_status", "Cycle Status", "string", lambda r: r.cycle.status),
+    TypedColumn("category", "Category", "string", lambda r: _result_metric_category(r) or None),
+    TypedColumn("plan_metric_id", "Plan Metric ID", "int", lambda r: r.plan_metric_id),
+    TypedColumn("kpm_id", "KPM ID", "int", lambda r: r.plan_metric.kpm_id if r.plan_metric else None),
+    TypedColumn("metric", "Metric", "string", _result_metric_name),
+    TypedColumn("model_id", "Model ID", "int", lambda r: r.model_id),
+    TypedColumn("model", "Model", "string", lambda r: r.model.model_name if r.model else None),
+    TypedColumn("numeric_value", "Numeric Value", "float", lambda r: r.numeric_value),
+    TypedColumn("outcome", "Outcome", "outcome", lambda r: r.calculated_outcome or OUTCOME_NA),
+    TypedColumn("narrative", "Narrative", "string", lambda r: r.narrative),
+    TypedColumn("entered_by", "Entered By", "string", lambda r: r.entered_by.full_name if r.entered_by else None),
+    TypedColumn("entered_at", "Entered At", "timestamp", lambda r: r.entered_at),
+    TypedColumn("updated_at", "Updated At", "timestamp", lambda r: r.updated_at),
+]
+
+# Cycle exports carry the cycle in the filename, not per row
+CYCLE_RESULT_TYPED_EXPORT_COLUMNS = select_columns(RESULT_TYPED_EXPORT_COLUMNS, [
+    "category", "metric", "plan_metric_id", "kpm_id", "model_id", "model",
+    "numeric_value", "outcome", "narrative", "entered_by", "entered_at",
+])
+
+
 @router.get("/monitoring/plans/{plan_id}/cycles/{cycle_id}/export")
 def export_cycle_results(
     plan_id: int,
     cycle_id: int,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="csv, parquet or arrow"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Export cycle results to CSV format.
+    """Export cycle results as CSV, Parquet or Arrow.
 
-    Returns CSV with all metric results for the cycle.
+    Returns all metric results for the cycle.
     """
-    from fastapi.responses import Response
-    import csv
-    import io
 
     # Verify cycle belongs to plan
     cycle = db.query(MonitoringCycle).options(
@@ -5856,7 +5558,7 @@ def export_cycle_results(
             MonitoringPlanMetric.kpm).joinedload(Kpm.category)
     ).filter(
         MonitoringResult.cycle_id == cycle_id
-    ).order_by(MonitoringResult.plan_metric_id).all()
+    ).order_by(MonitoringResult.plan_metric_id, MonitoringResult.result_id)
 
     # Get plan name for filename
     plan = cycle.plan
@@ -5866,49 +5568,77 @@ def export_cycle_results(
             detail="Plan not found"
         )
 
-    # Build CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header row
-    writer.writerow([
-        "Category",
-        "Metric",
-        "Model",
-        "Numeric Value",
-        "Outcome",
-        "Narrative",
-        "Entered By",
-        "Entered At"
-    ])
-
-    # Data rows
-    for result in results:
-        metric = result.plan_metric
-        writer.writerow([
-            metric.kpm.category.name if metric and metric.kpm and metric.kpm.category else "",
-            metric.kpm.name if metric and metric.kpm else f"Metric {result.plan_metric_id}",
-            result.model.model_name if result.model else "All Models",
-            result.numeric_value if result.numeric_value is not None else "",
-            result.calculated_outcome or OUTCOME_NA,
-            result.narrative or "",
-            result.entered_by.full_name if result.entered_by else "",
-            result.entered_at.strftime(
-                "%Y-%m-%d %H:%M") if result.entered_at else ""
-        ])
-
-    csv_content = output.getvalue()
-
     # Generate filename
     period = f"{cycle.period_start_date.strftime('%Y%m%d')}-{cycle.period_end_date.strftime('%Y%m%d')}"
-    filename = f"{plan.name.replace(' ', '_')}_Cycle_{period}.csv"
+    filename_stem = f"{plan.name.replace(' ', '_')}_Cycle_{period}"
+
+    return export_response(
+        stream_query(results),
+        export_format,
+        filename_stem,
+        CYCLE_RESULT_TYPED_EXPORT_COLUMNS,
+        csv_columns=CYCLE_RESULT_EXPORT_COLUMNS,
+        db=db,
+    )
 
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename={filename}"
-        }
+
+@router.get("/monitoring/results/export")
+def export_result_history(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="csv, parquet or arrow"),
+    plan_id: Optional[int] = Query(None, description="Only results of this plan"),
+    model_id: Optional[int] = Query(None, description="Only results for this model"),
+    period_end_from: Optional[date] = Query(None, description="Only cycles whose period ends on or after this date"),
+    period_end_to: Optional[date] = Query(None, description="Only cycles whose period ends on or before this date"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Bulk export of monitoring result history across cycles.
+
+    Intended for analytics loads: rows are ordered by cycle period and carry
+    the plan, cycle and period with each result. Admins and validators export
+    all results; other users export results for plans they can view (with
+    plan_id) or for models they can access.
+    """
+    accessible_model_ids = _get_accessible_model_ids(db, current_user)
+
+    results = db.query(MonitoringResult).join(MonitoringResult.cycle).options(
+        contains_eager(MonitoringResult.cycle),
+        joinedload(MonitoringResult.model),
+        joinedload(MonitoringResult.entered_by),
+        joinedload(MonitoringResult.plan_metric).joinedload(
+            MonitoringPlanMetric.kpm).joinedload(Kpm.category)
+    )
+
+    if plan_id is not None:
+        plan = db.query(MonitoringPlan).options(
+            joinedload(MonitoringPlan.team).joinedload(MonitoringTeam.members),
+            joinedload(MonitoringPlan.models)
+        ).filter(MonitoringPlan.plan_id == plan_id).first()
+        if not plan:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
+        _require_plan_view_access(plan, current_user, accessible_model_ids)
+        results = results.filter(MonitoringCycle.plan_id == plan_id)
+    elif accessible_model_ids is not None:
+        results = results.filter(MonitoringResult.model_id.in_(accessible_model_ids))
+
+    if model_id is not None:
+        results = results.filter(MonitoringResult.model_id == model_id)
+    if period_end_from is not None:
+        results = results.filter(MonitoringCycle.period_end_date >= period_end_from)
+    if period_end_to is not None:
+        results = results.filter(MonitoringCycle.period_end_date <= period_end_to)
+
+    results = results.order_by(
+        MonitoringCycle.period_end_date, MonitoringResult.cycle_id, MonitoringResult.result_id
+    )
+
+    return export_response(
+        stream_query(results),
+        export_format,
+        f"monitoring_results_{date.today().strftime('%Y%m%d')}",
+        RESULT_TYPED_EXPORT_COLUMNS,
+        db=db,
     )
 
 
@@ -5917,6 +5647,7 @@ def generate_cycle_report_pdf(
     cycle_id: int,
     include_trends: bool = True,
     trend_periods: int = 4,
+    background: bool = Query(False, description="Queue the render and return a PDF job instead of the PDF"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -5937,13 +5668,17 @@ def generate_cycle_report_pdf(
         cycle_id: The ID of the cycle to generate report for
         include_trends: Whether to include trend charts (default: True)
         trend_periods: Number of historical cycles for trends (default: 4)
+        background: Queue the render and return 202 with a PDF job (poll /pdf-jobs/{job_id})
 
     Returns:
         PDF file as StreamingResponse
+
+    APPROVED cycles are immutable, so their rendered report is kept in the
+    PDF artifact store and served from there on later downloads.
     """
     from fastapi.responses import Response
     import os
-    from app.core.pdf_reports import MonitoringCycleReportPDF
+    from app.core.pdf_jobs import queue_pdf_job, render_pdf_cached
 
     # Get cycle with all required relationships
     cycle = db.query(MonitoringCycle).options(
@@ -6046,6 +5781,7 @@ def generate_cycle_report_pdf(
     # Key by "metric_id_model_id" to keep trends separate per model
     trend_data = {}
     if include_trends and breached_metric_ids:
+        trend_results = {}
         for metric_id, model_id in breached_metric_ids:
             # Get historical results for this specific metric AND model
             trend_query = db.query(MonitoringResult).join(
@@ -6065,15 +5801,25 @@ def generate_cycle_report_pdf(
             ).order_by(
                 MonitoringCycle.period_end_date.desc()
             ).limit(trend_periods).all()
+            trend_results[(metric_id, model_id)] = trend_query
+
+        # Resolve snapshot/live thresholds for every trend point in one query
+        threshold_sources = resolve_threshold_sources(db, (
+            (tr.cycle, tr.plan_metric)
+            for trend_query in trend_results.values()
+            for tr in trend_query
+            if tr.plan_metric and tr.numeric_value is not None
+        ))
 
+        for (metric_id, model_id), trend_query in trend_results.items():
             # Build trend points (reverse to chronological order)
             trend_points = []
             for tr in reversed(trend_query):
                 if tr.numeric_value is not None:
                     threshold_source = None
                     if tr.plan_metric:
-                        threshold_source, _ = resolve_threshold_source(
-                            db, tr.cycle, tr.plan_metric)
+                        threshold_source = threshold_sources[
+                            (tr.cycle.plan_version_id, tr.plan_metric.metric_id)]
                     trend_points.append({
                         'cycle_id': tr.cycle_id,
                         'period_end_date': tr.cycle.period_end_date,
@@ -6152,23 +5898,30 @@ def generate_cycle_report_pdf(
             logo_path = path
             break
 
-    # Generate PDF
-    pdf = MonitoringCycleReportPDF(
-        cycle_data=cycle_data,
-        plan_data=plan_data,
-        results=results_data,
-        approvals=approvals_data,
-        trend_data=trend_data if include_trends else None,
-        logo_path=logo_path
-    )
-
-    pdf_bytes = pdf.generate()
+    payload = {
+        'cycle_data': cycle_data,
+        'plan_data': plan_data,
+        'results': results_data,
+        'approvals': approvals_data,
+        'trend_data': trend_data if include_trends else None,
+        'logo_path': logo_path,
+    }
 
     # Generate filename
     period = f"{cycle.period_start_date.strftime('%Y%m%d')}-{cycle.period_end_date.strftime('%Y%m%d')}"
     plan_name_safe = cycle.plan.name.replace(' ', '_').replace('/', '-')[:50]
     filename = f"Monitoring_Report_{plan_name_safe}_{period}.pdf"
 
+    if background:
+        return queue_pdf_job("monitoring_cycle_report", payload, filename, current_user.user_id)
+
+    # Generate PDF
+    pdf_bytes = render_pdf_cached(
+        "monitoring_cycle_report",
+        payload,
+        store_result=cycle.status == MonitoringCycleStatus.APPROVED.value,
+    )
+
     return Response(
         content=pdf_bytes,
         media_type="application/pdf",
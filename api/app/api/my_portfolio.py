@@ -9,10 +9,11 @@ from fpdf import FPDF
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.pdf_jobs import queue_pdf_job, render_pdf_cached
 from app.core.time import utc_now
 from app.core.monitoring_constants import OUTCOME_YELLOW, OUTCOME_RED
-from app.core.model_approval_status import compute_model_approval_status, get_status_label, ApprovalStatus
-from app.api.validation_workflow import calculate_model_revalidation_status
+from app.core.model_approval_status import compute_model_approval_statuses, get_status_label, ApprovalStatus
+from app.core.batch_revalidation import compute_revalidation_statuses
 from app.models.user import User
 from app.models.model import Model
 from app.models.model_delegate import ModelDelegate
@@ -529,9 +530,23 @@ def get_my_portfolio(
 
     open_recs_map = {model_id: count for model_id, count in open_recs_by_model}
 
+    # Revalidation and approval status for all owned models in set-based queries
+    reval_statuses = compute_revalidation_statuses(db, owned_models)
+    approval_statuses = compute_model_approval_statuses(owned_models, db, reval_statuses)
+
+    # Pending attestation per model
+    pending_attestation_map = {}
+    for record in db.query(AttestationRecord).join(
+        AttestationCycle
+    ).filter(
+        AttestationRecord.model_id.in_(owned_model_ids),
+        AttestationCycle.status.in_(["PENDING", "OPEN"]),
+    ).all():
+        pending_attestation_map.setdefault(record.model_id, record)
+
     for model in owned_models:
-        # Calculate revalidation status to get all key dates
-        reval_status = calculate_model_revalidation_status(model, db)
+        # Revalidation status carries all key dates
+        reval_status = reval_statuses[model.model_id]
 
         last_val_date = reval_status.get("last_validation_date")
         next_submission_due = reval_status.get("next_submission_due")
@@ -541,18 +556,12 @@ def get_my_portfolio(
 
         # Get pending attestation status
         attestation_status = None
-        pending_att = db.query(AttestationRecord).join(
-            AttestationCycle
-        ).filter(
-            AttestationRecord.model_id == model.model_id,
-            AttestationCycle.status.in_(["PENDING", "OPEN"]),
-        ).first()
+        pending_att = pending_attestation_map.get(model.model_id)
         if pending_att:
             attestation_status = pending_att.status.capitalize() if pending_att.status else None
 
         # Compute model approval status (validation-based)
-        model_approval_status_code, _ = compute_model_approval_status(
-            model, db)
+        model_approval_status_code, _ = approval_statuses[model.model_id]
         model_approval_status_label = get_status_label(
             model_approval_status_code)
 
@@ -1067,6 +1076,7 @@ class MyPortfolioPDF(FPDF):
 
 @router.get("/reports/my-portfolio/pdf")
 def export_my_portfolio_pdf(
+    background: bool = Query(False, description="Queue the render and return a PDF job instead of the PDF"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -1078,9 +1088,12 @@ def export_my_portfolio_pdf(
     - Action items by urgency
     - Monitoring alerts
     - Full model portfolio table
+
+    With background=true the render is queued and 202 returns a PDF job
+    (poll /pdf-jobs/{job_id}).
     """
     # Get the portfolio data using the existing endpoint logic
-    portfolio = get_my_portfolio(db=db, current_user=current_user)
+    portfolio = get_my_portfolio(team_id=None, db=db, current_user=current_user)
 
     # Convert to dict for PDF generation
     report_data = {
@@ -1150,13 +1163,19 @@ def export_my_portfolio_pdf(
         ],
     }
 
+    payload = {
+        'report_data': report_data,
+        'user_name': current_user.full_name or current_user.email,
+    }
+    filename = f"my_portfolio_{portfolio.as_of_date}.pdf"
+
+    if background:
+        return queue_pdf_job("my_portfolio", payload, filename, current_user.user_id)
+
     # Generate PDF
-    user_name = current_user.full_name or current_user.email
-    pdf = MyPortfolioPDF(report_data, user_name)
-    pdf_bytes = pdf.generate()
+    pdf_bytes = render_pdf_cached("my_portfolio", payload)
 
     # Return as downloadable PDF
-    filename = f"my_portfolio_{portfolio.as_of_date}.pdf"
     return Response(
         content=pdf_bytes,
         media_type="application/pdf",
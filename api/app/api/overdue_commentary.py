@@ -8,11 +8,11 @@ from sqlalchemy import desc
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin, is_validator
+from app.core.audit import create_audit_log
 from app.models import (
     User, Model, ValidationRequest, ValidationRequestModelVersion,
     ValidationAssignment, OverdueRevalidationComment
 )
-from app.models.audit_log import AuditLog
 from app.schemas.overdue_commentary import (
     OverdueCommentaryCreate,
     OverdueCommentaryResponse,
@@ -27,18 +27,6 @@ router = APIRouter()
 COMMENT_STALENESS_DAYS = 45
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for overdue commentary operations."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def get_stale_reason(comment: Optional[OverdueRevalidationComment]) -> tuple[bool, Optional[str]]:
     """
     Check if a comment is stale and return the reason.
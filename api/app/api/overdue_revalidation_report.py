@@ -33,6 +33,8 @@ from app.models.region import Region
 from app.models.taxonomy import Taxonomy, TaxonomyValue
 from app.models.team import Team
 from app.core.team_utils import build_lob_team_map
+from app.core.validation_due_dates import submission_overdue_candidates, validation_overdue_candidates
+from app.core.validation_memo import prefetch_validation_lookups
 from app.models.validation import (
     ValidationRequest, ValidationRequestModelVersion,
     ValidationAssignment
@@ -377,8 +379,10 @@ def get_overdue_revalidation_report(
                 TaxonomyValue.code == "COMPREHENSIVE"),
             ValidationRequest.submission_received_date.is_(None),
             ValidationRequest.current_status.has(
-                TaxonomyValue.code.in_(["INTAKE", "PLANNING"]))
+                TaxonomyValue.code.in_(["INTAKE", "PLANNING"])),
+            submission_overdue_candidates(today)
         ).all()
+        prefetch_validation_lookups(db, [req.request_id for req in pre_submission_requests])
 
         for req in pre_submission_requests:
             # Check if past due
@@ -508,8 +512,10 @@ def get_overdue_revalidation_report(
             ValidationRequest.validation_type.has(
                 TaxonomyValue.code == "COMPREHENSIVE"),
             ValidationRequest.current_status.has(
-                TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"]))
+                TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"])),
+            validation_overdue_candidates(today)
         ).all()
+        prefetch_validation_lookups(db, [req.request_id for req in in_progress_requests])
 
         for req in in_progress_requests:
             # Check if past validation due
@@ -0,0 +1,61 @@
+"""Background PDF job routes."""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+
+from app.core.deps import get_current_user, get_current_user_id
+from app.core.pdf_jobs import JOB_COMPLETED, get_pdf_job_runner, pdf_job_status
+from app.models.user import User
+from app.schemas.pdf_job import PDFJobResponse
+
+router = APIRouter()
+
+MAX_WAIT_SECONDS = 30
+
+
+def _check_owner(job, user_id: int) -> dict:
+    # Jobs belong to the user who queued them; others get a 404, not a 403,
+    # so job IDs cannot be probed.
+    if job is None or job["owner_id"] != user_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PDF job not found")
+    return job
+
+
+@router.get("/{job_id}", response_model=PDFJobResponse)
+async def get_pdf_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=MAX_WAIT_SECONDS, description="Long-poll: seconds to wait for completion"),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """Get the status of a queued PDF render.
+
+    With ``wait`` > 0 the response is held until the job finishes or the wait
+    elapses, whichever comes first. The wait runs on the event loop and holds
+    neither a worker thread nor a database connection.
+    """
+    runner = get_pdf_job_runner()
+    job = _check_owner(runner.get(job_id), current_user_id)
+    if wait:
+        job = await runner.wait_async(job_id, wait)
+    return pdf_job_status(_check_owner(job, current_user_id))
+
+
+@router.get("/{job_id}/download")
+def download_pdf_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Download the PDF produced by a completed job."""
+    job = _check_owner(get_pdf_job_runner().get(job_id), current_user.user_id)
+    if job["status"] != JOB_COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"PDF job is {job['status']}" + (f": {job['error']}" if job["error"] else "")
+        )
+    content = get_pdf_job_runner().store.get(job["artifact_key"])
+    if content is None:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="PDF has expired; queue it again")
+    return Response(
+        content=content,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={job['filename']}"}
+    )
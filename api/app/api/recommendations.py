@@ -17,8 +17,10 @@ from app.core.recommendation_status import TERMINAL_RECOMMENDATION_STATUS_CODES
 from app.core.deps import get_current_user
 from app.core.roles import is_admin, is_validator, is_global_approver, is_regional_approver
 from app.core.rls import can_see_all_data, can_see_recommendation, can_access_model
+from app.core.taxonomy_registry import taxonomy_registry
+from app.core.audit import create_audit_log as record_audit_log
 from app.models import (
-    User, Model, TaxonomyValue, Taxonomy, AuditLog, Region, ModelRegion,
+    User, Model, TaxonomyValue, Taxonomy, Region, ModelRegion,
     Recommendation, ActionPlanTask, RecommendationRebuttal,
     ClosureEvidence, RecommendationStatusHistory, RecommendationApproval,
     RecommendationPriorityConfig, ModelLimitation, ModelDelegate, MonitoringCycle
@@ -91,17 +93,12 @@ def check_developer_or_admin(user: User, recommendation: Recommendation):
 
 def get_status_by_code(db: Session, code: str) -> TaxonomyValue:
     """Get recommendation status taxonomy value by code."""
-    taxonomy = db.query(Taxonomy).filter(
-        Taxonomy.name == "Recommendation Status").first()
-    if not taxonomy:
+    if taxonomy_registry.taxonomy_id(db, "Recommendation Status") is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Recommendation Status taxonomy not found"
         )
-    value = db.query(TaxonomyValue).filter(
-        TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
-        TaxonomyValue.code == code
-    ).first()
+    value = taxonomy_registry.get_value(db, "Recommendation Status", code)
     if not value:
         status_aliases = {
             "REC_PENDING_FINAL_APPROVAL": "REC_PENDING_APPROVAL",
@@ -109,10 +106,7 @@ def get_status_by_code(db: Session, code: str) -> TaxonomyValue:
         }
         alt_code = status_aliases.get(code)
         if alt_code:
-            value = db.query(TaxonomyValue).filter(
-                TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
-                TaxonomyValue.code == alt_code
-            ).first()
+            value = taxonomy_registry.get_value(db, "Recommendation Status", alt_code)
     if not value:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -123,26 +117,18 @@ def get_status_by_code(db: Session, code: str) -> TaxonomyValue:
 
 def get_task_status_by_code(db: Session, code: str) -> TaxonomyValue:
     """Get task status taxonomy value by code."""
-    taxonomy = db.query(Taxonomy).filter(
-        Taxonomy.name == "Action Plan Task Status").first()
-    if not taxonomy:
+    if taxonomy_registry.taxonomy_id(db, "Action Plan Task Status") is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Action Plan Task Status taxonomy not found"
         )
-    value = db.query(TaxonomyValue).filter(
-        TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
-        TaxonomyValue.code == code
-    ).first()
+    value = taxonomy_registry.get_value(db, "Action Plan Task Status", code)
     if not value:
         if code.startswith("TASK_"):
             alt_code = code.replace("TASK_", "", 1)
         else:
             alt_code = f"TASK_{code}"
-        value = db.query(TaxonomyValue).filter(
-            TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
-            TaxonomyValue.code == alt_code
-        ).first()
+        value = taxonomy_registry.get_value(db, "Action Plan Task Status", alt_code)
     if not value:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -211,14 +197,7 @@ def create_audit_log(
     if new_values:
         changes["new"] = new_values
 
-    audit = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user.user_id,
-        changes=changes if changes else None
-    )
-    db.add(audit)
+    record_audit_log(db, entity_type, entity_id, action, user.user_id, changes or None)
 
 
 def is_terminal_status(code: str) -> bool:
@@ -87,7 +87,7 @@ class RegionalComplianceReportResponse(BaseModel):
 
 
 @router.get("/", response_model=RegionalComplianceReportResponse)
-async def get_regional_deployment_compliance_report(
+def get_regional_deployment_compliance_report(
     region_code: Optional[str] = Query(None, description="Filter by region code (e.g., 'US')"),
     model_id: Optional[int] = Query(None, description="Filter by specific model"),
     team_id: Optional[int] = Query(None, description="Filter by team ID (0 = Unassigned)"),
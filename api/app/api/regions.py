@@ -6,24 +6,12 @@ from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.models import Region as RegionModel, User
 from app.core.roles import is_admin
-from app.models.audit_log import AuditLog
+from app.core.audit import create_audit_log
 from app.schemas.region import Region, RegionCreate, RegionUpdate
 
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for region management operations."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 @router.get("/", response_model=List[Region])
 def list_regions(
     db: Session = Depends(get_db),
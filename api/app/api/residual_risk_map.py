@@ -13,7 +13,7 @@ from app.core.deps import get_current_user
 from app.core.time import utc_now
 from app.models.user import User
 from app.core.roles import is_admin
-from app.models.audit_log import AuditLog
+from app.core.audit import create_audit_log
 from app.models.residual_risk_map import ResidualRiskMapConfig
 from app.schemas.residual_risk_map import (
     ResidualRiskMapCreate,
@@ -38,21 +38,6 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-def create_audit_log(
-    db: Session, entity_type: str, entity_id: int,
-    action: str, user_id: int, changes: dict | None = None
-):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def get_active_config(db: Session) -> Optional[ResidualRiskMapConfig]:
     """Get the currently active residual risk map configuration."""
     return (
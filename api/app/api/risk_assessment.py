@@ -20,6 +20,7 @@ from app.core.risk_calculation import (
 from app.core.pdf_generator import RiskAssessmentPDF
 from app.models.user import User
 from app.core.roles import is_admin, is_validator
+from app.core.audit import create_audit_log
 from app.models.model import Model
 from app.models.taxonomy import Taxonomy, TaxonomyValue
 from app.models.audit_log import AuditLog
@@ -52,21 +53,6 @@ from app.api.validation_workflow import reset_validation_plan_for_tier_change
 router = APIRouter()
 
 
-def create_audit_log(
-    db: Session, entity_type: str, entity_id: int,
-    action: str, user_id: int, changes: dict | None = None
-):
-    """Create an audit log entry for risk assessment changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def require_admin_or_validator(current_user: User = Depends(get_current_user)) -> User:
     """Require the current user to be an Admin or Validator."""
     if not (is_admin(current_user) or is_validator(current_user)):
@@ -2,7 +2,7 @@
 from io import BytesIO
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
@@ -11,7 +11,7 @@ from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin, is_validator
 from app.core.time import utc_now
-from app.core.pdf_reports import generate_validation_scorecard_pdf
+from app.core.pdf_jobs import queue_pdf_job, render_pdf_cached
 from app.core.scorecard import (
     compute_scorecard,
     load_scorecard_config,
@@ -19,8 +19,8 @@ from app.core.scorecard import (
     score_to_rating,
     VALID_RATINGS as VALID_RATING_VALUES,
 )
+from app.core.audit import create_audit_log
 from app.models.user import User
-from app.models.audit_log import AuditLog
 from app.models.scorecard import (
     ScorecardSection,
     ScorecardCriterion,
@@ -73,21 +73,6 @@ router = APIRouter()
 # Helper Functions
 # ============================================================================
 
-def create_audit_log(
-    db: Session, entity_type: str, entity_id: int,
-    action: str, user_id: int, changes: Optional[dict] = None
-):
-    """Create an audit log entry for scorecard changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def require_admin_or_validator(current_user: User = Depends(get_current_user)) -> User:
     """Require the current user to be an Admin or Validator."""
     if not (is_admin(current_user) or is_validator(current_user)):
@@ -398,6 +383,7 @@ def get_scorecard(
 @router.get("/validation/{request_id}/export-pdf")
 def export_validation_scorecard_pdf(
     request_id: int,
+    background: bool = Query(False, description="Queue the render and return a PDF job instead of the PDF"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> StreamingResponse:
@@ -410,6 +396,9 @@ def export_validation_scorecard_pdf(
     - Criteria ratings table organized by section
     - Related models (upstream/downstream dependencies)
     - Region metadata
+
+    With background=true the render is queued and 202 returns a PDF job
+    (poll /pdf-jobs/{job_id}).
     """
     # Get validation request with models relationship
     validation_request = (
@@ -579,16 +568,15 @@ def export_validation_scorecard_pdf(
     else:
         all_validation_types_list = []
 
-    # Generate PDF
-    pdf_bytes = generate_validation_scorecard_pdf(
-        validation_request=validation_request_dict,
-        model=model_dict,
-        scorecard_data=scorecard_dict,
-        dependencies=dependencies_dict,
-        all_regions=all_regions_list,
-        all_categories=all_categories_list,
-        all_validation_types=all_validation_types_list,
-    )
+    payload = {
+        "validation_request": validation_request_dict,
+        "model": model_dict,
+        "scorecard_data": scorecard_dict,
+        "dependencies": dependencies_dict,
+        "all_regions": all_regions_list,
+        "all_categories": all_categories_list,
+        "all_validation_types": all_validation_types_list,
+    }
 
     # Build filename
     model_name_safe = "".join(
@@ -597,6 +585,12 @@ def export_validation_scorecard_pdf(
     ).strip()
     filename = f"Scorecard_{model_name_safe}_{request_id}.pdf"
 
+    if background:
+        return queue_pdf_job("validation_scorecard", payload, filename, current_user.user_id)
+
+    # Generate PDF
+    pdf_bytes = render_pdf_cached("validation_scorecard", payload)
+
     return StreamingResponse(
         BytesIO(pdf_bytes),
         media_type="application/pdf",
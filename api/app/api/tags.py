@@ -1,15 +1,15 @@
 """Tag routes for model categorization."""
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session, joinedload
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
+from app.core.audit import create_audit_log
 from app.models.user import User
 from app.models.model import Model
 from app.models.tag import TagCategory, Tag, ModelTag, ModelTagHistory
-from app.models.audit_log import AuditLog
 from app.schemas.tag import (
     TagCategoryCreate,
     TagCategoryUpdate,
@@ -34,18 +34,6 @@ from app.schemas.tag import (
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def require_admin(user: User, action: str = "perform this action"):
     """Require admin role for the operation."""
     if not is_admin(user):
@@ -854,25 +842,24 @@ def bulk_assign_tag(
     ).all()
     existing_model_ids = {r[0] for r in existing}
 
-    # Add new assignments
-    models_to_add = found_model_ids - existing_model_ids
-    for model_id in models_to_add:
-        model_tag = ModelTag(
-            model_id=model_id,
-            tag_id=payload.tag_id,
-            added_by_id=current_user.user_id,
-        )
-        db.add(model_tag)
-
-        history = ModelTagHistory(
-            model_id=model_id,
-            tag_id=payload.tag_id,
-            action="ADDED",
-            performed_by_id=current_user.user_id,
-        )
-        db.add(history)
-
+    # Add new assignments with one multi-row INSERT per table rather than
+    # two ORM objects per model
+    models_to_add = sorted(found_model_ids - existing_model_ids)
     if models_to_add:
+        db.execute(insert(ModelTag), [
+            {"model_id": model_id, "tag_id": payload.tag_id, "added_by_id": current_user.user_id}
+            for model_id in models_to_add
+        ])
+        db.execute(insert(ModelTagHistory), [
+            {
+                "model_id": model_id,
+                "tag_id": payload.tag_id,
+                "action": "ADDED",
+                "performed_by_id": current_user.user_id,
+            }
+            for model_id in models_to_add
+        ])
+
         create_audit_log(
             db=db,
             entity_type="Tag",
@@ -882,7 +869,7 @@ def bulk_assign_tag(
             changes={
                 "tag_name": tag.name,
                 "models_added": len(models_to_add),
-                "model_ids": list(models_to_add),
+                "model_ids": models_to_add,
             }
         )
 
@@ -1,16 +1,15 @@
 """Taxonomy routes."""
-import csv
-import io
 from typing import List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
+from app.core.csv_export import CSVColumn, csv_streaming_response, stream_query
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
+from app.core.taxonomy_registry import taxonomy_registry
+from app.core.audit import create_audit_log
 from app.models.user import User
 from app.models.taxonomy import Taxonomy, TaxonomyValue
-from app.models.audit_log import AuditLog
 from app.schemas.taxonomy import (
     TaxonomyResponse,
     TaxonomyListResponse,
@@ -40,18 +39,6 @@ def is_system_protected_override(value: TaxonomyValue) -> bool:
     return value.code in protected_codes
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for taxonomy operations."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def require_admin_for_bucket_taxonomy(user: User, taxonomy: Taxonomy, action: str = "modify"):
     """Require admin role for bucket taxonomy modifications.
 
@@ -271,6 +258,7 @@ def create_taxonomy(
     )
 
     db.commit()
+    taxonomy_registry.invalidate()
     db.refresh(taxonomy)
     return taxonomy
 
@@ -335,6 +323,7 @@ def update_taxonomy(
         )
 
     db.commit()
+    taxonomy_registry.invalidate()
     db.refresh(taxonomy)
     return taxonomy
 
@@ -375,6 +364,7 @@ def delete_taxonomy(
 
     db.delete(taxonomy)
     db.commit()
+    taxonomy_registry.invalidate()
     return None
 
 
@@ -459,6 +449,7 @@ def create_taxonomy_value(
     )
 
     db.commit()
+    taxonomy_registry.invalidate()
     db.refresh(value)
     return value
 
@@ -547,6 +538,7 @@ def update_taxonomy_value(
         )
 
     db.commit()
+    taxonomy_registry.invalidate()
     db.refresh(value)
     return value
 
@@ -616,9 +608,24 @@ def delete_taxonomy_value(
 
     db.delete(value)
     db.commit()
+    taxonomy_registry.invalidate()
     return None
 
 
+TAXONOMY_EXPORT_COLUMNS = [
+    CSVColumn("taxonomy", "Taxonomy", lambda v: v.taxonomy.name if v.taxonomy else ""),
+    CSVColumn("taxonomy_type", "Taxonomy Type", lambda v: v.taxonomy.taxonomy_type if v.taxonomy else ""),
+    CSVColumn("code", "Code", lambda v: v.code),
+    CSVColumn("label", "Label", lambda v: v.label),
+    CSVColumn("description", "Description", lambda v: v.description or ""),
+    CSVColumn("sort_order", "Sort Order", lambda v: v.sort_order),
+    CSVColumn("is_active", "Active", lambda v: "Yes" if v.is_active else "No"),
+    CSVColumn("min_days", "Min Days", lambda v: v.min_days if v.min_days is not None else ""),
+    CSVColumn("max_days", "Max Days", lambda v: v.max_days if v.max_days is not None else ""),
+    CSVColumn("created_at", "Created At", lambda v: v.created_at.isoformat() if v.created_at else ""),
+]
+
+
 @router.get("/export/csv")
 def export_taxonomies_csv(
     db: Session = Depends(get_db),
@@ -627,49 +634,7 @@ def export_taxonomies_csv(
     """Export all taxonomy values to CSV."""
     values = db.query(TaxonomyValue).options(
         joinedload(TaxonomyValue.taxonomy)
-    ).order_by(TaxonomyValue.taxonomy_id, TaxonomyValue.sort_order).all()
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        "Taxonomy",
-        "Taxonomy Type",
-        "Code",
-        "Label",
-        "Description",
-        "Sort Order",
-        "Active",
-        "Min Days",
-        "Max Days",
-        "Created At"
-    ])
-
-    # Write data rows
-    for value in values:
-        writer.writerow([
-            value.taxonomy.name if value.taxonomy else "",
-            value.taxonomy.taxonomy_type if value.taxonomy else "",
-            value.code,
-            value.label,
-            value.description or "",
-            value.sort_order,
-            "Yes" if value.is_active else "No",
-            value.min_days if value.min_days is not None else "",
-            value.max_days if value.max_days is not None else "",
-            value.created_at.isoformat() if value.created_at else ""
-        ])
-
-    # Reset stream position
-    output.seek(0)
-
-    # Return as streaming response
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=taxonomies_export.csv"
-        }
+    ).order_by(TaxonomyValue.taxonomy_id, TaxonomyValue.sort_order)
+    return csv_streaming_response(
+        stream_query(values), TAXONOMY_EXPORT_COLUMNS, "taxonomies_export.csv", db=db
     )
@@ -11,8 +11,8 @@ from app.core.deps import get_current_user
 from app.core.roles import is_admin
 from app.core.rls import apply_model_rls
 from app.core.team_utils import build_lob_team_map, get_all_lob_ids_for_team, get_models_team_map
+from app.core.audit import create_audit_log
 from app.models.team import Team
-from app.models.audit_log import AuditLog
 from app.models.lob import LOBUnit
 from app.models.model import Model
 from app.models.user import User
@@ -27,25 +27,6 @@ class TeamLOBAssignment(BaseModel):
     lob_id: int
 
 
-def create_audit_log(
-    db: Session,
-    entity_type: str,
-    entity_id: int,
-    action: str,
-    user_id: int,
-    changes: dict | None = None
-):
-    """Create an audit log entry for team changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 def _require_admin(user: User) -> None:
     if not is_admin(user):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
@@ -8,7 +8,7 @@ from fastapi.responses import FileResponse
 from starlette.background import BackgroundTask
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session, joinedload, aliased
-from sqlalchemy import desc, or_, func, nullslast, select, text
+from sqlalchemy import DateTime, Integer, cast, desc, extract, literal, or_, func, nullslast, select, text
 from fpdf import FPDF
 import tempfile
 import os
@@ -18,14 +18,18 @@ from app.core.time import utc_now
 from app.core.deps import get_current_user
 from app.core.roles import is_admin, is_validator, is_global_approver, is_regional_approver, RoleCode
 from app.core.rule_evaluation import get_required_approver_roles
+from app.core.taxonomy_registry import taxonomy_registry
 from app.core.exception_detection import autoclose_type3_on_full_validation_approved
+from app.core.validation_due_dates import submission_overdue_candidates, validation_overdue_candidates
+from app.core.validation_memo import get_validation_memo, prefetch_validation_lookups
 from app.core.validation_conflicts import (
     find_active_validation_conflicts,
     build_validation_conflict_message
 )
+from app.core.audit import create_audit_log
 from app.models.user import LocalStatus
 from app.models import (
-    User, Model, ModelVersion, TaxonomyValue, Taxonomy, AuditLog, Region, EntraUser, ApproverRole,
+    User, Role, Model, ModelVersion, TaxonomyValue, Taxonomy, Region, EntraUser, ApproverRole,
     ValidationRequest, ValidationRequestModelVersion, ValidationStatusHistory, ValidationAssignment,
     ValidationOutcome, ValidationReviewOutcome, ValidationApproval, ValidationGroupingMemory,
     ValidationPolicy, ValidationWorkflowSLA, ModelRegion, Region,
@@ -106,26 +110,6 @@ def check_admin(user: User):
         )
 
 
-def create_audit_log(
-    db: Session,
-    entity_type: str,
-    entity_id: int,
-    action: str,
-    user_id: int,
-    changes: Optional[dict] = None
-):
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-    # Note: commit happens with the main transaction
-
-
 def _is_user_active(db: Session, user: Optional[User]) -> bool:
     """Check if user is active based on local_status (synced from Entra)."""
     if not user:
@@ -441,7 +425,8 @@ def reset_validation_plan_for_tier_change(
             plan.overall_deviation_rationale = None
 
             # Create audit log for plan reset
-            audit_log = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationPlan",
                 entity_id=plan.plan_id,
                 action="RISK_TIER_RESET",
@@ -453,10 +438,8 @@ def reset_validation_plan_for_tier_change(
                     "new_risk_tier_code": new_tier_code,
                     "old_component_count": old_component_count,
                     "new_component_count": len(all_components)
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(audit_log)
 
         # Void all pending approvals for this request
         pending_approvals = db.query(ValidationApproval).filter(
@@ -473,7 +456,8 @@ def reset_validation_plan_for_tier_change(
 
         # Create audit log for approvals voided
         if pending_approvals:
-            approval_audit = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationApproval",
                 entity_id=request.request_id,
                 action="BULK_VOID",
@@ -483,10 +467,8 @@ def reset_validation_plan_for_tier_change(
                     "model_id": model_id,
                     "new_risk_tier_code": new_tier_code,
                     "voided_approval_ids": [a.approval_id for a in pending_approvals]
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(approval_audit)
 
         result["reset_count"] += 1
         result["request_ids"].append(request.request_id)
@@ -683,16 +665,11 @@ def check_target_completion_date_warnings(
 
 def get_taxonomy_value_by_code(db: Session, taxonomy_name: str, code: str) -> TaxonomyValue:
     """Get taxonomy value by taxonomy name and code."""
-    taxonomy = db.query(Taxonomy).filter(
-        Taxonomy.name == taxonomy_name).first()
-    if not taxonomy:
+    if taxonomy_registry.taxonomy_id(db, taxonomy_name) is None:
         raise HTTPException(
             status_code=404, detail=f"Taxonomy '{taxonomy_name}' not found")
 
-    value = db.query(TaxonomyValue).filter(
-        TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
-        TaxonomyValue.code == code
-    ).first()
+    value = taxonomy_registry.get_value(db, taxonomy_name, code)
     if not value:
         raise HTTPException(
             status_code=404, detail=f"Taxonomy value '{code}' not found in '{taxonomy_name}'")
@@ -1157,6 +1134,26 @@ def calculate_days_in_status(request: ValidationRequest) -> int:
         return delta.days
 
 
+TERMINAL_REQUEST_STATUS_CODES = ("APPROVED", "CANCELLED")
+# Joins model names in SQL; a control character cannot appear in a name
+_MODEL_NAME_SEPARATOR = "\x1f"
+
+
+def days_since_sql(db: Session, column, now: datetime):
+    """SQL expression for the whole days from ``column`` to ``now``.
+
+    Matches ``(now - value).days`` for past timestamps, as used by
+    calculate_days_in_status.
+    """
+    now_param = literal(now, DateTime())
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        return cast(func.floor(extract("epoch", now_param - column) / 86400), Integer)
+    return (
+        cast(func.strftime("%s", now_param), Integer) - cast(func.strftime("%s", column), Integer)
+    ) // 86400
+
+
 def update_grouping_memory(db: Session, validation_request: ValidationRequest, models: List[Model]):
     """Update validation grouping memory for multi-model regular validations.
 
@@ -1423,7 +1420,8 @@ def auto_assign_approvers(
             {"approver_id": a.approver_id, "role": a.approver_role}
             for a in approvals_to_create
         ]
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="ValidationRequest",
             entity_id=validation_request.request_id,
             action="AUTO_ASSIGN_APPROVERS",
@@ -1432,10 +1430,8 @@ def auto_assign_approvers(
                 "approvers_assigned": len(approvals_to_create),
                 "approvers": approver_info,
                 "assignment_type": "Automatic"
-            },
-            timestamp=utc_now()
+            }
         )
-        db.add(audit_log)
 
 
 def evaluate_and_create_conditional_approvals(
@@ -1666,15 +1662,14 @@ def log_model_change_audit(
         "conditional_approvals_voided": conditional_voided or 0
     }
 
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=validation_request.request_id,
         action="UPDATE_MODELS",
         user_id=current_user.user_id,
-        changes=changes,
-        timestamp=utc_now()
+        changes=changes
     )
-    db.add(audit_log)
 
 # ==================== REVALIDATION LIFECYCLE HELPERS ====================
 
@@ -1861,9 +1856,7 @@ def calculate_model_revalidation_status(model: Model, db: Session) -> Dict:
             completion_lead_time = policy.model_change_lead_time_days
 
         # Add workflow SLA periods (assignment, begin_work, approval)
-        workflow_sla = db.query(ValidationWorkflowSLA).filter(
-            ValidationWorkflowSLA.workflow_type == "Validation"
-        ).first()
+        workflow_sla = get_validation_memo(db).workflow_sla
         sla_days = 0
         if workflow_sla:
             sla_days = (workflow_sla.assignment_days or 0) + \
@@ -1954,8 +1947,12 @@ def get_models_needing_revalidation(
         Model.risk_tier_id.isnot(None)
     ).all()
 
+    # Compute all statuses with a fixed number of set-based queries
+    from app.core.batch_revalidation import compute_revalidation_statuses
+    statuses = compute_revalidation_statuses(db, models)
+
     for model in models:
-        revalidation_status = calculate_model_revalidation_status(model, db)
+        revalidation_status = statuses[model.model_id]
 
         # Filter based on criteria
         if include_overdue and "Overdue" in revalidation_status["status"]:
@@ -2298,7 +2295,8 @@ def create_validation_request(
 
     # Create audit log
     model_names = [m.model_name for m in models]
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=validation_request.request_id,
         action="CREATE",
@@ -2309,10 +2307,8 @@ def create_validation_request(
             "validation_type": validation_type.label,
             "priority": priority.label,
             "status": "Intake"
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # Update grouping memory for multi-model regular validations
     update_grouping_memory(db, validation_request, models)
@@ -2439,11 +2435,12 @@ def list_validation_requests(
     requests = query.order_by(desc(ValidationRequest.request_date)).offset(
         offset).limit(limit).all()
 
+    # One lookup per policy/override table for the whole page
+    memo = prefetch_validation_lookups(db, [req.request_id for req in requests])
+
     # Fetch approval SLA days (for forecasted approval date)
     approval_days = None
-    workflow_sla = db.query(ValidationWorkflowSLA).filter(
-        ValidationWorkflowSLA.workflow_type == "Validation"
-    ).first()
+    workflow_sla = memo.workflow_sla
     if workflow_sla:
         approval_days = workflow_sla.approval_days
 
@@ -2674,15 +2671,14 @@ def update_validation_request(
     if changes:
         validation_request.updated_at = utc_now()
 
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="ValidationRequest",
             entity_id=request_id,
             action="UPDATE",
             user_id=current_user.user_id,
-            changes=changes,
-            timestamp=utc_now()
+            changes=changes
         )
-        db.add(audit_log)
 
     db.commit()
     db.refresh(validation_request)
@@ -3120,15 +3116,14 @@ def mark_submission_received(
     if submission_data.notes:
         changes["notes"] = submission_data.notes
 
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="MARK_SUBMISSION_RECEIVED",
         user_id=current_user.user_id,
-        changes=changes,
-        timestamp=utc_now()
+        changes=changes
     )
-    db.add(audit_log)
 
     # Auto-update linked version statuses if we auto-transitioned to IN_PROGRESS
     if auto_transitioned:
@@ -3506,7 +3501,8 @@ def update_validation_request_status(
     )
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="STATUS_CHANGE",
@@ -3515,10 +3511,8 @@ def update_validation_request_status(
             "old_status": old_status.label if old_status else None,
             "new_status": new_status.label,
             "reason": status_update.change_reason
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # ===== SNAPSHOT RISK TIER ON APPROVAL =====
     # When validation is approved, capture the model's risk tier at that moment
@@ -3541,7 +3535,8 @@ def update_validation_request_status(
                 validation_request.validated_risk_tier_id = best_tier_id
 
                 # Audit log for risk tier snapshot
-                tier_snapshot_audit = AuditLog(
+                create_audit_log(
+                    db,
                     entity_type="ValidationRequest",
                     entity_id=request_id,
                     action="RISK_TIER_SNAPSHOT",
@@ -3550,10 +3545,8 @@ def update_validation_request_status(
                         "validated_risk_tier_id": best_tier_id,
                         "model_count": len(models),
                         "reason": "Risk tier captured at validation approval"
-                    },
-                    timestamp=utc_now()
+                    }
                 )
-                db.add(tier_snapshot_audit)
 
         # ===== DUE DATE OVERRIDE HANDLING ON APPROVAL =====
         # Handle override lifecycle: clear ONE_TIME or roll-forward PERMANENT
@@ -3580,7 +3573,8 @@ def update_validation_request_status(
                 plan.locked_by_user_id = current_user.user_id
 
                 # Audit log for plan lock
-                plan_lock_audit = AuditLog(
+                create_audit_log(
+                    db,
                     entity_type="ValidationPlan",
                     entity_id=plan.plan_id,
                     action="LOCK",
@@ -3591,10 +3585,8 @@ def update_validation_request_status(
                         "reason": f"Plan locked when validation moved to {new_status.label}",
                         "old_status": old_status.label if old_status else None,
                         "new_status": new_status.label
-                    },
-                    timestamp=utc_now()
+                    }
                 )
-                db.add(plan_lock_audit)
 
         # UNLOCK: When moving FROM locked status TO editable status (sendback scenario)
         elif old_status_code in locked_statuses and new_status_code in editable_statuses and plan.locked_at:
@@ -3603,7 +3595,8 @@ def update_validation_request_status(
             plan.locked_by_user_id = None
 
             # Audit log for plan unlock
-            plan_unlock_audit = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationPlan",
                 entity_id=plan.plan_id,
                 action="UNLOCK",
@@ -3613,10 +3606,8 @@ def update_validation_request_status(
                     "previous_status": old_status.label if old_status else None,
                     "new_status": new_status.label,
                     "config_id_preserved": plan.config_id  # Still linked to original config
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(plan_unlock_audit)
 
     # ===== VOID CONDITIONAL APPROVALS WHEN SENDING BACK =====
     # When moving FROM PENDING_APPROVAL TO IN_PROGRESS, void all conditional approvals
@@ -3635,7 +3626,8 @@ def update_validation_request_status(
             approval.voided_at = utc_now()
 
             # Create audit log for each voided approval
-            void_audit = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationApproval",
                 entity_id=approval.approval_id,
                 action="VOID",
@@ -3646,10 +3638,8 @@ def update_validation_request_status(
                     "approver_role_id": approval.approver_role_id,
                     "request_id": request_id,
                     "status_change": f"{old_status.label} → {new_status.label}"
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(void_audit)
 
         # Also clear model use_approval_date if any models were approved
         for model in validation_request.models:
@@ -3657,7 +3647,8 @@ def update_validation_request_status(
                 model.use_approval_date = None
 
                 # Create audit log for model approval reversal
-                model_audit = AuditLog(
+                create_audit_log(
+                    db,
                     entity_type="Model",
                     entity_id=model.model_id,
                     action="CONDITIONAL_APPROVAL_REVERTED",
@@ -3666,10 +3657,8 @@ def update_validation_request_status(
                         "reason": f"Validation sent back to In Progress: {status_update.change_reason or 'No reason provided'}",
                         "validation_request_id": request_id,
                         "status_change": f"{old_status.label} → {new_status.label}"
-                    },
-                    timestamp=utc_now()
+                    }
                 )
-                db.add(model_audit)
 
         # Reset all traditional approvals (Global/Regional) unconditionally
         traditional_approvals = db.query(ValidationApproval).filter(
@@ -3684,7 +3673,8 @@ def update_validation_request_status(
             approval.approved_at = None
             approval.comments = None
 
-            reset_audit = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationApproval",
                 entity_id=approval.approval_id,
                 action="RESET",
@@ -3699,10 +3689,8 @@ def update_validation_request_status(
                     "approval_type": approval.approval_type,
                     "request_id": request_id,
                     "reset_type": "unconditional"
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(reset_audit)
 
     # ===== RESUBMISSION FROM REVISION - CONDITIONAL APPROVAL RESET =====
     # When resubmitting from REVISION to PENDING_APPROVAL, conditionally reset approvals
@@ -3788,7 +3776,8 @@ def update_validation_request_status(
                     })
 
             # Create audit log for resubmission
-            resubmit_audit = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationRequest",
                 entity_id=request_id,
                 action="RESUBMIT_FROM_REVISION",
@@ -3802,10 +3791,8 @@ def update_validation_request_status(
                     },
                     "approvals_reset": reset_approvals,
                     "reason": status_update.change_reason
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(resubmit_audit)
 
     # ===== RETURN FROM ADMIN IN_PROGRESS SENDBACK (AUDIT ONLY) =====
     if new_status_code == "PENDING_APPROVAL" and old_status_code in ("IN_PROGRESS", "REVIEW"):
@@ -3849,7 +3836,8 @@ def update_validation_request_status(
                 current_lim_ids != snapshot_lim_ids
             )
 
-            audit_log = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationRequest",
                 entity_id=request_id,
                 action="RETURN_FROM_IN_PROGRESS_SENDBACK",
@@ -3863,10 +3851,8 @@ def update_validation_request_status(
                     },
                     "note": "Approvals were reset when sent to In Progress; this audit is for transparency only.",
                     "reason": status_update.change_reason
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(audit_log)
 
             if status_history_entry:
                 status_history_entry.additional_context = json.dumps({
@@ -3960,7 +3946,8 @@ def decline_validation_request(
     )
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="DECLINED",
@@ -3970,10 +3957,8 @@ def decline_validation_request(
             "new_status": cancelled_status.label,
             "decline_reason": decline_data.decline_reason,
             "declined_by": current_user.full_name
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # Auto-update linked model version statuses
     update_version_statuses_for_validation(
@@ -4050,7 +4035,8 @@ def put_request_on_hold(
     )
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="PUT_ON_HOLD",
@@ -4059,10 +4045,8 @@ def put_request_on_hold(
             "old_status": old_status.label if old_status else None,
             "new_status": on_hold_status.label,
             "hold_reason": hold_data.hold_reason
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # Auto-update linked model version statuses (IN_VALIDATION -> DRAFT)
     update_version_statuses_for_validation(
@@ -4135,7 +4119,8 @@ def cancel_validation_request(
     )
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="CANCELLED",
@@ -4144,10 +4129,8 @@ def cancel_validation_request(
             "old_status": old_status.label if old_status else None,
             "new_status": cancelled_status.label,
             "cancel_reason": cancel_data.cancel_reason
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # Auto-update linked model version statuses (IN_VALIDATION -> DRAFT)
     update_version_statuses_for_validation(
@@ -4240,7 +4223,8 @@ def resume_from_hold(
     )
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="RESUMED_FROM_HOLD",
@@ -4250,10 +4234,8 @@ def resume_from_hold(
             "new_status": target_status.label,
             "total_hold_days": validation_request.total_hold_days,
             "resume_notes": resume_data.resume_notes
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # Auto-update linked model version statuses if resuming to active work
     if target_status_code in ["IN_PROGRESS", "REVIEW", "PENDING_APPROVAL"]:
@@ -4283,15 +4265,14 @@ def delete_validation_request(
             status_code=404, detail="Validation request not found")
 
     # Create audit log before deletion
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="DELETE",
         user_id=current_user.user_id,
-        changes={"request_id": request_id},
-        timestamp=utc_now()
+        changes={"request_id": request_id}
     )
-    db.add(audit_log)
 
     db.delete(validation_request)
     db.commit()
@@ -4384,7 +4365,8 @@ def create_assignment(
         roles.append("Reviewer")
     role_str = " & ".join(roles) if roles else "Supporting"
 
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationAssignment",
         entity_id=request_id,
         action="CREATE",
@@ -4394,10 +4376,8 @@ def create_assignment(
             "validator": validator.full_name,
             "role": role_str,
             "estimated_hours": assignment_data.estimated_hours
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # Auto-transition from INTAKE to PLANNING when first validator is assigned
     if validation_request.current_status and validation_request.current_status.code == "INTAKE":
@@ -4423,7 +4403,8 @@ def create_assignment(
             )
 
             # Create audit log for status change
-            status_audit = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationRequest",
                 entity_id=request_id,
                 action="UPDATE",
@@ -4433,10 +4414,8 @@ def create_assignment(
                     "old_value": "INTAKE",
                     "new_value": "PLANNING",
                     "reason": "Auto-transitioned when validator assigned"
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(status_audit)
 
     db.commit()
     db.refresh(assignment)
@@ -4515,7 +4494,8 @@ def update_assignment(
 
     if changes:
         # Create audit log for assignment update
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="ValidationAssignment",
             entity_id=assignment.request_id,
             action="UPDATE",
@@ -4524,10 +4504,8 @@ def update_assignment(
                 "assignment_id": assignment_id,
                 "validator": assignment.validator.full_name,
                 **changes
-            },
-            timestamp=utc_now()
+            }
         )
-        db.add(audit_log)
 
     db.commit()
     db.refresh(assignment)
@@ -4589,7 +4567,8 @@ def delete_assignment(
                 )
 
                 # Create audit log for status change
-                status_audit_log = AuditLog(
+                create_audit_log(
+                    db,
                     entity_type="ValidationRequest",
                     entity_id=assignment.request_id,
                     action="STATUS_CHANGE",
@@ -4599,10 +4578,8 @@ def delete_assignment(
                         "old_value": "PLANNING",
                         "new_value": "INTAKE",
                         "reason": "Auto-reverted when last validator removed"
-                    },
-                    timestamp=utc_now()
+                    }
                 )
-                db.add(status_audit_log)
         else:
             # For other active statuses, still block removal
             raise HTTPException(
@@ -4620,7 +4597,8 @@ def delete_assignment(
         if len(remaining_validators) == 1:
             # Auto-promote the only remaining validator to primary
             remaining_validators[0].is_primary = True
-            audit_log_promotion = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationAssignment",
                 entity_id=assignment.request_id,
                 action="UPDATE",
@@ -4630,10 +4608,8 @@ def delete_assignment(
                     "validator": remaining_validators[0].validator.full_name,
                     "is_primary": {"old": "False", "new": "True"},
                     "reason": "Auto-promoted when previous primary was removed"
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(audit_log_promotion)
         elif len(remaining_validators) > 1:
             # Multiple validators remain - require explicit new primary selection
             if not new_primary_id:
@@ -4652,7 +4628,8 @@ def delete_assignment(
                 )
 
             new_primary.is_primary = True
-            audit_log_promotion = AuditLog(
+            create_audit_log(
+                db,
                 entity_type="ValidationAssignment",
                 entity_id=assignment.request_id,
                 action="UPDATE",
@@ -4662,10 +4639,8 @@ def delete_assignment(
                     "validator": new_primary.validator.full_name,
                     "is_primary": {"old": "False", "new": "True"},
                     "reason": "Promoted to primary when previous primary was removed"
-                },
-                timestamp=utc_now()
+                }
             )
-            db.add(audit_log_promotion)
 
     # Create audit log before deletion
     roles = []
@@ -4675,7 +4650,8 @@ def delete_assignment(
         roles.append("Reviewer")
     role_str = " & ".join(roles) if roles else "Supporting"
 
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationAssignment",
         entity_id=assignment.request_id,
         action="DELETE",
@@ -4684,10 +4660,8 @@ def delete_assignment(
             "assignment_id": assignment_id,
             "validator": assignment.validator.full_name,
             "role": role_str
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.delete(assignment)
     db.commit()
@@ -4739,7 +4713,8 @@ def reviewer_sign_off(
     assignment.reviewer_sign_off_comments = sign_off_data.comments
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationAssignment",
         entity_id=assignment.request_id,
         action="REVIEWER_SIGN_OFF",
@@ -4748,10 +4723,8 @@ def reviewer_sign_off(
             "assignment_id": assignment_id,
             "reviewer": current_user.full_name,
             "comments": sign_off_data.comments
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.commit()
     db.refresh(assignment)
@@ -4841,7 +4814,8 @@ def reviewer_send_back(
     assignment.reviewer_sign_off_comments = send_back_data.comments
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request.request_id,
         action="REVIEWER_SEND_BACK",
@@ -4852,10 +4826,8 @@ def reviewer_send_back(
             "comments": send_back_data.comments,
             "old_status": "Review",
             "new_status": "In Progress"
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.commit()
     db.refresh(request)
@@ -4926,17 +4898,16 @@ def create_outcome(
     db.add(outcome)
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationOutcome",
         entity_id=request_id,
         action="CREATE",
         user_id=current_user.user_id,
         changes={
             "overall_rating": rating.label
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.commit()
     db.refresh(outcome)
@@ -5000,15 +4971,14 @@ def update_outcome(
 
     # Create audit log if changes were made
     if changes:
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="ValidationOutcome",
             entity_id=outcome.request_id,
             action="UPDATE",
             user_id=current_user.user_id,
-            changes=changes,
-            timestamp=utc_now()
+            changes=changes
         )
-        db.add(audit_log)
 
     db.commit()
     db.refresh(outcome)
@@ -5111,7 +5081,8 @@ def create_review_outcome(
         )
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationReviewOutcome",
         entity_id=request_id,
         action="CREATE",
@@ -5120,10 +5091,8 @@ def create_review_outcome(
             "decision": review_data.decision,
             "agrees_with_rating": review_data.agrees_with_rating,
             "comments": review_data.comments
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.commit()
     db.refresh(review_outcome)
@@ -5173,15 +5142,14 @@ def update_review_outcome(
 
     # Create audit log if changes were made
     if changes:
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="ValidationReviewOutcome",
             entity_id=review_outcome.request_id,
             action="UPDATE",
             user_id=current_user.user_id,
-            changes=changes,
-            timestamp=utc_now()
+            changes=changes
         )
-        db.add(audit_log)
 
     db.commit()
     db.refresh(review_outcome)
@@ -5311,7 +5279,8 @@ def submit_approval(
                     model.use_approval_date = None
 
                     # Create audit log for model approval reversal
-                    model_audit = AuditLog(
+                    create_audit_log(
+                        db,
                         entity_type="Model",
                         entity_id=model.model_id,
                         action="CONDITIONAL_APPROVAL_REVERTED",
@@ -5320,10 +5289,8 @@ def submit_approval(
                             "reason": "Conditional approval withdrawn",
                             "validation_request_id": approval.request_id,
                             "approval_id": approval_id
-                        },
-                        timestamp=utc_now()
+                        }
                     )
-                    db.add(model_audit)
 
     elif update_data.approval_status == "Sent Back":
         # Handle send-back for revision - only Global and Regional approvers
@@ -5375,7 +5342,8 @@ def submit_approval(
                 db.add(history)
 
                 # Create audit log for status transition
-                status_audit = AuditLog(
+                create_audit_log(
+                    db,
                     entity_type="ValidationRequest",
                     entity_id=validation_request.request_id,
                     action="STATUS_SENT_BACK",
@@ -5386,10 +5354,8 @@ def submit_approval(
                         "sent_back_by_role": approval.approver_role,
                         "approval_id": approval_id,
                         "comments": update_data.comments
-                    },
-                    timestamp=utc_now()
+                    }
                 )
-                db.add(status_audit)
 
     # Create audit log with appropriate action type
     if update_data.approval_status == "Pending":
@@ -5413,15 +5379,14 @@ def submit_approval(
         changes_dict["approved_by_admin"] = current_user.full_name
         changes_dict["on_behalf_of"] = approval.approver.full_name
 
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationApproval",
         entity_id=approval.request_id,
         action=action,
         user_id=current_user.user_id,
-        changes=changes_dict,
-        timestamp=utc_now()
+        changes=changes_dict
     )
-    db.add(audit_log)
 
     # Update validation request completion_date based on approval status
     validation_request = db.query(ValidationRequest).filter(
@@ -5486,7 +5451,8 @@ def submit_approval(
                         )
 
                         # Create audit log for status transition
-                        status_audit = AuditLog(
+                        create_audit_log(
+                            db,
                             entity_type="ValidationRequest",
                             entity_id=validation_request.request_id,
                             action="STATUS_AUTO_TRANSITION",
@@ -5496,10 +5462,8 @@ def submit_approval(
                                 "new_status": "APPROVED",
                                 "reason": "All required approvals complete",
                                 "final_approval_id": approval_id
-                            },
-                            timestamp=utc_now()
+                            }
                         )
-                        db.add(status_audit)
 
                         # Auto-close Type 3 exceptions for models in this validation
                         # (only for full validations, not interim)
@@ -5556,7 +5520,8 @@ def unlink_regional_approval(
     approval.is_required = False  # No longer required
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationApproval",
         entity_id=approval.request_id,
         action="APPROVAL_UNLINKED",
@@ -5566,10 +5531,8 @@ def unlink_regional_approval(
             "approver_role": approval.approver_role,
             "unlink_reason": unlink_data.unlink_reason,
             "unlinked_by": current_user.full_name
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.commit()
     db.refresh(approval)
@@ -5586,32 +5549,65 @@ def get_aging_report(
     """Get validation requests aging report by status."""
     check_admin(current_user)
 
+    # Latest entry into each request's current status
+    last_change = select(
+        ValidationStatusHistory.request_id,
+        func.max(ValidationStatusHistory.changed_at).label("changed_at"),
+    ).join(
+        ValidationRequest, ValidationRequest.request_id == ValidationStatusHistory.request_id
+    ).where(
+        ValidationStatusHistory.new_status_id == ValidationRequest.current_status_id
+    ).group_by(ValidationStatusHistory.request_id).subquery()
+
+    model_names = select(
+        ValidationRequestModelVersion.request_id,
+        func.aggregate_strings(Model.model_name, _MODEL_NAME_SEPARATOR).label("model_names"),
+    ).join(
+        Model, Model.model_id == ValidationRequestModelVersion.model_id
+    ).group_by(ValidationRequestModelVersion.request_id).subquery()
+
+    status_value = aliased(TaxonomyValue)
+    priority_value = aliased(TaxonomyValue)
+    # Requests with no history in their status age from creation
+    days_in_status = days_since_sql(
+        db, func.coalesce(last_change.c.changed_at, ValidationRequest.created_at), utc_now()
+    ).label("days_in_status")
+
     # Get all non-terminal requests
-    requests = db.query(ValidationRequest).options(
-        joinedload(ValidationRequest.current_status),
-        joinedload(ValidationRequest.models),
-        joinedload(ValidationRequest.priority),
-        # For days_in_status calculation
-        joinedload(ValidationRequest.status_history)
+    rows = db.execute(
+        select(
+            ValidationRequest.request_id,
+            model_names.c.model_names,
+            status_value.label.label("current_status"),
+            priority_value.label.label("priority"),
+            ValidationRequest.target_completion_date,
+            days_in_status,
+        ).select_from(ValidationRequest).join(
+            status_value, status_value.value_id == ValidationRequest.current_status_id
+        ).outerjoin(
+            priority_value, priority_value.value_id == ValidationRequest.priority_id
+        ).outerjoin(
+            last_change, last_change.c.request_id == ValidationRequest.request_id
+        ).outerjoin(
+            model_names, model_names.c.request_id == ValidationRequest.request_id
+        ).where(
+            status_value.code.notin_(TERMINAL_REQUEST_STATUS_CODES)
+        ).order_by(days_in_status.desc(), ValidationRequest.request_id)
     ).all()
 
-    aging_data = []
-    for req in requests:
-        if req.current_status and req.current_status.code not in ["APPROVED", "CANCELLED"]:
-            days_in_status = calculate_days_in_status(req)
-            model_names = [
-                m.model_name for m in req.models] if req.models else []
-            aging_data.append({
-                "request_id": req.request_id,
-                "model_names": model_names,
-                "current_status": req.current_status.label if req.current_status else "Unknown",
-                "priority": req.priority.label if req.priority else "Unknown",
-                "days_in_status": days_in_status,
-                "target_completion_date": req.target_completion_date.isoformat() if req.target_completion_date else None,
-                "is_overdue": req.target_completion_date < date.today() if req.target_completion_date else False
-            })
-
-    return sorted(aging_data, key=lambda x: x["days_in_status"], reverse=True)
+    today = date.today()
+    return [
+        {
+            "request_id": row.request_id,
+            "model_names": row.model_names.split(_MODEL_NAME_SEPARATOR) if row.model_names else [],
+            "current_status": row.current_status or "Unknown",
+            "priority": row.priority or "Unknown",
+            "days_in_status": row.days_in_status,
+            "target_completion_date": row.target_completion_date.isoformat() if row.target_completion_date else None,
+            "is_overdue": row.target_completion_date < today if row.target_completion_date else False
+        }
+        for row in rows
+    ]
 
 
 @router.get("/dashboard/workload")
@@ -5622,39 +5618,45 @@ def get_workload_report(
     """Get validator workload report."""
     check_admin(current_user)
 
-    # Get validators and their assignments
-    validators = db.query(User).filter(
-        User.role_code.in_([RoleCode.VALIDATOR.value, RoleCode.ADMIN.value])
-    ).all()
-
-    workload_data = []
-    for validator in validators:
-        active_assignments = db.query(ValidationAssignment).join(
-            ValidationRequest
+    # Active (non-terminal) assignments per validator
+    active = select(
+        ValidationAssignment.validator_id,
+        func.count(ValidationAssignment.assignment_id).label("active_assignments"),
+    ).join(
+        ValidationRequest, ValidationRequest.request_id == ValidationAssignment.request_id
+    ).join(
+        TaxonomyValue, ValidationRequest.current_status_id == TaxonomyValue.value_id
+    ).where(
+        TaxonomyValue.code.notin_(TERMINAL_REQUEST_STATUS_CODES)
+    ).group_by(ValidationAssignment.validator_id).subquery()
+
+    active_assignments = func.coalesce(active.c.active_assignments, 0).label("active_assignments")
+
+    # Validators and admins with their assignment counts
+    rows = db.execute(
+        select(
+            User.user_id,
+            User.full_name,
+            Role.display_name,
+            active_assignments,
         ).join(
-            TaxonomyValue,
-            ValidationRequest.current_status_id == TaxonomyValue.value_id
-        ).filter(
-            ValidationAssignment.validator_id == validator.user_id,
-            TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"])
-        ).count()
-
-        total_estimated_hours = db.query(ValidationAssignment).filter(
-            ValidationAssignment.validator_id == validator.user_id
-        ).with_entities(
-            db.query(ValidationAssignment.estimated_hours).filter(
-                ValidationAssignment.validator_id == validator.user_id
-            ).scalar_subquery()
-        )
-
-        workload_data.append({
-            "validator_id": validator.user_id,
-            "validator_name": validator.full_name,
-            "active_assignments": active_assignments,
-            "role": validator.role_display
-        })
+            Role, Role.role_id == User.role_id
+        ).outerjoin(
+            active, active.c.validator_id == User.user_id
+        ).where(
+            Role.code.in_([RoleCode.VALIDATOR.value, RoleCode.ADMIN.value])
+        ).order_by(active_assignments.desc(), User.user_id)
+    ).all()
 
-    return sorted(workload_data, key=lambda x: x["active_assignments"], reverse=True)
+    return [
+        {
+            "validator_id": row.user_id,
+            "validator_name": row.full_name,
+            "active_assignments": row.active_assignments,
+            "role": row.display_name
+        }
+        for row in rows
+    ]
 
 
 @router.get("/validators/{validator_id}/assignments")
@@ -6022,7 +6024,8 @@ def submit_documentation(
     validation_request.submission_received_date = received_date
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationRequest",
         entity_id=request_id,
         action="SUBMIT_DOCUMENTATION",
@@ -6031,10 +6034,8 @@ def submit_documentation(
             "submission_received_date": received_date.isoformat(),
             "submission_status": validation_request.submission_status,
             "validation_team_sla_due_date": validation_request.validation_team_sla_due_date.isoformat() if validation_request.validation_team_sla_due_date else None
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
     db.commit()
     db.refresh(validation_request)
 
@@ -6085,9 +6086,11 @@ def get_my_overdue_items(
                 TaxonomyValue.code == "COMPREHENSIVE"),
             ValidationRequest.submission_received_date.is_(None),
             ValidationRequest.current_status.has(
-                TaxonomyValue.code.in_(["INTAKE", "PLANNING"]))
+                TaxonomyValue.code.in_(["INTAKE", "PLANNING"])),
+            submission_overdue_candidates(today)
         )
     ).scalars().unique().all()
+    prefetch_validation_lookups(db, [req.request_id for req in pending_requests])
 
     for req in pending_requests:
         # Check if past due or past grace
@@ -6184,9 +6187,11 @@ def get_my_validator_overdue_items(
                 TaxonomyValue.code == "COMPREHENSIVE"),
             ValidationRequest.submission_received_date.isnot(None),  # Submitted
             ValidationRequest.current_status.has(
-                TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"]))
+                TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"])),
+            validation_overdue_candidates(today)
         )
     ).scalars().unique().all()
+    prefetch_validation_lookups(db, [req.request_id for req in assigned_requests])
 
     for req in assigned_requests:
         # Check if current user is an assigned validator for this request
@@ -6246,7 +6251,8 @@ def get_overdue_submissions(
     Includes:
     1. Models past submission due date but still in grace period
     2. Models past grace period (fully overdue)
-    Uses dynamic calculation from computed properties.
+    Candidates are selected on the materialized due-date columns, then
+    checked with the computed properties.
     Admin only.
     """
     check_admin(current_user)
@@ -6270,9 +6276,11 @@ def get_overdue_submissions(
                 TaxonomyValue.code == "COMPREHENSIVE"),
             ValidationRequest.submission_received_date.is_(None),
             ValidationRequest.current_status.has(
-                TaxonomyValue.code.in_(["INTAKE", "PLANNING"]))
+                TaxonomyValue.code.in_(["INTAKE", "PLANNING"])),
+            submission_overdue_candidates(today)
         )
     ).scalars().unique().all()
+    prefetch_validation_lookups(db, [req.request_id for req in pending_requests])
 
     results = []
     for req in pending_requests:
@@ -6335,7 +6343,8 @@ def get_overdue_validations(
     """
     Get models with overdue validations (past model_validation_due_date).
     This is SEPARATE from overdue submissions - no overlap.
-    Uses dynamic calculation from computed properties.
+    Candidates are selected on the materialized due-date columns, then
+    checked with the computed properties.
     Admin only.
     """
     check_admin(current_user)
@@ -6358,9 +6367,11 @@ def get_overdue_validations(
             ValidationRequest.validation_type.has(
                 TaxonomyValue.code == "COMPREHENSIVE"),
             ValidationRequest.current_status.has(
-                TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"]))
+                TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"])),
+            validation_overdue_candidates(today)
         )
     ).scalars().unique().all()
+    prefetch_validation_lookups(db, [req.request_id for req in active_requests])
 
     results = []
     for req in active_requests:
@@ -6456,8 +6467,10 @@ def get_dashboard_my_overdue_items(
             ValidationRequestModelVersion.model_id.in_(responsible_model_ids),
             ValidationRequest.submission_received_date.is_(None),
             ValidationRequest.current_status.has(
-                TaxonomyValue.code.in_(["INTAKE", "PLANNING"]))
+                TaxonomyValue.code.in_(["INTAKE", "PLANNING"])),
+            submission_overdue_candidates(today)
         ).all()
+        prefetch_validation_lookups(db, [req.request_id for req in pre_sub_requests])
 
         for req in pre_sub_requests:
             is_past_due = req.submission_due_date and today > req.submission_due_date
@@ -6517,8 +6530,10 @@ def get_dashboard_my_overdue_items(
     ).filter(
         ValidationAssignment.validator_id == current_user.user_id,
         ValidationRequest.current_status.has(
-            TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"]))
+            TaxonomyValue.code.notin_(["APPROVED", "CANCELLED"])),
+        validation_overdue_candidates(today)
     ).all()
+    prefetch_validation_lookups(db, [req.request_id for req in validator_requests])
 
     for req in validator_requests:
         if req.model_validation_due_date and today > req.model_validation_due_date:
@@ -6917,15 +6932,14 @@ def update_validation_component_definition(
         db.refresh(component)
 
         # Audit log
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="ValidationComponentDefinition",
             entity_id=component.component_id,
             action="UPDATE",
             user_id=current_user.user_id,
-            changes=changes,
-            timestamp=utc_now()
+            changes=changes
         )
-        db.add(audit_log)
         db.commit()
 
     return component
@@ -7385,7 +7399,8 @@ def create_validation_plan(
             db.add(plan_comp)
 
         # Audit log for template usage
-        audit_log = AuditLog(
+        create_audit_log(
+            db,
             entity_type="ValidationPlan",
             entity_id=new_plan.plan_id,
             action="CREATE_FROM_TEMPLATE",
@@ -7395,10 +7410,8 @@ def create_validation_plan(
                 "template_request_id": template_plan.request_id,
                 "template_config_id": template_plan.config_id,
                 "template_config_name": template_plan.configuration.config_name if template_plan.configuration else None
-            },
-            timestamp=utc_now()
+            }
         )
-        db.add(audit_log)
 
     else:
         # Auto-create all components with defaults
@@ -8112,7 +8125,8 @@ def delete_validation_plan(
     component_count = len(plan.components)
 
     # Create audit log BEFORE deletion
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationPlan",
         entity_id=plan_id,
         action="DELETE",
@@ -8122,10 +8136,8 @@ def delete_validation_plan(
             "component_count": component_count,
             "was_locked": False,
             "reason": "Validation plan deleted before lock-in"
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     # Delete plan (cascade will delete components)
     db.delete(plan)
@@ -8245,7 +8257,8 @@ def publish_new_configuration(
     db.refresh(new_config)
 
     # Audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ComponentDefinitionConfiguration",
         entity_id=new_config.config_id,
         action="PUBLISH",
@@ -8256,10 +8269,8 @@ def publish_new_configuration(
             "effective_date": str(config_data.effective_date or date.today()),
             "component_count": len(components),
             "previous_active_config_id": current_active.config_id if current_active else None
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
     db.commit()
 
     return new_config
@@ -8601,7 +8612,8 @@ def add_manual_approval(
     db.add(approval)
     db.flush()
 
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationApproval",
         entity_id=request_id,
         action="MANUAL_APPROVAL_ADDED",
@@ -8613,10 +8625,8 @@ def add_manual_approval(
             "assigned_approver_name": assigned_user.full_name if data.assigned_approver_id else None,
             "status": "Pending",
             "reason": data.reason
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
     db.commit()
 
     return ManualApprovalResponse(
@@ -8775,7 +8785,8 @@ def submit_conditional_approval(
     is_proxy_approval = is_admin_user and not is_assigned_user
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationApproval",
         entity_id=approval.request_id,
         action="CONDITIONAL_APPROVAL_SUBMIT",
@@ -8797,10 +8808,8 @@ def submit_conditional_approval(
                 if is_proxy_approval
                 else {}
             )
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.commit()
 
@@ -8872,7 +8881,8 @@ def void_approval_requirement(
                 model.use_approval_date = None
 
                 # Create audit log for model approval reversal
-                model_audit = AuditLog(
+                create_audit_log(
+                    db,
                     entity_type="Model",
                     entity_id=model.model_id,
                     action="CONDITIONAL_APPROVAL_REVERTED",
@@ -8881,10 +8891,8 @@ def void_approval_requirement(
                         "reason": f"Additional approval voided: {void_data.void_reason}",
                         "validation_request_id": approval.request_id,
                         "voided_approval_id": approval_id
-                    },
-                    timestamp=utc_now()
+                    }
                 )
-                db.add(model_audit)
 
     approver_role_name = None
     assigned_approver_name = None
@@ -8900,7 +8908,8 @@ def void_approval_requirement(
         assigned_approver_name = assigned_user.full_name if assigned_user else None
 
     # Create audit log
-    audit_log = AuditLog(
+    create_audit_log(
+        db,
         entity_type="ValidationApproval",
         entity_id=approval.request_id,
         action="CONDITIONAL_APPROVAL_VOID",
@@ -8912,10 +8921,8 @@ def void_approval_requirement(
             "assigned_approver_name": assigned_approver_name,
             "status": "Voided",
             "void_reason": void_data.void_reason
-        },
-        timestamp=utc_now()
+        }
     )
-    db.add(audit_log)
 
     db.commit()
 
@@ -1,10 +1,8 @@
 """Vendors routes."""
-import csv
-import io
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
+from app.core.csv_export import CSVColumn, csv_streaming_response, stream_query
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.models.user import User
@@ -144,43 +142,21 @@ def delete_vendor(
     return None
 
 
+VENDOR_EXPORT_COLUMNS = [
+    CSVColumn("vendor_id", "Vendor ID", lambda v: v.vendor_id),
+    CSVColumn("name", "Name", lambda v: v.name),
+    CSVColumn("contact_info", "Contact Info", lambda v: v.contact_info or ""),
+    CSVColumn("created_at", "Created At", lambda v: v.created_at.isoformat() if v.created_at else ""),
+]
+
+
 @router.get("/export/csv")
 def export_vendors_csv(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Export all vendors to CSV."""
-    vendors = db.query(Vendor).all()
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        "Vendor ID",
-        "Name",
-        "Contact Info",
-        "Created At"
-    ])
-
-    # Write data rows
-    for vendor in vendors:
-        writer.writerow([
-            vendor.vendor_id,
-            vendor.name,
-            vendor.contact_info or "",
-            vendor.created_at.isoformat() if vendor.created_at else ""
-        ])
-
-    # Reset stream position
-    output.seek(0)
-
-    # Return as streaming response
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=vendors_export.csv"
-        }
+    vendors = db.query(Vendor).order_by(Vendor.vendor_id)
+    return csv_streaming_response(
+        stream_query(vendors), VENDOR_EXPORT_COLUMNS, "vendors_export.csv", db=db
     )
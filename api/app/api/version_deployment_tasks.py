@@ -9,6 +9,7 @@ from app.core.time import utc_now
 from app.core.deps import get_current_user
 from app.core.roles import is_admin
 from app.core.exception_detection import detect_type3_for_deployment_task
+from app.core.audit import audit_batch, create_audit_log
 from app.models.user import User
 from app.core.roles import is_admin
 from app.models.version_deployment_task import VersionDeploymentTask
@@ -19,7 +20,6 @@ from app.models.validation import ValidationRequest, ValidationApproval
 from app.models.model_region import ModelRegion
 from app.models.region import Region
 from app.models.taxonomy import TaxonomyValue
-from app.models.audit_log import AuditLog
 from app.schemas.version_deployment_task import (
     VersionDeploymentTaskResponse,
     VersionDeploymentTaskSummary,
@@ -556,7 +556,8 @@ def confirm_deployment(
         create_regional_approval_if_required(db, task, version.validation_request_id)
 
     # Issue 3 fix: Add audit logging
-    db.add(AuditLog(
+    create_audit_log(
+        db,
         entity_type="VersionDeploymentTask",
         entity_id=task.task_id,
         action="DEPLOYMENT_CONFIRMED",
@@ -569,7 +570,7 @@ def confirm_deployment(
             "model_id": task.model_id,
             "deployed_before_validation_approved": task.deployed_before_validation_approved
         }
-    ))
+    )
 
     db.commit()
     db.refresh(task)
@@ -1029,7 +1030,8 @@ def deploy_version(
         created_task_ids.append(task.task_id)
 
         # Issue 3 fix: Add audit logging for task creation
-        db.add(AuditLog(
+        create_audit_log(
+            db,
             entity_type="VersionDeploymentTask",
             entity_id=task.task_id,
             action="DEPLOYMENT_CREATED",
@@ -1042,7 +1044,7 @@ def deploy_version(
                 "model_id": task.model_id,
                 "deploy_now": deploy_request.deploy_now
             }
-        ))
+        )
 
         # If deploy_now, also update ModelRegion
         if deploy_request.deploy_now:
@@ -1072,7 +1074,8 @@ def deploy_version(
                 create_regional_approval_if_required(db, task, version.validation_request_id)
 
             # Issue 3 fix: Add audit logging for immediate confirmation
-            db.add(AuditLog(
+            create_audit_log(
+                db,
                 entity_type="VersionDeploymentTask",
                 entity_id=task.task_id,
                 action="DEPLOYMENT_CONFIRMED",
@@ -1085,7 +1088,7 @@ def deploy_version(
                     "model_id": task.model_id,
                     "deployed_before_validation_approved": task.deployed_before_validation_approved
                 }
-            ))
+            )
 
     db.commit()
 
@@ -1119,6 +1122,8 @@ def bulk_confirm_deployments(
     """
     succeeded = []
     failed = []
+    # Entries recorded in a task's savepoint are dropped if that task fails
+    confirmed_audit = audit_batch(db, "VersionDeploymentTask", "DEPLOYMENT_CONFIRMED", current_user.user_id)
 
     for task_id in request.task_ids:
         try:
@@ -1194,20 +1199,14 @@ def bulk_confirm_deployments(
                     detect_type3_for_deployment_task(db, task)
 
                 # Issue 3 fix: Add audit logging for bulk confirmation
-                db.add(AuditLog(
-                    entity_type="VersionDeploymentTask",
-                    entity_id=task.task_id,
-                    action="DEPLOYMENT_CONFIRMED",
-                    user_id=current_user.user_id,
-                    changes={
-                        "status": task.status,
-                        "actual_production_date": str(task.actual_production_date),
-                        "region_id": task.region_id,
-                        "version_id": task.version_id,
-                        "model_id": task.model_id,
-                        "deployed_before_validation_approved": task.deployed_before_validation_approved
-                    }
-                ))
+                confirmed_audit.add(task.task_id, {
+                    "status": task.status,
+                    "actual_production_date": str(task.actual_production_date),
+                    "region_id": task.region_id,
+                    "version_id": task.version_id,
+                    "model_id": task.model_id,
+                    "deployed_before_validation_approved": task.deployed_before_validation_approved
+                })
 
                 db.flush()
 
@@ -1238,6 +1237,7 @@ def bulk_adjust_deployments(
     """
     succeeded = []
     failed = []
+    adjusted_audit = audit_batch(db, "VersionDeploymentTask", "DEPLOYMENT_DATE_ADJUSTED", current_user.user_id)
 
     for task_id in request.task_ids:
         try:
@@ -1265,21 +1265,15 @@ def bulk_adjust_deployments(
             task.status = "ADJUSTED"
 
             # Issue 3 fix: Add audit logging for date adjustment
-            db.add(AuditLog(
-                entity_type="VersionDeploymentTask",
-                entity_id=task.task_id,
-                action="DEPLOYMENT_DATE_ADJUSTED",
-                user_id=current_user.user_id,
-                changes={
-                    "status": task.status,
-                    "old_planned_date": str(old_date) if old_date else None,
-                    "new_planned_date": str(request.new_planned_date),
-                    "adjustment_reason": request.adjustment_reason,
-                    "region_id": task.region_id,
-                    "version_id": task.version_id,
-                    "model_id": task.model_id
-                }
-            ))
+            adjusted_audit.add(task.task_id, {
+                "status": task.status,
+                "old_planned_date": str(old_date) if old_date else None,
+                "new_planned_date": str(request.new_planned_date),
+                "adjustment_reason": request.adjustment_reason,
+                "region_id": task.region_id,
+                "version_id": task.version_id,
+                "model_id": task.model_id
+            })
 
             succeeded.append(task_id)
 
@@ -1308,6 +1302,7 @@ def bulk_cancel_deployments(
     """
     succeeded = []
     failed = []
+    cancelled_audit = audit_batch(db, "VersionDeploymentTask", "DEPLOYMENT_CANCELLED", current_user.user_id)
 
     for task_id in request.task_ids:
         try:
@@ -1333,19 +1328,13 @@ def bulk_cancel_deployments(
                 task.confirmation_notes = request.cancellation_reason
 
             # Issue 3 fix: Add audit logging for cancellation
-            db.add(AuditLog(
-                entity_type="VersionDeploymentTask",
-                entity_id=task.task_id,
-                action="DEPLOYMENT_CANCELLED",
-                user_id=current_user.user_id,
-                changes={
-                    "status": task.status,
-                    "cancellation_reason": request.cancellation_reason,
-                    "region_id": task.region_id,
-                    "version_id": task.version_id,
-                    "model_id": task.model_id
-                }
-            ))
+            cancelled_audit.add(task.task_id, {
+                "status": task.status,
+                "cancellation_reason": request.cancellation_reason,
+                "region_id": task.region_id,
+                "version_id": task.version_id,
+                "model_id": task.model_id
+            })
 
             succeeded.append(task_id)
 
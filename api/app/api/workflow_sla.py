@@ -7,25 +7,13 @@ from app.core.time import utc_now
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.core.roles import is_admin
+from app.core.audit import create_audit_log
 from app.models.validation import ValidationWorkflowSLA
-from app.models.audit_log import AuditLog
 from app.schemas.workflow_sla import WorkflowSLAResponse, WorkflowSLAUpdate
 
 router = APIRouter()
 
 
-def create_audit_log(db: Session, entity_type: str, entity_id: int, action: str, user_id: int, changes: dict | None = None):
-    """Create an audit log entry for workflow SLA configuration changes."""
-    audit_log = AuditLog(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        user_id=user_id,
-        changes=changes
-    )
-    db.add(audit_log)
-
-
 @router.get("/validation", response_model=WorkflowSLAResponse)
 def get_validation_sla(
     db: Session = Depends(get_db),
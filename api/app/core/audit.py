@@ -0,0 +1,135 @@
+"""Buffered audit log writer shared by the routers.
+
+``create_audit_log`` no longer adds an ``AuditLog`` ORM object per entry. It
+appends the entry to a buffer kept in ``session.info``; a ``before_commit``
+listener writes the buffer with one multi-row INSERT when the transaction
+commits, so audit rows skip identity-map and unit-of-work bookkeeping.
+
+Bulk operations open an ``AuditBatch`` with ``audit_batch`` and ``add`` one
+``(entity_id, changes)`` pair per entity: the entity type, action, user and
+timestamp are stored once for the whole batch, and each entity still gets its
+own row, so per-entity history queries are unchanged.
+
+Entries follow the transaction they were recorded in: they are dropped when it
+(or an enclosing savepoint) rolls back. Buffered rows are not visible to
+queries until the commit; call ``flush_audit_log`` to write them earlier.
+"""
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.time import utc_now
+from app.models.audit_log import AuditLog
+
+_BUFFER_KEY = "audit_log_buffer"
+
+_audit_logs = AuditLog.__table__
+
+
+def _current_transaction(session: Session) -> Optional[SessionTransaction]:
+    return session.get_nested_transaction() or session.get_transaction()
+
+
+class AuditBatch:
+    """Audit entries sharing entity type, action, user and timestamp."""
+
+    __slots__ = ("_session", "entity_type", "action", "user_id", "timestamp", "entries")
+
+    def __init__(self, session: Session, entity_type: str, action: str, user_id: int):
+        self._session = session
+        self.entity_type = entity_type
+        self.action = action
+        self.user_id = user_id
+        self.timestamp: datetime = utc_now()
+        self.entries: List[Tuple[int, Optional[dict], Optional[SessionTransaction]]] = []
+
+    def add(self, entity_id: int, changes: Optional[dict] = None) -> None:
+        self.entries.append((entity_id, changes, _current_transaction(self._session)))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def rows(self) -> List[dict[str, Any]]:
+        return [
+            {
+                "entity_type": self.entity_type,
+                "entity_id": entity_id,
+                "action": self.action,
+                "user_id": self.user_id,
+                "changes": changes,
+                "timestamp": self.timestamp,
+            }
+            for entity_id, changes, _ in self.entries
+        ]
+
+
+def _buffer(db: Session) -> List[AuditBatch]:
+    buffer = db.info.get(_BUFFER_KEY)
+    if buffer is None:
+        buffer = db.info[_BUFFER_KEY] = []
+    return buffer
+
+
+def audit_batch(db: Session, entity_type: str, action: str, user_id: int) -> AuditBatch:
+    """Open a batch of audit entries written with the rest of the buffer at commit."""
+    batch = AuditBatch(db, entity_type, action, user_id)
+    _buffer(db).append(batch)
+    return batch
+
+
+def create_audit_log(
+    db: Session,
+    entity_type: str,
+    entity_id: int,
+    action: str,
+    user_id: int,
+    changes: Optional[dict] = None
+) -> None:
+    """Record an audit log entry; it is written when the transaction commits."""
+    audit_batch(db, entity_type, action, user_id).add(entity_id, changes)
+
+
+def flush_audit_log(db: Session) -> int:
+    """Write the buffered entries now, in one INSERT. Returns the number of rows."""
+    buffer = db.info.pop(_BUFFER_KEY, None)
+    if not buffer:
+        return 0
+    rows = [row for batch in buffer for row in batch.rows()]
+    if rows:
+        db.connection().execute(insert(_audit_logs), rows)
+    return len(rows)
+
+
+def _within(transaction: Optional[SessionTransaction], ancestor: SessionTransaction) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Session, "before_commit")
+def _write_buffer_at_commit(session: Session) -> None:
+    # Released savepoints keep their entries until the outer transaction commits
+    if not session.in_nested_transaction():
+        flush_audit_log(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_rolled_back_entries(session: Session, previous_transaction: SessionTransaction) -> None:
+    if not previous_transaction.nested:
+        session.info.pop(_BUFFER_KEY, None)
+        return
+    for batch in session.info.get(_BUFFER_KEY, ()):
+        batch.entries = [
+            entry for entry in batch.entries if not _within(entry[2], previous_transaction)
+        ]
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_buffer_at_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    # Covers sessions closed without commit or rollback
+    if transaction.parent is None:
+        session.info.pop(_BUFFER_KEY, None)
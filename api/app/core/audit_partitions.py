@@ -0,0 +1,132 @@
+"""Monthly partition maintenance for ``audit_logs`` on PostgreSQL.
+
+Migration ``alp001`` turns ``audit_logs`` into a table partitioned by
+``RANGE ("timestamp")`` with one partition per calendar month
+(``audit_logs_yYYYYmMM``) and a DEFAULT partition. Time-bounded audit queries
+then only scan the months they cover, and old months can be detached or
+archived without touching the rest of the table.
+
+``ensure_audit_log_partitions`` creates the partitions for the current month
+and the next ``AUDIT_LOG_PARTITION_MONTHS_AHEAD`` months, so new rows land in
+a monthly partition rather than the DEFAULT one. ``maintain_audit_log_partitions``
+runs it at startup and then every ``AUDIT_LOG_PARTITION_CHECK_SECONDS`` for the
+life of the process; an advisory lock serializes the workers.
+
+Each month is created in its own transaction, so one failure does not undo
+the others. A month cannot be attached while DEFAULT holds rows for it, so in
+that case DEFAULT is detached, the month created, its rows moved out of
+DEFAULT, and DEFAULT reattached. On other databases, or before the migration,
+nothing happens.
+"""
+import asyncio
+import logging
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+# Serializes partition creation between workers
+_PARTITION_LOCK_KEY = 734_211
+_DEFAULT_PARTITION = "audit_logs_default"
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"audit_logs_y{month.year:04d}m{month.month:02d}"
+
+
+def _is_partitioned(connection: Connection) -> bool:
+    return connection.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p "
+        "JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'audit_logs' AND c.relnamespace = current_schema()::regnamespace)"
+    )).scalar()
+
+
+def _existing_partitions(connection: Connection) -> set:
+    return set(connection.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'audit_logs'"
+    )).scalars())
+
+
+def ensure_audit_log_partitions(
+    bind: Engine, months_ahead: int, today: Optional[date] = None
+) -> List[str]:
+    """Create missing monthly partitions up to ``months_ahead`` months ahead.
+
+    Returns the names of the partitions created. Database errors are logged,
+    not raised: until a month's partition exists, its rows go to the DEFAULT
+    partition, and the next run retries it.
+    """
+    if bind.dialect.name != "postgresql":
+        return []
+    first = (today or date.today()).replace(day=1)
+    try:
+        with bind.connect() as connection:
+            if not _is_partitioned(connection):
+                return []
+            existing = _existing_partitions(connection)
+    except SQLAlchemyError:
+        logger.warning("Could not list audit log partitions", exc_info=True)
+        return []
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = _add_months(first, offset)
+        if partition_name(month) in existing:
+            continue
+        try:
+            if _create_partition(bind, month):
+                created.append(partition_name(month))
+        except SQLAlchemyError:
+            logger.warning("Could not create audit log partition %s", partition_name(month), exc_info=True)
+    if created:
+        logger.info("Created audit log partitions: %s", ", ".join(created))
+    return created
+
+
+def _create_partition(bind: Engine, month: date) -> bool:
+    """Create one month's partition in its own transaction; False if another worker did."""
+    name = partition_name(month)
+    start, end = month.isoformat(), _add_months(month, 1).isoformat()
+    with bind.begin() as connection:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PARTITION_LOCK_KEY})
+        if name in _existing_partitions(connection):
+            return False
+        bounds = {"start": start, "end": end}
+        in_range = '"timestamp" >= CAST(:start AS timestamp) AND "timestamp" < CAST(:end AS timestamp)'
+        has_default_rows = connection.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {_DEFAULT_PARTITION} WHERE {in_range})"), bounds
+        ).scalar()
+        if has_default_rows:
+            connection.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {_DEFAULT_PARTITION}"))
+        connection.execute(text(
+            f'CREATE TABLE "{name}" PARTITION OF audit_logs '
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        ))
+        if has_default_rows:
+            moved = connection.execute(text(
+                f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION} WHERE {in_range} RETURNING *) "
+                f'INSERT INTO "{name}" SELECT * FROM moved'
+            ), bounds).rowcount
+            connection.execute(text(f"ALTER TABLE audit_logs ATTACH PARTITION {_DEFAULT_PARTITION} DEFAULT"))
+            logger.info("Moved %s audit log rows from %s to %s", moved, _DEFAULT_PARTITION, name)
+    return True
+
+
+async def maintain_audit_log_partitions(bind: Engine, months_ahead: int, interval_seconds: int) -> None:
+    """Run ``ensure_audit_log_partitions`` now and then every ``interval_seconds``, until cancelled."""
+    while True:
+        await asyncio.to_thread(ensure_audit_log_partitions, bind, months_ahead)
+        await asyncio.sleep(interval_seconds)
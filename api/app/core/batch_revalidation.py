@@ -6,12 +6,21 @@ for the Models list endpoint, avoiding N+1 query patterns.
 
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
-from typing import Dict, List, Optional, Any
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
-from app.models.validation import ValidationPolicy, ValidationWorkflowSLA
+from typing import Dict, List, Optional, Any, Sequence, Iterable
+from sqlalchemy import text, func
+from sqlalchemy.orm import Session, aliased
+
+from app.models.model import Model
+from app.models.user import User
+from app.models.validation import (
+    ValidationPolicy,
+    ValidationWorkflowSLA,
+    ValidationRequest,
+    ValidationRequestModelVersion,
+    ValidationOutcome,
+)
 from app.models.taxonomy import Taxonomy, TaxonomyValue
+from app.core.taxonomy_registry import taxonomy_registry
 
 
 class RevalidationRefCache:
@@ -221,3 +230,373 @@ def compute_batch_revalidation_fields(
         else:
             # No validation yet - new model, status is null (not penalized until validated)
             result['validation_status'] = None
+
+
+def fetch_ranked_validations(
+    db: Session,
+    model_ids: Iterable[int],
+    criteria: Sequence[Any],
+    order_by: Sequence[Any],
+    per_model: int = 1,
+    options: Sequence[Any] = (),
+) -> Dict[int, List[ValidationRequest]]:
+    """
+    Fetch the top-N validation requests per model in a single windowed query.
+
+    Equivalent to running ``db.query(ValidationRequest).join(ValidationRequestModelVersion)
+    .filter(model_id == X, *criteria).order_by(*order_by).limit(per_model)`` for every
+    model, but as one ROW_NUMBER() query partitioned by model_id.
+
+    Returns dict: model_id -> list of ValidationRequest (ranked, best first)
+    """
+    model_ids = list(model_ids)
+    if not model_ids:
+        return {}
+
+    rank = func.row_number().over(
+        partition_by=ValidationRequestModelVersion.model_id,
+        order_by=list(order_by)
+    ).label("rn")
+
+    ranked = db.query(
+        ValidationRequestModelVersion.model_id.label("model_id"),
+        ValidationRequest.request_id.label("request_id"),
+        rank
+    ).join(
+        ValidationRequest,
+        ValidationRequest.request_id == ValidationRequestModelVersion.request_id
+    ).filter(
+        ValidationRequestModelVersion.model_id.in_(model_ids),
+        *criteria
+    ).subquery()
+
+    rows = db.query(ranked.c.model_id, ValidationRequest).join(
+        ranked, ranked.c.request_id == ValidationRequest.request_id
+    ).filter(
+        ranked.c.rn <= per_model
+    ).options(*options).order_by(ranked.c.model_id, ranked.c.rn).all()
+
+    output: Dict[int, List[ValidationRequest]] = {}
+    for model_id, request in rows:
+        output.setdefault(model_id, []).append(request)
+    return output
+
+
+def _status_ids(db: Session, codes: List[str]) -> List[int]:
+    return taxonomy_registry.value_ids(db, "Validation Request Status", codes)
+
+
+def _type_ids(db: Session, codes: List[str]) -> List[int]:
+    return taxonomy_registry.value_ids(db, "Validation Type", codes)
+
+
+def _fetch_interim_expirations(db: Session, model_ids: List[int]) -> Dict[int, date]:
+    """Latest INTERIM outcome expiration_date per model (APPROVED INTERIM validations only)."""
+    if not model_ids:
+        return {}
+
+    rows = db.query(
+        ValidationRequestModelVersion.model_id,
+        func.max(ValidationOutcome.expiration_date)
+    ).join(
+        ValidationRequest,
+        ValidationRequest.request_id == ValidationRequestModelVersion.request_id
+    ).join(
+        ValidationOutcome, ValidationRequest.request_id == ValidationOutcome.request_id
+    ).filter(
+        ValidationRequestModelVersion.model_id.in_(model_ids),
+        ValidationRequest.current_status_id.in_(_status_ids(db, ["APPROVED"])),
+        ValidationRequest.validation_type_id.in_(_type_ids(db, ["INTERIM"])),
+        ValidationOutcome.expiration_date.isnot(None)
+    ).group_by(ValidationRequestModelVersion.model_id).all()
+
+    return {model_id: expiration for model_id, expiration in rows if expiration}
+
+
+def _fetch_active_revalidation_requests(
+    db: Session,
+    last_request_by_model: Dict[int, int]
+) -> Dict[int, ValidationRequest]:
+    """
+    Active COMPREHENSIVE request per model that follows the model's last approved validation.
+
+    Returns dict: model_id -> ValidationRequest
+    """
+    if not last_request_by_model:
+        return {}
+
+    rows = db.query(ValidationRequestModelVersion.model_id, ValidationRequest).join(
+        ValidationRequest,
+        ValidationRequest.request_id == ValidationRequestModelVersion.request_id
+    ).filter(
+        ValidationRequestModelVersion.model_id.in_(list(last_request_by_model.keys())),
+        ValidationRequest.prior_validation_request_id.in_(set(last_request_by_model.values())),
+        ValidationRequest.validation_type_id.in_(_type_ids(db, ["COMPREHENSIVE"])),
+        ValidationRequest.current_status_id.notin_(_status_ids(db, ["APPROVED", "CANCELLED"]))
+    ).order_by(ValidationRequest.request_id).all()
+
+    output: Dict[int, ValidationRequest] = {}
+    for model_id, request in rows:
+        if model_id in output:
+            continue
+        if request.prior_validation_request_id == last_request_by_model.get(model_id):
+            output[model_id] = request
+    return output
+
+
+def _fetch_applicable_lead_times(
+    db: Session,
+    request_ids: Iterable[int],
+    cache: RevalidationRefCache
+) -> Dict[int, int]:
+    """
+    Batch equivalent of ValidationRequest.applicable_lead_time_days.
+
+    Returns dict: request_id -> max lead time across the request's models (default 90)
+    """
+    request_ids = list(request_ids)
+    if not request_ids:
+        return {}
+
+    rows = db.query(
+        ValidationRequestModelVersion.request_id,
+        Model.risk_tier_id
+    ).join(
+        Model, Model.model_id == ValidationRequestModelVersion.model_id
+    ).filter(
+        ValidationRequestModelVersion.request_id.in_(request_ids)
+    ).all()
+
+    lead_times: Dict[int, List[int]] = {request_id: [] for request_id in request_ids}
+    for request_id, risk_tier_id in rows:
+        policy = cache.get_policy(risk_tier_id)
+        if policy:
+            lead_times[request_id].append(policy.model_change_lead_time_days)
+
+    return {
+        request_id: max(values) if values else 90
+        for request_id, values in lead_times.items()
+    }
+
+
+def _fetch_model_labels(db: Session, model_ids: List[int]) -> Dict[int, Dict[str, Optional[str]]]:
+    """Owner name and risk tier label per model, used in the revalidation status dict."""
+    if not model_ids:
+        return {}
+
+    risk_tier = aliased(TaxonomyValue)
+    rows = db.query(
+        Model.model_id,
+        User.full_name,
+        User.user_id,
+        risk_tier.label
+    ).outerjoin(
+        User, User.user_id == Model.owner_id
+    ).outerjoin(
+        risk_tier, risk_tier.value_id == Model.risk_tier_id
+    ).filter(Model.model_id.in_(model_ids)).all()
+
+    return {
+        model_id: {
+            "model_owner": full_name if owner_id is not None else "Unknown",
+            "risk_tier": tier_label,
+        }
+        for model_id, full_name, owner_id, tier_label in rows
+    }
+
+
+def compute_revalidation_statuses(
+    db: Session,
+    models: List[Any],  # List of Model ORM objects
+    cache: Optional[RevalidationRefCache] = None
+) -> Dict[int, Dict]:
+    """
+    Batch equivalent of validation_workflow.calculate_model_revalidation_status.
+
+    Uses a fixed number of set-based queries regardless of len(models):
+    last approved validation, top-2 full validations, INTERIM expirations,
+    active COMPREHENSIVE requests and their lead times, plus cached
+    policies and workflow SLA.
+
+    Returns dict: model_id -> revalidation status dict (same shape as the
+    per-model function).
+    """
+    # Import here to avoid circular imports
+    from app.api.validation_workflow import _format_validation_summary
+
+    if not models:
+        return {}
+
+    if cache is None:
+        cache = RevalidationRefCache(db)
+
+    model_ids = [m.model_id for m in models]
+    labels = _fetch_model_labels(db, model_ids)
+
+    approved = ValidationRequest.current_status_id.in_(_status_ids(db, ["APPROVED"]))
+
+    last_validations = fetch_ranked_validations(
+        db, model_ids,
+        criteria=[approved],
+        order_by=[ValidationRequest.updated_at.desc()]
+    )
+
+    full_validations = fetch_ranked_validations(
+        db, model_ids,
+        criteria=[
+            approved,
+            ValidationRequest.validation_type_id.in_(_type_ids(db, ["INITIAL", "COMPREHENSIVE"]))
+        ],
+        order_by=[
+            ValidationRequest.completion_date.desc().nullslast(),
+            ValidationRequest.updated_at.desc()
+        ],
+        per_model=2
+    )
+
+    interim_expirations = _fetch_interim_expirations(
+        db, [model_id for model_id in model_ids if model_id not in full_validations]
+    )
+
+    # Active COMPREHENSIVE requests only matter on the standard (non-INTERIM) path
+    standard_last_request = {}
+    for model in models:
+        last = last_validations.get(model.model_id)
+        if not last or not cache.get_policy(model.risk_tier_id):
+            continue
+        if interim_expirations.get(model.model_id) and model.model_id not in full_validations:
+            continue
+        standard_last_request[model.model_id] = last[0].request_id
+
+    active_requests = _fetch_active_revalidation_requests(db, standard_last_request)
+    lead_times = _fetch_applicable_lead_times(
+        db, {r.request_id for r in active_requests.values()}, cache
+    )
+
+    today = date.today()
+    results: Dict[int, Dict] = {}
+
+    for model in models:
+        model_id = model.model_id
+        model_labels = labels.get(model_id, {"model_owner": "Unknown", "risk_tier": None})
+        fulls = full_validations.get(model_id, [])
+        most_recent_full = fulls[0] if len(fulls) > 0 else None
+        previous_full = fulls[1] if len(fulls) > 1 else None
+        interim_expiration = interim_expirations.get(model_id) if not most_recent_full else None
+        last_validation = (last_validations.get(model_id) or [None])[0]
+        policy = cache.get_policy(model.risk_tier_id)
+
+        base = {
+            "model_id": model_id,
+            "model_name": model.model_name,
+            "model_owner": model_labels["model_owner"],
+            "risk_tier": model_labels["risk_tier"],
+        }
+        summaries = {
+            "interim_expiration": interim_expiration.isoformat() if interim_expiration else None,
+            "most_recent_validation": _format_validation_summary(most_recent_full),
+            "previous_validation": _format_validation_summary(previous_full)
+        }
+
+        if not last_validation:
+            interim_submission_due = None
+            interim_validation_due = None
+            if interim_expiration and policy:
+                interim_submission_due = interim_expiration - timedelta(days=policy.model_change_lead_time_days)
+                interim_validation_due = interim_expiration
+
+            results[model_id] = {
+                **base,
+                "status": "Pending Full Validation" if interim_expiration else "Never Validated",
+                "last_validation_date": None,
+                "next_submission_due": interim_submission_due,
+                "grace_period_end": None,
+                "next_validation_due": interim_validation_due,
+                "days_until_submission_due": (interim_submission_due - today).days if interim_submission_due else None,
+                "days_until_validation_due": (interim_validation_due - today).days if interim_validation_due else None,
+                "active_request_id": None,
+                "submission_received": None,
+                **summaries
+            }
+            continue
+
+        approval_date = (last_validation.completion_date.date() if last_validation.completion_date
+                         else last_validation.updated_at.date())
+
+        if not policy:
+            results[model_id] = {
+                **base,
+                "status": "No Policy Configured",
+                "last_validation_date": approval_date,
+                "next_submission_due": None,
+                "grace_period_end": None,
+                "next_validation_due": interim_expiration,
+                "days_until_submission_due": None,
+                "days_until_validation_due": (interim_expiration - today).days if interim_expiration else None,
+                "active_request_id": None,
+                "submission_received": None,
+                **summaries
+            }
+            continue
+
+        last_completed = approval_date
+        if interim_expiration and not most_recent_full:
+            submission_due = interim_expiration - timedelta(days=policy.model_change_lead_time_days)
+            grace_period_end = None
+            validation_due = interim_expiration
+            active_request = None
+        else:
+            submission_due = last_completed + relativedelta(months=policy.frequency_months)
+            grace_period_end = submission_due + relativedelta(months=policy.grace_period_months)
+            active_request = active_requests.get(model_id)
+            if active_request:
+                completion_lead_time = lead_times.get(active_request.request_id, 90)
+            else:
+                completion_lead_time = policy.model_change_lead_time_days
+            validation_due = grace_period_end + timedelta(
+                days=completion_lead_time + cache.workflow_sla_days
+            )
+
+        if interim_expiration and not most_recent_full:
+            if today > validation_due:
+                status = "INTERIM Expired - Full Validation Required"
+            elif today > submission_due:
+                status = "Submission Overdue (INTERIM)"
+            else:
+                status = "Pending Full Validation"
+        elif active_request:
+            if not active_request.submission_received_date:
+                if grace_period_end and today > grace_period_end:
+                    status = "Submission Overdue"
+                elif submission_due and today > submission_due:
+                    status = "In Grace Period"
+                else:
+                    status = "Awaiting Submission"
+            else:
+                if validation_due and today > validation_due:
+                    status = "Validation Overdue"
+                else:
+                    status = "Validation In Progress"
+        else:
+            if validation_due and today > validation_due:
+                status = "Revalidation Overdue (No Request)"
+            elif grace_period_end and today > grace_period_end:
+                status = "Should Create Request"
+            else:
+                status = "Upcoming"
+
+        results[model_id] = {
+            **base,
+            "status": status,
+            "last_validation_date": last_completed,
+            "next_submission_due": submission_due,
+            "grace_period_end": grace_period_end,
+            "next_validation_due": validation_due,
+            "days_until_submission_due": (submission_due - today).days,
+            "days_until_validation_due": (validation_due - today).days,
+            "active_request_id": active_request.request_id if active_request else None,
+            "submission_received": active_request.submission_received_date if active_request else None,
+            **summaries
+        }
+
+    return results
@@ -0,0 +1,181 @@
+"""Cross-process invalidation of in-process caches via ``cache_generations``.
+
+Each worker keeps reference data (taxonomy values, user principals) in memory.
+A cache registered with ``track_generation`` records the generation it was
+loaded under and compares it with ``current_generation`` before serving:
+
+- an ``after_flush`` listener notices ORM writes to the tracked classes and
+  ``after_flush_postexec`` increments the cache's row in the same
+  transaction, so the bump commits (or rolls back) with the change;
+- ``after_commit`` runs the cache's local invalidation callback, and only
+  once the change is committed; a rollback neither bumps nor evicts;
+- ``current_generation`` is memoized per session until the transaction ends,
+  so a request pays one primary-key lookup per cache at most;
+- ``recent_generation`` additionally reuses a generation across sessions in
+  this process for a few seconds, for caches read on every request. Commits
+  in this process drop that memo at once; other processes' writes are seen
+  once it ages out.
+
+Readers must read the generation *before* the cached rows, so an entry is
+never labelled with a generation newer than its data.
+"""
+import threading
+import time
+from itertools import chain
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Type
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.time import utc_now
+from app.models.cache_generation import CacheGeneration
+
+_MEMO_KEY = "cache_generations_memo"
+_PENDING_KEY = "cache_generations_pending"
+_BUMPED_KEY = "cache_generations_bumped"
+
+_generations = CacheGeneration.__table__
+
+# name -> (tracked classes, should_bump(instance, session), on_commit())
+_tracked: Dict[str, Tuple[Tuple[Type, ...], Optional[Callable], Optional[Callable[[], None]]]] = {}
+
+# name -> (generation, monotonic time it was read), shared by this process's sessions
+_recent: Dict[str, Tuple[int, float]] = {}
+# name -> when this process last committed a bump; older readings are not kept
+_forgotten_at: Dict[str, float] = {}
+_recent_lock = threading.Lock()
+
+
+def track_generation(
+    name: str,
+    classes: Iterable[Type],
+    on_commit: Optional[Callable[[], None]] = None,
+    should_bump: Optional[Callable[[object, Session], bool]] = None,
+) -> None:
+    """Bump generation ``name`` whenever a flush writes one of ``classes``.
+
+    ``should_bump`` narrows which writes count (e.g. only certain columns);
+    ``on_commit`` drops this process's cached copy once the write commits.
+    """
+    _tracked[name] = (tuple(classes), should_bump, on_commit)
+
+
+def generation_select(name: str):
+    """SELECT of cache ``name``'s generation (no row until its first bump)."""
+    return select(_generations.c.generation).where(_generations.c.name == name)
+
+
+def current_generation(db: Session, name: str) -> int:
+    """The committed generation of cache ``name`` (0 before its first bump)."""
+    memo: Dict[str, int] = db.info.setdefault(_MEMO_KEY, {})
+    generation = memo.get(name)
+    if generation is None:
+        generation = db.execute(generation_select(name)).scalar() or 0
+        memo[name] = generation
+    return generation
+
+
+def memoized_generation(name: str, max_age_seconds: float) -> Optional[int]:
+    """Generation ``name`` read by this process within ``max_age_seconds``, if any."""
+    with _recent_lock:
+        entry = _recent.get(name)
+    if entry is None or time.monotonic() - entry[1] >= max_age_seconds:
+        return None
+    return entry[0]
+
+
+def memoize_generation(name: str, generation: int, read_at: float) -> None:
+    """Share a generation read at ``read_at`` (``time.monotonic()``) with this process."""
+    with _recent_lock:
+        entry = _recent.get(name)
+        # Never replace a newer reading, or keep one taken before a local bump committed
+        if (entry is None or entry[1] <= read_at) and _forgotten_at.get(name, 0.0) <= read_at:
+            _recent[name] = (generation, read_at)
+
+
+def forget_generations(*names: str) -> None:
+    """Drop this process's memoized generations (all of them when no names are given)."""
+    now = time.monotonic()
+    with _recent_lock:
+        for name in names or list(_recent):
+            _recent.pop(name, None)
+            _forgotten_at[name] = now
+
+
+def recent_generation(db: Session, name: str, max_age_seconds: float) -> int:
+    """``current_generation``, reused by every session in this process for ``max_age_seconds``."""
+    if max_age_seconds > 0:
+        generation = memoized_generation(name, max_age_seconds)
+        if generation is not None:
+            return generation
+    read_at = time.monotonic()
+    generation = current_generation(db, name)
+    if max_age_seconds > 0:
+        memoize_generation(name, generation, read_at)
+    return generation
+
+
+def bump_generation(db: Session, name: str) -> None:
+    """Increment generation ``name`` inside the session's current transaction."""
+    connection = db.connection()
+    if connection.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(_generations).values(name=name, generation=1, updated_at=utc_now())
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=[_generations.c.name],
+            set_={"generation": _generations.c.generation + 1, "updated_at": stmt.excluded.updated_at},
+        ))
+    else:
+        result = connection.execute(
+            update(_generations)
+            .where(_generations.c.name == name)
+            .values(generation=_generations.c.generation + 1, updated_at=utc_now())
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(_generations).values(name=name, generation=1, updated_at=utc_now()))
+    db.info.setdefault(_BUMPED_KEY, set()).add(name)
+    db.info.get(_MEMO_KEY, {}).pop(name, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tracked_writes(session: Session, flush_context) -> None:
+    """Record which tracked caches the rows in this flush invalidate."""
+    if not _tracked:
+        return
+    pending: Set[str] = session.info.setdefault(_PENDING_KEY, set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        for name, (classes, should_bump, _) in _tracked.items():
+            if name not in pending and isinstance(instance, classes):
+                if should_bump is None or should_bump(instance, session):
+                    pending.add(name)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _bump_tracked_generations(session: Session, flush_context) -> None:
+    """Bump each collected cache once per transaction."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    bumped = session.info.get(_BUMPED_KEY, set())
+    for name in sorted(pending - bumped):
+        bump_generation(session, name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """Drop this process's copies of the caches the committed transaction bumped."""
+    session.info.pop(_MEMO_KEY, None)
+    bumped = session.info.pop(_BUMPED_KEY, ())
+    if bumped:
+        forget_generations(*bumped)
+    for name in bumped:
+        on_commit = _tracked.get(name, (None, None, None))[2]
+        if on_commit is not None:
+            on_commit()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back(session: Session, previous_transaction) -> None:
+    for key in (_MEMO_KEY, _PENDING_KEY, _BUMPED_KEY):
+        session.info.pop(key, None)
@@ -0,0 +1,233 @@
+"""Typed columnar exports (Parquet and Arrow IPC).
+
+Analytics consumers load exports straight into pandas/Arrow, so besides CSV
+the inventory and monitoring result exports can be requested as
+``format=parquet`` or ``format=arrow``. Columns are declared as
+``TypedColumn(key, header, type, value)`` with one of the logical types in
+``COLUMN_TYPES``; values stay native (dates, floats, lists) and outcome
+codes are dictionary encoded against the fixed ``OUTCOME_CATEGORIES``.
+
+Rows are converted in record batches of ``BATCH_ROWS``; each batch becomes
+one Parquet row group (zstd compressed) or one Arrow IPC record batch and is
+sent as soon as it is written, so memory stays bounded like the CSV stream.
+Arrow output uses the IPC *file* format, which readers can memory-map.
+
+pyarrow is imported on first use so the API starts without it.
+"""
+import enum
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.csv_export import CSVColumn, close_after_stream, csv_streaming_response
+from app.core.monitoring_constants import (
+    OUTCOME_GREEN,
+    OUTCOME_NA,
+    OUTCOME_RED,
+    OUTCOME_UNCONFIGURED,
+    OUTCOME_YELLOW,
+)
+
+BATCH_ROWS = 10000
+
+OUTCOME_CATEGORIES = (OUTCOME_GREEN, OUTCOME_YELLOW, OUTCOME_RED, OUTCOME_NA, OUTCOME_UNCONFIGURED)
+_OUTCOME_INDEX = {code: index for index, code in enumerate(OUTCOME_CATEGORIES)}
+
+COLUMN_TYPES = ("int", "float", "bool", "string", "string_list", "date", "timestamp", "outcome")
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.file",
+}
+
+
+class TypedColumn(NamedTuple):
+    """One export column: stable key, CSV header, logical type and row -> value function."""
+    key: str
+    header: str
+    type: str
+    value: Callable[[Any], Any]
+
+
+def _arrow_type(column_type: str):
+    import pyarrow as pa
+
+    if column_type == "int":
+        return pa.int64()
+    if column_type == "float":
+        return pa.float64()
+    if column_type == "bool":
+        return pa.bool_()
+    if column_type == "string":
+        return pa.string()
+    if column_type == "string_list":
+        return pa.list_(pa.string())
+    if column_type == "date":
+        return pa.date32()
+    if column_type == "timestamp":
+        return pa.timestamp("us")
+    if column_type == "outcome":
+        return pa.dictionary(pa.int8(), pa.string())
+    raise ValueError(f"Unknown column type: {column_type!r}")
+
+
+def arrow_schema(columns: Sequence[TypedColumn]):
+    """Arrow schema for ``columns``."""
+    import pyarrow as pa
+
+    return pa.schema([pa.field(column.key, _arrow_type(column.type)) for column in columns])
+
+
+def _to_array(column: TypedColumn, values: List[Any]):
+    import pyarrow as pa
+
+    if column.type == "outcome":
+        # A fixed dictionary keeps every batch compatible with the IPC file
+        # format, which does not allow dictionary replacement.
+        indices = pa.array([_OUTCOME_INDEX.get(value) for value in values], type=pa.int8())
+        return pa.DictionaryArray.from_arrays(indices, pa.array(OUTCOME_CATEGORIES, type=pa.string()))
+    return pa.array(values, type=_arrow_type(column.type))
+
+
+def iter_record_batches(
+    rows: Iterable[Any], columns: Sequence[TypedColumn], batch_rows: int = BATCH_ROWS
+) -> Iterator[Any]:
+    """Convert ``rows`` into Arrow record batches of at most ``batch_rows`` rows."""
+    import pyarrow as pa
+
+    schema = arrow_schema(columns)
+
+    def build(values: List[List[Any]]):
+        return pa.RecordBatch.from_arrays(
+            [_to_array(column, column_values) for column, column_values in zip(columns, values)],
+            schema=schema,
+        )
+
+    values: List[List[Any]] = [[] for _ in columns]
+    pending = 0
+    for row in rows:
+        for column, column_values in zip(columns, values):
+            column_values.append(column.value(row))
+        pending += 1
+        if pending >= batch_rows:
+            yield build(values)
+            values = [[] for _ in columns]
+            pending = 0
+    if pending:
+        yield build(values)
+
+
+class _ChunkSink:
+    """Write-only file object that buffers bytes until drained."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_columnar(
+    rows: Iterable[Any],
+    columns: Sequence[TypedColumn],
+    export_format: ExportFormat,
+    batch_rows: int = BATCH_ROWS,
+) -> Iterator[bytes]:
+    """Yield a Parquet or Arrow IPC file for ``rows`` one batch at a time."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _ChunkSink()
+    schema = arrow_schema(columns)
+    if export_format == ExportFormat.PARQUET:
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    elif export_format == ExportFormat.ARROW:
+        writer = pa.ipc.new_file(sink, schema)
+    else:
+        raise ValueError(f"Not a columnar format: {export_format!r}")
+
+    try:
+        for batch in iter_record_batches(rows, columns, batch_rows):
+            writer.write_batch(batch)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return value
+
+
+def as_csv_columns(columns: Sequence[TypedColumn]) -> List[CSVColumn]:
+    """CSV columns rendering typed values as text (ISO dates, comma-joined lists)."""
+    return [
+        CSVColumn(column.key, column.header, lambda row, value=column.value: _csv_value(value(row)))
+        for column in columns
+    ]
+
+
+def export_response(
+    rows: Iterable[Any],
+    export_format: ExportFormat,
+    filename_stem: str,
+    typed_columns: Sequence[TypedColumn],
+    csv_columns: Optional[Sequence[CSVColumn]] = None,
+    db: Optional[Session] = None,
+) -> StreamingResponse:
+    """Stream ``rows`` in ``export_format`` as ``<filename_stem>.<format>``.
+
+    CSV uses ``csv_columns`` when given (existing CSV layouts), otherwise the
+    typed columns rendered as text. ``db`` is closed when the stream ends, as
+    for ``csv_streaming_response``.
+    """
+    export_format = ExportFormat(export_format)
+    filename = f"{filename_stem}.{export_format.value}"
+    if export_format == ExportFormat.CSV:
+        return csv_streaming_response(
+            rows, csv_columns if csv_columns is not None else as_csv_columns(typed_columns), filename, db=db
+        )
+    return StreamingResponse(
+        close_after_stream(iter_columnar(rows, typed_columns, export_format), db),
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
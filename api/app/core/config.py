@@ -18,6 +18,70 @@ class Settings(BaseSettings):
     # CORS configuration - comma-separated origins
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:5174"
 
+    # Connection pool (ignored for SQLite). The reporting pool serves analytics
+    # and report endpoints so they cannot starve interactive requests.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_REPORTING_POOL_SIZE: int = 3
+    DB_REPORTING_MAX_OVERFLOW: int = 2
+
+    # Threads available to sync (def) endpoints per worker
+    THREADPOOL_MAX_WORKERS: int = 40
+
+    # Async engine (asyncpg / aiosqlite) serving the native async news feed and
+    # monitoring tasks routes in app.api.async_reads. Off by default.
+    ASYNC_DB_ENABLED: bool = False
+    DB_ASYNC_POOL_SIZE: int = 20
+    DB_ASYNC_MAX_OVERFLOW: int = 20
+
+    # KPI report cache - "memory" (per worker) or "file" (shared via KPI_CACHE_DIR,
+    # a 0700 directory; defaults to <tempdir>/mrm-kpi-cache-<uid>)
+    KPI_CACHE_BACKEND: str = "memory"
+    KPI_CACHE_DIR: str | None = None
+
+    # Background PDF rendering: process pool size, the content-addressed
+    # artifact store (a private 0700 directory; defaults to
+    # <tempdir>/mrm-pdf-artifacts-<uid>) and how long a job may stay PENDING
+    PDF_JOB_WORKERS: int = 2
+    PDF_ARTIFACT_DIR: str | None = None
+    PDF_ARTIFACT_TTL_HOURS: int = 168
+    PDF_JOB_TIMEOUT_SECONDS: int = 600
+
+    # Monitoring report trend charts: LRU size (entries), optional disk cache,
+    # and process pool used once a report has TREND_CHART_PARALLEL_MIN
+    # uncached charts (0 workers renders serially)
+    TREND_CHART_CACHE_SIZE: int = 512
+    TREND_CHART_CACHE_DIR: str | None = None
+    TREND_CHART_WORKERS: int = 4
+    TREND_CHART_PARALLEL_MIN: int = 8
+
+    # Monitoring results CSV import: upload size limit and rows parsed,
+    # evaluated and written per batch
+    MONITORING_IMPORT_MAX_BYTES: int = 50 * 1024 * 1024
+    MONITORING_IMPORT_CHUNK_ROWS: int = 5000
+    MONITORING_IMPORT_PREVIEW_ROWS: int = 500
+
+    # Monthly audit_logs partitions created ahead of time at startup and then
+    # every AUDIT_LOG_PARTITION_CHECK_SECONDS (PostgreSQL, after the alp001 migration)
+    AUDIT_LOG_PARTITION_MONTHS_AHEAD: int = 3
+    AUDIT_LOG_PARTITION_CHECK_SECONDS: int = 24 * 60 * 60
+
+    # Authenticated-user cache used by get_current_user (0 disables)
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_SIZE: int = 1024
+    # Seconds a worker reuses the shared users generation before re-reading it
+    USER_CACHE_GENERATION_SECONDS: int = 2
+
+    # Request-level SQL profiler (opt-in): Server-Timing headers plus a ring
+    # buffer of recent request profiles at GET /debug/profiles
+    QUERY_PROFILER_ENABLED: bool = False
+    QUERY_PROFILER_BUFFER_SIZE: int = 200
+    QUERY_PROFILER_SLOW_STATEMENTS: int = 5
+    QUERY_PROFILER_REPEAT_THRESHOLD: int = 5
+
     model_config = SettingsConfigDict(env_file=".env")
 
     def get_cors_origins(self) -> list[str]:
@@ -0,0 +1,136 @@
+"""Streaming CSV exports.
+
+``csv_streaming_response`` sends the header row immediately and then writes
+rows in chunks as they are read, so neither the full result set nor the full
+file is ever held in memory. ORM queries should be passed through
+``stream_query``, which reads them with ``yield_per`` (a server-side cursor
+on PostgreSQL) and avoids materializing every row up front.
+
+Columns are declared as ``CSVColumn(key, header, value)``. The keys match
+the frontend column keys, so a saved ``ExportView`` can select and order the
+columns of an export (``export_view_columns``).
+"""
+import csv
+import io
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_
+from sqlalchemy.orm import Query, Session
+
+from app.models.export_view import ExportView
+from app.models.user import User
+
+STREAM_BATCH_SIZE = 1000
+CHUNK_ROWS = 500
+
+
+class CSVColumn(NamedTuple):
+    """One export column: stable key, header text and a row -> value function."""
+    key: str
+    header: str
+    value: Callable[[Any], Any]
+
+
+def select_columns(columns: Sequence[CSVColumn], keys: Optional[Iterable[str]]) -> List[CSVColumn]:
+    """Columns named by ``keys``, in that order; all columns when ``keys`` is None.
+
+    Unknown keys are ignored (views may name frontend-only columns).
+    """
+    if keys is None:
+        return list(columns)
+    by_key = {column.key: column for column in columns}
+    selected = [by_key[key] for key in dict.fromkeys(keys) if key in by_key]
+    if not selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Export view has no columns available in this export"
+        )
+    return selected
+
+
+def export_view_columns(
+    db: Session, view_id: Optional[int], current_user: User, entity_type: str
+) -> Optional[List[str]]:
+    """Column keys of a saved export view the user may use, or None if no view."""
+    if view_id is None:
+        return None
+    view = db.query(ExportView).filter(
+        ExportView.view_id == view_id,
+        or_(ExportView.user_id == current_user.user_id, ExportView.is_public == True)
+    ).first()
+    if not view:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export view not found"
+        )
+    if view.entity_type != entity_type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Export view is for {view.entity_type}, not {entity_type}"
+        )
+    return list(view.columns or [])
+
+
+def stream_query(query: Query, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Any]:
+    """Iterate ``query`` in batches without loading every row.
+
+    The query runs on first iteration, i.e. while the response streams.
+
+    Collections must be eager loaded with ``selectinload`` (loaded per
+    batch); joined eager loading of collections cannot be combined with
+    ``yield_per``.
+    """
+    yield from query.yield_per(batch_size)
+
+
+def iter_csv(rows: Iterable[Any], columns: Sequence[CSVColumn], chunk_rows: int = CHUNK_ROWS) -> Iterator[str]:
+    """Yield the header, then CSV text every ``chunk_rows`` rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.header for column in columns])
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+
+    pending = 0
+    for row in rows:
+        writer.writerow([column.value(row) for column in columns])
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+
+def close_after_stream(chunks: Iterator[Any], db: Optional[Session]) -> Iterator[Any]:
+    """Pass ``chunks`` through, closing ``db`` once they are exhausted or abandoned."""
+    try:
+        yield from chunks
+    finally:
+        if db is not None:
+            db.close()
+
+
+def csv_streaming_response(
+    rows: Iterable[Any],
+    columns: Sequence[CSVColumn],
+    filename: str,
+    db: Optional[Session] = None,
+) -> StreamingResponse:
+    """Stream ``rows`` as a CSV attachment.
+
+    ``rows`` is consumed while the response body is sent, after the route's
+    dependencies have been torn down, so a query read from the request
+    session reopens a connection on it; pass that session as ``db`` so it is
+    closed again once the stream ends (or the client disconnects).
+    """
+    return StreamingResponse(
+        close_after_stream(iter_csv(rows, columns), db),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
@@ -1,11 +1,102 @@
 """Database configuration."""
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.db_metrics import TimedQueuePool, instrument_engine
 
-engine = create_engine(settings.DATABASE_URL)
+
+def _engine_options(database_url: str, pool_size: int, max_overflow: int) -> dict:
+    """Pool options for ``create_engine``.
+
+    SQLite (tests, local tooling) keeps SQLAlchemy's default pool; sizing,
+    timeout and recycle only apply to server databases.
+    """
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    **_engine_options(settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Separate, smaller pool for analytics/reporting traffic so long-running
+# report queries cannot exhaust the connections used by interactive requests.
+reporting_engine = create_engine(
+    settings.DATABASE_URL,
+    **_engine_options(
+        settings.DATABASE_URL,
+        settings.DB_REPORTING_POOL_SIZE,
+        settings.DB_REPORTING_MAX_OVERFLOW,
+    ),
+)
+ReportingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=reporting_engine)
+
+pool_telemetry = {
+    "primary": instrument_engine(engine, "primary", settings.DB_MAX_OVERFLOW),
+    "reporting": instrument_engine(reporting_engine, "reporting", settings.DB_REPORTING_MAX_OVERFLOW),
+}
+
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def async_database_url(database_url: str) -> str:
+    """``database_url`` with its driver replaced by the asyncio one."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r} databases")
+    return url.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def create_async_session_factory(database_url: str, pool_size: int, max_overflow: int) -> async_sessionmaker:
+    """AsyncSession factory on a new async engine for ``database_url``.
+
+    The engine uses SQLAlchemy's asyncio-aware queue pool, so the sizing
+    options from ``_engine_options`` apply but not ``TimedQueuePool``.
+    """
+    options = _engine_options(database_url, pool_size, max_overflow)
+    options.pop("poolclass", None)
+    async_engine = create_async_engine(async_database_url(database_url), **options)
+    return async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+# AsyncSession factory for async def routes that await their queries natively.
+# Only created when enabled, so asyncpg stays an optional dependency.
+async_engine = None
+AsyncSessionLocal = None
+if settings.ASYNC_DB_ENABLED:
+    AsyncSessionLocal = create_async_session_factory(
+        settings.DATABASE_URL, settings.DB_ASYNC_POOL_SIZE, settings.DB_ASYNC_MAX_OVERFLOW
+    )
+    async_engine = AsyncSessionLocal.kw["bind"]
+    pool_telemetry["async"] = instrument_engine(
+        async_engine.sync_engine, "async", settings.DB_ASYNC_MAX_OVERFLOW
+    )
+
+
+def get_pool_metrics() -> dict:
+    """Pool state and telemetry counters for every engine."""
+    metrics = {
+        "primary": pool_telemetry["primary"].snapshot(engine.pool),
+        "reporting": pool_telemetry["reporting"].snapshot(reporting_engine.pool),
+    }
+    if async_engine is not None:
+        metrics["async"] = pool_telemetry["async"].snapshot(async_engine.pool)
+    return metrics
+
 
 def get_db():
     """Get database session."""
@@ -14,3 +105,30 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_session_factory() -> sessionmaker:
+    """The primary session factory, for background work that outlives the request session."""
+    return SessionLocal
+
+
+def get_reporting_db():
+    """Get a database session from the reporting pool."""
+    db = ReportingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """The AsyncSession factory, for routes that open several sessions."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access is disabled (set ASYNC_DB_ENABLED)")
+    return AsyncSessionLocal
+
+
+async def get_async_db(factory: async_sessionmaker = Depends(get_async_session_factory)):
+    """Get an async database session."""
+    async with factory() as db:
+        yield db
@@ -0,0 +1,168 @@
+"""Connection pool telemetry.
+
+Each engine's pool is instrumented with checkout/checkin listeners that
+record how long a request waited for a connection, how long it held it, and
+which route it was serving. ``DBRouteContextMiddleware`` publishes the ASGI
+scope in a context variable so the checkout listener can attribute the
+connection; the route template is read at checkin, after routing.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+_current_scope: ContextVar[Optional[dict]] = ContextVar("db_route_scope", default=None)
+
+NO_ROUTE = "(no request)"
+UNMATCHED_ROUTE = "(unmatched)"
+
+
+def route_label(scope: Optional[dict]) -> str:
+    if scope is None:
+        return NO_ROUTE
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+class PoolTelemetry:
+    """Counters for one engine's connection pool."""
+
+    def __init__(self, name: str, max_overflow: Optional[int] = None):
+        self.name = name
+        self.max_overflow = max_overflow
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.routes: Dict[str, Dict[str, float]] = {}
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_hold(self, route: str, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = {
+                    "checkouts": 0,
+                    "hold_seconds_total": 0.0,
+                    "hold_seconds_max": 0.0,
+                }
+            stats["checkouts"] += 1
+            stats["hold_seconds_total"] += seconds
+            stats["hold_seconds_max"] = max(stats["hold_seconds_max"], seconds)
+
+    def snapshot(self, pool) -> Dict[str, Any]:
+        """Current pool state plus accumulated counters."""
+        state: Dict[str, Any] = {"name": self.name, "pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            state.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=self.max_overflow,
+                timeout_seconds=pool.timeout(),
+            )
+        with self._lock:
+            state.update(
+                checkouts=self.checkouts,
+                timeouts=self.timeouts,
+                wait_seconds_total=round(self.wait_seconds_total, 6),
+                wait_seconds_max=round(self.wait_seconds_max, 6),
+                routes={
+                    route: {
+                        "checkouts": int(stats["checkouts"]),
+                        "hold_seconds_total": round(stats["hold_seconds_total"], 6),
+                        "hold_seconds_avg": round(stats["hold_seconds_total"] / stats["checkouts"], 6),
+                        "hold_seconds_max": round(stats["hold_seconds_max"], 6),
+                    }
+                    for route, stats in sorted(self.routes.items())
+                },
+            )
+        return state
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports connection wait time to its PoolTelemetry.
+
+    Sized through the standard ``pool_size``/``max_overflow``/``pool_timeout``
+    engine options; only the public ``connect()`` entry point is wrapped.
+    """
+
+    telemetry: Optional[PoolTelemetry] = None
+
+    def connect(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.telemetry is not None:
+                self.telemetry.record_wait(time.perf_counter() - start, timed_out)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+
+def instrument_engine(engine, name: str, max_overflow: Optional[int] = None) -> PoolTelemetry:
+    """Attach telemetry listeners to ``engine``'s pool and return the counters.
+
+    ``max_overflow`` is the configured option, reported alongside the pool state.
+    """
+    telemetry = PoolTelemetry(name, max_overflow)
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.telemetry = telemetry
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        connection_record.info["route_scope"] = _current_scope.get()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        scope = connection_record.info.pop("route_scope", None)
+        if checked_out_at is not None:
+            telemetry.record_hold(route_label(scope), time.perf_counter() - checked_out_at)
+
+    return telemetry
+
+
+class DBRouteContextMiddleware:
+    """ASGI middleware that exposes the request scope to pool listeners."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
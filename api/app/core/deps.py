@@ -1,9 +1,16 @@
 """Dependencies for FastAPI routes."""
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, sessionmaker
+from app.core.cache_generations import generation_select, memoize_generation, memoized_generation
+from app.core.config import settings
+from app.core.database import get_async_db, get_db, get_reporting_db, get_session_factory
 from app.core.security import decode_token
+from app.core.user_cache import GENERATION_NAME, current_users_generation, user_principal_cache
 from app.models.user import User, LocalStatus
 
 security = HTTPBearer()
@@ -14,7 +21,68 @@ def get_current_user(
     db: Session = Depends(get_db)
 ) -> User:
     """Get current authenticated user."""
-    token = credentials.credentials
+    return _resolve_user(db, credentials.credentials)
+
+
+def get_current_reporting_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_reporting_db)
+) -> User:
+    """Get current authenticated user on the request's reporting-pool session.
+
+    Reporting routes depend on this instead of ``get_current_user`` so a
+    request holds one reporting connection and no primary-pool connection.
+    """
+    return _resolve_user(db, credentials.credentials)
+
+
+def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session_factory: sessionmaker = Depends(get_session_factory)
+) -> int:
+    """Authenticate on a short-lived session and return the user's id.
+
+    For ``async def`` routes that wait (long-polls): the session is closed
+    before the route runs, so no connection is held while it waits.
+    """
+    db = session_factory()
+    try:
+        return _resolve_user(db, credentials.credentials).user_id
+    finally:
+        db.close()
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """Get current authenticated user for async routes.
+
+    Both queries are awaited on the async driver; the role is eager-loaded,
+    other relationships must be loaded explicitly by the route.
+    """
+    email = _token_subject(credentials.credentials)
+    # Read before the user row, so a concurrent commit can only make the row newer
+    generation = memoized_generation(GENERATION_NAME, settings.USER_CACHE_GENERATION_SECONDS)
+    if generation is None:
+        read_at = time.monotonic()
+        generation = (await db.execute(generation_select(GENERATION_NAME))).scalar() or 0
+        memoize_generation(GENERATION_NAME, generation, read_at)
+    principal = user_principal_cache.get(email, generation)
+    if principal is not None:
+        # merge(load=False) issues no SQL, so the sync session can be used directly
+        user = principal.attach(db.sync_session)
+    else:
+        user = (await db.execute(
+            select(User).options(joinedload(User.role_ref)).where(User.email == email)
+        )).scalars().first()
+        _check_found(user)
+        user_principal_cache.put(email, user, generation)
+    _check_enabled(user)
+    return user
+
+
+def _token_subject(token: str) -> str:
     payload = decode_token(token)
 
     if payload is None:
@@ -29,14 +97,18 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
         )
+    return email
 
-    user = db.query(User).filter(User.email == email).first()
+
+def _check_found(user) -> None:
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
 
+
+def _check_enabled(user: User) -> None:
     # Check if user account is disabled
     if user.local_status == LocalStatus.DISABLED.value:
         raise HTTPException(
@@ -44,4 +116,19 @@ def get_current_user(
             detail="Account is disabled. Contact your administrator."
         )
 
+
+def _resolve_user(db: Session, token: str) -> User:
+    email = _token_subject(token)
+
+    # Read before the user row, so a concurrent commit can only make the row newer
+    generation = current_users_generation(db)
+    principal = user_principal_cache.get(email, generation)
+    if principal is not None:
+        user = principal.attach(db)
+    else:
+        user = db.query(User).options(joinedload(User.role_ref)).filter(User.email == email).first()
+        _check_found(user)
+        user_principal_cache.put(email, user, generation)
+
+    _check_enabled(user)
     return user
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 from app.core.time import utc_now
 from app.core.recommendation_status import TERMINAL_RECOMMENDATION_STATUS_CODES
+from app.core.taxonomy_registry import taxonomy_registry
 from app.models.model_exception import ModelException, ModelExceptionStatusHistory
 from app.models.monitoring import MonitoringResult, MonitoringCycle, MonitoringPlanMetric
 from app.models.attestation import AttestationResponse, AttestationRecord
@@ -84,11 +85,7 @@ def generate_exception_code(db: Session) -> str:
 
 def get_closure_reason_value_id(db: Session, code: str) -> Optional[int]:
     """Get the taxonomy value ID for a closure reason code."""
-    result = db.query(TaxonomyValue.value_id).join(Taxonomy).filter(
-        Taxonomy.name == "Exception Closure Reason",
-        TaxonomyValue.code == code
-    ).scalar()
-    return result
+    return taxonomy_registry.value_id(db, "Exception Closure Reason", code)
 
 
 def ensure_closure_reason_taxonomy(db: Session) -> bool:
@@ -554,6 +551,56 @@ def autoclose_type1_on_improved_result(
     return closed_exceptions
 
 
+def autoclose_type1_on_improved_results(
+    db: Session,
+    cycle_id: int,
+    outcomes: dict[Tuple[int, int], str],
+) -> List[ModelException]:
+    """Batch form of ``autoclose_type1_on_improved_result`` for bulk result writes.
+
+    Args:
+        db: Database session
+        cycle_id: Cycle the results were recorded in
+        outcomes: Outcome recorded per (model_id, plan_metric_id)
+
+    Returns:
+        List of auto-closed exceptions
+    """
+    improved = {
+        key: outcome for key, outcome in outcomes.items()
+        if key[0] and outcome in ("GREEN", "YELLOW")
+    }
+    if not improved:
+        return []
+
+    # Open Type 1 exceptions on the affected models, with the metric of the
+    # result that raised them
+    candidates = db.query(ModelException, MonitoringResult.plan_metric_id).join(
+        MonitoringResult, ModelException.monitoring_result_id == MonitoringResult.result_id
+    ).filter(
+        ModelException.model_id.in_({model_id for model_id, _ in improved}),
+        ModelException.exception_type == EXCEPTION_TYPE_UNMITIGATED_PERFORMANCE,
+        ModelException.status.in_([STATUS_OPEN, STATUS_ACKNOWLEDGED])
+    ).all()
+
+    closed_exceptions = []
+    for exception, plan_metric_id in candidates:
+        outcome = improved.get((exception.model_id, plan_metric_id))
+        if outcome is None:
+            continue
+        closed = _close_exception(
+            db=db,
+            exception=exception,
+            closure_narrative=f"Metric returned to {outcome} in cycle {cycle_id}",
+            closure_reason_code=CLOSURE_REASON_NO_LONGER_EXCEPTION,
+            auto_closed=True,
+        )
+        if closed:
+            closed_exceptions.append(exception)
+
+    return closed_exceptions
+
+
 def close_type1_exception_for_result(
     db: Session,
     result: MonitoringResult,
@@ -8,11 +8,13 @@ Computes the final risk ranking by:
 """
 
 from datetime import date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 
 from app.models.taxonomy import Taxonomy, TaxonomyValue
+from app.core.taxonomy_registry import taxonomy_registry
 
 
 # Scorecard outcomes ordered from best (0) to worst (5)
@@ -76,6 +78,11 @@ def get_past_due_level_with_notches(
         Dictionary with bucket details including downgrade_notches,
         or None if no matching bucket found.
     """
+    return _match_past_due_level(_load_past_due_levels(db), days_overdue)
+
+
+def _load_past_due_levels(db: Session) -> List[TaxonomyValue]:
+    """Load active Past Due Level bucket values ordered by sort_order."""
     # Find the "Past Due Level" taxonomy
     taxonomy = db.query(Taxonomy).filter(
         Taxonomy.name == "Past Due Level",
@@ -83,15 +90,20 @@ def get_past_due_level_with_notches(
     ).first()
 
     if not taxonomy:
-        return None
+        return []
 
     # Get all bucket values ordered by sort_order
-    values = db.query(TaxonomyValue).filter(
+    return db.query(TaxonomyValue).filter(
         TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
         TaxonomyValue.is_active == True
     ).order_by(TaxonomyValue.sort_order).all()
 
-    # Find the matching bucket
+
+def _match_past_due_level(
+    values: List[TaxonomyValue],
+    days_overdue: int
+) -> Optional[Dict[str, Any]]:
+    """Find the bucket in preloaded Past Due Level values that contains days_overdue."""
     for value in values:
         min_days = value.min_days
         max_days = value.max_days
@@ -99,6 +111,18 @@ def get_past_due_level_with_notches(
         # Check if days_overdue falls within this bucket
         if min_days is None and max_days is None:
             # Single unbounded bucket - matches everything
+            matched = True
+        elif min_days is None:
+            # Lower unbounded: matches if days_overdue <= max_days
+            matched = max_days is not None and days_overdue <= max_days
+        elif max_days is None:
+            # Upper unbounded: matches if days_overdue >= min_days
+            matched = days_overdue >= min_days
+        else:
+            # Bounded: matches if min_days <= days_overdue <= max_days
+            matched = min_days <= days_overdue <= max_days
+
+        if matched:
             return {
                 "value_id": value.value_id,
                 "code": value.code,
@@ -106,36 +130,6 @@ def get_past_due_level_with_notches(
                 "description": value.description,
                 "downgrade_notches": value.downgrade_notches or 0,
             }
-        elif min_days is None:
-            # Lower unbounded: matches if days_overdue <= max_days
-            if max_days is not None and days_overdue <= max_days:
-                return {
-                    "value_id": value.value_id,
-                    "code": value.code,
-                    "label": value.label,
-                    "description": value.description,
-                    "downgrade_notches": value.downgrade_notches or 0,
-                }
-        elif max_days is None:
-            # Upper unbounded: matches if days_overdue >= min_days
-            if days_overdue >= min_days:
-                return {
-                    "value_id": value.value_id,
-                    "code": value.code,
-                    "label": value.label,
-                    "description": value.description,
-                    "downgrade_notches": value.downgrade_notches or 0,
-                }
-        else:
-            # Bounded: matches if min_days <= days_overdue <= max_days
-            if min_days <= days_overdue <= max_days:
-                return {
-                    "value_id": value.value_id,
-                    "code": value.code,
-                    "label": value.label,
-                    "description": value.description,
-                    "downgrade_notches": value.downgrade_notches or 0,
-                }
 
     return None
 
@@ -156,12 +150,20 @@ def lookup_residual_risk(
     Returns:
         Residual risk rating ("High", "Medium", "Low") or None if not found
     """
+    return _lookup_in_risk_map(_load_active_risk_map(db), inherent_risk_tier, scorecard_outcome)
+
+
+def _load_active_risk_map(db: Session):
+    """Load the active ResidualRiskMapConfig (or None)."""
     from app.models.residual_risk_map import ResidualRiskMapConfig
 
-    config = db.query(ResidualRiskMapConfig).filter(
+    return db.query(ResidualRiskMapConfig).filter(
         ResidualRiskMapConfig.is_active == True
     ).first()
 
+
+def _lookup_in_risk_map(config, inherent_risk_tier: str, scorecard_outcome: str) -> Optional[str]:
+    """Look up residual risk in a preloaded ResidualRiskMapConfig."""
     if not config or not config.matrix_config:
         return None
 
@@ -227,6 +229,11 @@ def calculate_model_days_overdue(db: Session, model_id: int) -> int:
         # No active policy for this tier
         return 0
 
+    return _days_overdue_from_completion(latest_approved.completion_date, policy, today)
+
+
+def _days_overdue_from_completion(completion_date, policy, today: date) -> int:
+    """Days past grace period end, given the last approved completion date and policy."""
     # Calculate when the next validation is due
     # Due date = last completion date + frequency_months + grace_period_months
     from dateutil.relativedelta import relativedelta
@@ -235,7 +242,6 @@ def calculate_model_days_overdue(db: Session, model_id: int) -> int:
     grace_period_months = policy.grace_period_months or 0
 
     # Next due date is completion_date + frequency_months
-    completion_date = latest_approved.completion_date
     if isinstance(completion_date, str):
         completion_date = date.fromisoformat(completion_date)
     elif hasattr(completion_date, 'date'):
@@ -328,8 +334,27 @@ def compute_final_model_risk_ranking(
     # Calculate days overdue for the model
     days_overdue = calculate_model_days_overdue(db, model_id)
 
+    return _build_risk_ranking(
+        original_scorecard,
+        days_overdue,
+        inherent_risk_tier,
+        inherent_risk_tier_label,
+        _load_past_due_levels(db),
+        _load_active_risk_map(db),
+    )
+
+
+def _build_risk_ranking(
+    original_scorecard: str,
+    days_overdue: int,
+    inherent_risk_tier: str,
+    inherent_risk_tier_label: Optional[str],
+    past_due_levels: List[TaxonomyValue],
+    risk_map_config,
+) -> Dict[str, Any]:
+    """Assemble the final risk ranking dict from preloaded reference data."""
     # Get past due level and downgrade notches
-    past_due_info = get_past_due_level_with_notches(db, days_overdue)
+    past_due_info = _match_past_due_level(past_due_levels, days_overdue)
     downgrade_notches = past_due_info.get("downgrade_notches", 0) if past_due_info else 0
     past_due_level = past_due_info.get("label", "Current") if past_due_info else "Current"
     past_due_level_code = past_due_info.get("code", "CURRENT") if past_due_info else "CURRENT"
@@ -338,10 +363,12 @@ def compute_final_model_risk_ranking(
     adjusted_scorecard = downgrade_scorecard(original_scorecard, downgrade_notches)
 
     # Compute final residual risk with adjusted scorecard
-    final_rating = lookup_residual_risk(db, inherent_risk_tier, adjusted_scorecard)
+    final_rating = _lookup_in_risk_map(risk_map_config, inherent_risk_tier, adjusted_scorecard)
 
     # Also compute what residual risk would be without penalty (for comparison)
-    residual_risk_without_penalty = lookup_residual_risk(db, inherent_risk_tier, original_scorecard)
+    residual_risk_without_penalty = _lookup_in_risk_map(
+        risk_map_config, inherent_risk_tier, original_scorecard
+    )
 
     return {
         "original_scorecard": original_scorecard,
@@ -355,3 +382,104 @@ def compute_final_model_risk_ranking(
         "final_rating": final_rating,
         "residual_risk_without_penalty": residual_risk_without_penalty,
     }
+
+
+def compute_final_model_risk_rankings(
+    db: Session,
+    model_ids: Iterable[int]
+) -> Dict[int, Optional[Dict[str, Any]]]:
+    """
+    Compute the Final Model Risk Ranking for many models at once.
+
+    Batch equivalent of compute_final_model_risk_ranking for list views.
+    Loads models, latest scorecard results, latest approved completion dates,
+    validation policies, Past Due Level buckets and the active residual risk
+    map with a fixed number of queries regardless of the number of models.
+
+    Args:
+        db: Database session
+        model_ids: IDs of the models
+
+    Returns:
+        Dict of model_id -> ranking dict (same shape as the per-model function),
+        or None where there is insufficient data to compute.
+    """
+    from app.models import Model
+    from app.models.validation import ValidationRequest, ValidationPolicy, ValidationRequestModelVersion
+    from app.core.batch_revalidation import fetch_ranked_validations
+
+    model_ids = list(dict.fromkeys(model_ids))
+    results: Dict[int, Optional[Dict[str, Any]]] = {model_id: None for model_id in model_ids}
+    if not model_ids:
+        return results
+
+    # Models with a recognised inherent risk tier
+    rows = db.query(
+        Model.model_id, Model.risk_tier_id, TaxonomyValue.label
+    ).join(
+        TaxonomyValue, TaxonomyValue.value_id == Model.risk_tier_id
+    ).filter(Model.model_id.in_(model_ids)).all()
+
+    tiers = {
+        model_id: (risk_tier_id, label, RISK_TIER_MAPPING.get(label))
+        for model_id, risk_tier_id, label in rows
+        if RISK_TIER_MAPPING.get(label)
+    }
+    if not tiers:
+        return results
+
+    # Most recent validation with a scorecard result, per model
+    scorecard_validations = fetch_ranked_validations(
+        db, tiers.keys(),
+        criteria=[ValidationRequest.scorecard_result.has()],
+        order_by=[ValidationRequest.completion_date.desc().nullslast()],
+        options=[joinedload(ValidationRequest.scorecard_result)]
+    )
+
+    scorecards = {}
+    for model_id, validations in scorecard_validations.items():
+        result = validations[0].scorecard_result
+        if result and result.overall_rating:
+            scorecards[model_id] = result.overall_rating
+    if not scorecards:
+        return results
+
+    # Latest APPROVED completion date, per model
+    completion_rows = db.query(
+        ValidationRequestModelVersion.model_id,
+        func.max(ValidationRequest.completion_date)
+    ).join(
+        ValidationRequest,
+        ValidationRequest.request_id == ValidationRequestModelVersion.request_id
+    ).filter(
+        ValidationRequestModelVersion.model_id.in_(list(scorecards.keys())),
+        ValidationRequest.current_status_id.in_(
+            taxonomy_registry.value_ids(db, "Validation Request Status", ["APPROVED"])
+        ),
+        ValidationRequest.completion_date.isnot(None)
+    ).group_by(ValidationRequestModelVersion.model_id).all()
+    latest_completions = {model_id: completed for model_id, completed in completion_rows}
+
+    policies = {p.risk_tier_id: p for p in db.query(ValidationPolicy).all()}
+    past_due_levels = _load_past_due_levels(db)
+    risk_map_config = _load_active_risk_map(db)
+
+    today = date.today()
+    for model_id, original_scorecard in scorecards.items():
+        risk_tier_id, tier_label, inherent_risk_tier = tiers[model_id]
+        completion_date = latest_completions.get(model_id)
+        policy = policies.get(risk_tier_id)
+        days_overdue = 0
+        if completion_date and policy:
+            days_overdue = _days_overdue_from_completion(completion_date, policy, today)
+
+        results[model_id] = _build_risk_ranking(
+            original_scorecard,
+            days_overdue,
+            inherent_risk_tier,
+            tier_label,
+            past_due_levels,
+            risk_map_config,
+        )
+
+    return results
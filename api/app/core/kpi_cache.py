@@ -0,0 +1,262 @@
+"""Pluggable cache for the KPI report.
+
+The KPI report is expensive to compute, so results are cached per
+(region_id, team_id) key. Entries carry the cache *generation* they were
+computed under; any write that can change a KPI bumps the generation, so
+stale entries are discarded on the next read instead of waiting for the TTL.
+Callers read ``generation()`` before computing a value and pass it to
+``set``, so a value computed while a write committed is dropped (or stored
+already stale) rather than served as fresh.
+
+Values must be JSON-serializable (the KPI router stores the report's
+``model_dump(mode="json")``).
+
+Backends:
+- ``memory``: per-process dict (default, suitable for a single worker).
+- ``file``: JSON files in a private (0700) directory, so every worker on the
+  host sees the same entries and the same generation counter.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Hashable, Optional
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.private_storage import private_directory
+
+
+class KPICacheBackend(ABC):
+    """Interface for KPI report cache backends."""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None when missing, expired or stale."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl_seconds: int, generation: Optional[int] = None) -> bool:
+        """Store a JSON-serializable value computed under ``generation`` (default: current).
+
+        Returns False, storing nothing, when the generation has moved on since.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+    @abstractmethod
+    def generation(self) -> int:
+        """Current generation counter."""
+
+    @abstractmethod
+    def bump_generation(self) -> int:
+        """Invalidate every entry; returns the new generation."""
+
+    def _entry(self, value: Any, ttl_seconds: int, generation: Optional[int]) -> Optional[Dict[str, Any]]:
+        current = self.generation()
+        if generation is not None and generation != current:
+            return None
+        return {"value": value, "expires_at": time.time() + ttl_seconds, "generation": current}
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return bool(
+            entry
+            and entry["expires_at"] > time.time()
+            and entry["generation"] == self.generation()
+        )
+
+
+class InMemoryKPICache(KPICacheBackend):
+    """Per-process cache; entries are not shared between workers."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, Dict[str, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if not self._is_fresh(entry):
+            self._entries.pop(key, None)
+            return None
+        return entry["value"]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: int, generation: Optional[int] = None) -> bool:
+        with self._lock:
+            entry = self._entry(value, ttl_seconds, generation)
+            if entry is None:
+                return False
+            self._entries[key] = entry
+            return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def generation(self) -> int:
+        return self._generation
+
+    def bump_generation(self) -> int:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            return self._generation
+
+
+class FileKPICache(KPICacheBackend):
+    """Cache shared between processes through a private directory of JSON files.
+
+    Writes go to a temporary file followed by ``os.replace`` so readers never
+    observe a partially written entry. The generation counter lives in its own
+    file and is incremented under an exclusive lock file. Expired and
+    previous-generation files are purged on ``bump_generation`` and, at most
+    every ``purge_interval_seconds``, on ``set``.
+    """
+
+    _GENERATION_FILE = "generation"
+    _ENTRY_PREFIX = "kpi-"
+
+    def __init__(self, directory: Optional[str] = None, purge_interval_seconds: int = 300) -> None:
+        self.directory = private_directory(directory, "mrm-kpi-cache")
+        self.purge_interval_seconds = purge_interval_seconds
+        self._last_purge = 0.0
+
+    def _entry_path(self, key: Hashable) -> str:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{self._ENTRY_PREFIX}{digest}.json")
+
+    def _atomic_write(self, path: str, payload: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _read_entry(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._read_entry(self._entry_path(key))
+        if not self._is_fresh(entry):
+            return None
+        return entry["value"]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: int, generation: Optional[int] = None) -> bool:
+        # A bump racing this write leaves the entry on the older generation,
+        # so readers still treat it as stale
+        entry = self._entry(value, ttl_seconds, generation)
+        if entry is None:
+            return False
+        self._atomic_write(self._entry_path(key), json.dumps(entry).encode("utf-8"))
+        if time.time() - self._last_purge >= self.purge_interval_seconds:
+            self.purge_expired()
+        return True
+
+    def _entry_files(self):
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.startswith(self._ENTRY_PREFIX)
+        ]
+
+    def _unlink(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def purge_expired(self) -> int:
+        """Delete expired, previous-generation and unreadable entries. Returns the count."""
+        self._last_purge = time.time()
+        removed = 0
+        for path in self._entry_files():
+            if not self._is_fresh(self._read_entry(path)):
+                self._unlink(path)
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for path in self._entry_files():
+            self._unlink(path)
+
+    def generation(self) -> int:
+        try:
+            with open(os.path.join(self.directory, self._GENERATION_FILE), "r") as handle:
+                return int(handle.read().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def bump_generation(self) -> int:
+        import fcntl
+
+        lock_path = os.path.join(self.directory, ".generation.lock")
+        with open(lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                new_generation = self.generation() + 1
+                self._atomic_write(
+                    os.path.join(self.directory, self._GENERATION_FILE),
+                    str(new_generation).encode("utf-8"),
+                )
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+        # Every existing entry now belongs to an older generation
+        self.purge_expired()
+        return new_generation
+
+
+_kpi_cache: Optional[KPICacheBackend] = None
+
+
+def build_kpi_cache(backend: str, directory: Optional[str] = None) -> KPICacheBackend:
+    """Create a cache backend by name ("memory" or "file")."""
+    backend = (backend or "memory").strip().lower()
+    if backend == "memory":
+        return InMemoryKPICache()
+    if backend == "file":
+        return FileKPICache(directory)
+    raise ValueError(f"Unsupported KPI cache backend: {backend!r}")
+
+
+def get_kpi_cache() -> KPICacheBackend:
+    """Return the process-wide KPI cache, creating it from settings on first use."""
+    global _kpi_cache
+    if _kpi_cache is None:
+        _kpi_cache = build_kpi_cache(settings.KPI_CACHE_BACKEND, settings.KPI_CACHE_DIR)
+    return _kpi_cache
+
+
+def set_kpi_cache(cache: KPICacheBackend) -> None:
+    """Replace the process-wide KPI cache (used by tests and custom deployments)."""
+    global _kpi_cache
+    _kpi_cache = cache
+
+
+def invalidate_kpi_cache() -> None:
+    """Mark every cached KPI report as stale."""
+    get_kpi_cache().bump_generation()
+
+
+def invalidate_kpi_cache_on_write(request: Request):
+    """Router dependency: bump the KPI cache generation after successful writes.
+
+    Read-only requests are left alone. The generation is bumped after the
+    endpoint returns, i.e. after its transaction has been committed.
+    """
+    yield
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        invalidate_kpi_cache()
@@ -0,0 +1,244 @@
+"""KPI metric snapshot job and snapshot readers.
+
+The snapshot job computes the KPI report for every region x team scope and
+stores each metric in ``kpi_metric_snapshots``. Re-running the job for the
+same date replaces that date's rows, so it is safe to run nightly and on
+demand.
+
+Runs are incremental: ``stale_snapshot_scopes`` keeps only the scopes with
+no rows for the date yet, or whose rows were taken before the latest audited
+write (``max(audit_logs.timestamp)``). Snapshots are not carried across
+dates, since several metrics are relative to the current day.
+"""
+import logging
+import threading
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.time import utc_now
+from app.models.audit_log import AuditLog
+from app.models.kpi_snapshot import KpiMetricSnapshot
+from app.models.region import Region
+from app.models.team import Team
+from app.schemas.kpi_report import (
+    KPIHistoryPoint,
+    KPIMetric,
+    KPIMetricHistory,
+    KPIReportResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+Scope = Tuple[Optional[int], Optional[int]]
+
+# Serializes background snapshot runs in this process
+_job_lock = threading.Lock()
+
+
+def _scope_filter(query, region_id: Optional[int], team_id: Optional[int]):
+    """Filter snapshots to one scope (NULL region/team means 'All')."""
+    if region_id is None:
+        query = query.filter(KpiMetricSnapshot.region_id.is_(None))
+    else:
+        query = query.filter(KpiMetricSnapshot.region_id == region_id)
+    if team_id is None:
+        query = query.filter(KpiMetricSnapshot.team_id.is_(None))
+    else:
+        query = query.filter(KpiMetricSnapshot.team_id == team_id)
+    return query
+
+
+def list_snapshot_scopes(db: Session) -> List[Scope]:
+    """All (region_id, team_id) scopes: All/each region x All/Unassigned/each active team."""
+    region_ids: List[Optional[int]] = [None] + [
+        row.region_id for row in db.query(Region.region_id).order_by(Region.region_id)
+    ]
+    team_ids: List[Optional[int]] = [None, 0] + [
+        row.team_id for row in db.query(Team.team_id).filter(Team.is_active == True).order_by(Team.team_id)
+    ]
+    return [(region_id, team_id) for region_id in region_ids for team_id in team_ids]
+
+
+def stale_snapshot_scopes(db: Session, as_of_date: date, scopes: Sequence[Scope]) -> List[Scope]:
+    """The ``scopes`` whose snapshot for ``as_of_date`` is missing or predates the last audited write."""
+    last_write = db.query(func.max(AuditLog.timestamp)).scalar()
+    taken_at = {
+        (row.region_id, row.team_id): row.taken_at
+        for row in db.query(
+            KpiMetricSnapshot.region_id,
+            KpiMetricSnapshot.team_id,
+            func.min(KpiMetricSnapshot.created_at).label("taken_at"),
+        ).filter(
+            KpiMetricSnapshot.as_of_date == as_of_date
+        ).group_by(KpiMetricSnapshot.region_id, KpiMetricSnapshot.team_id)
+    }
+    return [
+        scope for scope in scopes
+        if scope not in taken_at or (last_write is not None and taken_at[scope] <= last_write)
+    ]
+
+
+def _snapshot_rows(report: KPIReportResponse, as_of_date: date, taken_at) -> List[KpiMetricSnapshot]:
+    rows = []
+    for metric in report.metrics:
+        ratio = metric.ratio_value
+        rows.append(KpiMetricSnapshot(
+            as_of_date=as_of_date,
+            region_id=report.region_id,
+            team_id=report.team_id,
+            region_name=report.region_name,
+            team_name=report.team_name,
+            metric_id=metric.metric_id,
+            metric_name=metric.metric_name,
+            category=metric.category,
+            metric_type=metric.metric_type,
+            count_value=metric.count_value,
+            duration_value=metric.duration_value,
+            numerator=ratio.numerator if ratio else None,
+            denominator=ratio.denominator if ratio else None,
+            percentage=ratio.percentage if ratio else None,
+            breakdown=(
+                [item.model_dump(mode="json") for item in metric.breakdown_value]
+                if metric.breakdown_value is not None else None
+            ),
+            total_active_models=report.total_active_models,
+            payload=metric.model_dump(mode="json"),
+            report_generated_at=report.report_generated_at,
+            created_at=taken_at,
+        ))
+    return rows
+
+
+def snapshot_kpi_metrics(
+    db: Session,
+    as_of_date: Optional[date] = None,
+    scopes: Optional[Sequence[Scope]] = None,
+) -> Dict[str, int]:
+    """Compute and store KPI metric snapshots for the given scopes.
+
+    Metrics are always computed from current data; ``as_of_date`` only labels
+    the rows (defaults to today). Existing rows for the same date and scope are
+    replaced. Commits after each scope, so an interrupted run keeps the scopes
+    it finished and the next incremental run resumes from there.
+
+    Returns:
+        Dict with "scopes" and "rows_written" counts.
+    """
+    from app.api.kpi_report import compute_kpi_report
+
+    as_of_date = as_of_date or date.today()
+    scopes = list(scopes) if scopes is not None else list_snapshot_scopes(db)
+
+    rows_written = 0
+    for region_id, team_id in scopes:
+        # Taken before computing: writes audited after this instant mark the scope stale
+        taken_at = utc_now()
+        report = compute_kpi_report(db, region_id, team_id)
+        _scope_filter(
+            db.query(KpiMetricSnapshot).filter(KpiMetricSnapshot.as_of_date == as_of_date),
+            region_id,
+            team_id,
+        ).delete(synchronize_session=False)
+        rows = _snapshot_rows(report, as_of_date, taken_at)
+        db.add_all(rows)
+        db.commit()
+        rows_written += len(rows)
+
+    return {"scopes": len(scopes), "rows_written": rows_written}
+
+
+def run_kpi_snapshot_job(session_factory: sessionmaker, as_of_date: date, force: bool = False) -> Dict[str, int]:
+    """Background entry point: snapshot the stale scopes for ``as_of_date`` on a new session.
+
+    Staleness is re-checked under a process-wide lock, so overlapping requests
+    do not compute the same scopes twice. ``force`` recomputes every scope.
+    """
+    with _job_lock:
+        db = session_factory()
+        try:
+            scopes = list_snapshot_scopes(db)
+            if not force:
+                scopes = stale_snapshot_scopes(db, as_of_date, scopes)
+            summary = snapshot_kpi_metrics(db, as_of_date, scopes)
+        except Exception:
+            db.rollback()
+            logger.exception("KPI snapshot job for %s failed", as_of_date)
+            raise
+        finally:
+            db.close()
+    logger.info("KPI snapshot job for %s: %s", as_of_date, summary)
+    return summary
+
+
+def load_kpi_report_snapshot(
+    db: Session,
+    as_of_date: date,
+    region_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+) -> Optional[KPIReportResponse]:
+    """Rebuild the KPI report for a past date from snapshots (None if not snapshotted)."""
+    rows = _scope_filter(
+        db.query(KpiMetricSnapshot).filter(KpiMetricSnapshot.as_of_date == as_of_date),
+        region_id,
+        team_id,
+    ).order_by(KpiMetricSnapshot.snapshot_id).all()
+    if not rows:
+        return None
+
+    first = rows[0]
+    return KPIReportResponse(
+        report_generated_at=first.report_generated_at,
+        as_of_date=as_of_date,
+        metrics=[KPIMetric.model_validate(row.payload) for row in rows],
+        total_active_models=first.total_active_models,
+        region_id=region_id,
+        region_name=first.region_name,
+        team_id=team_id,
+        team_name=first.team_name,
+    )
+
+
+def get_kpi_metric_history(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    region_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+    metric_ids: Optional[Iterable[str]] = None,
+) -> List[KPIMetricHistory]:
+    """Per-metric time series from snapshots, ordered by metric then date."""
+    query = _scope_filter(
+        db.query(KpiMetricSnapshot).filter(
+            KpiMetricSnapshot.as_of_date >= start_date,
+            KpiMetricSnapshot.as_of_date <= end_date,
+        ),
+        region_id,
+        team_id,
+    )
+    if metric_ids:
+        query = query.filter(KpiMetricSnapshot.metric_id.in_(list(metric_ids)))
+
+    history: Dict[str, KPIMetricHistory] = {}
+    for row in query.order_by(KpiMetricSnapshot.as_of_date, KpiMetricSnapshot.snapshot_id):
+        series = history.get(row.metric_id)
+        if series is None:
+            series = KPIMetricHistory(
+                metric_id=row.metric_id,
+                metric_name=row.metric_name,
+                category=row.category,
+                metric_type=row.metric_type,
+            )
+            history[row.metric_id] = series
+        series.points.append(KPIHistoryPoint(
+            as_of_date=row.as_of_date,
+            count_value=row.count_value,
+            duration_value=row.duration_value,
+            numerator=row.numerator,
+            denominator=row.denominator,
+            percentage=row.percentage,
+            breakdown=row.breakdown,
+        ))
+    return list(history.values())
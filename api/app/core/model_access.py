@@ -0,0 +1,199 @@
+"""Materialized model visibility for row-level security.
+
+Non-privileged users see a model when it is approved (``row_approval_status``
+IS NULL) and they are its owner, developer, shared owner, shared developer or
+an active delegate, or when they submitted it. Evaluating that as an OR filter
+with a correlated delegate EXISTS on every query, and with one or two queries
+per ``can_access_model`` call, is replaced by the ``user_model_access`` table,
+which holds one row per visible (user, model) pair:
+
+- ``apply_model_rls``/``apply_exception_rls`` semi-join against it;
+- ``accessible_model_ids`` loads a user's model ids once per session, so
+  per-row checks (``can_access_model``) become set membership tests.
+
+Maintenance is incremental. An ``after_flush`` listener collects models whose
+owner/developer/shared/submitter columns or approval status changed, new and
+deleted models, and models whose delegates changed; ``after_flush_postexec``
+rewrites those models' rows with one DELETE and one INSERT ... SELECT, so the
+table commits (or rolls back) with the change that caused it.
+
+On PostgreSQL the rewrite first locks the affected model rows (``SELECT ...
+FOR UPDATE``, in model id order), so concurrent transactions touching the same
+model recompute one after the other: under READ COMMITTED the second one's
+INSERT ... SELECT sees the first one's committed owners and delegates instead
+of restoring a stale grant or colliding on the primary key. A full rebuild
+locks ``user_model_access`` itself against concurrent rewrites.
+
+Writes made outside the ORM (raw SQL, restores) need
+``refresh_model_access``.
+"""
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from sqlalchemy import delete, event, insert, inspect, select, text, union
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.models.model import Model
+from app.models.model_delegate import ModelDelegate
+from app.models.user import User
+from app.models.user_model_access import UserModelAccess
+
+# Model columns naming a user who sees the model once it is approved
+ROLE_COLUMNS = ("owner_id", "developer_id", "shared_owner_id", "shared_developer_id")
+ACCESS_COLUMNS = ROLE_COLUMNS + ("row_approval_status", "submitted_by_user_id")
+
+_PENDING_KEY = "model_access_pending"
+_MEMO_KEY = "model_access_memo"
+_CHUNK_SIZE = 500
+
+_models = Model.__table__
+_delegates = ModelDelegate.__table__
+_access = UserModelAccess.__table__
+
+
+def model_access_select(model_ids: Optional[List[int]] = None):
+    """``(user_id, model_id)`` pairs granted by the RLS rules, optionally for some models."""
+    def scoped(stmt: Select, model_id_column) -> Select:
+        return stmt if model_ids is None else stmt.where(model_id_column.in_(model_ids))
+
+    approved = _models.c.row_approval_status.is_(None)
+    parts = [
+        scoped(
+            select(_models.c[column].label("user_id"), _models.c.model_id).where(
+                approved, _models.c[column].isnot(None)
+            ),
+            _models.c.model_id,
+        )
+        for column in ROLE_COLUMNS
+    ]
+    parts.append(scoped(
+        select(_delegates.c.user_id, _delegates.c.model_id).select_from(
+            _delegates.join(_models, _models.c.model_id == _delegates.c.model_id)
+        ).where(approved, _delegates.c.revoked_at.is_(None)),
+        _delegates.c.model_id,
+    ))
+    # Submitters see their own models in any approval status
+    parts.append(scoped(
+        select(_models.c.submitted_by_user_id.label("user_id"), _models.c.model_id).where(
+            _models.c.submitted_by_user_id.isnot(None)
+        ),
+        _models.c.model_id,
+    ))
+    return union(*parts)
+
+
+def accessible_model_ids_select(user: User) -> Select:
+    """Subquery of the model ids visible to ``user``, for ``Model.model_id.in_(...)``."""
+    return select(_access.c.model_id).where(_access.c.user_id == user.user_id)
+
+
+def _lock(connection: Connection, model_ids: Optional[List[int]]) -> None:
+    """Serialize concurrent rewrites of the same models' rows (PostgreSQL only)."""
+    if connection.dialect.name != "postgresql":
+        return
+    if model_ids is None:
+        connection.execute(text(f"LOCK TABLE {_access.name} IN SHARE ROW EXCLUSIVE MODE"))
+    else:
+        connection.execute(
+            select(_models.c.model_id)
+            .where(_models.c.model_id.in_(model_ids))
+            .order_by(_models.c.model_id)
+            .with_for_update()
+        )
+
+
+def _write(db: Session, model_ids: Optional[List[int]]) -> None:
+    connection = db.connection()
+    _lock(connection, model_ids)
+    if model_ids is None:
+        connection.execute(delete(_access))
+    else:
+        connection.execute(delete(_access).where(_access.c.model_id.in_(model_ids)))
+    connection.execute(
+        insert(_access).from_select(["user_id", "model_id"], model_access_select(model_ids))
+    )
+
+
+def _refresh(db: Session, model_ids: Optional[Iterable[int]]) -> None:
+    if model_ids is None:
+        _write(db, None)
+    else:
+        ids = sorted(set(model_ids))
+        for start in range(0, len(ids), _CHUNK_SIZE):
+            _write(db, ids[start:start + _CHUNK_SIZE])
+    db.info.pop(_MEMO_KEY, None)
+
+
+def refresh_model_access(db: Session, model_ids: Optional[Iterable[int]] = None) -> None:
+    """Rebuild the visibility rows of ``model_ids`` (None = every model).
+
+    Pending changes are flushed first; the caller commits.
+    """
+    db.flush()
+    _refresh(db, model_ids)
+
+
+def _has_pending_access_writes(session: Session) -> bool:
+    return any(
+        isinstance(instance, (Model, ModelDelegate))
+        for instance in chain(session.new, session.dirty, session.deleted)
+    )
+
+
+def accessible_model_ids(db: Session, user: User) -> FrozenSet[int]:
+    """Ids of the models visible to a non-privileged ``user``, memoized per session.
+
+    The memo is dropped when visibility rows are rewritten, when the session
+    holds unflushed model or delegate changes, and at the end of every
+    transaction.
+    """
+    memo: Optional[Dict[int, FrozenSet[int]]] = db.info.get(_MEMO_KEY)
+    if memo is None or _has_pending_access_writes(db):
+        memo = db.info[_MEMO_KEY] = {}
+    model_ids = memo.get(user.user_id)
+    if model_ids is None:
+        model_ids = frozenset(db.execute(accessible_model_ids_select(user)).scalars())
+        memo[user.user_id] = model_ids
+    return model_ids
+
+
+def _pending(session: Session) -> Set[int]:
+    pending = session.info.get(_PENDING_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_KEY] = set()
+    return pending
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_affected_models(session: Session, flush_context) -> None:
+    """Record which models' visibility the rows in this flush can change."""
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, ModelDelegate):
+            # Includes the previous model of a delegation moved between models
+            history = inspect(instance).attrs.model_id.history
+            _pending(session).update(
+                model_id for model_id in chain(history.sum(), history.deleted)
+                if model_id is not None
+            )
+        elif isinstance(instance, Model) and instance.model_id is not None:
+            if instance in session.dirty:
+                attrs = inspect(instance).attrs
+                if not any(attrs[column].history.has_changes() for column in ACCESS_COLUMNS):
+                    continue
+            _pending(session).add(instance.model_id)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _refresh_affected_models(session: Session, flush_context) -> None:
+    """Rewrite the visibility rows of the models collected by ``_collect_affected_models``."""
+    model_ids = session.info.pop(_PENDING_KEY, None)
+    if model_ids:
+        _refresh(session, model_ids)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_memo_at_transaction_end(session: Session, *args) -> None:
+    session.info.pop(_MEMO_KEY, None)
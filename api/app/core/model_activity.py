@@ -0,0 +1,340 @@
+"""Model activity event stream shared by the model timeline and the news feed.
+
+Activity is spread over a dozen workflow tables (audit logs, versions,
+validation history, delegates, comments, deployments, decommissioning,
+monitoring, exceptions, pending edits, ...). Each event kind here is a SELECT
+over its source table with the common columns
+
+    (model_id, occurred_at, event_type, source_id)
+
+and ``activity_page`` reads one page of the UNION ALL of the requested kinds,
+ordered by ``(occurred_at, event_type, source_id)`` descending and continued
+with an opaque cursor. Each branch carries its own ``model_id`` filter, cursor
+predicate and ``ORDER BY occurred_at DESC, source_id DESC LIMIT :limit``, so it
+can read its newest rows through the ``(model_id, <timestamp>)`` indexes on the
+source tables and the merge sees at most ``limit`` rows per kind instead of a
+model's whole history. Callers then load only the source rows on the page to
+format them.
+
+Events that belong to several models (a validation request or monitoring
+cycle covering many models) appear once per model; ``distinct=True`` collapses
+them for multi-model readers such as the news feed.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from sqlalchemy import String, literal, select, tuple_, union, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.query_steps import Steps, run_steps
+from app.models.attestation import AttestationRecord
+from app.models.audit_log import AuditLog
+from app.models.decommissioning import (
+    DecommissioningApproval, DecommissioningRequest, DecommissioningStatusHistory
+)
+from app.models.model_approval_status_history import ModelApprovalStatusHistory
+from app.models.model_delegate import ModelDelegate
+from app.models.model_exception import ModelException
+from app.models.model_pending_edit import ModelPendingEdit
+from app.models.model_submission_comment import ModelSubmissionComment
+from app.models.model_version import ModelVersion
+from app.models.monitoring import (
+    MonitoringCycle, MonitoringCycleApproval, MonitoringCycleModelScope,
+    MonitoringPlanModelSnapshot, MonitoringResult
+)
+from app.models.recommendation import Recommendation, RecommendationStatusHistory
+from app.models.risk_assessment import ModelRiskAssessment
+from app.models.validation import (
+    ValidationApproval, ValidationRequest, ValidationStatusHistory, validation_request_models
+)
+from app.models.version_deployment_task import VersionDeploymentTask
+
+_CURSOR_SEPARATOR = "|"
+
+
+@dataclass(frozen=True)
+class ActivityEvent:
+    """One row of the activity stream: which source row, and when."""
+    occurred_at: datetime
+    event_type: str
+    source_id: int
+
+    @property
+    def cursor(self) -> str:
+        """Cursor continuing a page after this event."""
+        return _CURSOR_SEPARATOR.join(
+            (self.occurred_at.isoformat(), self.event_type, str(self.source_id))
+        )
+
+
+def decode_cursor(cursor: str) -> ActivityEvent:
+    """Parse a cursor from ``ActivityEvent.cursor``; raises ValueError when malformed."""
+    occurred_at, event_type, source_id = cursor.split(_CURSOR_SEPARATOR)
+    return ActivityEvent(datetime.fromisoformat(occurred_at), event_type, int(source_id))
+
+
+def _event(event_type: str, model_id, occurred_at, source_id, *criteria, from_=None) -> Select:
+    stmt = select(
+        model_id.label("model_id"),
+        occurred_at.label("occurred_at"),
+        literal(event_type, String).label("event_type"),
+        source_id.label("source_id"),
+    )
+    if from_ is not None:
+        stmt = stmt.select_from(from_)
+    return stmt.where(occurred_at.isnot(None), *criteria)
+
+
+def _cycle_models():
+    """(cycle_id, model_id) pairs: locked scope, plan version snapshot or submitted results."""
+    return union(
+        select(MonitoringCycleModelScope.cycle_id, MonitoringCycleModelScope.model_id),
+        select(MonitoringCycle.cycle_id, MonitoringPlanModelSnapshot.model_id).join(
+            MonitoringPlanModelSnapshot,
+            MonitoringPlanModelSnapshot.version_id == MonitoringCycle.plan_version_id,
+        ),
+        select(MonitoringResult.cycle_id, MonitoringResult.model_id).where(
+            MonitoringResult.model_id.isnot(None)
+        ),
+    ).subquery("cycle_models")
+
+
+def _validation_event(event_type: str, table, occurred_at, source_id, *criteria) -> Select:
+    return _event(
+        event_type, validation_request_models.c.model_id, occurred_at, source_id, *criteria,
+        from_=table.__table__.join(
+            validation_request_models,
+            validation_request_models.c.request_id == table.request_id,
+        ),
+    )
+
+
+def _decommissioning_event(event_type: str, table, occurred_at, source_id, *criteria) -> Select:
+    return _event(
+        event_type, DecommissioningRequest.model_id, occurred_at, source_id, *criteria,
+        from_=table.__table__.join(
+            DecommissioningRequest, DecommissioningRequest.request_id == table.request_id
+        ),
+    )
+
+
+def _monitoring_event(event_type: str, table, occurred_at, source_id, *criteria) -> Select:
+    cycle_models = _cycle_models()
+    if table is MonitoringCycle:
+        from_ = MonitoringCycle.__table__.join(
+            cycle_models, cycle_models.c.cycle_id == MonitoringCycle.cycle_id
+        )
+    else:
+        from_ = table.__table__.join(
+            MonitoringCycle, MonitoringCycle.cycle_id == table.cycle_id
+        ).join(cycle_models, cycle_models.c.cycle_id == MonitoringCycle.cycle_id)
+    return _event(event_type, cycle_models.c.model_id, occurred_at, source_id, *criteria, from_=from_)
+
+
+# Event kinds: event_type -> SELECT of (model_id, occurred_at, event_type, source_id)
+EVENT_SOURCES: Dict[str, Callable[[], Select]] = {
+    "model_audit": lambda: _event(
+        "model_audit", AuditLog.entity_id, AuditLog.timestamp, AuditLog.log_id,
+        AuditLog.entity_type == "Model",
+    ),
+    "risk_assessment_audit": lambda: _event(
+        "risk_assessment_audit", ModelRiskAssessment.model_id, AuditLog.timestamp, AuditLog.log_id,
+        AuditLog.entity_type == "ModelRiskAssessment",
+        from_=AuditLog.__table__.join(
+            ModelRiskAssessment, ModelRiskAssessment.assessment_id == AuditLog.entity_id
+        ),
+    ),
+    "version_created": lambda: _event(
+        "version_created", ModelVersion.model_id, ModelVersion.created_at, ModelVersion.version_id,
+    ),
+    "validation_request_created": lambda: _validation_event(
+        "validation_request_created", ValidationRequest,
+        ValidationRequest.created_at, ValidationRequest.request_id,
+    ),
+    "validation_status_change": lambda: _validation_event(
+        "validation_status_change", ValidationStatusHistory,
+        ValidationStatusHistory.changed_at, ValidationStatusHistory.history_id,
+    ),
+    "validation_approval": lambda: _validation_event(
+        "validation_approval", ValidationApproval,
+        ValidationApproval.approved_at, ValidationApproval.approval_id,
+    ),
+    "validation_decision": lambda: _validation_event(
+        "validation_decision", ValidationApproval,
+        ValidationApproval.approved_at, ValidationApproval.approval_id,
+        ValidationApproval.approval_status.in_(["Approved", "Rejected", "Sent Back"]),
+    ),
+    "delegate_added": lambda: _event(
+        "delegate_added", ModelDelegate.model_id, ModelDelegate.delegated_at, ModelDelegate.delegate_id,
+    ),
+    "delegate_removed": lambda: _event(
+        "delegate_removed", ModelDelegate.model_id, ModelDelegate.revoked_at, ModelDelegate.delegate_id,
+    ),
+    "comment_added": lambda: _event(
+        "comment_added", ModelSubmissionComment.model_id,
+        ModelSubmissionComment.created_at, ModelSubmissionComment.comment_id,
+    ),
+    "deployment_confirmed": lambda: _event(
+        "deployment_confirmed", VersionDeploymentTask.model_id,
+        VersionDeploymentTask.confirmed_at, VersionDeploymentTask.task_id,
+    ),
+    "decommissioning_request_created": lambda: _event(
+        "decommissioning_request_created", DecommissioningRequest.model_id,
+        DecommissioningRequest.created_at, DecommissioningRequest.request_id,
+    ),
+    "decommissioning_validator_review": lambda: _event(
+        "decommissioning_validator_review", DecommissioningRequest.model_id,
+        DecommissioningRequest.validator_reviewed_at, DecommissioningRequest.request_id,
+    ),
+    "decommissioning_owner_review": lambda: _event(
+        "decommissioning_owner_review", DecommissioningRequest.model_id,
+        DecommissioningRequest.owner_reviewed_at, DecommissioningRequest.request_id,
+        DecommissioningRequest.owner_approval_required.is_(True),
+    ),
+    "decommissioning_history": lambda: _decommissioning_event(
+        "decommissioning_history", DecommissioningStatusHistory,
+        DecommissioningStatusHistory.changed_at, DecommissioningStatusHistory.history_id,
+    ),
+    "decommissioning_status_change": lambda: _decommissioning_event(
+        "decommissioning_status_change", DecommissioningStatusHistory,
+        DecommissioningStatusHistory.changed_at, DecommissioningStatusHistory.history_id,
+        DecommissioningStatusHistory.old_status.isnot(None),
+    ),
+    "decommissioning_approval": lambda: _decommissioning_event(
+        "decommissioning_approval", DecommissioningApproval,
+        DecommissioningApproval.approved_at, DecommissioningApproval.approval_id,
+    ),
+    "monitoring_cycle_created": lambda: _monitoring_event(
+        "monitoring_cycle_created", MonitoringCycle,
+        MonitoringCycle.created_at, MonitoringCycle.cycle_id,
+    ),
+    "monitoring_cycle_submitted": lambda: _monitoring_event(
+        "monitoring_cycle_submitted", MonitoringCycle,
+        MonitoringCycle.submitted_at, MonitoringCycle.cycle_id,
+    ),
+    "monitoring_cycle_completed": lambda: _monitoring_event(
+        "monitoring_cycle_completed", MonitoringCycle,
+        MonitoringCycle.completed_at, MonitoringCycle.cycle_id,
+        MonitoringCycle.status == "APPROVED",
+    ),
+    "monitoring_cycle_approval": lambda: _monitoring_event(
+        "monitoring_cycle_approval", MonitoringCycleApproval,
+        MonitoringCycleApproval.approved_at, MonitoringCycleApproval.approval_id,
+        MonitoringCycleApproval.approval_status.in_(["Approved", "Rejected"]),
+    ),
+    "recommendation_status_change": lambda: _event(
+        "recommendation_status_change", Recommendation.model_id,
+        RecommendationStatusHistory.changed_at, RecommendationStatusHistory.history_id,
+        from_=RecommendationStatusHistory.__table__.join(
+            Recommendation,
+            Recommendation.recommendation_id == RecommendationStatusHistory.recommendation_id,
+        ),
+    ),
+    "model_approval_status_change": lambda: _event(
+        "model_approval_status_change", ModelApprovalStatusHistory.model_id,
+        ModelApprovalStatusHistory.changed_at, ModelApprovalStatusHistory.history_id,
+    ),
+    "attestation_submitted": lambda: _event(
+        "attestation_submitted", AttestationRecord.model_id,
+        AttestationRecord.attested_at, AttestationRecord.attestation_id,
+    ),
+    "attestation_reviewed": lambda: _event(
+        "attestation_reviewed", AttestationRecord.model_id,
+        AttestationRecord.reviewed_at, AttestationRecord.attestation_id,
+    ),
+    "exception_detected": lambda: _event(
+        "exception_detected", ModelException.model_id,
+        ModelException.detected_at, ModelException.exception_id,
+    ),
+    "exception_acknowledged": lambda: _event(
+        "exception_acknowledged", ModelException.model_id,
+        ModelException.acknowledged_at, ModelException.exception_id,
+    ),
+    "exception_closed": lambda: _event(
+        "exception_closed", ModelException.model_id,
+        ModelException.closed_at, ModelException.exception_id,
+    ),
+    "pending_edit_submitted": lambda: _event(
+        "pending_edit_submitted", ModelPendingEdit.model_id,
+        ModelPendingEdit.requested_at, ModelPendingEdit.pending_edit_id,
+    ),
+    "pending_edit_reviewed": lambda: _event(
+        "pending_edit_reviewed", ModelPendingEdit.model_id,
+        ModelPendingEdit.reviewed_at, ModelPendingEdit.pending_edit_id,
+        ModelPendingEdit.status.in_(["approved", "rejected"]),
+    ),
+}
+
+
+def _page_branch(
+    event_type: str,
+    model_ids: Union[Sequence[int], Select, None],
+    limit: int,
+    cursor: Optional[ActivityEvent],
+    distinct: bool,
+) -> Select:
+    """One kind's newest ``limit`` events for ``model_ids`` after ``cursor``."""
+    branch = EVENT_SOURCES[event_type]()
+    columns = branch.selected_columns
+    if model_ids is not None:
+        branch = branch.where(columns.model_id.in_(model_ids))
+    if cursor is not None:
+        branch = branch.where(
+            # Range on the indexed timestamp; the row value settles ties
+            columns.occurred_at <= cursor.occurred_at,
+            tuple_(columns.occurred_at, columns.event_type, columns.source_id)
+            < tuple_(cursor.occurred_at, cursor.event_type, cursor.source_id),
+        )
+    if distinct:
+        branch = branch.with_only_columns(
+            columns.occurred_at, columns.event_type, columns.source_id
+        ).distinct()
+    # Wrapped so every dialect accepts ORDER BY/LIMIT inside the UNION ALL
+    page = branch.order_by(columns.occurred_at.desc(), columns.source_id.desc()).limit(limit).subquery()
+    return select(page.c.occurred_at, page.c.event_type, page.c.source_id)
+
+
+def activity_page_steps(
+    event_types: Sequence[str],
+    model_ids: Union[Sequence[int], Select, None],
+    limit: int,
+    cursor: Optional[ActivityEvent] = None,
+    distinct: bool = False,
+) -> Steps[List[ActivityEvent]]:
+    """Steps (see ``app.core.query_steps``) reading one ``activity_page``."""
+    events = union_all(*(
+        _page_branch(event_type, model_ids, limit, cursor, distinct) for event_type in event_types
+    )).subquery("model_activity_events")
+    stmt = select(events.c.occurred_at, events.c.event_type, events.c.source_id)
+    if distinct:
+        stmt = stmt.distinct()
+    stmt = stmt.order_by(
+        events.c.occurred_at.desc(), events.c.event_type.desc(), events.c.source_id.desc()
+    ).limit(limit)
+    return [ActivityEvent(*row) for row in (yield stmt)]
+
+
+def activity_page(
+    db: Session,
+    event_types: Sequence[str],
+    model_ids: Union[Sequence[int], Select, None],
+    limit: int,
+    cursor: Optional[ActivityEvent] = None,
+    distinct: bool = False,
+) -> List[ActivityEvent]:
+    """One page of events for ``model_ids`` (None = every model), newest first.
+
+    ``model_ids`` may be a list or a subquery of ids. Pass the ``cursor`` of the
+    last event of a page to continue after it.
+    """
+    return run_steps(db, activity_page_steps(event_types, model_ids, limit, cursor, distinct))
+
+
+def source_ids_by_type(page: Iterable[ActivityEvent]) -> Dict[str, List[int]]:
+    """Group a page's source ids by event type, for loading the source rows."""
+    grouped: Dict[str, List[int]] = {}
+    for event in page:
+        grouped.setdefault(event.event_type, []).append(event.source_id)
+    return grouped
@@ -17,9 +17,9 @@ Status Definitions:
 - EXPIRED: Model is overdue with no active validation or validation still in INTAKE
 """
 from datetime import date, datetime
-from typing import Optional, Tuple, Dict, Any, List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import Optional, Tuple, Dict, Any, List, Set
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, case, func
 
 from app.models import (
     Model,
@@ -31,6 +31,7 @@ from app.models import (
 )
 from app.models.model_approval_status_history import ModelApprovalStatusHistory
 from app.core.time import utc_now
+from app.core.taxonomy_registry import taxonomy_registry
 
 
 class ApprovalStatus:
@@ -42,6 +43,10 @@ class ApprovalStatus:
     EXPIRED = "EXPIRED"
 
 
+# Validation statuses that indicate substantive validation work (beyond INTAKE)
+SUBSTANTIVE_STATUSES = ["PLANNING", "ASSIGNED", "IN_PROGRESS", "REVIEW", "PENDING_APPROVAL"]
+
+
 # Status labels for display
 STATUS_LABELS = {
     ApprovalStatus.NEVER_VALIDATED: "Never Validated",
@@ -150,15 +155,12 @@ def _get_active_substantive_validation(model: Model, db: Session) -> Optional[Va
     Substantive stages are: PLANNING, ASSIGNED, IN_PROGRESS, REVIEW, PENDING_APPROVAL
     INTAKE stage does NOT count as substantive work has not begun.
     """
-    # Statuses that indicate substantive validation work (beyond INTAKE)
-    substantive_statuses = ["PLANNING", "ASSIGNED", "IN_PROGRESS", "REVIEW", "PENDING_APPROVAL"]
-
     return db.query(ValidationRequest).join(
         ValidationRequestModelVersion
     ).filter(
         ValidationRequestModelVersion.model_id == model.model_id,
         ValidationRequest.current_status.has(
-            TaxonomyValue.code.in_(substantive_statuses)
+            TaxonomyValue.code.in_(SUBSTANTIVE_STATUSES)
         )
     ).order_by(
         ValidationRequest.created_at.desc()
@@ -180,7 +182,11 @@ def _is_model_overdue(
     from app.api.validation_workflow import calculate_model_revalidation_status
 
     status = calculate_model_revalidation_status(model, db)
+    return _overdue_from_revalidation_status(status)
 
+
+def _overdue_from_revalidation_status(status: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+    """Derive (is_overdue, context) from a revalidation status dict."""
     # Extract relevant info
     today = date.today()
     next_validation_due = status.get("next_validation_due")
@@ -211,6 +217,171 @@ def _is_model_overdue(
     return False, context
 
 
+def compute_model_approval_statuses(
+    models: List[Model],
+    db: Session,
+    revalidation_statuses: Optional[Dict[int, Dict]] = None
+) -> Dict[int, Tuple[Optional[str], Dict[str, Any]]]:
+    """
+    Compute approval status for many models with a fixed number of queries.
+
+    Batch equivalent of compute_model_approval_status: results are identical
+    per model, but latest approvals, approval counts, revalidation status and
+    active substantive validations are each fetched with one set-based query
+    for the whole list instead of several queries per model.
+
+    Callers that already hold compute_revalidation_statuses() output for these
+    models can pass it as revalidation_statuses to avoid recomputing it.
+
+    Returns:
+        Dict of model_id -> (status_code, context_dict)
+    """
+    from app.core.batch_revalidation import (
+        RevalidationRefCache,
+        compute_revalidation_statuses,
+        fetch_ranked_validations,
+    )
+
+    results: Dict[int, Tuple[Optional[str], Dict[str, Any]]] = {}
+    candidates: List[Model] = []
+    for model in models:
+        if hasattr(model, 'is_model') and not model.is_model:
+            results[model.model_id] = (None, {"reason": "Non-model entity"})
+        else:
+            candidates.append(model)
+
+    if not candidates:
+        return results
+
+    model_ids = [m.model_id for m in candidates]
+    latest_approved_by_model = fetch_ranked_validations(
+        db, model_ids,
+        criteria=[ValidationRequest.current_status_id.in_(
+            taxonomy_registry.value_ids(db, "Validation Request Status", ["APPROVED"])
+        )],
+        order_by=[
+            ValidationRequest.completion_date.desc().nullslast(),
+            ValidationRequest.updated_at.desc()
+        ],
+        options=[joinedload(ValidationRequest.validation_type)]
+    )
+
+    validated = [m for m in candidates if m.model_id in latest_approved_by_model]
+    approval_counts = _batch_approval_counts(
+        db, {latest_approved_by_model[m.model_id][0].request_id for m in validated}
+    )
+    if revalidation_statuses is None:
+        revalidation_statuses = compute_revalidation_statuses(
+            db, validated, RevalidationRefCache(db)
+        ) if validated else {}
+
+    overdue_ids: List[int] = []
+    for model in candidates:
+        context: Dict[str, Any] = {
+            "model_id": model.model_id,
+            "computed_at": utc_now(),
+        }
+        approved_list = latest_approved_by_model.get(model.model_id)
+        if not approved_list:
+            results[model.model_id] = (ApprovalStatus.NEVER_VALIDATED, context)
+            continue
+
+        latest_approved = approved_list[0]
+        context["latest_approved_validation_id"] = latest_approved.request_id
+        context["latest_approved_date"] = (
+            latest_approved.completion_date or latest_approved.updated_at
+        )
+        context["validation_type_code"] = (
+            latest_approved.validation_type.code if latest_approved.validation_type else None
+        )
+        context["validation_type_label"] = (
+            latest_approved.validation_type.label if latest_approved.validation_type else None
+        )
+
+        pending_traditional, has_conditional, pending_conditional = approval_counts.get(
+            latest_approved.request_id, (0, 0, 0)
+        )
+        conditional_complete = True
+        if has_conditional > 0:
+            conditional_complete = model.use_approval_date is not None
+        pending_count = pending_traditional
+        if not conditional_complete:
+            pending_count += pending_conditional
+        context["approvals_complete"] = pending_traditional == 0 and conditional_complete
+        context["pending_approval_count"] = pending_count
+
+        is_overdue, revalidation_context = _overdue_from_revalidation_status(
+            revalidation_statuses[model.model_id]
+        )
+        context["is_overdue"] = is_overdue
+        context["next_validation_due"] = revalidation_context.get("next_validation_due")
+        context["days_until_due"] = revalidation_context.get("days_until_validation_due")
+
+        if not is_overdue:
+            if context["validation_type_code"] == "INTERIM":
+                results[model.model_id] = (ApprovalStatus.INTERIM_APPROVED, context)
+            else:
+                results[model.model_id] = (ApprovalStatus.APPROVED, context)
+            continue
+
+        overdue_ids.append(model.model_id)
+        results[model.model_id] = (ApprovalStatus.EXPIRED, context)
+
+    # Overdue models: check for substantive validation work in one query
+    active_by_model = fetch_ranked_validations(
+        db, overdue_ids,
+        criteria=[ValidationRequest.current_status_id.in_(
+            taxonomy_registry.value_ids(db, "Validation Request Status", SUBSTANTIVE_STATUSES)
+        )],
+        order_by=[ValidationRequest.created_at.desc()],
+        options=[joinedload(ValidationRequest.current_status)]
+    )
+    for model_id in overdue_ids:
+        context = results[model_id][1]
+        active_validation = (active_by_model.get(model_id) or [None])[0]
+        context["active_validation_id"] = active_validation.request_id if active_validation else None
+        context["active_validation_status"] = (
+            active_validation.current_status.code if active_validation and active_validation.current_status else None
+        )
+        if active_validation:
+            results[model_id] = (ApprovalStatus.VALIDATION_IN_PROGRESS, context)
+
+    return results
+
+
+def _batch_approval_counts(db: Session, request_ids: Set[int]) -> Dict[int, Tuple[int, int, int]]:
+    """
+    Approval counts per validation request in a single grouped query.
+
+    Returns dict: request_id -> (pending_traditional, conditional_total, pending_conditional)
+    matching the counts used by _check_approvals_complete.
+    """
+    if not request_ids:
+        return {}
+
+    conditional = or_(
+        ValidationApproval.approver_role_id.isnot(None),
+        ValidationApproval.assigned_approver_id.isnot(None)
+    )
+    pending = and_(
+        ValidationApproval.approval_status == "Pending",
+        ValidationApproval.voided_at.is_(None)
+    )
+    rows = db.query(
+        ValidationApproval.request_id,
+        func.sum(case((and_(ValidationApproval.is_required == True, pending), 1), else_=0)),
+        func.sum(case((conditional, 1), else_=0)),
+        func.sum(case((and_(conditional, pending), 1), else_=0)),
+    ).filter(
+        ValidationApproval.request_id.in_(request_ids)
+    ).group_by(ValidationApproval.request_id).all()
+
+    return {
+        request_id: (int(pending_required or 0), int(conditional_total or 0), int(pending_cond or 0))
+        for request_id, pending_required, conditional_total, pending_cond in rows
+    }
+
+
 def _check_approvals_complete(
     validation: ValidationRequest,
     model: Model,
@@ -362,27 +533,28 @@ def backfill_model_approval_status(db: Session) -> int:
     """
     count = 0
 
+    # Only models without any history need a record
+    has_history = db.query(ModelApprovalStatusHistory.model_id).filter(
+        ModelApprovalStatusHistory.model_id == Model.model_id
+    ).exists()
+
     # Get all models (not checking is_model since field may not exist)
-    models = db.query(Model).all()
+    models = db.query(Model).filter(~has_history).all()
+
+    statuses = compute_model_approval_statuses(models, db)
 
     for model in models:
-        # Check if already has history
-        existing = db.query(ModelApprovalStatusHistory).filter(
-            ModelApprovalStatusHistory.model_id == model.model_id
-        ).first()
-
-        if not existing:
-            current_status, context = compute_model_approval_status(model, db)
-            if current_status:
-                record_status_change(
-                    model_id=model.model_id,
-                    old_status=None,
-                    new_status=current_status,
-                    trigger_type="BACKFILL",
-                    notes="Initial status record created during migration",
-                    db=db
-                )
-                count += 1
+        current_status, context = statuses[model.model_id]
+        if current_status:
+            record_status_change(
+                model_id=model.model_id,
+                old_status=None,
+                new_status=current_status,
+                trigger_type="BACKFILL",
+                notes="Initial status record created during migration",
+                db=db
+            )
+            count += 1
 
     db.commit()
     return count
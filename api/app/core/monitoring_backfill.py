@@ -10,7 +10,7 @@ from app.core.exception_detection import (
     close_type1_exception_for_result,
     ensure_type1_exception_for_result,
 )
-from app.models.audit_log import AuditLog
+from app.core.audit import create_audit_log
 from app.models.kpm import Kpm
 from app.models.monitoring import (
     MonitoringCycle,
@@ -19,7 +19,8 @@ from app.models.monitoring import (
     MonitoringPlanVersion,
     MonitoringResult,
 )
-from app.api.monitoring import calculate_outcome, resolve_outcome_value_id
+from app.core.monitoring_outcomes import ThresholdTable
+from app.api.monitoring import resolve_outcome_value_id
 
 
 def backfill_monitoring_results_outcomes(
@@ -77,7 +78,23 @@ def backfill_monitoring_results_outcomes(
         if s.original_metric_id is not None
     }
 
+    # Evaluate every result that has snapshot thresholds in one pass
+    thresholds = ThresholdTable(snapshot_map)
+    evaluated = [
+        r for r in results
+        if r.cycle and r.numeric_value is not None
+        and (r.cycle.plan_version_id, r.plan_metric_id) in thresholds
+    ]
+    new_outcomes = dict(zip(
+        (r.result_id for r in evaluated),
+        thresholds.evaluate(
+            [(r.cycle.plan_version_id, r.plan_metric_id) for r in evaluated],
+            [r.numeric_value for r in evaluated],
+        ),
+    ))
+
     cycle_update_counts: dict[int, int] = {}
+    outcome_value_ids: dict[str, Optional[int]] = {}
 
     for result in results:
         summary["processed"] += 1
@@ -86,14 +103,13 @@ def backfill_monitoring_results_outcomes(
             summary["skipped_no_snapshot"] += 1
             continue
 
-        snapshot = snapshot_map.get((cycle.plan_version_id, result.plan_metric_id))
-        if not snapshot:
+        if (cycle.plan_version_id, result.plan_metric_id) not in thresholds:
             summary["skipped_no_snapshot"] += 1
             continue
 
         if result.numeric_value is None:
             continue
-        new_outcome = calculate_outcome(result.numeric_value, snapshot)
+        new_outcome = new_outcomes[result.result_id]
         old_outcome = result.calculated_outcome
 
         if new_outcome == old_outcome:
@@ -106,7 +122,9 @@ def backfill_monitoring_results_outcomes(
             continue
 
         result.calculated_outcome = new_outcome
-        result.outcome_value_id = resolve_outcome_value_id(db, new_outcome)
+        if new_outcome not in outcome_value_ids:
+            outcome_value_ids[new_outcome] = resolve_outcome_value_id(db, new_outcome)
+        result.outcome_value_id = outcome_value_ids[new_outcome]
         result.updated_at = utc_now()
 
         if old_outcome == "RED" and new_outcome in ("GREEN", "YELLOW"):
@@ -119,13 +137,14 @@ def backfill_monitoring_results_outcomes(
     if not dry_run:
         if user_id:
             for cycle_id_key, count in cycle_update_counts.items():
-                db.add(AuditLog(
+                create_audit_log(
+                    db,
                     entity_type="MonitoringCycle",
                     entity_id=cycle_id_key,
                     action="BACKFILL_OUTCOMES",
                     user_id=user_id,
                     changes={"updated_results": count}
-                ))
+                )
         db.commit()
 
     return summary
@@ -199,7 +218,8 @@ def backfill_monitoring_cycle_versions(
         cycle.updated_at = utc_now()
 
         if user_id:
-            db.add(AuditLog(
+            create_audit_log(
+                db,
                 entity_type="MonitoringCycle",
                 entity_id=cycle.cycle_id,
                 action="BACKFILL_VERSION",
@@ -208,7 +228,7 @@ def backfill_monitoring_cycle_versions(
                     "plan_version_id": selected_version.version_id,
                     "version_number": selected_version.version_number,
                 }
-            ))
+            )
 
     if not dry_run:
         db.commit()
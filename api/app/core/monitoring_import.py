@@ -0,0 +1,357 @@
+"""Set-based import of monitoring cycle results from CSV.
+
+The CSV is parsed and validated row by row (streaming, so the upload is never
+held in memory) and processed in chunks of ``MONITORING_IMPORT_CHUNK_ROWS``:
+
+- everything the rows are checked against - cycle model scope, plan metrics
+  or version snapshots, outcome taxonomy values and the keys of results that
+  already exist - is loaded once up front (``load_import_context``);
+- outcomes for a chunk are computed in one vectorized pass against those
+  thresholds (``evaluate_outcomes``, via ``monitoring_outcomes.ThresholdTable``);
+- ``ResultWriter`` writes each chunk with one multi-row INSERT for new
+  (model, metric) keys and one executemany UPDATE per set of changed
+  columns for existing keys, instead of one ORM object per row.
+
+The endpoint runs in a single transaction with the cycle row locked, so the
+preloaded key set stays accurate while the import runs. Responses list at most
+``MONITORING_IMPORT_PREVIEW_ROWS`` preview rows and error rows each; the
+summary counts cover the whole file.
+"""
+from __future__ import annotations
+
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.monitoring_constants import QUALITATIVE_OUTCOME_TAXONOMY_NAME, VALID_OUTCOME_CODES
+from app.core.monitoring_outcomes import ThresholdSource, ThresholdTable
+from app.core.time import utc_now
+from app.models.monitoring import (
+    MonitoringCycle,
+    MonitoringPlanMetric,
+    MonitoringPlanMetricSnapshot,
+    MonitoringResult,
+)
+from app.models.taxonomy import Taxonomy, TaxonomyValue
+from app.schemas.monitoring import CSVImportPreviewRow
+
+ResultKey = Tuple[int, int]  # (model_id, plan_metric_id)
+
+_results = MonitoringResult.__table__
+
+
+class ImportRow(NamedTuple):
+    """A validated CSV row."""
+    row_number: int
+    model_id: int
+    metric_id: int
+    value: Optional[float]
+    outcome: Optional[str]
+    narrative: Optional[str]
+
+
+class ImportContext(NamedTuple):
+    """Reference data an import is validated and evaluated against."""
+    cycle_id: int
+    model_names: Dict[int, str]
+    metric_names: Dict[int, str]
+    # Thresholds of each quantitative metric (snapshot for locked versions)
+    thresholds: ThresholdTable
+    outcome_value_ids: Dict[str, int]
+    existing_keys: Set[ResultKey]
+
+
+def load_import_context(db: Session, cycle: MonitoringCycle, model_scope: List[dict]) -> ImportContext:
+    """Load everything needed to validate and evaluate rows for ``cycle``."""
+    model_names = {
+        entry["model_id"]: entry.get("model_name") or f"Model {entry['model_id']}"
+        for entry in model_scope
+    }
+
+    metric_names: Dict[int, str] = {}
+    quantitative: Dict[int, ThresholdSource] = {}
+    if cycle.plan_version_id:
+        # Use metric snapshots from locked version
+        snapshots = db.query(MonitoringPlanMetricSnapshot).filter(
+            MonitoringPlanMetricSnapshot.version_id == cycle.plan_version_id
+        ).all()
+        for snapshot in snapshots:
+            if snapshot.original_metric_id:
+                metric_names[snapshot.original_metric_id] = snapshot.kpm_name
+                if snapshot.evaluation_type == "Quantitative":
+                    quantitative[snapshot.original_metric_id] = snapshot
+    else:
+        # Use live plan metrics
+        metrics = db.query(MonitoringPlanMetric).options(
+            joinedload(MonitoringPlanMetric.kpm)
+        ).filter(
+            MonitoringPlanMetric.plan_id == cycle.plan_id,
+            MonitoringPlanMetric.is_active == True
+        ).all()
+        for metric in metrics:
+            metric_names[metric.metric_id] = metric.kpm.name if metric.kpm else f"Metric {metric.metric_id}"
+            if metric.kpm and metric.kpm.evaluation_type == "Quantitative":
+                quantitative[metric.metric_id] = metric
+
+    # Maps outcome code (GREEN, YELLOW, RED) to taxonomy value_id
+    outcome_value_ids: Dict[str, int] = {}
+    taxonomy = db.query(Taxonomy).filter(
+        Taxonomy.name == QUALITATIVE_OUTCOME_TAXONOMY_NAME
+    ).first()
+    if taxonomy:
+        values = db.query(TaxonomyValue.code, TaxonomyValue.value_id).filter(
+            TaxonomyValue.taxonomy_id == taxonomy.taxonomy_id,
+            TaxonomyValue.is_active == True
+        ).all()
+        outcome_value_ids = {code.upper(): value_id for code, value_id in values}
+
+    existing_keys = {
+        (model_id, metric_id)
+        for model_id, metric_id in db.query(
+            MonitoringResult.model_id, MonitoringResult.plan_metric_id
+        ).filter(MonitoringResult.cycle_id == cycle.cycle_id)
+    }
+
+    return ImportContext(
+        cycle_id=cycle.cycle_id,
+        model_names=model_names,
+        metric_names=metric_names,
+        thresholds=ThresholdTable(quantitative),
+        outcome_value_ids=outcome_value_ids,
+        existing_keys=existing_keys,
+    )
+
+
+def parse_import_rows(
+    reader: Iterable[dict], context: ImportContext
+) -> Iterator[Union[ImportRow, CSVImportPreviewRow]]:
+    """Validate CSV rows, yielding an ``ImportRow`` or an error preview row for each."""
+    valid_outcomes = VALID_OUTCOME_CODES | {''}
+    model_names = context.model_names
+    metric_names = context.metric_names
+
+    for row_number, row in enumerate(reader, start=1):
+        # Parse model_id
+        try:
+            model_id = int(row.get('model_id', '').strip())
+        except (ValueError, AttributeError):
+            yield CSVImportPreviewRow(
+                row_number=row_number, model_id=0, metric_id=0,
+                action="skip", error="Invalid or missing model_id"
+            )
+            continue
+
+        # Parse metric_id
+        try:
+            metric_id = int(row.get('metric_id', '').strip())
+        except (ValueError, AttributeError):
+            yield CSVImportPreviewRow(
+                row_number=row_number, model_id=model_id, model_name=model_names.get(model_id),
+                metric_id=0, action="skip", error="Invalid or missing metric_id"
+            )
+            continue
+
+        # Validate model and metric are in the plan
+        if model_id not in model_names:
+            yield CSVImportPreviewRow(
+                row_number=row_number, model_id=model_id, metric_id=metric_id,
+                action="skip", error=f"Model {model_id} is not in this monitoring plan"
+            )
+            continue
+        if metric_id not in metric_names:
+            yield CSVImportPreviewRow(
+                row_number=row_number, model_id=model_id, model_name=model_names.get(model_id),
+                metric_id=metric_id, action="skip",
+                error=f"Metric {metric_id} is not in this monitoring plan"
+            )
+            continue
+
+        # Parse value
+        value_str = (row.get('value') or '').strip()
+        value = None
+        if value_str:
+            try:
+                value = float(value_str)
+            except ValueError:
+                yield CSVImportPreviewRow(
+                    row_number=row_number, model_id=model_id, model_name=model_names.get(model_id),
+                    metric_id=metric_id, metric_name=metric_names.get(metric_id),
+                    action="skip", error=f"Invalid numeric value: {value_str}"
+                )
+                continue
+
+        # Parse outcome
+        outcome = (row.get('outcome') or '').strip().upper()
+        if outcome and outcome not in valid_outcomes:
+            yield CSVImportPreviewRow(
+                row_number=row_number, model_id=model_id, model_name=model_names.get(model_id),
+                metric_id=metric_id, metric_name=metric_names.get(metric_id), value=value,
+                action="skip", error=f"Invalid outcome: {outcome}. Must be GREEN, YELLOW, or RED"
+            )
+            continue
+
+        # SECURITY: Quantitative metrics MUST derive outcome from numeric value
+        if metric_id in context.thresholds:
+            if value is None:
+                yield CSVImportPreviewRow(
+                    row_number=row_number, model_id=model_id, model_name=model_names.get(model_id),
+                    metric_id=metric_id, metric_name=metric_names.get(metric_id), action="skip",
+                    error="Quantitative metrics require a numeric value; outcome cannot be set directly"
+                )
+                continue
+            # Silently ignore explicit outcome - calculated from thresholds
+            outcome = ''
+
+        narrative = (row.get('narrative') or '').strip()
+        yield ImportRow(
+            row_number=row_number,
+            model_id=model_id,
+            metric_id=metric_id,
+            value=value,
+            outcome=outcome or None,
+            narrative=narrative or None,
+        )
+
+
+def iter_chunks(rows: Iterable, size: int) -> Iterator[list]:
+    """Split ``rows`` into lists of at most ``size`` items."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def preview_action(row: ImportRow, context: ImportContext) -> str:
+    """"update" if the row's (model, metric) result already exists, else "create"."""
+    return "update" if (row.model_id, row.metric_id) in context.existing_keys else "create"
+
+
+def preview_row(row: ImportRow, context: ImportContext) -> CSVImportPreviewRow:
+    """Dry-run preview of a valid row."""
+    return CSVImportPreviewRow(
+        row_number=row.row_number,
+        model_id=row.model_id,
+        model_name=context.model_names.get(row.model_id),
+        metric_id=row.metric_id,
+        metric_name=context.metric_names.get(row.metric_id),
+        value=row.value,
+        outcome=row.outcome,
+        narrative=row.narrative,
+        action=preview_action(row, context),
+    )
+
+
+def evaluate_outcomes(
+    rows: List[ImportRow], context: ImportContext
+) -> List[Tuple[Optional[str], Optional[int]]]:
+    """``(calculated_outcome, outcome_value_id)`` for each row.
+
+    Quantitative rows are evaluated together against their metric's
+    thresholds; qualitative rows take the outcome given in the CSV.
+    """
+    outcomes: List[Optional[str]] = [None if row.value is not None else row.outcome for row in rows]
+    quantitative = [
+        i for i, row in enumerate(rows)
+        if row.value is not None and row.metric_id in context.thresholds
+    ]
+    calculated = context.thresholds.evaluate(
+        [rows[i].metric_id for i in quantitative], [rows[i].value for i in quantitative]
+    )
+    for i, outcome in zip(quantitative, calculated):
+        outcomes[i] = outcome
+    return [
+        (outcome, context.outcome_value_ids.get(outcome) if outcome else None)
+        for outcome in outcomes
+    ]
+
+
+def _merge_changes(
+    changes: dict, row: ImportRow, outcome: Optional[str], outcome_value_id: Optional[int]
+) -> None:
+    # Blank CSV fields leave the stored value unchanged
+    if row.value is not None:
+        changes["numeric_value"] = row.value
+    if outcome:
+        changes["calculated_outcome"] = outcome
+    if outcome_value_id:
+        changes["outcome_value_id"] = outcome_value_id
+    if row.narrative:
+        changes["narrative"] = row.narrative
+
+
+class ResultWriter:
+    """Write evaluated import chunks to a cycle's results with bulk statements.
+
+    Rows for a key that does not exist yet are inserted (the first row for
+    the key; later rows in the file update it). Rows for existing keys update
+    only the fields they provide. The entering user of existing results is
+    preserved.
+    """
+
+    def __init__(self, db: Session, context: ImportContext, user_id: int) -> None:
+        self.db = db
+        self.context = context
+        self.user_id = user_id
+        self.created = 0
+        self.updated = 0
+        # Outcome written for each key, for Type 1 exception follow-up
+        self.outcomes: Dict[ResultKey, str] = {}
+
+    def write(self, rows: List[ImportRow], evaluated: List[Tuple[Optional[str], Optional[int]]]) -> None:
+        now = utc_now()
+        inserts: Dict[ResultKey, dict] = {}
+        updates: Dict[ResultKey, dict] = {}
+
+        for row, (outcome, outcome_value_id) in zip(rows, evaluated):
+            key = (row.model_id, row.metric_id)
+            if key in inserts:
+                _merge_changes(inserts[key], row, outcome, outcome_value_id)
+                self.updated += 1
+            elif key in self.context.existing_keys:
+                _merge_changes(updates.setdefault(key, {}), row, outcome, outcome_value_id)
+                self.updated += 1
+            else:
+                inserts[key] = {
+                    "cycle_id": self.context.cycle_id,
+                    "plan_metric_id": row.metric_id,
+                    "model_id": row.model_id,
+                    "numeric_value": row.value,
+                    "calculated_outcome": outcome,
+                    "outcome_value_id": outcome_value_id,
+                    "narrative": row.narrative,
+                    "entered_by_user_id": self.user_id,
+                    "entered_at": now,
+                    "updated_at": now,
+                }
+                self.created += 1
+            if outcome:
+                self.outcomes[key] = outcome
+
+        if inserts:
+            self.db.execute(insert(_results), list(inserts.values()))
+            self.context.existing_keys.update(inserts)
+        self._update(updates, now)
+
+    def _update(self, updates: Dict[ResultKey, dict], now) -> None:
+        # One executemany per distinct set of changed columns
+        batches: Dict[Tuple[str, ...], List[dict]] = {}
+        for (model_id, metric_id), changes in updates.items():
+            columns = tuple(sorted(changes))
+            params = {f"new_{column}": value for column, value in changes.items()}
+            params.update(key_model_id=model_id, key_metric_id=metric_id)
+            batches.setdefault(columns, []).append(params)
+
+        for columns, params in batches.items():
+            statement = update(_results).where(
+                _results.c.cycle_id == self.context.cycle_id,
+                _results.c.model_id == bindparam("key_model_id"),
+                _results.c.plan_metric_id == bindparam("key_metric_id"),
+            ).values(
+                updated_at=now,
+                **{column: bindparam(f"new_{column}") for column in columns}
+            )
+            self.db.execute(statement, params)
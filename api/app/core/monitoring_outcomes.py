@@ -0,0 +1,170 @@
+"""Monitoring outcome evaluation against metric thresholds.
+
+``calculate_outcome`` evaluates a single value. ``evaluate_outcomes`` does
+the same for arrays of values and per-value threshold vectors in one NumPy
+pass and returns exactly the same codes, including N/A for missing values
+and UNCONFIGURED where no threshold is set. ``ThresholdTable`` holds the
+threshold vectors of a set of live metrics or version snapshots so callers
+evaluate a whole batch against them by key.
+
+``resolve_threshold_sources`` is the batch form of
+``monitoring.resolve_threshold_source``: snapshot thresholds for cycles
+locked to a plan version, otherwise the live plan metric, with one query for
+all requested pairs.
+"""
+import logging
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.monitoring_constants import (
+    OUTCOME_GREEN,
+    OUTCOME_NA,
+    OUTCOME_RED,
+    OUTCOME_UNCONFIGURED,
+    OUTCOME_YELLOW,
+)
+from app.models.monitoring import MonitoringCycle, MonitoringPlanMetric, MonitoringPlanMetricSnapshot
+
+logger = logging.getLogger(__name__)
+
+ThresholdSource = Union[MonitoringPlanMetric, MonitoringPlanMetricSnapshot]
+THRESHOLD_FIELDS = ("yellow_min", "yellow_max", "red_min", "red_max")
+
+
+def calculate_outcome(
+    value: float,
+    metric: ThresholdSource
+) -> str:
+    """Calculate outcome (GREEN, YELLOW, RED, UNCONFIGURED) based on thresholds."""
+    if value is None:
+        return OUTCOME_NA
+
+    # Check if any thresholds are configured
+    has_thresholds = any([
+        metric.red_min is not None,
+        metric.red_max is not None,
+        metric.yellow_min is not None,
+        metric.yellow_max is not None,
+    ])
+    if not has_thresholds:
+        return OUTCOME_UNCONFIGURED
+
+    # Check red thresholds first (highest severity)
+    if metric.red_min is not None and value < metric.red_min:
+        return OUTCOME_RED
+    if metric.red_max is not None and value > metric.red_max:
+        return OUTCOME_RED
+
+    # Check yellow thresholds
+    if metric.yellow_min is not None and value < metric.yellow_min:
+        return OUTCOME_YELLOW
+    if metric.yellow_max is not None and value > metric.yellow_max:
+        return OUTCOME_YELLOW
+
+    # If passed all threshold checks, it's green
+    return OUTCOME_GREEN
+
+
+def _float_array(values: Sequence[Optional[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """``values`` as float64 with NaN for None, plus the mask of None entries."""
+    count = len(values)
+    unset = np.fromiter((value is None for value in values), dtype=bool, count=count)
+    array = np.fromiter(
+        (np.nan if value is None else value for value in values), dtype=np.float64, count=count
+    )
+    return array, unset
+
+
+def _evaluate(
+    value: np.ndarray,
+    value_unset: np.ndarray,
+    bounds: Sequence[Tuple[np.ndarray, np.ndarray]],
+) -> np.ndarray:
+    (yellow_min, yellow_min_unset), (yellow_max, yellow_max_unset), \
+        (red_min, red_min_unset), (red_max, red_max_unset) = bounds
+    configured = ~(yellow_min_unset & yellow_max_unset & red_min_unset & red_max_unset)
+    # Unset bounds are NaN, and comparisons with NaN are False - the same as
+    # skipping the check in calculate_outcome
+    with np.errstate(invalid="ignore"):
+        red = (value < red_min) | (value > red_max)
+        yellow = (value < yellow_min) | (value > yellow_max)
+    return np.select(
+        [value_unset, ~configured, red, yellow],
+        [OUTCOME_NA, OUTCOME_UNCONFIGURED, OUTCOME_RED, OUTCOME_YELLOW],
+        default=OUTCOME_GREEN,
+    )
+
+
+def evaluate_outcomes(
+    values: Sequence[Optional[float]],
+    yellow_min: Sequence[Optional[float]],
+    yellow_max: Sequence[Optional[float]],
+    red_min: Sequence[Optional[float]],
+    red_max: Sequence[Optional[float]],
+) -> List[str]:
+    """Vectorized ``calculate_outcome``.
+
+    All arguments have one entry per value; None marks a missing value or an
+    unset threshold.
+    """
+    value, value_unset = _float_array(values)
+    bounds = [_float_array(threshold) for threshold in (yellow_min, yellow_max, red_min, red_max)]
+    return _evaluate(value, value_unset, bounds).tolist()
+
+
+class ThresholdTable:
+    """Threshold vectors of a set of metrics or snapshots, looked up by key."""
+
+    def __init__(self, sources: Mapping[Hashable, ThresholdSource]) -> None:
+        self._index = {key: position for position, key in enumerate(sources)}
+        self._bounds = [
+            _float_array([getattr(source, field) for source in sources.values()])
+            for field in THRESHOLD_FIELDS
+        ]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def evaluate(self, keys: Sequence[Hashable], values: Sequence[Optional[float]]) -> List[str]:
+        """Outcome of ``values[i]`` against the thresholds of ``keys[i]``."""
+        positions = np.fromiter((self._index[key] for key in keys), dtype=np.intp, count=len(keys))
+        value, value_unset = _float_array(values)
+        bounds = [(array[positions], unset[positions]) for array, unset in self._bounds]
+        return _evaluate(value, value_unset, bounds).tolist()
+
+
+def resolve_threshold_sources(
+    db: Session,
+    pairs: Iterable[Tuple[MonitoringCycle, MonitoringPlanMetric]],
+) -> Dict[Tuple[Optional[int], int], ThresholdSource]:
+    """Threshold source for each (cycle, metric) pair, keyed on (plan_version_id, metric_id)."""
+    metrics: Dict[Tuple[Optional[int], int], MonitoringPlanMetric] = {}
+    for cycle, metric in pairs:
+        metrics[(cycle.plan_version_id, metric.metric_id)] = metric
+
+    versioned = [key for key in metrics if key[0]]
+    snapshots: Dict[Tuple[int, int], MonitoringPlanMetricSnapshot] = {}
+    if versioned:
+        rows = db.query(MonitoringPlanMetricSnapshot).filter(
+            MonitoringPlanMetricSnapshot.version_id.in_({version_id for version_id, _ in versioned}),
+            MonitoringPlanMetricSnapshot.original_metric_id.in_({metric_id for _, metric_id in versioned})
+        ).order_by(MonitoringPlanMetricSnapshot.snapshot_id).all()
+        for snapshot in rows:
+            snapshots.setdefault((snapshot.version_id, snapshot.original_metric_id), snapshot)
+
+    sources: Dict[Tuple[Optional[int], int], ThresholdSource] = {}
+    for key, metric in metrics.items():
+        snapshot = snapshots.get(key) if key[0] else None
+        if key[0] and snapshot is None:
+            logger.warning(
+                "Missing metric snapshot for plan_version_id=%s metric_id=%s; using live thresholds.",
+                key[0],
+                key[1]
+            )
+        sources[key] = snapshot or metric
+    return sources
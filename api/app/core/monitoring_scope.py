@@ -4,8 +4,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional, Set
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.query_steps import Steps, run_steps
 from app.core.time import utc_now
 from app.models.model import Model
 from app.models.monitoring import (
@@ -17,58 +19,50 @@ from app.models.monitoring import (
 )
 
 
-def get_cycle_scope_models(db: Session, cycle: MonitoringCycle) -> List[dict]:
-    """Return model scope for a cycle with best-effort fallbacks."""
-    scope_rows = db.query(MonitoringCycleModelScope).filter(
+def cycle_scope_model_steps(cycle: MonitoringCycle) -> Steps[List[dict]]:
+    """Steps (see ``app.core.query_steps``) resolving a cycle's model scope."""
+    scope_rows = (yield select(MonitoringCycleModelScope).where(
         MonitoringCycleModelScope.cycle_id == cycle.cycle_id
-    ).all()
+    )).scalars().all()
 
     if scope_rows:
         model_ids = {row.model_id for row in scope_rows}
         names_by_id = {row.model_id: row.model_name for row in scope_rows if row.model_name}
         missing_ids = [model_id for model_id in model_ids if model_id not in names_by_id]
         if missing_ids:
-            models = db.query(Model).filter(Model.model_id.in_(missing_ids)).all()
-            for model in models:
-                names_by_id[model.model_id] = model.model_name
+            names_by_id.update((yield _model_names(missing_ids)).all())
         return [
             {"model_id": model_id, "model_name": names_by_id.get(model_id)}
             for model_id in sorted(model_ids)
         ]
 
     if cycle.plan_version_id:
-        snapshots = db.query(MonitoringPlanModelSnapshot).filter(
+        snapshots = (yield select(MonitoringPlanModelSnapshot).where(
             MonitoringPlanModelSnapshot.version_id == cycle.plan_version_id
-        ).all()
+        )).scalars().all()
         if snapshots:
             return [
                 {"model_id": snapshot.model_id, "model_name": snapshot.model_name}
                 for snapshot in sorted(snapshots, key=lambda s: s.model_id)
             ]
 
-    result_model_ids = [
-        row[0]
-        for row in db.query(MonitoringResult.model_id).filter(
-            MonitoringResult.cycle_id == cycle.cycle_id,
-            MonitoringResult.model_id.isnot(None),
-        ).distinct().all()
-    ]
+    result_model_ids = (yield select(MonitoringResult.model_id).where(
+        MonitoringResult.cycle_id == cycle.cycle_id,
+        MonitoringResult.model_id.isnot(None),
+    ).distinct()).scalars().all()
     if result_model_ids:
-        models = db.query(Model).filter(Model.model_id.in_(result_model_ids)).all()
-        names_by_id = {model.model_id: model.model_name for model in models}
+        names_by_id = dict((yield _model_names(result_model_ids)).all())
         return [
             {"model_id": model_id, "model_name": names_by_id.get(model_id)}
             for model_id in sorted(set(result_model_ids))
         ]
 
-    memberships = db.query(MonitoringPlanMembership).filter(
+    model_ids = (yield select(MonitoringPlanMembership.model_id).where(
         MonitoringPlanMembership.plan_id == cycle.plan_id,
         MonitoringPlanMembership.effective_to.is_(None),
-    ).all()
-    if memberships:
-        model_ids = [membership.model_id for membership in memberships]
-        models = db.query(Model).filter(Model.model_id.in_(model_ids)).all()
-        names_by_id = {model.model_id: model.model_name for model in models}
+    )).scalars().all()
+    if model_ids:
+        names_by_id = dict((yield _model_names(model_ids)).all())
         return [
             {"model_id": model_id, "model_name": names_by_id.get(model_id)}
             for model_id in sorted(set(model_ids))
@@ -77,6 +71,15 @@ def get_cycle_scope_models(db: Session, cycle: MonitoringCycle) -> List[dict]:
     return []
 
 
+def _model_names(model_ids):
+    return select(Model.model_id, Model.model_name).where(Model.model_id.in_(model_ids))
+
+
+def get_cycle_scope_models(db: Session, cycle: MonitoringCycle) -> List[dict]:
+    """Return model scope for a cycle with best-effort fallbacks."""
+    return run_steps(db, cycle_scope_model_steps(cycle))
+
+
 def get_cycle_scope_model_ids(db: Session, cycle: MonitoringCycle) -> Set[int]:
     """Return model IDs for a cycle scope with fallbacks."""
     return {entry["model_id"] for entry in get_cycle_scope_models(db, cycle)}
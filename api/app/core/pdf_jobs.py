@@ -0,0 +1,368 @@
+"""Background rendering of PDF reports with a content-addressed artifact store.
+
+Report endpoints gather their data on the request thread (that part needs
+the DB session) into a plain-data *payload* and hand it to a named renderer.
+Rendering - FPDF layout and matplotlib charts - is CPU-bound, so:
+
+- ``ArtifactStore`` keeps rendered PDFs in a directory keyed on the SHA-256
+  of the renderer name and payload. Identical inputs always produce the same
+  document, so an artifact can be served again instead of re-rendered (e.g.
+  repeated downloads of an APPROVED monitoring cycle report).
+- ``PDFJobRunner`` renders payloads in a process pool and records job status
+  next to the artifacts, so any worker on the host can answer a status poll
+  or serve the download (``GET /pdf-jobs/{job_id}``). A job still PENDING
+  after ``PDF_JOB_TIMEOUT_SECONDS`` (e.g. its worker was restarted) is
+  reported as FAILED.
+
+The store lives in a private 0700 directory (``PDF_ARTIFACT_DIR``, or a
+per-user directory under the system temp dir), since job records and
+artifacts are served back to users.
+
+Endpoints accept ``background=true`` to queue the render and get a job back
+(``queue_pdf_job``); otherwise they render inline through ``render_pdf_cached``.
+"""
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.private_storage import private_directory
+from app.core.time import utc_now
+
+JOB_PENDING = "PENDING"
+JOB_COMPLETED = "COMPLETED"
+JOB_FAILED = "FAILED"
+
+
+# ---------------------------------------------------------------------------
+# Renderers (module-level so process pool workers can import them)
+# ---------------------------------------------------------------------------
+
+def _render_monitoring_cycle_report(payload: Dict[str, Any]) -> bytes:
+    from app.core.pdf_reports import MonitoringCycleReportPDF
+    return MonitoringCycleReportPDF(**payload).generate()
+
+
+def _render_validation_scorecard(payload: Dict[str, Any]) -> bytes:
+    from app.core.pdf_reports import generate_validation_scorecard_pdf
+    return generate_validation_scorecard_pdf(**payload)
+
+
+def _render_my_portfolio(payload: Dict[str, Any]) -> bytes:
+    from app.api.my_portfolio import MyPortfolioPDF
+    return MyPortfolioPDF(payload["report_data"], payload["user_name"]).generate()
+
+
+def _render_lineage(payload: Dict[str, Any]) -> bytes:
+    from app.api.model_dependencies import render_lineage_pdf
+    return render_lineage_pdf(payload["paths"], payload["include_hierarchy"])
+
+
+RENDERERS: Dict[str, Callable[[Dict[str, Any]], bytes]] = {
+    "monitoring_cycle_report": _render_monitoring_cycle_report,
+    "validation_scorecard": _render_validation_scorecard,
+    "my_portfolio": _render_my_portfolio,
+    "lineage": _render_lineage,
+}
+
+
+def render_pdf(renderer: str, payload: Dict[str, Any]) -> bytes:
+    """Render ``payload`` with the named renderer."""
+    return bytes(RENDERERS[renderer](payload))
+
+
+def artifact_key(renderer: str, payload: Dict[str, Any]) -> str:
+    """Content hash identifying the document ``renderer`` makes from ``payload``."""
+    canonical = json.dumps([renderer, payload], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+class ArtifactStore:
+    """Rendered PDFs and job records in a directory shared by all workers.
+
+    Writes go to a temporary file followed by ``os.replace`` so readers never
+    observe a partial file. Artifacts unused for ``ttl_seconds`` are pruned;
+    reads refresh the modification time so hot artifacts stay.
+    """
+
+    _PRUNE_INTERVAL_SECONDS = 3600
+
+    def __init__(self, directory: str, ttl_seconds: int) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self._last_pruned = 0.0
+        os.makedirs(os.path.join(directory, "artifacts"), mode=0o700, exist_ok=True)
+        os.makedirs(os.path.join(directory, "jobs"), mode=0o700, exist_ok=True)
+
+    def _artifact_path(self, key: str) -> str:
+        return os.path.join(self.directory, "artifacts", f"{key}.pdf")
+
+    def _job_path(self, job_id: str) -> str:
+        return os.path.join(self.directory, "jobs", f"{job_id}.json")
+
+    def _atomic_write(self, path: str, payload: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._artifact_path(key)
+        try:
+            with open(path, "rb") as handle:
+                content = handle.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return content
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._artifact_path(key))
+
+    def put(self, key: str, content: bytes) -> None:
+        self._atomic_write(self._artifact_path(key), content)
+        self.prune()
+
+    def load_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._job_path(job_id), "r") as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save_job(self, job: Dict[str, Any]) -> None:
+        self._atomic_write(self._job_path(job["job_id"]), json.dumps(job, default=str).encode("utf-8"))
+
+    def prune(self, force: bool = False) -> int:
+        """Delete artifacts and job records older than the TTL (at most hourly)."""
+        now = time.time()
+        if not force and now - self._last_pruned < self._PRUNE_INTERVAL_SECONDS:
+            return 0
+        self._last_pruned = now
+        removed = 0
+        for subdir in ("artifacts", "jobs"):
+            directory = os.path.join(self.directory, subdir)
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                try:
+                    if now - os.path.getmtime(path) > self.ttl_seconds:
+                        os.unlink(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+
+# ---------------------------------------------------------------------------
+# Job runner
+# ---------------------------------------------------------------------------
+
+class PDFJobRunner:
+    """Queue PDF renders on a process pool and track them as jobs.
+
+    The pool is created on first use with the ``spawn`` start method, since
+    forking a multi-threaded server process is unsafe. Tests may pass any
+    ``Executor`` instead. Jobs left PENDING for ``timeout_seconds`` are marked
+    FAILED when next read, so a job whose worker died does not poll forever.
+    """
+
+    _POLL_INTERVAL_SECONDS = 0.25
+
+    def __init__(
+        self,
+        store: ArtifactStore,
+        max_workers: int,
+        executor: Optional[Executor] = None,
+        timeout_seconds: int = 600,
+    ) -> None:
+        self.store = store
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self._executor = executor
+        self._events: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def submit(self, renderer: str, payload: Dict[str, Any], filename: str, owner_id: int) -> Dict[str, Any]:
+        """Queue a render and return its job record.
+
+        If the artifact already exists the job completes immediately.
+        """
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unknown PDF renderer: {renderer!r}")
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "renderer": renderer,
+            "status": JOB_PENDING,
+            "filename": filename,
+            "owner_id": owner_id,
+            "artifact_key": artifact_key(renderer, payload),
+            "error": None,
+            "created_at": utc_now().isoformat(),
+            "completed_at": None,
+        }
+        if self.store.exists(job["artifact_key"]):
+            job["status"] = JOB_COMPLETED
+            job["completed_at"] = job["created_at"]
+            self.store.save_job(job)
+            return job
+
+        self.store.save_job(job)
+        self._events[job["job_id"]] = threading.Event()
+        future = self._get_executor().submit(render_pdf, renderer, payload)
+        future.add_done_callback(lambda done: self._finish(job, done))
+        return job
+
+    def _finish(self, job: Dict[str, Any], future: Future) -> None:
+        job = dict(job, completed_at=utc_now().isoformat())
+        try:
+            self.store.put(job["artifact_key"], future.result())
+            job["status"] = JOB_COMPLETED
+        except Exception as exc:
+            job["status"] = JOB_FAILED
+            job["error"] = f"{type(exc).__name__}: {exc}"
+        self.store.save_job(job)
+        event = self._events.pop(job["job_id"], None)
+        if event is not None:
+            event.set()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.store.load_job(job_id)
+        if job is not None and job["status"] == JOB_PENDING and self._timed_out(job):
+            job = dict(
+                job,
+                status=JOB_FAILED,
+                error=f"Render did not finish within {self.timeout_seconds} seconds",
+                completed_at=utc_now().isoformat(),
+            )
+            self.store.save_job(job)
+        return job
+
+    def _timed_out(self, job: Dict[str, Any]) -> bool:
+        created_at = datetime.fromisoformat(job["created_at"])
+        return (utc_now() - created_at).total_seconds() > self.timeout_seconds
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Return the job once it has finished or ``timeout`` seconds pass.
+
+        Blocks the calling thread: jobs queued by this process are awaited on
+        their completion event, jobs from other workers are re-read from the
+        store periodically. Request handlers use ``wait_async``.
+        """
+        deadline = time.monotonic() + timeout
+        job = self.get(job_id)
+        while job is not None and job["status"] == JOB_PENDING:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            event = self._events.get(job_id)
+            if event is not None:
+                event.wait(remaining)
+            else:
+                time.sleep(min(0.5, remaining))
+            job = self.get(job_id)
+        return job
+
+    async def wait_async(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """``wait`` for the event loop: polls the job record between ``asyncio.sleep`` calls."""
+        deadline = time.monotonic() + timeout
+        job = self.get(job_id)
+        while job is not None and job["status"] == JOB_PENDING:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(self._POLL_INTERVAL_SECONDS, remaining))
+            job = self.get(job_id)
+        return job
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_runner: Optional[PDFJobRunner] = None
+
+
+def get_pdf_job_runner() -> PDFJobRunner:
+    """Return the process-wide job runner, creating it from settings on first use."""
+    global _runner
+    if _runner is None:
+        directory = private_directory(settings.PDF_ARTIFACT_DIR, "mrm-pdf-artifacts")
+        store = ArtifactStore(directory, settings.PDF_ARTIFACT_TTL_HOURS * 3600)
+        _runner = PDFJobRunner(
+            store, settings.PDF_JOB_WORKERS, timeout_seconds=settings.PDF_JOB_TIMEOUT_SECONDS
+        )
+    return _runner
+
+
+def shutdown_pdf_job_runner() -> None:
+    """Stop the job runner's process pool, if one was started."""
+    if _runner is not None:
+        _runner.shutdown()
+
+
+def render_pdf_cached(renderer: str, payload: Dict[str, Any], store_result: bool = False) -> bytes:
+    """Render inline, serving a stored artifact for identical input if present.
+
+    ``store_result`` keeps the rendered document for later requests; use it
+    for reports whose input is immutable (e.g. APPROVED cycles).
+    """
+    store = get_pdf_job_runner().store
+    key = artifact_key(renderer, payload)
+    content = store.get(key)
+    if content is None:
+        content = render_pdf(renderer, payload)
+        if store_result:
+            store.put(key, content)
+    return content
+
+
+def pdf_job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Public view of a job record."""
+    body = {
+        key: job[key]
+        for key in ("job_id", "status", "filename", "error", "created_at", "completed_at")
+    }
+    body["status_url"] = f"/pdf-jobs/{job['job_id']}"
+    body["download_url"] = f"/pdf-jobs/{job['job_id']}/download" if job["status"] == JOB_COMPLETED else None
+    return body
+
+
+def queue_pdf_job(renderer: str, payload: Dict[str, Any], filename: str, owner_id: int) -> JSONResponse:
+    """Queue a render and return ``202 Accepted`` with the job status."""
+    job = get_pdf_job_runner().submit(renderer, payload, filename, owner_id)
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=pdf_job_status(job))
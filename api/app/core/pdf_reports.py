@@ -16,11 +16,19 @@ Features:
 from app.core.monitoring_constants import (
     OUTCOME_GREEN, OUTCOME_YELLOW, OUTCOME_RED, OUTCOME_NA, OUTCOME_UNCONFIGURED
 )
+from app.core.config import settings
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
+import hashlib
 import io
+import json
+import multiprocessing
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional, Any, Tuple, Union
 from fpdf import FPDF
@@ -158,17 +166,17 @@ def generate_trend_chart(
     if not dates:
         return b''
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=(width, height), dpi=100)
+    # Create figure (reusing this thread's canvas)
+    fig = _trend_figure(width, height)
+    ax = fig.add_subplot()
 
     # Plot line and points
     ax.plot(dates, values, linestyle='-',
             color='#6B7280', linewidth=1.5, zorder=2)
 
     # Scatter points with outcome colors
-    for i, (d, v, c) in enumerate(zip(dates, values, colors)):
-        ax.scatter([d], [v], c=[c], s=60, zorder=3,
-                   edgecolors='white', linewidths=1)
+    ax.scatter(dates, values, c=colors, s=60, zorder=3,
+               edgecolors='white', linewidths=1)
 
     def has_series_values(series: List[Optional[float]]) -> bool:
         return any(value is not None for value in series)
@@ -259,8 +267,10 @@ def generate_trend_chart(
 
     # Format x-axis dates
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-    plt.xticks(rotation=45, ha='right', fontsize=8)
-    plt.yticks(fontsize=8)
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha='right', fontsize=8)
+    for label in ax.get_yticklabels():
+        label.set(fontsize=8)
 
     # Add legend if we have threshold lines
     if has_dynamic_thresholds or any([yellow_min, yellow_max, red_min, red_max]):
@@ -281,12 +291,161 @@ def generate_trend_chart(
 
     # Export to bytes
     buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', facecolor='white', edgecolor='none')
-    plt.close(fig)
+    fig.savefig(buffer, format='png', facecolor='white', edgecolor='none')
+    fig.clear()
     buffer.seek(0)
     return buffer.getvalue()
 
 
+class TrendChartCache:
+    """LRU cache of rendered trend chart PNGs, optionally backed by a directory.
+
+    Keys combine the caller's chart id (metric/model) with a hash of
+    everything the chart is drawn from, so a changed data point or
+    threshold never serves a stale image.
+    """
+
+    def __init__(self, max_entries: int, directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(chart_id: str, spec: Dict[str, Any]) -> str:
+        digest = hashlib.sha256(
+            json.dumps(spec, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        return f"{chart_id}-{digest}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.png')
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        if self.directory:
+            try:
+                with open(self._path(key), 'rb') as handle:
+                    content = handle.read()
+            except FileNotFoundError:
+                return None
+            self._remember(key, content)
+            return content
+        return None
+
+    def set(self, key: str, content: bytes) -> None:
+        self._remember(key, content)
+        if self.directory:
+            tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as handle:
+                handle.write(content)
+            os.replace(tmp_path, self._path(key))
+
+    def _remember(self, key: str, content: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = content
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_canvas_local = threading.local()
+_chart_cache: Optional[TrendChartCache] = None
+_chart_executor: Optional[Executor] = None
+_chart_executor_lock = threading.Lock()
+
+
+def _trend_figure(width: float, height: float) -> Figure:
+    """This thread's Agg figure, cleared and resized for the next chart.
+
+    Reusing one Figure/canvas avoids pyplot's global figure manager and the
+    cost of building a new canvas for every chart.
+    """
+    fig = getattr(_canvas_local, 'figure', None)
+    if fig is None:
+        fig = Figure(dpi=100)
+        FigureCanvasAgg(fig)
+        _canvas_local.figure = fig
+    fig.clear()
+    fig.set_size_inches(width, height)
+    return fig
+
+
+def get_trend_chart_cache() -> TrendChartCache:
+    """Return the process-wide chart cache, creating it from settings on first use."""
+    global _chart_cache
+    if _chart_cache is None:
+        _chart_cache = TrendChartCache(settings.TREND_CHART_CACHE_SIZE, settings.TREND_CHART_CACHE_DIR)
+    return _chart_cache
+
+
+def _get_chart_executor() -> Executor:
+    global _chart_executor
+    with _chart_executor_lock:
+        if _chart_executor is None:
+            _chart_executor = ProcessPoolExecutor(
+                max_workers=settings.TREND_CHART_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _chart_executor
+
+
+def _render_chart_spec(spec: Dict[str, Any]) -> bytes:
+    return generate_trend_chart(**spec)
+
+
+def render_trend_charts(
+    specs: Dict[str, Dict[str, Any]],
+    executor: Optional[Executor] = None
+) -> Dict[str, bytes]:
+    """Render many trend charts, using the cache and a process pool.
+
+    Args:
+        specs: Chart id (e.g. "metric_id_model_id") -> ``generate_trend_chart`` kwargs
+        executor: Executor for cache misses; defaults to the shared process
+            pool once there are at least TREND_CHART_PARALLEL_MIN misses
+
+    Returns:
+        Chart id -> PNG bytes (empty bytes when there was nothing to plot)
+    """
+    cache = get_trend_chart_cache()
+    charts: Dict[str, bytes] = {}
+    missing: Dict[str, str] = {}
+    for chart_id, spec in specs.items():
+        key = cache.key(chart_id, spec)
+        cached = cache.get(key)
+        if cached is not None:
+            charts[chart_id] = cached
+        else:
+            missing[chart_id] = key
+
+    if executor is None and settings.TREND_CHART_WORKERS > 0 \
+            and len(missing) >= settings.TREND_CHART_PARALLEL_MIN:
+        executor = _get_chart_executor()
+
+    if executor is None:
+        rendered = {chart_id: _render_chart_spec(specs[chart_id]) for chart_id in missing}
+    else:
+        chart_ids = list(missing)
+        rendered = dict(zip(chart_ids, executor.map(_render_chart_spec, [specs[c] for c in chart_ids])))
+
+    for chart_id, content in rendered.items():
+        cache.set(missing[chart_id], content)
+        charts[chart_id] = content
+    return charts
+
+
 class MonitoringCycleReportPDF(FPDF):
     """Professional PDF report generator for completed monitoring cycles."""
 
@@ -316,6 +475,7 @@ class MonitoringCycleReportPDF(FPDF):
         self.approvals = approvals
         self.trend_data: Dict[Union[int, str], List[Dict[str, Any]]] = trend_data or {}
         self.logo_path = logo_path
+        self._trend_charts: Dict[str, bytes] = {}
 
         # Page settings
         self.set_auto_page_break(auto=True, margin=20)
@@ -718,6 +878,8 @@ class MonitoringCycleReportPDF(FPDF):
         if not breaches:
             return  # Skip section if no breaches
 
+        self._prerender_trend_charts(breaches)
+
         self.add_page()
         self._add_section_header('Breach Analysis')
         self.ln(5)
@@ -830,21 +992,21 @@ class MonitoringCycleReportPDF(FPDF):
 
             self.ln(8)
 
-    def _add_inline_trend_chart(self, breach: Dict[str, Any]):
-        """Add trend chart inline after breach commentary (if quantitative with trend data)."""
+    def _trend_chart_spec(self, breach: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Chart id and ``generate_trend_chart`` kwargs for a breach, if it gets a chart."""
         # Only add chart for quantitative metrics
         if breach.get('numeric_value') is None:
-            return
+            return None
 
         if not self.trend_data:
-            return
+            return None
 
         # Build composite key: metric_id + model_id (or just metric_id if no model)
         metric_id = breach.get('metric_id', breach.get('plan_metric_id'))
         model_id = breach.get('model_id')
 
         if metric_id is None:
-            return
+            return None
 
         # Try composite key first, then metric-only key
         trend_key = f"{metric_id}_{model_id}" if model_id else str(metric_id)
@@ -855,11 +1017,7 @@ class MonitoringCycleReportPDF(FPDF):
             trend_points = self.trend_data.get(metric_id, [])
 
         if not trend_points or len(trend_points) < 2:
-            return  # Need at least 2 points for a meaningful trend
-
-        # Check for page break if needed (chart is ~70mm tall)
-        if self.get_y() > 200:
-            self.add_page()
+            return None  # Need at least 2 points for a meaningful trend
 
         # Generate chart with model name in title if applicable
         metric_name = breach.get(
@@ -870,16 +1028,40 @@ class MonitoringCycleReportPDF(FPDF):
         else:
             chart_title = f"Trend: {metric_name}"
 
-        chart_bytes = generate_trend_chart(
-            metric_name=chart_title,
-            data_points=trend_points,
-            yellow_min=breach.get('yellow_min'),
-            yellow_max=breach.get('yellow_max'),
-            red_min=breach.get('red_min'),
-            red_max=breach.get('red_max'),
-            width=6.2,  # Wider for readability with side legend
-            height=2.0
-        )
+        return trend_key, {
+            'metric_name': chart_title,
+            'data_points': trend_points,
+            'yellow_min': breach.get('yellow_min'),
+            'yellow_max': breach.get('yellow_max'),
+            'red_min': breach.get('red_min'),
+            'red_max': breach.get('red_max'),
+            'width': 6.2,  # Wider for readability with side legend
+            'height': 2.0,
+        }
+
+    def _prerender_trend_charts(self, breaches: List[Dict[str, Any]]):
+        """Render every breach's chart up front (cached, in parallel when many)."""
+        specs = {}
+        for breach in breaches:
+            chart_spec = self._trend_chart_spec(breach)
+            if chart_spec is not None:
+                specs.setdefault(*chart_spec)
+        self._trend_charts = render_trend_charts(specs) if specs else {}
+
+    def _add_inline_trend_chart(self, breach: Dict[str, Any]):
+        """Add trend chart inline after breach commentary (if quantitative with trend data)."""
+        chart_spec = self._trend_chart_spec(breach)
+        if chart_spec is None:
+            return
+        trend_key, spec = chart_spec
+
+        # Check for page break if needed (chart is ~70mm tall)
+        if self.get_y() > 200:
+            self.add_page()
+
+        chart_bytes = self._trend_charts.get(trend_key)
+        if chart_bytes is None:
+            chart_bytes = generate_trend_chart(**spec)
 
         if chart_bytes:
             try:
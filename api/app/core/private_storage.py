@@ -0,0 +1,27 @@
+"""Per-user private directories for on-disk caches and artifacts.
+
+Shared locations such as ``/tmp/<name>`` can be pre-created or written by any
+local user, so caches and artifact stores resolve their directory through
+``private_directory``: the configured path, or ``<tempdir>/<name>-<uid>`` by
+default, created with mode 0700 and refused when another user owns it.
+"""
+import os
+import stat
+import tempfile
+from typing import Optional
+
+
+def private_directory(configured: Optional[str], name: str) -> str:
+    """Create (if needed) and return a directory only the current user can access.
+
+    Raises ``PermissionError`` when the directory exists but belongs to another
+    user; loose permissions on a directory we own are tightened to 0700.
+    """
+    directory = configured or os.path.join(tempfile.gettempdir(), f"{name}-{os.getuid()}")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"{directory} is not a directory owned by the current user")
+    if stat.S_IMODE(info.st_mode) & 0o077:
+        os.chmod(directory, 0o700)
+    return directory
@@ -0,0 +1,222 @@
+"""Request-level SQL query profiler.
+
+When ``QUERY_PROFILER_ENABLED`` is set, ``QueryProfilerMiddleware`` starts a
+``RequestProfile`` for each HTTP request and publishes it in a context
+variable. Cursor-execute listeners registered on every ``Engine`` add each
+statement's duration and fingerprint to the active profile, so sessions from
+any pool (primary, reporting, test engines) are covered.
+
+At response start the middleware adds a ``Server-Timing`` header with the
+query count and DB time; once the request finishes the profile is summarized
+(slowest statements, repeated fingerprints that suggest an N+1 loop) and kept
+in a per-process ring buffer served by ``GET /debug/profiles``.
+"""
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.db_metrics import route_label
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("query_profile", default=None)
+
+_START_KEY = "query_profiler_start"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions share one key.
+
+    Literals and bind placeholders become ``?`` and ``IN`` lists collapse to
+    ``(...)``, so ``WHERE model_id = 1`` and ``WHERE model_id = 2`` match.
+    """
+    text = _STRING_LITERAL.sub("?", statement)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _IN_LIST.sub("(...)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class RequestProfile:
+    """Statements executed while serving one request."""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.route = ""
+        self.status_code: Optional[int] = None
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.duration_ms = 0.0
+        self._lock = threading.Lock()
+        self.statements: List[tuple] = []
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.statements.append((statement, seconds))
+
+    @property
+    def query_count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def db_ms(self) -> float:
+        return sum(seconds for _, seconds in self.statements) * 1000
+
+    def finish(self, scope: dict) -> None:
+        self.route = route_label(scope)
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+
+    def repeated_statements(self, threshold: int) -> List[Dict[str, Any]]:
+        """Fingerprints executed at least ``threshold`` times (N+1 signatures)."""
+        groups: Dict[str, Dict[str, Any]] = {}
+        for statement, seconds in self.statements:
+            key = fingerprint(statement)
+            group = groups.setdefault(key, {"fingerprint": key, "count": 0, "total_ms": 0.0})
+            group["count"] += 1
+            group["total_ms"] += seconds * 1000
+        repeated = [
+            {**group, "total_ms": round(group["total_ms"], 3)}
+            for group in groups.values()
+            if group["count"] >= threshold
+        ]
+        repeated.sort(key=lambda group: group["count"], reverse=True)
+        return repeated
+
+    def slowest_statements(self, limit: int) -> List[Dict[str, Any]]:
+        ranked = sorted(self.statements, key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            {"statement": _WHITESPACE.sub(" ", statement).strip(), "duration_ms": round(seconds * 1000, 3)}
+            for statement, seconds in ranked
+        ]
+
+    def server_timing(self) -> str:
+        """Value for the ``Server-Timing`` response header."""
+        return f'db;dur={self.db_ms:.2f};desc="{self.query_count} queries"'
+
+    def summary(self, slow_limit: int, repeat_threshold: int) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status_code": self.status_code,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "query_count": self.query_count,
+            "db_ms": round(self.db_ms, 3),
+            "slowest_statements": self.slowest_statements(slow_limit),
+            "repeated_statements": self.repeated_statements(repeat_threshold),
+        }
+
+
+class ProfileBuffer:
+    """Bounded, thread-safe store of the most recent request summaries."""
+
+    def __init__(self, maxlen: int):
+        self._lock = threading.Lock()
+        self._items: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+
+    def append(self, item: Dict[str, Any]) -> None:
+        with self._lock:
+            self._items.append(item)
+
+    def items(self) -> List[Dict[str, Any]]:
+        """Stored summaries, newest first."""
+        with self._lock:
+            return list(reversed(self._items))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+profile_buffer = ProfileBuffer(settings.QUERY_PROFILER_BUFFER_SIZE)
+
+_listeners_installed = False
+_install_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    starts = conn.info.get(_START_KEY)
+    if profile is None or not starts:
+        return
+    profile.record(statement, time.perf_counter() - starts.pop())
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get(_START_KEY) if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def install_listeners() -> None:
+    """Register the cursor listeners on all engines (idempotent)."""
+    global _listeners_installed
+    with _install_lock:
+        if _listeners_installed:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _listeners_installed = True
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware that profiles the SQL issued by each HTTP request."""
+
+    def __init__(
+        self,
+        app,
+        buffer: ProfileBuffer = profile_buffer,
+        slow_limit: int = settings.QUERY_PROFILER_SLOW_STATEMENTS,
+        repeat_threshold: int = settings.QUERY_PROFILER_REPEAT_THRESHOLD,
+    ):
+        self.app = app
+        self.buffer = buffer
+        self.slow_limit = slow_limit
+        self.repeat_threshold = repeat_threshold
+        install_listeners()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope.get("method", ""), scope.get("path", ""))
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                headers = list(message.get("headers", []))
+                timing = profile.server_timing()
+                repeated = profile.repeated_statements(self.repeat_threshold)
+                if repeated:
+                    timing += f', n-plus-one;desc="{len(repeated)} repeated statements"'
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            profile.finish(scope)
+            self.buffer.append(profile.summary(self.slow_limit, self.repeat_threshold))
@@ -0,0 +1,73 @@
+"""Read logic written once for sync and async sessions.
+
+A *steps* function is a generator that yields SELECT statements and gets
+each one's buffered ``Result`` back from the ``yield``; its return value is
+the answer. Yielding a list of statements asks for all of them at once and
+gets a list of results back.
+
+``run_steps`` drives a steps function on a sync ``Session`` (one statement
+after another). ``run_steps_async`` awaits every statement on the async
+driver, and runs the statements of a yielded list concurrently, each on its
+own session from ``async_sessionmaker``. So ``def`` routes and native
+``async def`` routes share their queries and formatting, and the async
+variant never runs ORM work through ``run_sync``.
+
+Objects loaded by the async variant may come from sessions that are already
+closed, so steps functions must eager-load every relationship they read.
+"""
+import asyncio
+from typing import Any, Generator, List, TypeVar, Union
+
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable
+
+T = TypeVar("T")
+
+Step = Union[Executable, List[Executable]]
+Steps = Generator[Step, Any, T]
+
+
+def run_steps(db: Session, steps: Steps[T]) -> T:
+    """Run ``steps`` to completion on a sync session."""
+    try:
+        step = next(steps)
+        while True:
+            if isinstance(step, list):
+                outcome: Any = [db.execute(statement) for statement in step]
+            else:
+                outcome = db.execute(step)
+            step = steps.send(outcome)
+    except StopIteration as done:
+        return done.value
+
+
+async def _execute_alone(factory: async_sessionmaker, statement: Executable) -> Result:
+    async with factory() as db:
+        return await db.execute(statement)
+
+
+async def run_steps_async(db: AsyncSession, factory: async_sessionmaker, steps: Steps[T]) -> T:
+    """Run ``steps`` on the async driver; yielded lists run concurrently on sessions from ``factory``."""
+    try:
+        step = next(steps)
+        while True:
+            if isinstance(step, list):
+                outcome: Any = list(await asyncio.gather(
+                    *(_execute_alone(factory, statement) for statement in step)
+                ))
+            else:
+                outcome = await db.execute(step)
+            step = steps.send(outcome)
+    except StopIteration as done:
+        return done.value
+
+
+async def gather_steps(factory: async_sessionmaker, *steps: Steps[Any]) -> List[Any]:
+    """Run several independent steps functions concurrently, each on its own session."""
+    async def run_alone(one: Steps[Any]) -> Any:
+        async with factory() as db:
+            return await run_steps_async(db, factory, one)
+
+    return list(await asyncio.gather(*(run_alone(one) for one in steps)))
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session, Query
 from sqlalchemy import or_
 from app.models.user import User
 from app.core.roles import is_admin, is_privileged
+from app.core.model_access import accessible_model_ids, accessible_model_ids_select
 from app.models.model import Model
 from app.models.model_delegate import ModelDelegate
 from app.models.validation import ValidationRequest, ValidationRequestModelVersion
@@ -35,29 +36,9 @@ def apply_model_rls(query: Query, user: User, db: Session) -> Query:
     if can_see_all_data(user):
         return query
 
-    # For "User" role, filter to:
-    # 1. Approved models they have access to (row_approval_status IS NULL)
-    # 2. Their own submissions regardless of approval status
-    return query.filter(
-        or_(
-            # Approved models where user is owner/developer/shared owner/shared developer/delegate
-            (
-                (Model.row_approval_status == None) &
-                or_(
-                    Model.owner_id == user.user_id,
-                    Model.developer_id == user.user_id,
-                    Model.shared_owner_id == user.user_id,
-                    Model.shared_developer_id == user.user_id,
-                    Model.delegates.any(
-                        (ModelDelegate.user_id == user.user_id) &
-                        (ModelDelegate.revoked_at == None)
-                    )
-                )
-            ),
-            # User's own submissions (Draft, needs_revision, rejected)
-            Model.submitted_by_user_id == user.user_id
-        )
-    )
+    # For "User" role, semi-join the materialized visibility rows
+    # (app/core/model_access.py) instead of evaluating the rules per row
+    return query.filter(Model.model_id.in_(accessible_model_ids_select(user)))
 
 
 def apply_validation_request_rls(query: Query, user: User, db: Session) -> Query:
@@ -104,33 +85,8 @@ def can_access_model(model_id: int, user: User, db: Session) -> bool:
     if can_see_all_data(user):
         return True
 
-    model = db.query(Model).filter(Model.model_id == model_id).first()
-    if not model:
-        return False
-
-    # User can always see their own submissions
-    if model.submitted_by_user_id == user.user_id:
-        return True
-
-    # For approved models only, check ownership/developer/delegate
-    if model.row_approval_status is not None:
-        # Model is Draft/needs_revision/rejected - only submitter can see
-        return False
-
-    # Check if user is owner, developer, shared owner, or shared developer
-    if model.owner_id == user.user_id or model.developer_id == user.user_id:
-        return True
-    if model.shared_owner_id == user.user_id or model.shared_developer_id == user.user_id:
-        return True
-
-    # Check if user is an active delegate
-    delegate = db.query(ModelDelegate).filter(
-        ModelDelegate.model_id == model_id,
-        ModelDelegate.user_id == user.user_id,
-        ModelDelegate.revoked_at == None
-    ).first()
-
-    return delegate is not None
+    # The user's visible model ids are loaded once per session
+    return model_id in accessible_model_ids(db, user)
 
 
 def can_access_validation_request(request_id: int, user: User, db: Session) -> bool:
@@ -239,29 +195,7 @@ def apply_exception_rls(query: Query, user: User, db: Session) -> Query:
         return query
 
     # For "User" role, filter to only exceptions for models they have access to
-    return query.join(
-        Model,
-        ModelException.model_id == Model.model_id
-    ).filter(
-        or_(
-            # Approved models where user is owner/developer/shared owner/shared developer/delegate
-            (
-                (Model.row_approval_status == None) &
-                or_(
-                    Model.owner_id == user.user_id,
-                    Model.developer_id == user.user_id,
-                    Model.shared_owner_id == user.user_id,
-                    Model.shared_developer_id == user.user_id,
-                    Model.delegates.any(
-                        (ModelDelegate.user_id == user.user_id) &
-                        (ModelDelegate.revoked_at == None)
-                    )
-                )
-            ),
-            # User's own submissions (Draft, needs_revision, rejected)
-            Model.submitted_by_user_id == user.user_id
-        )
-    )
+    return query.filter(ModelException.model_id.in_(accessible_model_ids_select(user)))
 
 
 def can_access_exception(exception_id: int, user: User, db: Session) -> bool:
@@ -0,0 +1,58 @@
+"""Startup checks on the registered routes.
+
+FastAPI runs ``def`` endpoints in a worker thread but awaits ``async def``
+endpoints on the event loop. An ``async def`` endpoint that uses a sync
+SQLAlchemy ``Session`` therefore blocks every other request on that worker
+for as long as its queries run. ``check_async_routes`` finds such endpoints
+so the application refuses to start with one.
+"""
+import inspect
+from typing import Callable, Iterable, List, Set
+
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from app.core.database import get_db, get_reporting_db
+
+SYNC_SESSION_DEPENDENCIES: Set[Callable] = {get_db, get_reporting_db}
+
+
+def _uses_dependency(dependant: Dependant, calls: Set[Callable]) -> bool:
+    for dependency in dependant.dependencies:
+        if dependency.call in calls or _uses_dependency(dependency, calls):
+            return True
+    return False
+
+
+def find_async_routes_with_sync_session(
+    routes: Iterable, calls: Set[Callable] = SYNC_SESSION_DEPENDENCIES
+) -> List[str]:
+    """Return "METHOD /path" for every async endpoint that depends on a sync Session."""
+    offenders = []
+    for route in routes:
+        if not isinstance(route, APIRoute) or not inspect.iscoroutinefunction(route.endpoint):
+            continue
+        if _uses_dependency(route.dependant, calls):
+            methods = ",".join(sorted(route.methods or []))
+            offenders.append(f"{methods} {route.path}")
+    return offenders
+
+
+def check_async_routes(app: FastAPI) -> None:
+    """Raise RuntimeError if an ``async def`` route uses a sync Session."""
+    offenders = find_async_routes_with_sync_session(app.routes)
+    if offenders:
+        raise RuntimeError(
+            "async def routes must not use a sync Session (declare them with "
+            "plain def so they run in the threadpool): " + "; ".join(offenders)
+        )
+
+
+def configure_threadpool(max_workers: int) -> None:
+    """Set how many sync endpoints a worker runs concurrently.
+
+    Must be called from the event loop (e.g. in the lifespan handler).
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max_workers
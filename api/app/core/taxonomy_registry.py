@@ -0,0 +1,158 @@
+"""Process-wide registry of taxonomy values keyed by (taxonomy name, code).
+
+Taxonomy values are reference data that change rarely, yet request handlers
+resolve them by name and code constantly. The registry loads every
+(taxonomy, value) pair once with a single query and answers lookups from
+memory, so handlers can filter with plain ``*_id IN (...)`` predicates
+instead of correlated ``.has(TaxonomyValue.code == ...)`` subqueries.
+
+Staleness is bounded three ways:
+- every ORM write to a taxonomy or value bumps the shared ``taxonomy``
+  generation (``app.core.cache_generations``) in its transaction; each
+  worker compares the snapshot's generation once per session and reloads
+  when another process committed a change;
+- a miss, including codes missing from a ``value_ids`` batch, falls back to a
+  direct query, and if the row exists the registry reloads, so values added
+  by raw SQL or migrations are picked up immediately;
+- snapshots expire after ``ttl_seconds`` (covers renames and deletes made
+  outside the ORM).
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.cache_generations import current_generation, track_generation
+from app.models.taxonomy import Taxonomy, TaxonomyValue
+
+TAXONOMY_REGISTRY_TTL_SECONDS = 300
+GENERATION_NAME = "taxonomy"
+
+
+class _Snapshot:
+    """Immutable view of the taxonomy tables at load time."""
+
+    def __init__(self, rows: Iterable[Tuple[str, int, Optional[str], Optional[int]]], generation: int):
+        self.generation = generation
+        self.taxonomy_ids: Dict[str, int] = {}
+        self.value_ids: Dict[Tuple[str, str], int] = {}
+        for taxonomy_name, taxonomy_id, code, value_id in rows:
+            self.taxonomy_ids[taxonomy_name] = taxonomy_id
+            if value_id is not None:
+                self.value_ids[(taxonomy_name, code)] = value_id
+        self.loaded_at = time.monotonic()
+
+
+class TaxonomyRegistry:
+    """Cached (taxonomy_name, code) -> value_id lookups."""
+
+    def __init__(self, ttl_seconds: int = TAXONOMY_REGISTRY_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot; the next lookup reloads it."""
+        self._snapshot = None
+
+    def _stale(self, snapshot: Optional[_Snapshot], generation: int) -> bool:
+        return (
+            snapshot is None
+            or snapshot.generation != generation
+            or time.monotonic() - snapshot.loaded_at > self.ttl_seconds
+        )
+
+    def _load(self, db: Session) -> _Snapshot:
+        # Generation first: a concurrent commit can only make the rows newer than it
+        generation = current_generation(db, GENERATION_NAME)
+        rows = db.query(
+            Taxonomy.name, Taxonomy.taxonomy_id, TaxonomyValue.code, TaxonomyValue.value_id
+        ).outerjoin(
+            TaxonomyValue, TaxonomyValue.taxonomy_id == Taxonomy.taxonomy_id
+        ).all()
+        snapshot = _Snapshot(rows, generation)
+        self._snapshot = snapshot
+        return snapshot
+
+    def _current(self, db: Session) -> _Snapshot:
+        generation = current_generation(db, GENERATION_NAME)
+        snapshot = self._snapshot
+        if self._stale(snapshot, generation):
+            with self._lock:
+                snapshot = self._snapshot
+                if self._stale(snapshot, generation):
+                    snapshot = self._load(db)
+        return snapshot
+
+    def _reload_if_exists(
+        self, db: Session, taxonomy_name: str, codes: Optional[Sequence[str]] = None
+    ) -> _Snapshot:
+        """Reload after a miss, but only if the database actually has one of the rows."""
+        query = db.query(Taxonomy.taxonomy_id).filter(Taxonomy.name == taxonomy_name)
+        if codes is not None:
+            query = query.join(
+                TaxonomyValue, TaxonomyValue.taxonomy_id == Taxonomy.taxonomy_id
+            ).filter(TaxonomyValue.code.in_(codes))
+        if query.first() is None:
+            return self._current(db)
+        with self._lock:
+            return self._load(db)
+
+    def taxonomy_id(self, db: Session, taxonomy_name: str) -> Optional[int]:
+        """Return the taxonomy_id for a taxonomy name, or None if it doesn't exist."""
+        snapshot = self._current(db)
+        taxonomy_id = snapshot.taxonomy_ids.get(taxonomy_name)
+        if taxonomy_id is None:
+            taxonomy_id = self._reload_if_exists(db, taxonomy_name).taxonomy_ids.get(taxonomy_name)
+        return taxonomy_id
+
+    def value_id(self, db: Session, taxonomy_name: str, code: str) -> Optional[int]:
+        """Return the value_id for (taxonomy_name, code), or None if it doesn't exist."""
+        key = (taxonomy_name, code)
+        value_id = self._current(db).value_ids.get(key)
+        if value_id is None:
+            value_id = self._reload_if_exists(db, taxonomy_name, [code]).value_ids.get(key)
+        return value_id
+
+    def value_ids(self, db: Session, taxonomy_name: str, codes: Iterable[str]) -> List[int]:
+        """Return value_ids for the codes that exist (order follows ``codes``).
+
+        Intended for ``column.in_(...)`` filters. Codes missing from the
+        snapshot are looked up in the database once; if any of them exists the
+        registry reloads, otherwise they are skipped.
+        """
+        codes = list(codes)
+        snapshot = self._current(db)
+        missing = [code for code in codes if (taxonomy_name, code) not in snapshot.value_ids]
+        if missing:
+            snapshot = self._reload_if_exists(db, taxonomy_name, missing)
+        return [
+            snapshot.value_ids[(taxonomy_name, code)]
+            for code in codes
+            if (taxonomy_name, code) in snapshot.value_ids
+        ]
+
+    def get_value(self, db: Session, taxonomy_name: str, code: str) -> Optional[TaxonomyValue]:
+        """Return the TaxonomyValue for (taxonomy_name, code) attached to ``db``.
+
+        Uses the session identity map when the value is already loaded, so a
+        hit costs at most one primary-key query.
+        """
+        value_id = self.value_id(db, taxonomy_name, code)
+        if value_id is None:
+            return None
+        value = db.get(TaxonomyValue, value_id)
+        if value is None or value.code != code:
+            # Deleted or recoded since the snapshot was taken
+            with self._lock:
+                self._load(db)
+            value_id = self.value_id(db, taxonomy_name, code)
+            value = db.get(TaxonomyValue, value_id) if value_id is not None else None
+        return value
+
+
+taxonomy_registry = TaxonomyRegistry()
+track_generation(
+    GENERATION_NAME, (Taxonomy, TaxonomyValue), on_commit=taxonomy_registry.invalidate
+)
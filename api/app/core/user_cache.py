@@ -0,0 +1,155 @@
+"""Short-lived cache of authenticated user principals.
+
+get_current_user runs on every request, and the SPA issues 10-20 requests per
+page view. Instead of querying ``users`` (and lazily ``roles``) each time, the
+column values of the user and their role are cached per token subject for a
+few seconds and re-attached to the request's session with
+``Session.merge(load=False)``, which issues no SQL. Relationships that are
+not cached (``lob``, ``regions``) lazy-load as before.
+
+Invalidation: entries are labelled with the shared ``users`` generation
+(``app.core.cache_generations``) read before the user row. ORM changes to a
+user's email, role, status or LOB, user deletes and role updates bump it
+inside the writing transaction; routine writes such as last-login or Entra
+sync fields do not. Each worker re-reads the generation at most every
+``USER_CACHE_GENERATION_SECONDS``, so a cache hit usually issues no SQL: role
+changes and disabled accounts take effect on the next request in the writing
+process and within that interval in the others. A rolled-back write bumps
+nothing. ``USER_CACHE_TTL_SECONDS`` (0 disables the cache) bounds staleness
+from writes made outside the ORM and from the other cached columns.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.cache_generations import recent_generation, track_generation
+from app.core.config import settings
+from app.models.role import Role
+from app.models.user import User
+
+GENERATION_NAME = "users"
+
+# Never keep credentials in the cache; the attribute lazy-loads if needed
+_EXCLUDED_USER_COLUMNS = {"password_hash"}
+
+# User columns that decide who a principal is and what it may do
+PRINCIPAL_COLUMNS = ("email", "role_id", "local_status", "lob_id")
+
+
+def _column_values(instance: Any, exclude: set = frozenset()) -> Dict[str, Any]:
+    return {
+        attr.key: getattr(instance, attr.key)
+        for attr in inspect(type(instance)).column_attrs
+        if attr.key not in exclude
+    }
+
+
+def _detached_copy(model_cls, values: Dict[str, Any]):
+    instance = model_cls(**values)
+    make_transient_to_detached(instance)
+    return instance
+
+
+class UserPrincipal:
+    """Detached snapshot of a user row and its role row."""
+
+    __slots__ = ("user_id", "user_values", "role_values", "generation", "expires_at")
+
+    def __init__(self, user: User, generation: int, ttl_seconds: int):
+        self.user_id = user.user_id
+        self.generation = generation
+        self.user_values = _column_values(user, _EXCLUDED_USER_COLUMNS)
+        self.role_values = _column_values(user.role_ref) if user.role_ref else None
+        self.expires_at = time.monotonic() + ttl_seconds
+
+    @property
+    def local_status(self) -> str:
+        return self.user_values["local_status"]
+
+    @property
+    def role_code(self) -> Optional[str]:
+        return self.role_values["code"] if self.role_values else None
+
+    def attach(self, db: Session) -> User:
+        """Return a session-bound User built from the snapshot without querying."""
+        user = db.merge(_detached_copy(User, self.user_values), load=False)
+        if self.role_values is not None:
+            role = db.merge(_detached_copy(Role, self.role_values), load=False)
+            set_committed_value(user, "role_ref", role)
+        return user
+
+
+class UserPrincipalCache:
+    """Size-bounded LRU of UserPrincipal entries keyed by token subject."""
+
+    def __init__(self, ttl_seconds: int, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, UserPrincipal]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, subject: str, generation: int) -> Optional[UserPrincipal]:
+        """The cached principal for ``subject`` if it was loaded under ``generation``."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            principal = self._entries.get(subject)
+            if principal is None:
+                return None
+            if principal.generation != generation or principal.expires_at <= time.monotonic():
+                del self._entries[subject]
+                return None
+            self._entries.move_to_end(subject)
+            return principal
+
+    def put(self, subject: str, user: User, generation: int) -> None:
+        """Cache ``user``; ``generation`` must have been read before the user row."""
+        if not self.enabled:
+            return
+        principal = UserPrincipal(user, generation, self.ttl_seconds)
+        with self._lock:
+            self._entries[subject] = principal
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+user_principal_cache = UserPrincipalCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_size=settings.USER_CACHE_MAX_SIZE,
+)
+
+
+def current_users_generation(db: Session) -> int:
+    """The ``users`` generation, re-read at most every ``USER_CACHE_GENERATION_SECONDS``."""
+    return recent_generation(db, GENERATION_NAME, settings.USER_CACHE_GENERATION_SECONDS)
+
+
+def _changes_principal(instance, session: Session) -> bool:
+    # New users have no cached entry; deletes and role edits may revoke access
+    if instance in session.new:
+        return False
+    if isinstance(instance, User) and instance not in session.deleted:
+        attrs = inspect(instance).attrs
+        return any(attrs[column].history.has_changes() for column in PRINCIPAL_COLUMNS)
+    return True
+
+
+track_generation(
+    GENERATION_NAME, (User, Role),
+    on_commit=user_principal_cache.clear,
+    should_bump=_changes_principal,
+)
@@ -0,0 +1,270 @@
+"""Materialized due dates for validation requests.
+
+ValidationRequest exposes its due dates as computed properties that look up
+the risk-tier policy, the model's active due-date override and the residual
+risk map on every access. This module stores their values in indexed columns
+(``effective_submission_due_date``, ``grace_period_end_date``,
+``validation_due_date``, ``team_sla_due_date``, ``lead_time_days``,
+``residual_risk_rating``) so dashboards can select overdue requests in SQL
+instead of loading every open request into Python.
+
+Maintenance is incremental. An ``after_flush`` listener collects the requests
+affected by the rows written in that flush and ``after_flush_postexec``
+recomputes only those:
+
+- request, model-version link, status history and scorecard result writes
+  refresh the request and any revalidation that follows it;
+- due-date override writes and model risk-tier changes refresh the model's
+  requests;
+- validation policy writes refresh the requests whose models are in the
+  policy's risk tier (old and new tier when it moves);
+- residual risk map writes refresh the requests that have both a validated
+  risk tier and a scorecard result, the only ones with a residual rating.
+
+Requests are recomputed in a separate session on the flush's connection, so
+the caller's loaded instances are never reloaded; only their materialized
+columns are updated in place. Values are written with a Core UPDATE, so the
+refresh neither dirties the session nor bumps ``updated_at``. The
+hold-adjusted team SLA date is not stored because an open hold extends it
+every day.
+"""
+from datetime import date
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import bindparam, event, inspect, or_, select, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.time import utc_now
+from app.core.validation_memo import prefetch_validation_lookups
+from app.models.due_date_override import ModelDueDateOverride
+from app.models.model import Model
+from app.models.residual_risk_map import ResidualRiskMapConfig
+from app.models.scorecard import ValidationScorecardResult
+from app.models.validation import (
+    ValidationPolicy,
+    ValidationRequest,
+    ValidationRequestModelVersion,
+    ValidationStatusHistory,
+)
+
+DUE_DATE_COLUMNS = (
+    "effective_submission_due_date",
+    "grace_period_end_date",
+    "validation_due_date",
+    "team_sla_due_date",
+    "lead_time_days",
+    "residual_risk_rating",
+)
+
+_PENDING_KEY = "validation_due_dates_pending"
+_CHUNK_SIZE = 500
+
+
+def compute_due_dates(request: ValidationRequest) -> Dict[str, Any]:
+    """Current values of the materialized columns, from the computed properties."""
+    return {
+        "effective_submission_due_date": request.get_submission_due_date(),
+        "grace_period_end_date": request.submission_grace_period_end,
+        "validation_due_date": request.model_validation_due_date,
+        "team_sla_due_date": request.validation_team_sla_due_date,
+        "lead_time_days": request.applicable_lead_time_days,
+        "residual_risk_rating": request.residual_risk,
+    }
+
+
+def _chunks(ids: List[int]) -> Iterable[List[int]]:
+    for start in range(0, len(ids), _CHUNK_SIZE):
+        yield ids[start:start + _CHUNK_SIZE]
+
+
+def _load_requests(db: Session, request_ids: List[int]) -> List[ValidationRequest]:
+    return db.query(ValidationRequest).options(
+        selectinload(ValidationRequest.model_versions_assoc).selectinload(
+            ValidationRequestModelVersion.model
+        ),
+        selectinload(ValidationRequest.prior_validation_request).selectinload(
+            ValidationRequest.current_status
+        ),
+        selectinload(ValidationRequest.current_status),
+        selectinload(ValidationRequest.validation_type),
+        selectinload(ValidationRequest.validated_risk_tier),
+        selectinload(ValidationRequest.scorecard_result),
+    ).filter(
+        ValidationRequest.request_id.in_(request_ids)
+    ).all()
+
+
+def _sync_loaded_instance(db: Session, request_id: int, values: Dict[str, Any]) -> None:
+    """Set the new values on the caller's instance of a request, if it has one loaded.
+
+    Only the materialized columns are touched, and not those the caller has
+    assigned since the last flush.
+    """
+    instance = db.identity_map.get(db.identity_key(ValidationRequest, request_id))
+    if instance is None:
+        return
+    attrs = inspect(instance).attrs
+    for key, value in values.items():
+        if not attrs[key].history.has_changes():
+            set_committed_value(instance, key, value)
+
+
+def _write(db: Session, requests: List[ValidationRequest]) -> int:
+    if not requests:
+        return 0
+    refreshed_at = utc_now()
+    rows = []
+    for request in requests:
+        values = compute_due_dates(request)
+        values["due_dates_refreshed_at"] = refreshed_at
+        rows.append({"_request_id": request.request_id, **{f"_{k}": v for k, v in values.items()}})
+        _sync_loaded_instance(db, request.request_id, values)
+
+    table = ValidationRequest.__table__
+    stmt = update(table).where(
+        table.c.request_id == bindparam("_request_id")
+    ).values(
+        # Assigning the column to itself keeps onupdate=utc_now from firing
+        updated_at=table.c.updated_at,
+        due_dates_refreshed_at=bindparam("_due_dates_refreshed_at"),
+        **{column: bindparam(f"_{column}") for column in DUE_DATE_COLUMNS},
+    )
+    db.connection().execute(stmt, rows)
+    return len(rows)
+
+
+def _refresh(db: Session, request_ids: Optional[Iterable[int]]) -> int:
+    if request_ids is None:
+        ids = list(db.execute(select(ValidationRequest.request_id)).scalars())
+    else:
+        ids = sorted(set(request_ids))
+    if not ids:
+        return 0
+    # A private session on the same connection sees this transaction's
+    # flushed rows without reloading (or overwriting) the caller's instances.
+    work = Session(bind=db.connection(), autoflush=False)
+    try:
+        written = 0
+        for chunk in _chunks(ids):
+            prefetch_validation_lookups(work, chunk)
+            written += _write(db, _load_requests(work, chunk))
+            work.expunge_all()
+        return written
+    finally:
+        work.close()
+
+
+def refresh_validation_due_dates(db: Session, request_ids: Optional[Iterable[int]] = None) -> int:
+    """Recompute the materialized due-date columns.
+
+    Args:
+        db: Database session. Pending changes are flushed first; the caller
+            commits.
+        request_ids: Requests to refresh, or None for every request.
+
+    Returns:
+        Number of requests written.
+    """
+    db.flush()
+    return _refresh(db, request_ids)
+
+
+def submission_overdue_candidates(today: date):
+    """Filter for requests whose submission may be past due on ``today``.
+
+    Rows that were never materialized are included so callers can check
+    them with the computed properties.
+    """
+    return or_(
+        ValidationRequest.due_dates_refreshed_at.is_(None),
+        ValidationRequest.submission_due_date < today,
+        ValidationRequest.effective_submission_due_date < today,
+        ValidationRequest.grace_period_end_date < today,
+    )
+
+
+def validation_overdue_candidates(today: date):
+    """Filter for requests whose model validation may be past due on ``today``."""
+    return or_(
+        ValidationRequest.due_dates_refreshed_at.is_(None),
+        ValidationRequest.validation_due_date < today,
+    )
+
+
+def _pending(session: Session) -> Dict[str, Any]:
+    pending = session.info.get(_PENDING_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_KEY] = {
+            "residual_risk_map": False,
+            "request_ids": set(),
+            "model_ids": set(),
+            "risk_tier_ids": set(),
+        }
+    return pending
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_affected_requests(session: Session, flush_context) -> None:
+    """Record which requests the rows in this flush can affect."""
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, ResidualRiskMapConfig):
+            _pending(session)["residual_risk_map"] = True
+        elif isinstance(instance, ValidationPolicy):
+            # Includes the previous tier of a policy moved between tiers
+            history = inspect(instance).attrs.risk_tier_id.history
+            _pending(session)["risk_tier_ids"].update(
+                tier_id for tier_id in chain(history.sum(), history.deleted)
+                if tier_id is not None
+            )
+        elif isinstance(instance, ValidationRequest):
+            if instance not in session.deleted and instance.request_id is not None:
+                _pending(session)["request_ids"].add(instance.request_id)
+        elif isinstance(instance, (ValidationRequestModelVersion, ValidationStatusHistory, ValidationScorecardResult)):
+            if instance.request_id is not None:
+                _pending(session)["request_ids"].add(instance.request_id)
+        elif isinstance(instance, ModelDueDateOverride):
+            if instance.model_id is not None:
+                _pending(session)["model_ids"].add(instance.model_id)
+        elif isinstance(instance, Model) and instance in session.dirty:
+            if inspect(instance).attrs.risk_tier_id.history.has_changes():
+                _pending(session)["model_ids"].add(instance.model_id)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _refresh_affected_requests(session: Session, flush_context) -> None:
+    """Recompute the requests collected by ``_collect_affected_requests``."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+
+    request_ids: Set[int] = set(pending["request_ids"])
+    if pending["residual_risk_map"]:
+        request_ids.update(session.execute(
+            select(ValidationRequest.request_id).join(
+                ValidationScorecardResult,
+                ValidationScorecardResult.request_id == ValidationRequest.request_id,
+            ).where(ValidationRequest.validated_risk_tier_id.isnot(None))
+        ).scalars())
+    if pending["risk_tier_ids"]:
+        request_ids.update(session.execute(
+            select(ValidationRequestModelVersion.request_id).join(
+                Model, Model.model_id == ValidationRequestModelVersion.model_id
+            ).where(Model.risk_tier_id.in_(pending["risk_tier_ids"]))
+        ).scalars())
+    if pending["model_ids"]:
+        request_ids.update(session.execute(
+            select(ValidationRequestModelVersion.request_id).where(
+                ValidationRequestModelVersion.model_id.in_(pending["model_ids"])
+            )
+        ).scalars())
+    if pending["request_ids"]:
+        # Revalidations date from their prior request's approval
+        request_ids.update(session.execute(
+            select(ValidationRequest.request_id).where(
+                ValidationRequest.prior_validation_request_id.in_(pending["request_ids"])
+            )
+        ).scalars())
+    if request_ids:
+        _refresh(session, request_ids)
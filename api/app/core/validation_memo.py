@@ -0,0 +1,160 @@
+"""Session-scoped memo of the reference rows behind ValidationRequest's
+computed properties.
+
+``_get_policy_for_request``, ``_get_active_override_date``,
+``applicable_lead_time_days`` and ``residual_risk`` each need a
+ValidationPolicy (by risk tier), the model's active ModelDueDateOverride or
+the active ResidualRiskMapConfig. Querying for them on every property access
+turns a loop over N requests into several N queries. The memo lives in
+``Session.info`` so it shares the session's transaction and identity map:
+
+- policies, the Validation workflow SLA and the residual risk map are loaded
+  once, on first use;
+- overrides are loaded per model on first use, or in bulk for a list of
+  requests with ``prefetch_validation_lookups``.
+
+The memo is dropped when the session has pending or flushed writes to any of
+those tables and at the end of every transaction, so it never outlives the
+data it was read from.
+"""
+from itertools import chain
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.models.due_date_override import ModelDueDateOverride
+from app.models.residual_risk_map import ResidualRiskMapConfig
+from app.models.validation import (
+    ValidationPolicy,
+    ValidationRequestModelVersion,
+    ValidationWorkflowSLA,
+)
+
+_MEMO_KEY = "validation_lookup_memo"
+_NOT_LOADED = object()
+_MEMOIZED_TYPES = (ValidationPolicy, ModelDueDateOverride, ValidationWorkflowSLA, ResidualRiskMapConfig)
+
+
+class ValidationLookupMemo:
+    """Reference rows for one session, loaded lazily and at most once."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._policies: Optional[Dict[int, ValidationPolicy]] = None
+        self._overrides: Dict[int, Optional[ModelDueDateOverride]] = {}
+        self._workflow_sla = _NOT_LOADED
+        self._residual_risk_config = _NOT_LOADED
+
+    def _load_policies(self) -> Dict[int, ValidationPolicy]:
+        if self._policies is None:
+            self._policies = {}
+            policies = self.session.query(ValidationPolicy).order_by(ValidationPolicy.policy_id).all()
+            for policy in policies:
+                self._policies.setdefault(policy.risk_tier_id, policy)
+        return self._policies
+
+    def policy_for_tier(self, risk_tier_id: Optional[int]) -> Optional[ValidationPolicy]:
+        if risk_tier_id is None:
+            return None
+        return self._load_policies().get(risk_tier_id)
+
+    def active_override(self, model_id: int) -> Optional[ModelDueDateOverride]:
+        if model_id not in self._overrides:
+            self.prefetch_overrides([model_id])
+        return self._overrides[model_id]
+
+    def prefetch_overrides(self, model_ids: Iterable[int]) -> None:
+        """Load active overrides for every model not yet memoized (one query)."""
+        missing = {model_id for model_id in model_ids if model_id not in self._overrides}
+        if not missing:
+            return
+        overrides = self.session.query(ModelDueDateOverride).filter(
+            ModelDueDateOverride.model_id.in_(missing),
+            ModelDueDateOverride.is_active == True
+        ).order_by(ModelDueDateOverride.override_id).all()
+        for model_id in missing:
+            self._overrides[model_id] = None
+        for override in overrides:
+            if self._overrides[override.model_id] is None:
+                self._overrides[override.model_id] = override
+
+    @property
+    def workflow_sla(self) -> Optional[ValidationWorkflowSLA]:
+        """The Validation workflow SLA configuration, if any."""
+        if self._workflow_sla is _NOT_LOADED:
+            self._workflow_sla = self.session.query(ValidationWorkflowSLA).filter(
+                ValidationWorkflowSLA.workflow_type == "Validation"
+            ).first()
+        return self._workflow_sla
+
+    @property
+    def residual_risk_config(self) -> Optional[ResidualRiskMapConfig]:
+        """The active residual risk map configuration, if any."""
+        if self._residual_risk_config is _NOT_LOADED:
+            self._residual_risk_config = self.session.query(ResidualRiskMapConfig).filter(
+                ResidualRiskMapConfig.is_active == True
+            ).first()
+        return self._residual_risk_config
+
+    def prefetch(self, model_ids: Iterable[int]) -> None:
+        """Load policies, the residual risk map and the given models' overrides."""
+        self._load_policies()
+        _ = self.residual_risk_config
+        self.prefetch_overrides(model_ids)
+
+
+def _has_pending_reference_writes(session: Session) -> bool:
+    return any(
+        isinstance(instance, _MEMOIZED_TYPES)
+        for instance in chain(session.new, session.dirty, session.deleted)
+    )
+
+
+def get_validation_memo(session: Session) -> ValidationLookupMemo:
+    """Return the session's memo, creating it on first use.
+
+    Unflushed changes to a memoized table discard the memo, so the next
+    lookup queries (and autoflushes) exactly as an uncached query would.
+    """
+    memo = session.info.get(_MEMO_KEY)
+    if memo is None or _has_pending_reference_writes(session):
+        memo = session.info[_MEMO_KEY] = ValidationLookupMemo(session)
+    return memo
+
+
+def prefetch_validation_lookups(session: Session, request_ids: Iterable[int]) -> ValidationLookupMemo:
+    """Warm the memo for a batch of requests.
+
+    Loads policies, the residual risk map and the active overrides for every
+    model linked to ``request_ids``, so computed properties evaluated over the
+    batch issue no further lookup queries.
+    """
+    memo = get_validation_memo(session)
+    request_ids = list(request_ids)
+    model_ids = []
+    if request_ids:
+        model_ids = session.execute(
+            select(ValidationRequestModelVersion.model_id).where(
+                ValidationRequestModelVersion.request_id.in_(request_ids)
+            ).distinct()
+        ).scalars().all()
+    memo.prefetch(model_ids)
+    return memo
+
+
+def clear_validation_memo(session: Session) -> None:
+    session.info.pop(_MEMO_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_memo_on_reference_writes(session: Session, flush_context) -> None:
+    """Drop the memo when this flush wrote a memoized table."""
+    if _MEMO_KEY in session.info and _has_pending_reference_writes(session):
+        clear_validation_memo(session)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_memo_at_transaction_end(session: Session, *args) -> None:
+    clear_validation_memo(session)
@@ -1,16 +1,41 @@
 """FastAPI application entry point."""
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from app.api import auth, users, roles, models, vendors, taxonomies, audit_logs, validation_workflow, validation_policies, workflow_sla, regions, model_regions, model_versions, model_delegates, model_change_taxonomy, model_types, methodology, dashboard, export_views, version_deployment_tasks, regional_compliance_report, analytics, saved_queries, model_hierarchy, model_dependencies, approver_roles, conditional_approval_rules, fry, map_applications, model_applications, overdue_commentary, overdue_revalidation_report, decommissioning, kpm, monitoring, recommendations, risk_assessment, qualitative_factors, scorecard, residual_risk_map, limitations, model_overlays, attestations, lob_units, kpi_report, irp, my_portfolio, exceptions, mrsa_review_policy, teams, tags, due_date_override
-from app.core.database import get_db
+from app.api import async_reads, auth, users, roles, models, vendors, taxonomies, audit_logs, validation_workflow, validation_policies, workflow_sla, regions, model_regions, model_versions, model_delegates, model_change_taxonomy, model_types, methodology, dashboard, export_views, version_deployment_tasks, regional_compliance_report, analytics, saved_queries, model_hierarchy, model_dependencies, approver_roles, conditional_approval_rules, fry, map_applications, model_applications, overdue_commentary, overdue_revalidation_report, decommissioning, kpm, monitoring, recommendations, risk_assessment, qualitative_factors, scorecard, residual_risk_map, limitations, model_overlays, attestations, lob_units, kpi_report, irp, my_portfolio, exceptions, mrsa_review_policy, teams, tags, due_date_override, pdf_jobs
+from app.core.audit_partitions import maintain_audit_log_partitions
+from app.core.database import engine, get_db, get_pool_metrics
+from app.core.db_metrics import DBRouteContextMiddleware
+from app.core.query_profiler import QueryProfilerMiddleware, profile_buffer
+from app.core.route_checks import check_async_routes, configure_threadpool
+from app.core.deps import get_current_user
+from app.core.roles import is_admin
+from app.models.user import User
 from app.core.config import settings
+from app.core.kpi_cache import invalidate_kpi_cache_on_write
+from app.core.pdf_jobs import shutdown_pdf_job_runner
 from app.core.exception_detection import get_missing_closure_reason_codes
 
-app = FastAPI(title="QMIS v0.1", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    configure_threadpool(settings.THREADPOOL_MAX_WORKERS)
+    partition_task = asyncio.create_task(maintain_audit_log_partitions(
+        engine, settings.AUDIT_LOG_PARTITION_MONTHS_AHEAD, settings.AUDIT_LOG_PARTITION_CHECK_SECONDS
+    ))
+    yield
+    partition_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await partition_task
+    shutdown_pdf_job_runner()
+
+
+app = FastAPI(title="QMIS v0.1", version="0.1.0", lifespan=lifespan)
 
 # CORS - uses environment-based origins from config
 app.add_middleware(
@@ -37,7 +62,19 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Outermost, so pool telemetry can attribute connections to routes
+app.add_middleware(DBRouteContextMiddleware)
+
+# Opt-in SQL profiler: Server-Timing headers and GET /debug/profiles
+if settings.QUERY_PROFILER_ENABLED:
+    app.add_middleware(QueryProfilerMiddleware)
+
 # Routes
+# Native async variants of the news feed and monitoring tasks; registered
+# first so they take precedence over the sync routes on the same paths
+if settings.ASYNC_DB_ENABLED:
+    app.include_router(async_reads.router, tags=["async-reads"])
+
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(users.router, tags=["users"])
 app.include_router(roles.router, tags=["roles"])
@@ -58,7 +95,8 @@ app.include_router(audit_logs.router, prefix="/audit-logs",
                    tags=["audit-logs"])
 # Workflow-based validation endpoints
 app.include_router(validation_workflow.router,
-                   prefix="/validation-workflow", tags=["validation-workflow"])
+                   prefix="/validation-workflow", tags=["validation-workflow"],
+                   dependencies=[Depends(invalidate_kpi_cache_on_write)])
 # Validation policies endpoint
 app.include_router(validation_policies.router,
                    prefix="/validation-workflow/policies", tags=["validation-policies"])
@@ -100,13 +138,16 @@ app.include_router(overdue_revalidation_report.router, tags=["reports"])
 app.include_router(due_date_override.router,
                    prefix="/models", tags=["due-date-override"])
 # Model decommissioning workflow
-app.include_router(decommissioning.router, tags=["decommissioning"])
+app.include_router(decommissioning.router, tags=["decommissioning"],
+                   dependencies=[Depends(invalidate_kpi_cache_on_write)])
 # KPM (Key Performance Metrics) library
 app.include_router(kpm.router, tags=["kpm"])
 # Monitoring Plans and Teams
-app.include_router(monitoring.router, tags=["monitoring"])
+app.include_router(monitoring.router, tags=["monitoring"],
+                   dependencies=[Depends(invalidate_kpi_cache_on_write)])
 # Model Recommendations
-app.include_router(recommendations.router, tags=["recommendations"])
+app.include_router(recommendations.router, tags=["recommendations"],
+                   dependencies=[Depends(invalidate_kpi_cache_on_write)])
 # Model Risk Assessment
 app.include_router(risk_assessment.router, tags=["risk-assessment"])
 # Qualitative Risk Factor Configuration (Admin)
@@ -138,6 +179,8 @@ app.include_router(mrsa_review_policy.router, tags=["mrsa-review"])
 app.include_router(exceptions.router, prefix="/exceptions", tags=["exceptions"])
 # Model Tags for categorization
 app.include_router(tags.router, prefix="/tags", tags=["tags"])
+# Background PDF jobs
+app.include_router(pdf_jobs.router, prefix="/pdf-jobs", tags=["pdf-jobs"])
 
 
 @app.get("/")
@@ -170,5 +213,30 @@ def readiness(db: Session = Depends(get_db)):
     return {"status": "ok", "checks": {"database": "ok", "exception_closure_reasons": "ok"}}
 
 
+@app.get("/metrics/db-pool")
+def db_pool_metrics(current_user: User = Depends(get_current_user)):
+    """Connection pool state and per-route connection hold times (Admin only)."""
+    if not is_admin(current_user):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return get_pool_metrics()
+
+
+@app.get("/debug/profiles")
+def debug_profiles(
+    limit: int = 50,
+    current_user: User = Depends(get_current_user),
+):
+    """Recent request SQL profiles, newest first (Admin only)."""
+    if not is_admin(current_user):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return {
+        "enabled": settings.QUERY_PROFILER_ENABLED,
+        "profiles": profile_buffer.items()[:max(limit, 0)],
+    }
+
+
 app.get("/healthz")(healthcheck)
 app.get("/readyz")(readiness)
+
+# Fail fast if an async def route would run sync DB work on the event loop
+check_async_routes(app)
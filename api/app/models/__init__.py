@@ -123,6 +123,9 @@ from app.models.attestation import (
 )
 from app.models.model_exception import ModelException, ModelExceptionStatusHistory
 from app.models.tag import TagCategory, Tag, ModelTag, ModelTagHistory
+from app.models.kpi_snapshot import KpiMetricSnapshot
+from app.models.user_model_access import UserModelAccess
+from app.models.cache_generation import CacheGeneration
 
 __all__ = [
     # LOB (Line of Business) hierarchy
@@ -277,4 +280,18 @@ __all__ = [
     "Tag",
     "ModelTag",
     "ModelTagHistory",
+    # KPI Report snapshots
+    "KpiMetricSnapshot",
+    # Materialized row-level security visibility
+    "UserModelAccess",
+    # Shared generation counters of in-process caches
+    "CacheGeneration",
 ]
+
+# Registers the flush listeners that keep ValidationRequest's materialized
+# due-date columns current (imported last: it depends on the models above).
+from app.core import validation_due_dates  # noqa: E402,F401
+# Same for the user_model_access visibility rows behind row-level security.
+from app.core import model_access  # noqa: E402,F401
+# And the cache generation bumps behind the in-process taxonomy registry.
+from app.core import taxonomy_registry  # noqa: E402,F401
@@ -234,6 +234,8 @@ class AttestationRecord(Base):
         UniqueConstraint('cycle_id', 'model_id', name='uq_attestation_cycle_model'),
         Index('ix_attestation_records_status', 'status'),
         Index('ix_attestation_records_due_date', 'due_date'),
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_attestation_records_model_id_attested_at', 'model_id', 'attested_at'),
     )
 
     # Relationships
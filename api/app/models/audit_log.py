@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -13,7 +14,13 @@ if TYPE_CHECKING:
 
 
 class AuditLog(Base):
-    """Audit log table for tracking model changes."""
+    """Audit log table for tracking model changes.
+
+    On PostgreSQL the table is partitioned by month on ``timestamp`` and
+    ``changes`` is JSONB with a GIN index (migration ``alp001``); the primary
+    key there is ``(log_id, timestamp)``, with ``log_id`` still unique from
+    its sequence.
+    """
     __tablename__ = "audit_logs"
 
     log_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -21,8 +28,17 @@ class AuditLog(Base):
     entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
     action: Mapped[str] = mapped_column(String(50), nullable=False)  # CREATE, UPDATE, DELETE
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.user_id"), nullable=False)
-    changes: Mapped[dict] = mapped_column(JSON, nullable=True)  # JSON of what changed
+    changes: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=True
+    )  # JSON of what changed
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=utc_now, nullable=False)
 
+    # Serve the entity history, per-user and unfiltered listings newest first
+    __table_args__ = (
+        Index("ix_audit_logs_entity_timestamp", "entity_type", "entity_id", "timestamp"),
+        Index("ix_audit_logs_user_timestamp", "user_id", "timestamp"),
+        Index("ix_audit_logs_timestamp_log_id", "timestamp", "log_id"),
+    )
+
     # Relationship to user
     user: Mapped["User"] = relationship("User")
@@ -0,0 +1,25 @@
+"""Shared generation counters for in-process caches.
+
+One row per cache name. Writes that invalidate a cache increment its row in
+the same transaction, so every worker process sees the new generation exactly
+when the change itself becomes visible. Maintained by
+``app.core.cache_generations``.
+"""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.core.time import utc_now
+
+
+class CacheGeneration(Base):
+    """Generation counter of one process-local cache."""
+    __tablename__ = "cache_generations"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    generation: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utc_now, onupdate=utc_now
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, date
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Integer, Text, DateTime, Date, ForeignKey, Boolean, CheckConstraint, UniqueConstraint
+from sqlalchemy import String, Integer, Text, DateTime, Date, ForeignKey, Boolean, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -94,12 +94,18 @@ class DecommissioningRequest(Base):
 
     __table_args__ = (
         CheckConstraint('model_id != replacement_model_id', name='chk_different_models'),
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_decommissioning_requests_model_id_created_at', 'model_id', 'created_at'),
     )
 
 
 class DecommissioningStatusHistory(Base):
     """Audit trail for decommissioning request status changes."""
     __tablename__ = "decommissioning_status_history"
+    __table_args__ = (
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_decommissioning_status_history_request_id_changed_at', 'request_id', 'changed_at'),
+    )
 
     history_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     request_id: Mapped[int] = mapped_column(
@@ -0,0 +1,62 @@
+"""KPI metric snapshots.
+
+One row per (as_of_date, region, team, metric) holding the metric value as it
+was computed by the KPI report on that date. Snapshots let the report serve
+historical values and trend lines without recomputing from raw tables.
+"""
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, Float, Date, DateTime, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.core.time import utc_now
+
+
+class KpiMetricSnapshot(Base):
+    """Materialized KPI metric value for one day and report scope.
+
+    Scope semantics mirror the KPI report filters:
+    - region_id: NULL = All Regions
+    - team_id: NULL = All Teams, 0 = Unassigned
+
+    The scalar columns (count/duration/numerator/denominator/percentage) are
+    kept for cheap trend queries; ``payload`` holds the full serialized
+    KPIMetric so a snapshot report can be rebuilt exactly.
+    """
+    __tablename__ = "kpi_metric_snapshots"
+
+    snapshot_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    as_of_date: Mapped[date] = mapped_column(Date, nullable=False)
+    region_id: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, comment="NULL = All Regions"
+    )
+    team_id: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, comment="NULL = All Teams, 0 = Unassigned"
+    )
+    region_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    team_name: Mapped[str] = mapped_column(String(200), nullable=False)
+
+    metric_id: Mapped[str] = mapped_column(String(20), nullable=False)
+    metric_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    category: Mapped[str] = mapped_column(String(100), nullable=False)
+    metric_type: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    count_value: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    duration_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    numerator: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    denominator: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    percentage: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    breakdown: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+
+    total_active_models: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    report_generated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utc_now)
+
+    __table_args__ = (
+        Index("ix_kpi_metric_snapshots_scope_date", "region_id", "team_id", "as_of_date"),
+        Index("ix_kpi_metric_snapshots_metric_date", "metric_id", "as_of_date"),
+    )
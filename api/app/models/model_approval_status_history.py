@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -19,6 +19,10 @@ class ModelApprovalStatusHistory(Base):
     APPROVED -> EXPIRED, etc.) for compliance and audit purposes.
     """
     __tablename__ = "model_approval_status_history"
+    __table_args__ = (
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_model_approval_status_history_model_id_changed_at', 'model_id', 'changed_at'),
+    )
 
     history_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     model_id: Mapped[int] = mapped_column(
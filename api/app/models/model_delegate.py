@@ -1,7 +1,7 @@
 """Model delegate model - permissions for non-owner users to manage models."""
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Integer, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, Boolean, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -48,6 +48,8 @@ class ModelDelegate(Base):
     # Unique constraint: one delegation per model-user pair (active or revoked)
     __table_args__ = (
         UniqueConstraint('model_id', 'user_id', name='uq_model_delegate'),
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_model_delegates_model_id_delegated_at', 'model_id', 'delegated_at'),
     )
 
     # Relationships
@@ -190,6 +190,8 @@ class ModelException(Base):
             "status != 'CLOSED' OR (closure_reason_id IS NOT NULL AND closure_narrative IS NOT NULL)",
             name="ck_model_exceptions_closure_requirements"
         ),
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_model_exceptions_model_id_detected_at', 'model_id', 'detected_at'),
     )
 
 
@@ -1,6 +1,6 @@
 """Model Pending Edit - stores proposed changes to approved models awaiting admin approval."""
 from datetime import datetime, UTC
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
@@ -13,6 +13,10 @@ class ModelPendingEdit(Base):
     instead of applying the changes directly, they are stored here for admin review.
     """
     __tablename__ = "model_pending_edits"
+    __table_args__ = (
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_model_pending_edits_model_id_requested_at', 'model_id', 'requested_at'),
+    )
 
     pending_edit_id = Column(Integer, primary_key=True, autoincrement=True)
     model_id = Column(Integer, ForeignKey("models.model_id", ondelete="CASCADE"), nullable=False)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 class ModelSubmissionComment(Base):
     """Model submission comment table - tracks conversation between submitter and admin."""
     __tablename__ = "model_submission_comments"
+    __table_args__ = (
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_model_submission_comments_model_id_created_at', 'model_id', 'created_at'),
+    )
 
     comment_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     model_id: Mapped[int] = mapped_column(
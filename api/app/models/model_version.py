@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, date
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Integer, Text, DateTime, Date, ForeignKey, Boolean, UniqueConstraint
+from sqlalchemy import String, Integer, Text, DateTime, Date, ForeignKey, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -22,6 +22,8 @@ class ModelVersion(Base):
     __tablename__ = "model_versions"
     __table_args__ = (
         UniqueConstraint('model_id', 'version_number', name='uq_model_versions_model_id_version_number'),
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_model_versions_model_id_created_at', 'model_id', 'created_at'),
     )
 
     version_id: Mapped[int] = mapped_column(Integer, primary_key=True)
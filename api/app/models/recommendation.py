@@ -7,7 +7,7 @@ from datetime import datetime, date
 from typing import Optional, List
 from sqlalchemy import (
     String, Integer, Text, Boolean, ForeignKey, DateTime, Date,
-    UniqueConstraint, CheckConstraint
+    UniqueConstraint, CheckConstraint, Index
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
@@ -255,6 +255,10 @@ class ClosureEvidence(Base):
 class RecommendationStatusHistory(Base):
     """Complete audit trail of all status changes."""
     __tablename__ = "recommendation_status_history"
+    __table_args__ = (
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_recommendation_status_history_recommendation_id_changed_at', 'recommendation_id', 'changed_at'),
+    )
 
     history_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     recommendation_id: Mapped[int] = mapped_column(
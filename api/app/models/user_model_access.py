@@ -0,0 +1,23 @@
+"""Materialized per-user model visibility.
+
+One row per (user, model) pair the row-level security rules grant to a
+non-privileged user: the user owns, develops, shares or is an active delegate
+of an approved model, or submitted the model. Maintained by
+``app.core.model_access``; privileged roles bypass it.
+"""
+from sqlalchemy import Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class UserModelAccess(Base):
+    """A model visible to a user under row-level security."""
+    __tablename__ = "user_model_access"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True
+    )
+    model_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("models.model_id", ondelete="CASCADE"), primary_key=True, index=True
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, date, timedelta
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Integer, Text, ForeignKey, DateTime, Date, Boolean, Float, Table, Column
+from sqlalchemy import String, Integer, Text, ForeignKey, DateTime, Date, Boolean, Float, Table, Column, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -223,6 +223,38 @@ class ValidationRequest(Base):
         comment="Snapshot of model's risk tier at the moment of validation approval"
     )
 
+    # Materialized due dates, maintained by app.core.validation_due_dates on flush.
+    # The computed properties below remain the source of truth; these columns
+    # let dashboards select overdue requests with an indexed range query.
+    effective_submission_due_date: Mapped[Optional[date]] = mapped_column(
+        Date, nullable=True, index=True,
+        comment="Materialized get_submission_due_date() (override applied)"
+    )
+    grace_period_end_date: Mapped[Optional[date]] = mapped_column(
+        Date, nullable=True, index=True,
+        comment="Materialized submission_grace_period_end"
+    )
+    validation_due_date: Mapped[Optional[date]] = mapped_column(
+        Date, nullable=True, index=True,
+        comment="Materialized model_validation_due_date"
+    )
+    team_sla_due_date: Mapped[Optional[date]] = mapped_column(
+        Date, nullable=True,
+        comment="Materialized validation_team_sla_due_date (before hold adjustment)"
+    )
+    lead_time_days: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True,
+        comment="Materialized applicable_lead_time_days"
+    )
+    residual_risk_rating: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True,
+        comment="Materialized residual_risk"
+    )
+    due_dates_refreshed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True,
+        comment="When the materialized due-date columns were last recomputed (NULL = never)"
+    )
+
     # Relationships
     # Association object for model-version tracking
     model_versions_assoc: Mapped[List["ValidationRequestModelVersion"]] = relationship(
@@ -339,9 +371,8 @@ class ValidationRequest(Base):
         if not session:
             return None
 
-        policy = session.query(ValidationPolicy).filter(
-            ValidationPolicy.risk_tier_id == model.risk_tier_id
-        ).first()
+        from app.core.validation_memo import get_validation_memo
+        policy = get_validation_memo(session).policy_for_tier(model.risk_tier_id)
 
         if not policy:
             return None
@@ -389,11 +420,8 @@ class ValidationRequest(Base):
         if not session:
             return None
 
-        from app.models.due_date_override import ModelDueDateOverride
-        override = session.query(ModelDueDateOverride).filter(
-            ModelDueDateOverride.model_id == model_id,
-            ModelDueDateOverride.is_active == True
-        ).first()
+        from app.core.validation_memo import get_validation_memo
+        override = get_validation_memo(session).active_override(model_id)
 
         if override:
             return override.override_date
@@ -412,9 +440,8 @@ class ValidationRequest(Base):
         if not session:
             return None
 
-        return session.query(ValidationPolicy).filter(
-            ValidationPolicy.risk_tier_id == model.risk_tier_id
-        ).first()
+        from app.core.validation_memo import get_validation_memo
+        return get_validation_memo(session).policy_for_tier(model.risk_tier_id)
 
     @property
     def applicable_lead_time_days(self) -> int:
@@ -441,14 +468,15 @@ class ValidationRequest(Base):
         if not session:
             return 90  # Default fallback
 
+        from app.core.validation_memo import get_validation_memo
+        memo = get_validation_memo(session)
+
         # Collect lead times from all models' policies
         lead_times = []
         for assoc in self.model_versions_assoc:
             model = assoc.model
             if model and model.risk_tier_id:
-                policy = session.query(ValidationPolicy).filter(
-                    ValidationPolicy.risk_tier_id == model.risk_tier_id
-                ).first()
+                policy = memo.policy_for_tier(model.risk_tier_id)
                 if policy:
                     lead_times.append(policy.model_change_lead_time_days)
 
@@ -508,9 +536,8 @@ class ValidationRequest(Base):
         if not session:
             return None
 
-        policy = session.query(ValidationPolicy).filter(
-            ValidationPolicy.risk_tier_id == model.risk_tier_id
-        ).first()
+        from app.core.validation_memo import get_validation_memo
+        policy = get_validation_memo(session).policy_for_tier(model.risk_tier_id)
 
         if not policy:
             return None
@@ -752,10 +779,8 @@ class ValidationRequest(Base):
         if not session:
             return None
 
-        from app.models.residual_risk_map import ResidualRiskMapConfig
-        config = session.query(ResidualRiskMapConfig).filter(
-            ResidualRiskMapConfig.is_active == True
-        ).first()
+        from app.core.validation_memo import get_validation_memo
+        config = get_validation_memo(session).residual_risk_config
 
         if not config or not config.matrix_config:
             return None
@@ -773,6 +798,10 @@ class ValidationRequest(Base):
 class ValidationStatusHistory(Base):
     """Audit trail for validation status changes."""
     __tablename__ = "validation_status_history"
+    __table_args__ = (
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_validation_status_history_request_id_changed_at', 'request_id', 'changed_at'),
+    )
 
     history_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     request_id: Mapped[int] = mapped_column(
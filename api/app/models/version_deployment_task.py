@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Integer, Text, DateTime, Date, ForeignKey, Boolean
+from sqlalchemy import String, Integer, Text, DateTime, Date, ForeignKey, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from app.core.time import utc_now
@@ -18,6 +18,10 @@ if TYPE_CHECKING:
 class VersionDeploymentTask(Base):
     """Tracks Model Owner confirmation of version deployments."""
     __tablename__ = "version_deployment_tasks"
+    __table_args__ = (
+        # Keyset scans of the model activity stream (app/core/model_activity.py)
+        Index('ix_version_deployment_tasks_model_id_confirmed_at', 'model_id', 'confirmed_at'),
+    )
 
     task_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     version_id: Mapped[int] = mapped_column(
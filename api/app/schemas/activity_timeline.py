@@ -20,9 +20,11 @@ class ActivityTimelineItem(BaseModel):
 
 
 class ActivityTimelineResponse(BaseModel):
-    """Response containing all activities for a model."""
+    """One page of a model's activities, newest first."""
     model_id: int
     model_name: str
     activities: List[ActivityTimelineItem]
-    total_count: int
+    page_count: int  # Activities on this page, not the model's total
+    total_count: int  # Deprecated, use page_count instead (same per-page value)
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last page
     model_config = ConfigDict(protected_namespaces=())
@@ -57,3 +57,39 @@ class KPIReportResponse(BaseModel):
     team_name: str = Field("All Teams", description="Team name or 'All Teams' if no filter")
 
     model_config = {"from_attributes": True}
+
+
+class KPIHistoryPoint(BaseModel):
+    """Single snapshot value of a metric."""
+    as_of_date: date = Field(..., description="Snapshot date")
+    count_value: Optional[int] = Field(None, description="Value for count metrics")
+    duration_value: Optional[float] = Field(None, description="Value for duration metrics (in days)")
+    numerator: Optional[int] = Field(None, description="Numerator for ratio metrics")
+    denominator: Optional[int] = Field(None, description="Denominator for ratio metrics")
+    percentage: Optional[float] = Field(None, description="Percentage for ratio metrics")
+    breakdown: Optional[List[KPIBreakdown]] = Field(None, description="Value for breakdown metrics")
+
+
+class KPIMetricHistory(BaseModel):
+    """Time series of snapshot values for one metric."""
+    metric_id: str = Field(..., description="Metric ID from METRICS.json")
+    metric_name: str = Field(..., description="Human-readable metric name")
+    category: str = Field(..., description="Grouping category")
+    metric_type: str = Field(..., description="Type of metric: 'count', 'ratio', 'duration', 'breakdown'")
+    points: List[KPIHistoryPoint] = Field(default_factory=list, description="Snapshot values ordered by date")
+
+
+class KPIHistoryResponse(BaseModel):
+    """KPI metric trends served from stored snapshots."""
+    region_id: Optional[int] = Field(None, description="Region ID, None for all regions")
+    team_id: Optional[int] = Field(None, description="Team ID, 0 for Unassigned, None for all")
+    start_date: date = Field(..., description="First date in the requested window")
+    end_date: date = Field(..., description="Last date in the requested window")
+    metrics: List[KPIMetricHistory] = Field(..., description="Per-metric time series")
+
+
+class KPISnapshotRunResponse(BaseModel):
+    """KPI snapshot run queued in the background."""
+    as_of_date: date = Field(..., description="Date the snapshots are recorded for")
+    scopes: int = Field(..., description="Number of region/team scopes queued for computation")
+    scopes_up_to_date: int = Field(..., description="Scopes skipped because their snapshot is newer than the last audited write")
@@ -877,6 +877,7 @@ class CSVImportPreviewSummary(BaseModel):
     update_count: int
     skip_count: int
     error_count: int
+    rows_truncated: bool = False  # valid_rows/error_rows hold only the first rows of each kind
 
 
 class CSVImportPreviewResponse(BaseModel):
@@ -893,7 +894,7 @@ class CSVImportResultResponse(BaseModel):
     updated: int
     skipped: int
     errors: int
-    error_messages: List[str] = []
+    error_messages: List[str] = []  # first MONITORING_IMPORT_PREVIEW_ROWS errors; see errors for the total
 
 
 # ============================================================================
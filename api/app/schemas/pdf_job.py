@@ -0,0 +1,16 @@
+"""Background PDF job schemas."""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class PDFJobResponse(BaseModel):
+    """Status of a queued PDF render."""
+    job_id: str = Field(..., description="Job identifier")
+    status: str = Field(..., description="PENDING, COMPLETED or FAILED")
+    filename: str = Field(..., description="Download filename of the PDF")
+    error: Optional[str] = Field(None, description="Failure reason when status is FAILED")
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    status_url: str = Field(..., description="Poll this URL (optionally with ?wait=N) for status")
+    download_url: Optional[str] = Field(None, description="PDF download URL once COMPLETED")
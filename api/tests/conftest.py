@@ -1,6 +1,7 @@
 """Pytest fixtures for API testing."""
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -10,12 +11,17 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.core.database import get_db
+from app.core import pdf_jobs
+from app.core.database import get_db, get_reporting_db, get_session_factory
+from app.core.pdf_jobs import ArtifactStore, PDFJobRunner
 from app.core.security import get_password_hash, create_access_token
 from app.models.base import Base
 from app.models.user import User
 from app.models.role import Role
 from app.core.roles import RoleCode, ROLE_CODE_TO_DISPLAY
+from app.core.taxonomy_registry import taxonomy_registry
+from app.core.cache_generations import forget_generations
+from app.core.user_cache import user_principal_cache
 from app.models.model import Model
 from app.models.vendor import Vendor
 from app.models.model_pending_edit import ModelPendingEdit  # For pending edit workflow tests
@@ -62,6 +68,10 @@ def db_session(sqlite_engine, session_factory):
     for code, display_name in ROLE_CODE_TO_DISPLAY.items():
         db.add(Role(code=code, display_name=display_name, is_system=True, is_active=True))
     db.commit()
+    # Taxonomy IDs differ between test databases
+    taxonomy_registry.invalidate()
+    user_principal_cache.clear()
+    forget_generations()
     yield db
     db.close()
     Base.metadata.drop_all(bind=sqlite_engine)
@@ -108,6 +118,10 @@ def postgres_db_session(postgres_engine):
     for code, display_name in ROLE_CODE_TO_DISPLAY.items():
         db.add(Role(code=code, display_name=display_name, is_system=True, is_active=True))
     db.commit()
+    # Taxonomy IDs differ between test databases
+    taxonomy_registry.invalidate()
+    user_principal_cache.clear()
+    forget_generations()
 
     yield db
 
@@ -128,6 +142,8 @@ def client(db_session, session_factory):
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_reporting_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
 
     with TestClient(app) as test_client:
         yield test_client
@@ -135,6 +151,19 @@ def client(db_session, session_factory):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def pdf_job_runner(tmp_path, monkeypatch):
+    """Per-test PDF artifact store, rendering in a thread instead of a process."""
+    runner = PDFJobRunner(
+        ArtifactStore(str(tmp_path / "pdf-artifacts"), ttl_seconds=3600),
+        max_workers=1,
+        executor=ThreadPoolExecutor(max_workers=1),
+    )
+    monkeypatch.setattr(pdf_jobs, "_runner", runner)
+    yield runner
+    runner.shutdown()
+
+
 @pytest.fixture
 def lob_hierarchy(db_session):
     """Create a test LOB hierarchy for testing.
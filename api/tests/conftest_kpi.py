@@ -24,14 +24,14 @@ from app.models.scorecard import ValidationScorecardResult
 def clear_kpi_cache():
     """Clear KPI report cache before each test.
 
-    The KPI report uses a module-level cache that can cause test interference
+    The KPI report uses a process-wide cache that can cause test interference
     when tests run in parallel. This fixture ensures each test starts with
     an empty cache.
     """
-    from app.api.kpi_report import _KPI_CACHE
-    _KPI_CACHE.clear()
+    from app.core.kpi_cache import get_kpi_cache
+    get_kpi_cache().clear()
     yield
-    _KPI_CACHE.clear()
+    get_kpi_cache().clear()
 
 
 # =============================================================================
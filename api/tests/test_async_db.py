@@ -0,0 +1,54 @@
+"""Tests for the async database layer (get_async_db, get_current_user_async)."""
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import create_async_session_factory, get_async_session_factory
+from app.core.deps import get_current_user_async
+from app.core.route_checks import find_async_routes_with_sync_session
+from app.main import app as main_app
+from app.models.user import LocalStatus, User
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_client(client, sqlite_engine):
+    """Client for an app with one async route on the test database."""
+    factory = create_async_session_factory(
+        sqlite_engine.url.render_as_string(hide_password=False), pool_size=5, max_overflow=0
+    )
+    probe = FastAPI()
+
+    @probe.get("/whoami")
+    async def whoami(current_user: User = Depends(get_current_user_async)):
+        return {"user_id": current_user.user_id, "role_code": current_user.role_code}
+
+    probe.dependency_overrides[get_async_session_factory] = lambda: factory
+    with TestClient(probe) as test_client:
+        yield test_client
+        test_client.portal.call(factory.kw["bind"].dispose)
+
+
+def test_no_async_route_uses_a_sync_session():
+    assert find_async_routes_with_sync_session(main_app.routes) == []
+
+
+def test_async_user_resolution(async_client, test_user, auth_headers):
+    for _ in range(2):  # second request is served from the principal cache
+        response = async_client.get("/whoami", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {"user_id": test_user.user_id, "role_code": "USER"}
+
+
+def test_async_user_resolution_rejects_disabled_users(async_client, db_session, test_user, auth_headers):
+    assert async_client.get("/whoami", headers=auth_headers).status_code == 200
+
+    test_user.local_status = LocalStatus.DISABLED.value
+    db_session.commit()
+
+    assert async_client.get("/whoami", headers=auth_headers).status_code == 403
+
+
+def test_async_routes_require_authentication(async_client):
+    assert async_client.get("/whoami").status_code == 403
@@ -0,0 +1,156 @@
+"""Tests for the native async news feed and monitoring tasks routes."""
+from datetime import date, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import async_reads
+from app.core.database import create_async_session_factory, get_async_session_factory
+from app.core.route_checks import find_async_routes_with_sync_session
+from app.core.time import utc_now
+from app.models.kpm import Kpm, KpmCategory
+from app.models.model_submission_comment import ModelSubmissionComment
+from app.models.monitoring import (
+    MonitoringCycle,
+    MonitoringCycleStatus,
+    MonitoringFrequency,
+    MonitoringPlan,
+    MonitoringPlanMetric,
+    MonitoringResult,
+)
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_client(client, sqlite_engine):
+    """Client for an app serving only the async routes, on the test database."""
+    factory = create_async_session_factory(
+        sqlite_engine.url.render_as_string(hide_password=False), pool_size=5, max_overflow=0
+    )
+    probe = FastAPI()
+    probe.include_router(async_reads.router)
+    probe.dependency_overrides[get_async_session_factory] = lambda: factory
+    with TestClient(probe) as test_client:
+        yield test_client
+        test_client.portal.call(factory.kw["bind"].dispose)
+
+
+def _create_plan(db_session, name: str, **fields) -> MonitoringPlan:
+    plan = MonitoringPlan(
+        name=name,
+        frequency=MonitoringFrequency.QUARTERLY,
+        data_submission_lead_days=10,
+        reporting_lead_days=20,
+        next_submission_due_date=date.today(),
+        next_report_due_date=date.today() + timedelta(days=20),
+        is_active=True,
+        **fields,
+    )
+    db_session.add(plan)
+    db_session.flush()
+    return plan
+
+
+def _create_cycle(db_session, plan: MonitoringPlan, status: str, **fields) -> MonitoringCycle:
+    cycle = MonitoringCycle(
+        plan_id=plan.plan_id,
+        period_start_date=date.today() - timedelta(days=90),
+        period_end_date=date.today() - timedelta(days=1),
+        submission_due_date=date.today() + timedelta(days=3),
+        report_due_date=date.today() + timedelta(days=10),
+        status=status,
+        **fields,
+    )
+    db_session.add(cycle)
+    db_session.flush()
+    return cycle
+
+
+def _add_result(db_session, plan: MonitoringPlan, cycle: MonitoringCycle, model_id: int, user_id: int) -> None:
+    category = KpmCategory(code=f"AR_{plan.plan_id}", name="Performance", sort_order=1)
+    db_session.add(category)
+    db_session.flush()
+    kpm = Kpm(category_id=category.category_id, name="Async Reads Metric", sort_order=1)
+    db_session.add(kpm)
+    db_session.flush()
+    metric = MonitoringPlanMetric(plan_id=plan.plan_id, kpm_id=kpm.kpm_id, sort_order=1, is_active=True)
+    db_session.add(metric)
+    db_session.flush()
+    db_session.add(MonitoringResult(
+        cycle_id=cycle.cycle_id,
+        plan_metric_id=metric.metric_id,
+        model_id=model_id,
+        numeric_value=0.9,
+        calculated_outcome="GREEN",
+        entered_by_user_id=user_id,
+    ))
+
+
+def test_async_routes_do_not_use_sync_session():
+    assert find_async_routes_with_sync_session(async_reads.router.routes) == []
+
+
+def test_news_feed_matches_sync_route(client, async_client, db_session, sample_model, test_user, auth_headers):
+    for index in range(3):
+        db_session.add(ModelSubmissionComment(
+            model_id=sample_model.model_id,
+            user_id=test_user.user_id,
+            comment_text=f"Comment {index}",
+        ))
+    plan = _create_plan(db_session, "Async Feed Plan")
+    cycle = _create_cycle(
+        db_session, plan, MonitoringCycleStatus.APPROVED.value,
+        completed_at=utc_now(), completed_by_user_id=test_user.user_id,
+    )
+    _add_result(db_session, plan, cycle, sample_model.model_id, test_user.user_id)
+    db_session.commit()
+
+    expected = client.get("/dashboard/news-feed", headers=auth_headers)
+    response = async_client.get("/dashboard/news-feed", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 4
+    assert response.json() == expected.json()
+
+    page = async_client.get(
+        "/dashboard/news-feed", params={"limit": 2}, headers=auth_headers
+    ).json()
+    rest = async_client.get(
+        "/dashboard/news-feed", params={"cursor": page[-1]["cursor"]}, headers=auth_headers
+    ).json()
+    assert page + rest == expected.json()
+
+
+def test_news_feed_rejects_a_malformed_cursor(async_client, auth_headers):
+    response = async_client.get("/dashboard/news-feed", params={"cursor": "x"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_my_tasks_match_sync_route(client, async_client, db_session, sample_model, test_user, auth_headers):
+    provided = _create_plan(db_session, "Async Provider Plan", data_provider_user_id=test_user.user_id)
+    provided_cycle = _create_cycle(db_session, provided, MonitoringCycleStatus.DATA_COLLECTION.value)
+    _add_result(db_session, provided, provided_cycle, sample_model.model_id, test_user.user_id)
+    other = _create_plan(db_session, "Async Assigned Plan")
+    _create_cycle(
+        db_session, other, MonitoringCycleStatus.PENDING.value, assigned_to_user_id=test_user.user_id
+    )
+    _create_cycle(db_session, other, MonitoringCycleStatus.APPROVED.value, assigned_to_user_id=test_user.user_id)
+    db_session.commit()
+
+    for params in ({}, {"include_closed": "true"}):
+        expected = client.get("/monitoring/my-tasks", params=params, headers=auth_headers)
+        response = async_client.get("/monitoring/my-tasks", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == expected.json()
+
+    tasks = {task["cycle_id"]: task for task in response.json()}
+    assert len(tasks) == 3
+    assert tasks[provided_cycle.cycle_id]["user_role"] == "data_provider"
+    assert tasks[provided_cycle.cycle_id]["result_count"] == 1
+
+
+def test_async_routes_require_authentication(async_client):
+    assert async_client.get("/dashboard/news-feed").status_code == 403
+    assert async_client.get("/monitoring/my-tasks").status_code == 403
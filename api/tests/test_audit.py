@@ -0,0 +1,67 @@
+"""Tests for the buffered audit log writer."""
+from sqlalchemy import event
+
+from app.core.audit import audit_batch, create_audit_log, flush_audit_log
+from app.models.audit_log import AuditLog
+
+
+def _count_audit_inserts(db_session):
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO AUDIT_LOGS"):
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_execute)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", before_execute)
+
+
+def test_entries_written_at_commit_in_one_insert(db_session, test_user):
+    statements, stop = _count_audit_inserts(db_session)
+    try:
+        create_audit_log(db_session, "Model", 1, "UPDATE", test_user.user_id, {"status": "Active"})
+        batch = audit_batch(db_session, "Model", "BULK_UPDATE", test_user.user_id)
+        for model_id in range(2, 7):
+            batch.add(model_id, {"owner_id": {"old": None, "new": test_user.user_id}})
+        assert db_session.query(AuditLog).count() == 0
+
+        db_session.commit()
+    finally:
+        stop()
+
+    logs = db_session.query(AuditLog).order_by(AuditLog.entity_id).all()
+    assert [log.entity_id for log in logs] == [1, 2, 3, 4, 5, 6]
+    assert logs[0].changes == {"status": "Active"}
+    assert {log.action for log in logs[1:]} == {"BULK_UPDATE"}
+    assert len({log.timestamp for log in logs[1:]}) == 1
+    assert len(statements) == 1
+
+
+def test_rolled_back_entries_are_dropped(db_session, test_user):
+    create_audit_log(db_session, "Model", 1, "CREATE", test_user.user_id)
+    db_session.rollback()
+    db_session.commit()
+    assert db_session.query(AuditLog).count() == 0
+
+
+def test_savepoint_rollback_drops_only_its_entries(db_session, test_user):
+    batch = audit_batch(db_session, "VersionDeploymentTask", "DEPLOYMENT_CANCELLED", test_user.user_id)
+    for task_id in (1, 2, 3):
+        try:
+            with db_session.begin_nested():
+                batch.add(task_id)
+                if task_id == 2:
+                    raise ValueError("task failed")
+        except ValueError:
+            pass
+    db_session.commit()
+
+    assert sorted(entity_id for (entity_id,) in db_session.query(AuditLog.entity_id)) == [1, 3]
+
+
+def test_flush_audit_log_makes_entries_visible(db_session, test_user):
+    create_audit_log(db_session, "Tag", 7, "BULK_ASSIGN", test_user.user_id, {"model_ids": [1, 2]})
+    assert flush_audit_log(db_session) == 1
+    assert db_session.query(AuditLog).filter(AuditLog.entity_type == "Tag").count() == 1
+    assert flush_audit_log(db_session) == 0
@@ -1,4 +1,6 @@
 """Tests for audit log endpoints."""
+from datetime import datetime, timedelta
+
 import pytest
 from app.models.audit_log import AuditLog
 
@@ -204,6 +206,70 @@ class TestAuditLogs:
         logs = response.json()
         assert len(logs) == 2
 
+    def test_pagination_keyset_cursor(self, client, auth_headers, test_user, db_session):
+        """Test walking pages with the (timestamp, log_id) cursor, including tied timestamps."""
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        timestamps = [base, base, base + timedelta(minutes=1), base + timedelta(minutes=2), base + timedelta(minutes=2)]
+        for i, timestamp in enumerate(timestamps):
+            db_session.add(AuditLog(
+                entity_type="Model",
+                entity_id=i,
+                action="UPDATE",
+                user_id=test_user.user_id,
+                timestamp=timestamp
+            ))
+        db_session.commit()
+
+        expected = [
+            log.log_id for log in db_session.query(AuditLog).order_by(
+                AuditLog.timestamp.desc(), AuditLog.log_id.desc()
+            )
+        ]
+        seen = []
+        url = "/audit-logs/?limit=2"
+        while True:
+            response = client.get(url, headers=auth_headers)
+            assert response.status_code == 200
+            page = response.json()
+            seen.extend(log["log_id"] for log in page)
+            if len(page) < 2:
+                break
+            last = page[-1]
+            url = (
+                f"/audit-logs/?limit=2&before_timestamp={last['timestamp']}"
+                f"&before_log_id={last['log_id']}"
+            )
+        assert seen == expected
+
+    def test_pagination_cursor_requires_both_parts(self, client, auth_headers, db_session):
+        """Test that a half cursor, or a cursor with offset, is rejected."""
+        response = client.get("/audit-logs/?before_log_id=5", headers=auth_headers)
+        assert response.status_code == 400
+        response = client.get(
+            "/audit-logs/?before_timestamp=2026-01-01T00:00:00&before_log_id=5&offset=2",
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    def test_filter_by_changed_field(self, client, auth_headers, test_user, db_session):
+        """Test filtering audit logs by a key inside changes."""
+        db_session.add_all([
+            AuditLog(entity_type="Model", entity_id=1, action="UPDATE", user_id=test_user.user_id,
+                     changes={"status": {"old": "Draft", "new": "Active"}}),
+            AuditLog(entity_type="Model", entity_id=2, action="UPDATE", user_id=test_user.user_id,
+                     changes={"model_name": {"old": "A", "new": "B"}}),
+            AuditLog(entity_type="Model", entity_id=3, action="DELETE", user_id=test_user.user_id),
+        ])
+        db_session.commit()
+
+        response = client.get("/audit-logs/?changed_field=status", headers=auth_headers)
+        assert response.status_code == 200
+        logs = response.json()
+        assert [log["entity_id"] for log in logs] == [1]
+
+        response = client.get("/audit-logs/?changed_field=bad'key", headers=auth_headers)
+        assert response.status_code == 422
+
     def test_audit_log_includes_user_details(self, client, auth_headers, test_user, db_session):
         """Test that audit logs include user details."""
         log = AuditLog(
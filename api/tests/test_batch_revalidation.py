@@ -0,0 +1,210 @@
+"""Parity tests: compute_revalidation_statuses vs calculate_model_revalidation_status."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.api.validation_workflow import (
+    calculate_model_revalidation_status,
+    get_models_needing_revalidation,
+)
+from app.core.batch_revalidation import compute_revalidation_statuses
+from app.models import Model
+from app.models.validation import (
+    ValidationOutcome,
+    ValidationPolicy,
+    ValidationRequest,
+    ValidationRequestModelVersion,
+    ValidationWorkflowSLA,
+)
+
+
+def _add_request(db_session, models, type_value, status_value, refs, user, days_ago,
+                 prior=None, submission_received_days_ago=None):
+    completion = None
+    if status_value.code == "APPROVED":
+        completion = datetime.combine(date.today() - timedelta(days=days_ago), datetime.min.time())
+    request = ValidationRequest(
+        request_date=date.today() - timedelta(days=days_ago + 30),
+        requestor_id=user.user_id,
+        validation_type_id=type_value.value_id,
+        priority_id=refs["priority_standard"].value_id,
+        target_completion_date=date.today() - timedelta(days=days_ago),
+        current_status_id=status_value.value_id,
+        completion_date=completion,
+        prior_validation_request_id=prior.request_id if prior else None,
+        submission_received_date=(
+            date.today() - timedelta(days=submission_received_days_ago)
+            if submission_received_days_ago is not None else None
+        ),
+    )
+    db_session.add(request)
+    db_session.flush()
+    for model in models:
+        db_session.add(ValidationRequestModelVersion(
+            request_id=request.request_id, model_id=model.model_id
+        ))
+    db_session.flush()
+    return request
+
+
+def _add_outcome(db_session, request, refs, expires_in_days):
+    db_session.add(ValidationOutcome(
+        request_id=request.request_id,
+        overall_rating_id=refs["pass"].value_id,
+        executive_summary="Interim approval",
+        effective_date=date.today() - timedelta(days=30),
+        expiration_date=date.today() + timedelta(days=expires_in_days),
+    ))
+    db_session.flush()
+
+
+@pytest.fixture
+def revalidation_scenarios(db_session, test_user, usage_frequency, taxonomy_values):
+    """One model per revalidation status branch."""
+    refs = taxonomy_values
+    approved = refs["status_approved"]
+    intake = refs["status_intake"]
+    comprehensive = refs["comprehensive"]
+
+    db_session.add_all([
+        ValidationPolicy(risk_tier_id=refs["tier1"].value_id, frequency_months=12,
+                         grace_period_months=3, model_change_lead_time_days=90),
+        ValidationPolicy(risk_tier_id=refs["tier2"].value_id, frequency_months=24,
+                         grace_period_months=3, model_change_lead_time_days=180),
+        ValidationWorkflowSLA(workflow_type="Validation", assignment_days=10,
+                              begin_work_days=5, approval_days=10),
+    ])
+
+    def make_model(name, tier="tier1"):
+        model = Model(
+            model_name=name,
+            description="Revalidation scenario",
+            development_type="In-House",
+            status="Active",
+            owner_id=test_user.user_id,
+            row_approval_status="approved",
+            usage_frequency_id=usage_frequency["daily"].value_id,
+            risk_tier_id=refs[tier].value_id if tier else None,
+        )
+        db_session.add(model)
+        db_session.flush()
+        return model
+
+    def approved_full(model, days_ago, type_value=comprehensive):
+        return _add_request(db_session, [model], type_value, approved, refs, test_user, days_ago)
+
+    def active_revalidation(models, prior, submission_received_days_ago=None):
+        return _add_request(db_session, models, comprehensive, intake, refs, test_user, 0,
+                            prior=prior, submission_received_days_ago=submission_received_days_ago)
+
+    make_model("Never Validated")
+    make_model("No Tier", tier=None)
+
+    interim_pending = make_model("Interim Pending")
+    _add_outcome(db_session, approved_full(interim_pending, 30, refs["interim"]), refs, 300)
+
+    interim_expired = make_model("Interim Expired")
+    _add_outcome(db_session, approved_full(interim_expired, 400, refs["interim"]), refs, -10)
+
+    interim_submission_overdue = make_model("Interim Submission Overdue")
+    _add_outcome(db_session, approved_full(interim_submission_overdue, 300, refs["interim"]), refs, 30)
+
+    no_policy = make_model("No Policy", tier=None)
+    approved_full(no_policy, 100)
+
+    approved_full(make_model("Upcoming"), 30)
+    approved_full(make_model("Should Create Request"), 480)
+    approved_full(make_model("Overdue No Request"), 900)
+
+    two_full = make_model("Two Full Validations")
+    approved_full(two_full, 1000, refs["initial"])
+    approved_full(two_full, 60)
+
+    awaiting = make_model("Awaiting Submission")
+    active_revalidation([awaiting], approved_full(awaiting, 300))
+
+    grace = make_model("In Grace Period")
+    active_revalidation([grace], approved_full(grace, 400))
+
+    submission_overdue = make_model("Submission Overdue")
+    active_revalidation([submission_overdue], approved_full(submission_overdue, 500))
+
+    in_progress = make_model("Validation In Progress")
+    active_revalidation([in_progress], approved_full(in_progress, 400), submission_received_days_ago=5)
+
+    validation_overdue = make_model("Validation Overdue")
+    active_revalidation([validation_overdue], approved_full(validation_overdue, 900),
+                        submission_received_days_ago=5)
+
+    # Multi-model request: lead time is the MAX across both models' policies
+    multi_a = make_model("Multi Model A")
+    multi_b = make_model("Multi Model B", tier="tier2")
+    prior = approved_full(multi_a, 400)
+    active_revalidation([multi_a, multi_b], prior)
+
+    db_session.commit()
+    return db_session.query(Model).order_by(Model.model_id).all()
+
+
+def test_batch_matches_single_model(db_session, revalidation_scenarios):
+    batch = compute_revalidation_statuses(db_session, revalidation_scenarios)
+
+    assert set(batch) == {m.model_id for m in revalidation_scenarios}
+    for model in revalidation_scenarios:
+        expected = calculate_model_revalidation_status(model, db_session)
+        assert batch[model.model_id] == expected, model.model_name
+        assert list(batch[model.model_id]) == list(expected), model.model_name
+
+
+def test_scenarios_cover_every_status(db_session, revalidation_scenarios):
+    batch = compute_revalidation_statuses(db_session, revalidation_scenarios)
+    statuses = {status["status"] for status in batch.values()}
+    assert statuses == {
+        "Never Validated",
+        "Pending Full Validation",
+        "INTERIM Expired - Full Validation Required",
+        "Submission Overdue (INTERIM)",
+        "No Policy Configured",
+        "Upcoming",
+        "Should Create Request",
+        "Revalidation Overdue (No Request)",
+        "Awaiting Submission",
+        "In Grace Period",
+        "Submission Overdue",
+        "Validation In Progress",
+        "Validation Overdue",
+    }
+
+
+def test_query_count_does_not_grow_with_models(db_session, revalidation_scenarios):
+    counter = {"value": 0}
+
+    def before_cursor_execute(*_args, **_kwargs):
+        counter["value"] += 1
+
+    models = db_session.query(Model).all()
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        compute_revalidation_statuses(db_session, models)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(models) > 15
+    assert counter["value"] <= 12
+
+
+def test_models_needing_revalidation_uses_batch_results(db_session, revalidation_scenarios):
+    results = get_models_needing_revalidation(db_session, days_ahead=10000, include_overdue=True)
+    names = {r["model_name"] for r in results}
+
+    assert "Overdue No Request" in names
+    assert "Upcoming" in names
+    assert "No Tier" not in names
+    due_dates = [r["next_submission_due"] or date.max for r in results]
+    assert due_dates == sorted(due_dates)
+
+
+def test_empty_input(db_session):
+    assert compute_revalidation_statuses(db_session, []) == {}
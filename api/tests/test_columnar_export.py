@@ -0,0 +1,175 @@
+"""Tests for Parquet/Arrow exports."""
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.columnar_export import ExportFormat, TypedColumn, iter_columnar, iter_record_batches
+from app.core.monitoring_membership import MonitoringMembershipService
+from app.models.kpm import Kpm, KpmCategory
+from app.models.monitoring import (
+    MonitoringCycle,
+    MonitoringCycleStatus,
+    MonitoringFrequency,
+    MonitoringPlan,
+    MonitoringPlanMetric,
+    MonitoringResult,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+COLUMNS = [
+    TypedColumn("id", "ID", "int", lambda row: row["id"]),
+    TypedColumn("value", "Value", "float", lambda row: row["value"]),
+    TypedColumn("day", "Day", "date", lambda row: row["day"]),
+    TypedColumn("outcome", "Outcome", "outcome", lambda row: row["outcome"]),
+]
+
+
+def _rows(count):
+    outcomes = ["GREEN", "YELLOW", "RED", None]
+    return [
+        {"id": i, "value": i / 2, "day": date(2024, 1, 1) + timedelta(days=i), "outcome": outcomes[i % 4]}
+        for i in range(count)
+    ]
+
+
+def test_record_batches_are_typed_and_bounded():
+    batches = list(iter_record_batches(_rows(5), COLUMNS, batch_rows=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    schema = batches[0].schema
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("value").type == pa.float64()
+    assert schema.field("day").type == pa.date32()
+    assert pa.types.is_dictionary(schema.field("outcome").type)
+
+
+@pytest.mark.parametrize("export_format", [ExportFormat.PARQUET, ExportFormat.ARROW])
+def test_columnar_file_round_trips_in_batches(export_format):
+    chunks = list(iter_columnar(_rows(7), COLUMNS, export_format, batch_rows=3))
+    data = pa.py_buffer(b"".join(chunks))
+
+    if export_format == ExportFormat.PARQUET:
+        parquet_file = pq.ParquetFile(pa.BufferReader(data))
+        assert parquet_file.metadata.num_row_groups == 3
+        table = parquet_file.read()
+    else:
+        reader = pa.ipc.open_file(data)
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+
+    assert table.column("id").to_pylist() == list(range(7))
+    assert table.column("day").to_pylist()[1] == date(2024, 1, 2)
+    assert table.column("outcome").to_pylist()[:4] == ["GREEN", "YELLOW", "RED", None]
+
+
+def test_columnar_file_without_rows_keeps_schema():
+    data = pa.py_buffer(b"".join(iter_columnar([], COLUMNS, ExportFormat.ARROW)))
+    table = pa.ipc.open_file(data).read_all()
+
+    assert table.num_rows == 0
+    assert table.schema.names == ["id", "value", "day", "outcome"]
+
+
+def test_models_export_as_parquet(client, auth_headers, sample_model):
+    response = client.get("/models/export/csv?format=parquet", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].endswith("models_export.parquet")
+    table = pq.read_table(pa.BufferReader(response.content))
+    assert table.column("model_id").to_pylist() == [sample_model.model_id]
+    assert table.schema.field("created_at").type == pa.timestamp("us")
+    assert table.schema.field("users").type == pa.list_(pa.string())
+
+
+@pytest.fixture
+def monitoring_results(db_session, admin_user, sample_model):
+    plan = MonitoringPlan(
+        name="Columnar Plan",
+        frequency=MonitoringFrequency.QUARTERLY,
+        data_submission_lead_days=10,
+        reporting_lead_days=20,
+        next_submission_due_date=date.today(),
+        next_report_due_date=date.today() + timedelta(days=20),
+        is_active=True,
+    )
+    db_session.add(plan)
+    db_session.flush()
+    MonitoringMembershipService(db_session).replace_plan_models(
+        plan.plan_id, [sample_model.model_id],
+        changed_by_user_id=admin_user.user_id, reason="Export setup",
+    )
+    category = KpmCategory(code="COLUMNAR", name="Performance", sort_order=1)
+    db_session.add(category)
+    db_session.flush()
+    kpm = Kpm(category_id=category.category_id, name="Accuracy", sort_order=1)
+    db_session.add(kpm)
+    db_session.flush()
+    metric = MonitoringPlanMetric(plan_id=plan.plan_id, kpm_id=kpm.kpm_id, sort_order=1, is_active=True)
+    db_session.add(metric)
+    db_session.flush()
+
+    cycles = []
+    for quarter, (value, outcome) in enumerate([(0.91, "GREEN"), (0.72, "RED")]):
+        end = date(2024, 3 * (quarter + 1), 28)
+        cycle = MonitoringCycle(
+            plan_id=plan.plan_id,
+            period_start_date=end - timedelta(days=89),
+            period_end_date=end,
+            submission_due_date=end + timedelta(days=10),
+            report_due_date=end + timedelta(days=30),
+            status=MonitoringCycleStatus.APPROVED.value,
+        )
+        db_session.add(cycle)
+        db_session.flush()
+        db_session.add(MonitoringResult(
+            cycle_id=cycle.cycle_id,
+            plan_metric_id=metric.metric_id,
+            model_id=sample_model.model_id,
+            numeric_value=value,
+            calculated_outcome=outcome,
+            entered_by_user_id=admin_user.user_id,
+        ))
+        cycles.append(cycle)
+    db_session.commit()
+    return plan, cycles
+
+
+def test_cycle_results_export_as_arrow(client, admin_headers, monitoring_results):
+    plan, cycles = monitoring_results
+    response = client.get(
+        f"/monitoring/plans/{plan.plan_id}/cycles/{cycles[0].cycle_id}/export?format=arrow",
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    table = pa.ipc.open_file(pa.py_buffer(response.content)).read_all()
+    assert table.column("numeric_value").to_pylist() == [0.91]
+    assert table.column("outcome").to_pylist() == ["GREEN"]
+
+
+def test_result_history_export(client, auth_headers, monitoring_results):
+    plan, cycles = monitoring_results
+    response = client.get("/monitoring/results/export?format=parquet", headers=auth_headers)
+
+    assert response.status_code == 200
+    table = pq.read_table(pa.BufferReader(response.content))
+    assert table.column("cycle_id").to_pylist() == [cycle.cycle_id for cycle in cycles]
+    assert table.column("period_end_date").to_pylist() == [cycle.period_end_date for cycle in cycles]
+    assert table.column("outcome").to_pylist() == ["GREEN", "RED"]
+
+    filtered = client.get(
+        "/monitoring/results/export?format=csv&period_end_from=2024-04-01", headers=auth_headers
+    )
+    assert filtered.status_code == 200
+    lines = filtered.text.strip().splitlines()
+    assert len(lines) == 2
+    assert "2024-06-28" in lines[1]
+
+
+def test_result_history_export_respects_model_access(client, second_user_headers, monitoring_results):
+    response = client.get("/monitoring/results/export?format=parquet", headers=second_user_headers)
+
+    assert response.status_code == 200
+    assert pq.read_table(pa.BufferReader(response.content)).num_rows == 0
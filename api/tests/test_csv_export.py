@@ -0,0 +1,105 @@
+"""Tests for streaming CSV exports."""
+import csv
+import io
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.csv_export import CSVColumn, iter_csv, select_columns
+from app.models.export_view import ExportView
+
+COLUMNS = [
+    CSVColumn("id", "ID", lambda row: row["id"]),
+    CSVColumn("name", "Name", lambda row: row["name"]),
+    CSVColumn("note", "Note", lambda row: row.get("note", "")),
+]
+
+
+def _parse(text):
+    return list(csv.reader(io.StringIO(text)))
+
+
+def test_iter_csv_yields_header_then_chunks():
+    rows = ({"id": i, "name": f"row {i}"} for i in range(5))
+    chunks = list(iter_csv(rows, COLUMNS, chunk_rows=2))
+
+    assert _parse(chunks[0]) == [["ID", "Name", "Note"]]
+    assert [len(_parse(chunk)) for chunk in chunks[1:]] == [2, 2, 1]
+    assert _parse("".join(chunks))[-1] == ["4", "row 4", ""]
+
+
+def test_iter_csv_consumes_rows_lazily():
+    consumed = []
+
+    def rows():
+        for i in range(4):
+            consumed.append(i)
+            yield {"id": i, "name": "x"}
+
+    chunks = iter_csv(rows(), COLUMNS, chunk_rows=2)
+    next(chunks)
+    assert consumed == []
+    next(chunks)
+    assert consumed == [0, 1]
+
+
+def test_select_columns_orders_and_ignores_unknown_keys():
+    assert select_columns(COLUMNS, None) == COLUMNS
+    selected = select_columns(COLUMNS, ["note", "unknown", "id", "note"])
+    assert [column.key for column in selected] == ["note", "id"]
+
+    with pytest.raises(HTTPException) as excinfo:
+        select_columns(COLUMNS, ["unknown"])
+    assert excinfo.value.status_code == 400
+
+
+def test_models_export_streams_visible_models(client, auth_headers, sample_model):
+    response = client.get("/models/export/csv", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = _parse(response.text)
+    assert rows[0][:2] == ["Model ID", "Model Name"]
+    assert [row[1] for row in rows[1:]] == [sample_model.model_name]
+
+
+def test_models_export_hides_models_outside_rls(client, second_user_headers, sample_model):
+    response = client.get("/models/export/csv", headers=second_user_headers)
+
+    assert response.status_code == 200
+    assert _parse(response.text)[1:] == []
+
+
+def test_models_export_uses_export_view_columns(client, db_session, test_user, auth_headers, sample_model):
+    view = ExportView(
+        user_id=test_user.user_id,
+        entity_type="models",
+        view_name="Short",
+        columns=["model_name", "model_id", "not_a_column"],
+    )
+    db_session.add(view)
+    db_session.commit()
+
+    response = client.get(f"/models/export/csv?view_id={view.view_id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert _parse(response.text) == [
+        ["Model Name", "Model ID"],
+        [sample_model.model_name, str(sample_model.model_id)],
+    ]
+
+
+def test_models_export_rejects_other_users_private_view(
+    client, db_session, admin_user, auth_headers, sample_model
+):
+    view = ExportView(
+        user_id=admin_user.user_id,
+        entity_type="models",
+        view_name="Private",
+        columns=["model_id"],
+    )
+    db_session.add(view)
+    db_session.commit()
+
+    response = client.get(f"/models/export/csv?view_id={view.view_id}", headers=auth_headers)
+    assert response.status_code == 404
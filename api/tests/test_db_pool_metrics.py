@@ -0,0 +1,115 @@
+"""Tests for connection pool configuration and telemetry."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.database import _engine_options
+from app.core.db_metrics import (
+    NO_ROUTE,
+    DBRouteContextMiddleware,
+    TimedQueuePool,
+    instrument_engine,
+)
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    telemetry = instrument_engine(engine, "test", max_overflow=0)
+    yield engine, telemetry
+    engine.dispose()
+
+
+def test_sqlite_keeps_default_pool():
+    assert _engine_options("sqlite:///./test.db", 5, 5) == {}
+
+
+def test_server_database_gets_pool_options():
+    options = _engine_options("postgresql://user:pw@db/mrm", 7, 3)
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 3
+    assert options["pool_pre_ping"] is True
+    assert {"pool_timeout", "pool_recycle"} <= set(options)
+
+
+def test_snapshot_reports_checked_out_connections_and_timeouts(pooled_engine):
+    engine, telemetry = pooled_engine
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        state = telemetry.snapshot(engine.pool)
+        assert state["size"] == 1
+        assert state["max_overflow"] == 0
+        assert state["checked_out"] == 1
+
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    state = telemetry.snapshot(engine.pool)
+    assert state["checked_out"] == 0
+    assert state["timeouts"] == 1
+    assert state["wait_seconds_max"] >= 0.05
+    assert state["routes"][NO_ROUTE]["checkouts"] == 1
+
+
+def test_pool_recreate_keeps_telemetry(pooled_engine):
+    engine, telemetry = pooled_engine
+    engine.dispose()
+    assert engine.pool.telemetry is telemetry
+
+
+def test_hold_time_is_attributed_to_route_template(pooled_engine):
+    engine, telemetry = pooled_engine
+    app = FastAPI()
+    app.add_middleware(DBRouteContextMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            return {"value": conn.execute(text("SELECT :v"), {"v": item_id}).scalar()}
+
+    with TestClient(app) as client:
+        assert client.get("/items/1").json() == {"value": 1}
+        assert client.get("/items/2").json() == {"value": 2}
+
+    routes = telemetry.snapshot(engine.pool)["routes"]
+    assert routes["GET /items/{item_id}"]["checkouts"] == 2
+    assert routes["GET /items/{item_id}"]["hold_seconds_max"] >= 0
+
+
+def test_metrics_endpoint_requires_admin(client, auth_headers):
+    response = client.get("/metrics/db-pool", headers=auth_headers)
+    assert response.status_code == 403
+
+
+def test_metrics_endpoint(client, admin_headers):
+    response = client.get("/metrics/db-pool", headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"primary", "reporting"}
+    assert data["reporting"]["name"] == "reporting"
+    assert "routes" in data["primary"]
+
+
+def test_reporting_routes_do_not_use_the_primary_pool():
+    from app.api import kpi_report
+    from app.core.database import get_db
+    from app.core.route_checks import _uses_dependency
+    from app.main import app
+
+    routes = [
+        route for route in app.routes
+        if getattr(route, "endpoint", None) in (kpi_report.get_kpi_report, kpi_report.get_kpi_report_history)
+    ]
+    assert len(routes) == 2
+    for route in routes:
+        assert not _uses_dependency(route.dependant, {get_db})
@@ -40,6 +40,7 @@ from app.core.exception_detection import (
     detect_type3_use_prior_to_validation,
     detect_type3_for_deployment_task,
     autoclose_type1_on_improved_result,
+    autoclose_type1_on_improved_results,
     autoclose_type3_on_full_validation_approved,
     acknowledge_exception,
     close_exception_manually,
@@ -1097,6 +1098,53 @@ class TestAutoCloseType1:
         db_session.refresh(exception)
         assert exception.status == STATUS_OPEN
 
+    def test_batch_autoclose_only_matches_improved_metric(
+        self, db_session, sample_model, monitoring_setup, exception_closure_reason_taxonomy
+    ):
+        """Batch auto-close closes exceptions whose model and metric improved."""
+        red_result = MonitoringResult(
+            cycle_id=monitoring_setup["cycle"].cycle_id,
+            plan_metric_id=monitoring_setup["metric"].metric_id,
+            model_id=sample_model.model_id,
+            numeric_value=0.5,
+            calculated_outcome="RED",
+            entered_by_user_id=1,
+        )
+        db_session.add(red_result)
+        db_session.flush()
+
+        exception = ModelException(
+            exception_code="EXC-2025-00001",
+            model_id=sample_model.model_id,
+            exception_type=EXCEPTION_TYPE_UNMITIGATED_PERFORMANCE,
+            status=STATUS_OPEN,
+            description="RED result",
+            detected_at=utc_now(),
+            monitoring_result_id=red_result.result_id,
+        )
+        db_session.add(exception)
+        db_session.commit()
+
+        cycle_id = monitoring_setup["cycle"].cycle_id
+        metric_id = monitoring_setup["metric"].metric_id
+        other_metric = autoclose_type1_on_improved_results(
+            db_session, cycle_id, {(sample_model.model_id, metric_id + 1): "GREEN"}
+        )
+        still_red = autoclose_type1_on_improved_results(
+            db_session, cycle_id, {(sample_model.model_id, metric_id): "RED"}
+        )
+        assert other_metric == [] and still_red == []
+
+        closed = autoclose_type1_on_improved_results(
+            db_session, cycle_id, {(sample_model.model_id, metric_id): "YELLOW"}
+        )
+        db_session.commit()
+
+        assert [e.exception_id for e in closed] == [exception.exception_id]
+        db_session.refresh(exception)
+        assert exception.status == STATUS_CLOSED
+        assert exception.auto_closed is True
+
 
 class TestAutoCloseType3:
     """Tests for Type 3 exception auto-close on FULL validation approval."""
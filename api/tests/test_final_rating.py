@@ -0,0 +1,193 @@
+"""Tests for Final Model Risk Ranking computation (single and batch)."""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.core.taxonomy_registry import taxonomy_registry
+from app.core.final_rating import (
+    compute_final_model_risk_ranking,
+    compute_final_model_risk_rankings,
+    downgrade_scorecard,
+)
+from app.models.model import Model
+from app.models.residual_risk_map import ResidualRiskMapConfig
+from app.models.scorecard import ValidationScorecardResult
+from app.models.taxonomy import Taxonomy, TaxonomyValue
+from app.models.validation import ValidationPolicy, ValidationRequest, ValidationRequestModelVersion
+
+
+@pytest.fixture
+def ranking_reference_data(db_session):
+    """Risk tiers, validation statuses/types, past due buckets, policy and risk map."""
+    tier_tax = Taxonomy(name="Model Risk Tier", is_system=True)
+    status_tax = Taxonomy(name="Validation Request Status", is_system=True)
+    type_tax = Taxonomy(name="Validation Type", is_system=True)
+    priority_tax = Taxonomy(name="Validation Priority", is_system=True)
+    past_due_tax = Taxonomy(name="Past Due Level", is_system=True, taxonomy_type="bucket")
+    db_session.add_all([tier_tax, status_tax, type_tax, priority_tax, past_due_tax])
+    db_session.flush()
+
+    high = TaxonomyValue(taxonomy_id=tier_tax.taxonomy_id, code="TIER_1", label="High Inherent Risk", sort_order=1)
+    low = TaxonomyValue(taxonomy_id=tier_tax.taxonomy_id, code="TIER_3", label="Low Inherent Risk", sort_order=3)
+    unmapped = TaxonomyValue(taxonomy_id=tier_tax.taxonomy_id, code="TIER_X", label="Unmapped Tier", sort_order=9)
+    approved = TaxonomyValue(taxonomy_id=status_tax.taxonomy_id, code="APPROVED", label="Approved", sort_order=1)
+    comprehensive = TaxonomyValue(taxonomy_id=type_tax.taxonomy_id, code="COMPREHENSIVE", label="Comprehensive", sort_order=1)
+    standard = TaxonomyValue(taxonomy_id=priority_tax.taxonomy_id, code="STANDARD", label="Standard", sort_order=1)
+    buckets = [
+        TaxonomyValue(taxonomy_id=past_due_tax.taxonomy_id, code="CURRENT", label="Current",
+                      sort_order=1, min_days=None, max_days=0, downgrade_notches=0),
+        TaxonomyValue(taxonomy_id=past_due_tax.taxonomy_id, code="MINIMAL", label="Minimal",
+                      sort_order=2, min_days=1, max_days=365, downgrade_notches=1),
+        TaxonomyValue(taxonomy_id=past_due_tax.taxonomy_id, code="CRITICAL", label="Critical",
+                      sort_order=3, min_days=366, max_days=None, downgrade_notches=3),
+    ]
+    db_session.add_all([high, low, unmapped, approved, comprehensive, standard, *buckets])
+    db_session.flush()
+
+    db_session.add_all([
+        ValidationPolicy(risk_tier_id=high.value_id, frequency_months=12,
+                         grace_period_months=3, model_change_lead_time_days=90),
+        ResidualRiskMapConfig(
+            version_number=1,
+            is_active=True,
+            matrix_config={"matrix": {
+                "High": {"Green": "Low", "Green-": "Medium", "Yellow+": "Medium",
+                         "Yellow": "High", "Yellow-": "High", "Red": "High"},
+                "Low": {"Green": "Low", "Green-": "Low", "Yellow+": "Low",
+                        "Yellow": "Medium", "Yellow-": "Medium", "Red": "High"},
+            }},
+        ),
+    ])
+    db_session.commit()
+    return {
+        "high": high,
+        "low": low,
+        "unmapped": unmapped,
+        "approved": approved,
+        "comprehensive": comprehensive,
+        "standard": standard,
+    }
+
+
+def _add_scored_validation(db_session, model, refs, user, rating, completed_days_ago):
+    completion = datetime.combine(date.today() - timedelta(days=completed_days_ago), datetime.min.time())
+    validation = ValidationRequest(
+        request_date=completion.date() - timedelta(days=30),
+        requestor_id=user.user_id,
+        validation_type_id=refs["comprehensive"].value_id,
+        priority_id=refs["standard"].value_id,
+        target_completion_date=completion.date(),
+        current_status_id=refs["approved"].value_id,
+        completion_date=completion,
+    )
+    db_session.add(validation)
+    db_session.flush()
+    db_session.add(ValidationRequestModelVersion(request_id=validation.request_id, model_id=model.model_id))
+    db_session.add(ValidationScorecardResult(request_id=validation.request_id, overall_rating=rating))
+    db_session.flush()
+    return validation
+
+
+@pytest.fixture
+def ranked_models(db_session, test_user, usage_frequency, ranking_reference_data):
+    refs = ranking_reference_data
+
+    def make_model(name, tier):
+        model = Model(
+            model_name=name,
+            description="Final rating scenario",
+            development_type="In-House",
+            status="Active",
+            owner_id=test_user.user_id,
+            row_approval_status="approved",
+            usage_frequency_id=usage_frequency["daily"].value_id,
+            risk_tier_id=tier.value_id if tier else None,
+        )
+        db_session.add(model)
+        db_session.flush()
+        return model
+
+    current = make_model("Current", refs["high"])
+    _add_scored_validation(db_session, current, refs, test_user, "Green", 30)
+
+    overdue = make_model("Overdue", refs["high"])
+    _add_scored_validation(db_session, overdue, refs, test_user, "Green", 900)
+    _add_scored_validation(db_session, overdue, refs, test_user, "Yellow", 1200)
+
+    minimal = make_model("Minimally Overdue", refs["high"])
+    _add_scored_validation(db_session, minimal, refs, test_user, "Green-", 500)
+
+    no_policy = make_model("No Policy", refs["low"])
+    _add_scored_validation(db_session, no_policy, refs, test_user, "Yellow", 2000)
+
+    unscored = make_model("Unscored", refs["high"])
+    unmapped = make_model("Unmapped Tier", refs["unmapped"])
+    _add_scored_validation(db_session, unmapped, refs, test_user, "Green", 30)
+    no_tier = make_model("No Tier", None)
+
+    db_session.commit()
+    return [current, overdue, minimal, no_policy, unscored, unmapped, no_tier]
+
+
+def test_downgrade_scorecard_caps_at_red():
+    assert downgrade_scorecard("Green", 0) == "Green"
+    assert downgrade_scorecard("Green", 2) == "Yellow+"
+    assert downgrade_scorecard("Yellow-", 5) == "Red"
+    assert downgrade_scorecard("Unknown", 1) == "Unknown"
+
+
+def test_batch_matches_single_model(db_session, ranked_models):
+    """Batch results are identical to compute_final_model_risk_ranking per model."""
+    model_ids = [m.model_id for m in ranked_models]
+    batch = compute_final_model_risk_rankings(db_session, model_ids)
+
+    assert set(batch.keys()) == set(model_ids)
+    for model in ranked_models:
+        assert batch[model.model_id] == compute_final_model_risk_ranking(db_session, model.model_id), model.model_name
+
+
+def test_batch_applies_past_due_penalty(db_session, ranked_models):
+    """Overdue models are downgraded using the Past Due Level buckets."""
+    by_name = {m.model_name: m.model_id for m in ranked_models}
+    batch = compute_final_model_risk_rankings(db_session, by_name.values())
+
+    assert batch[by_name["Current"]]["downgrade_notches"] == 0
+    assert batch[by_name["Current"]]["final_rating"] == "Low"
+
+    overdue = batch[by_name["Overdue"]]
+    assert overdue["past_due_level_code"] == "CRITICAL"
+    assert overdue["adjusted_scorecard"] == "Yellow"
+    assert overdue["final_rating"] == "High"
+    assert overdue["residual_risk_without_penalty"] == "Low"
+
+    assert batch[by_name["Minimally Overdue"]]["past_due_level_code"] == "MINIMAL"
+    assert batch[by_name["No Policy"]]["days_overdue"] == 0
+    assert batch[by_name["Unscored"]] is None
+    assert batch[by_name["Unmapped Tier"]] is None
+    assert batch[by_name["No Tier"]] is None
+
+
+def test_batch_query_count_is_fixed(db_session, ranked_models):
+    """Batch computation uses a fixed number of queries."""
+    from sqlalchemy import event
+
+    model_ids = [m.model_id for m in ranked_models]
+    # Taxonomy registry is loaded once per process, not per call
+    taxonomy_registry.value_ids(db_session, "Validation Request Status", ["APPROVED"])
+    counter = {"value": 0}
+
+    def before_cursor_execute(*_args, **_kwargs):
+        counter["value"] += 1
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        compute_final_model_risk_rankings(db_session, model_ids)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert counter["value"] <= 7
+
+
+def test_batch_empty(db_session):
+    assert compute_final_model_risk_rankings(db_session, []) == {}
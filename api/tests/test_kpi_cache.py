@@ -0,0 +1,181 @@
+"""Tests for the KPI report cache backends and write-driven invalidation."""
+import json
+import os
+import stat
+
+import pytest
+
+from app.core.kpi_cache import (
+    FileKPICache,
+    InMemoryKPICache,
+    KPICacheBackend,
+    build_kpi_cache,
+    get_kpi_cache,
+    set_kpi_cache,
+)
+from app.models import Model
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryKPICache()
+    return FileKPICache(str(tmp_path / "kpi-cache"))
+
+
+class TestKPICacheBackends:
+    def test_get_set_roundtrip(self, cache):
+        assert cache.get(("kpi_report", None, None)) is None
+        cache.set(("kpi_report", None, None), {"total": 3}, ttl_seconds=60)
+        assert cache.get(("kpi_report", None, None)) == {"total": 3}
+        assert cache.get(("kpi_report", 1, None)) is None
+
+    def test_expired_entries_are_misses(self, cache):
+        cache.set("key", "value", ttl_seconds=-1)
+        assert cache.get("key") is None
+
+    def test_bump_generation_invalidates_entries(self, cache):
+        cache.set("key", "value", ttl_seconds=60)
+        before = cache.generation()
+        assert cache.bump_generation() == before + 1
+        assert cache.get("key") is None
+
+        cache.set("key", "fresh", ttl_seconds=60)
+        assert cache.get("key") == "fresh"
+
+    def test_set_drops_value_computed_under_an_older_generation(self, cache):
+        generation = cache.generation()
+        cache.bump_generation()
+        assert cache.set("key", "stale", ttl_seconds=60, generation=generation) is False
+        assert cache.get("key") is None
+
+        assert cache.set("key", "fresh", ttl_seconds=60, generation=cache.generation()) is True
+        assert cache.get("key") == "fresh"
+
+    def test_clear(self, cache):
+        cache.set("key", "value", ttl_seconds=60)
+        cache.clear()
+        assert cache.get("key") is None
+
+
+def test_file_cache_is_shared_between_instances(tmp_path):
+    """Two workers pointing at the same directory see each other's entries and bumps."""
+    directory = str(tmp_path / "shared")
+    worker_a = FileKPICache(directory)
+    worker_b = FileKPICache(directory)
+
+    worker_a.set("key", "value", ttl_seconds=60)
+    assert worker_b.get("key") == "value"
+
+    worker_b.bump_generation()
+    assert worker_a.get("key") is None
+
+
+def test_file_cache_uses_private_directory_and_json(tmp_path):
+    directory = tmp_path / "kpi-cache"
+    directory.mkdir(mode=0o777)
+    os.chmod(directory, 0o777)
+    cache = FileKPICache(str(directory))
+
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    cache.set("key", {"total": 3}, ttl_seconds=60)
+    (entry_file,) = [name for name in os.listdir(directory) if name.startswith("kpi-")]
+    with open(directory / entry_file) as handle:
+        assert json.load(handle)["value"] == {"total": 3}
+
+
+def test_file_cache_purges_expired_entries(tmp_path):
+    cache = FileKPICache(str(tmp_path / "kpi-cache"))
+    cache.set("old", "value", ttl_seconds=-1)
+    cache.set("live", "value", ttl_seconds=60)
+
+    assert cache.purge_expired() == 1
+    assert len([n for n in os.listdir(cache.directory) if n.startswith("kpi-")]) == 1
+
+    cache.bump_generation()
+    assert [n for n in os.listdir(cache.directory) if n.startswith("kpi-")] == []
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        KPICacheBackend()
+
+
+def test_build_kpi_cache_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        build_kpi_cache("redis")
+
+
+class TestKPIReportInvalidation:
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self):
+        previous = get_kpi_cache()
+        set_kpi_cache(InMemoryKPICache())
+        yield
+        set_kpi_cache(previous)
+
+    def _add_active_model(self, db_session, owner, usage_frequency, name):
+        db_session.add(Model(
+            model_name=name,
+            description="KPI cache test",
+            development_type="In-House",
+            status="Active",
+            owner_id=owner.user_id,
+            row_approval_status="approved",
+            usage_frequency_id=usage_frequency["daily"].value_id,
+        ))
+        db_session.commit()
+
+    def test_report_is_served_from_cache_until_a_write(
+        self, client, admin_headers, admin_user, db_session, usage_frequency, taxonomy_values
+    ):
+        self._add_active_model(db_session, admin_user, usage_frequency, "First")
+        first = client.get("/kpi-report/", headers=admin_headers)
+        assert first.status_code == 200
+        assert first.json()["total_active_models"] == 1
+
+        # Direct DB change: no router write, so the cached report is still served
+        self._add_active_model(db_session, admin_user, usage_frequency, "Second")
+        assert client.get("/kpi-report/", headers=admin_headers).json()["total_active_models"] == 1
+
+        # A write through an invalidating router bumps the generation
+        response = client.post("/monitoring/teams", headers=admin_headers, json={
+            "name": "Cache Invalidation Team",
+            "description": "Triggers KPI invalidation",
+        })
+        assert response.status_code == 201
+        assert client.get("/kpi-report/", headers=admin_headers).json()["total_active_models"] == 2
+
+    def test_report_computed_during_a_write_is_not_cached(
+        self, client, admin_headers, admin_user, db_session, usage_frequency, taxonomy_values, monkeypatch
+    ):
+        from app.api import kpi_report
+
+        compute = kpi_report.compute_kpi_report
+
+        def compute_then_write(*args, **kwargs):
+            report = compute(*args, **kwargs)
+            # A write commits and bumps the generation while the report is built
+            self._add_active_model(db_session, admin_user, usage_frequency, "Concurrent")
+            get_kpi_cache().bump_generation()
+            return report
+
+        self._add_active_model(db_session, admin_user, usage_frequency, "First")
+        monkeypatch.setattr(kpi_report, "compute_kpi_report", compute_then_write)
+        assert client.get("/kpi-report/", headers=admin_headers).json()["total_active_models"] == 1
+
+        monkeypatch.setattr(kpi_report, "compute_kpi_report", compute)
+        assert client.get("/kpi-report/", headers=admin_headers).json()["total_active_models"] == 2
+
+    def test_failed_write_does_not_invalidate(self, client, admin_headers, auth_headers):
+        cache = get_kpi_cache()
+        generation = cache.generation()
+        response = client.post("/monitoring/teams", headers=auth_headers, json={"name": "Denied"})
+        assert response.status_code == 403
+        assert cache.generation() == generation
+
+    def test_reads_do_not_invalidate(self, client, admin_headers):
+        cache = get_kpi_cache()
+        generation = cache.generation()
+        client.get("/monitoring/teams", headers=admin_headers)
+        assert cache.generation() == generation
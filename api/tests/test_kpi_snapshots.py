@@ -0,0 +1,150 @@
+"""Tests for KPI metric snapshots and GET /kpi-report/history."""
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.kpi_snapshots import list_snapshot_scopes, snapshot_kpi_metrics, stale_snapshot_scopes
+from app.core.audit import create_audit_log
+from app.models import Model
+from app.models.kpi_snapshot import KpiMetricSnapshot
+from app.models.region import Region
+from app.models.team import Team
+
+
+@pytest.fixture
+def snapshot_models(db_session, admin_user, usage_frequency, taxonomy_values):
+    def add(name):
+        db_session.add(Model(
+            model_name=name,
+            description="KPI snapshot test",
+            development_type="In-House",
+            status="Active",
+            owner_id=admin_user.user_id,
+            row_approval_status="approved",
+            usage_frequency_id=usage_frequency["daily"].value_id,
+        ))
+        db_session.commit()
+
+    add("Snapshot Model 1")
+    return add
+
+
+def _metric(report, metric_id):
+    return next(m for m in report["metrics"] if m["metric_id"] == metric_id)
+
+
+def test_scopes_cover_every_region_and_team(db_session):
+    db_session.add_all([Region(code="US", name="United States"), Team(name="Alpha")])
+    db_session.commit()
+    region_id = db_session.query(Region.region_id).scalar()
+    team_id = db_session.query(Team.team_id).scalar()
+
+    scopes = set(list_snapshot_scopes(db_session))
+    assert scopes == {
+        (None, None), (None, 0), (None, team_id),
+        (region_id, None), (region_id, 0), (region_id, team_id),
+    }
+
+
+def test_rerun_replaces_rows_for_the_same_date(db_session, snapshot_models):
+    first = snapshot_kpi_metrics(db_session, scopes=[(None, None)])
+    second = snapshot_kpi_metrics(db_session, scopes=[(None, None)])
+    assert first["rows_written"] == second["rows_written"] > 0
+    assert db_session.query(KpiMetricSnapshot).count() == second["rows_written"]
+
+
+def test_run_snapshot_endpoint_requires_admin(client, auth_headers):
+    response = client.post("/kpi-report/snapshots", headers=auth_headers)
+    assert response.status_code == 403
+
+
+def test_stale_scopes_follow_the_audit_log(db_session, snapshot_models, admin_user):
+    today = date.today()
+    scopes = [(None, None), (None, 0)]
+    snapshot_kpi_metrics(db_session, as_of_date=today, scopes=[(None, None)])
+    assert stale_snapshot_scopes(db_session, today, scopes) == [(None, 0)]
+
+    create_audit_log(db_session, "Model", 1, "UPDATE", admin_user.user_id, {})
+    db_session.commit()
+    assert stale_snapshot_scopes(db_session, today, scopes) == scopes
+
+
+def test_run_snapshot_endpoint(client, admin_headers, db_session, snapshot_models):
+    response = client.post("/kpi-report/snapshots", headers=admin_headers)
+    assert response.status_code == 202
+    data = response.json()
+    assert data["as_of_date"] == date.today().isoformat()
+    assert data["scopes"] == 2  # All Teams + Unassigned, no regions/teams configured
+    assert data["scopes_up_to_date"] == 0
+    # TestClient runs background tasks before returning the response
+    assert db_session.query(KpiMetricSnapshot.team_id).distinct().count() == 2
+
+    again = client.post("/kpi-report/snapshots", headers=admin_headers).json()
+    assert again["scopes"] == 0
+    assert again["scopes_up_to_date"] == 2
+
+    forced = client.post("/kpi-report/snapshots?force=true", headers=admin_headers).json()
+    assert forced["scopes"] == 2
+
+
+def test_future_as_of_date_is_rejected(client, admin_headers):
+    tomorrow = date.today() + timedelta(days=1)
+    response = client.get(f"/kpi-report/?as_of_date={tomorrow.isoformat()}", headers=admin_headers)
+    assert response.status_code == 400
+
+
+def test_past_report_is_served_from_snapshot(client, admin_headers, db_session, snapshot_models):
+    yesterday = date.today() - timedelta(days=1)
+    live = client.get("/kpi-report/", headers=admin_headers).json()
+    snapshot_kpi_metrics(db_session, as_of_date=yesterday, scopes=[(None, None)])
+
+    # Data changes after the snapshot do not affect the stored report
+    snapshot_models("Snapshot Model 2")
+
+    response = client.get(f"/kpi-report/?as_of_date={yesterday.isoformat()}", headers=admin_headers)
+    assert response.status_code == 200
+    past = response.json()
+    assert past["as_of_date"] == yesterday.isoformat()
+    assert past["total_active_models"] == 1
+    assert past["metrics"] == live["metrics"]
+
+
+def test_past_report_without_snapshot_is_404(client, admin_headers):
+    yesterday = date.today() - timedelta(days=1)
+    response = client.get(f"/kpi-report/?as_of_date={yesterday.isoformat()}", headers=admin_headers)
+    assert response.status_code == 404
+
+
+def test_history_returns_series_per_metric(client, admin_headers, db_session, snapshot_models):
+    today = date.today()
+    snapshot_kpi_metrics(db_session, as_of_date=today - timedelta(days=2), scopes=[(None, None)])
+    snapshot_models("Snapshot Model 2")
+    snapshot_kpi_metrics(db_session, as_of_date=today - timedelta(days=1), scopes=[(None, None), (None, 0)])
+
+    response = client.get("/kpi-report/history?metric_ids=4.1", headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["end_date"] == today.isoformat()
+    assert [m["metric_id"] for m in data["metrics"]] == ["4.1"]
+    points = data["metrics"][0]["points"]
+    assert [p["count_value"] for p in points] == [1, 2]
+    assert [p["as_of_date"] for p in points] == [
+        (today - timedelta(days=2)).isoformat(),
+        (today - timedelta(days=1)).isoformat(),
+    ]
+
+    window = client.get(
+        f"/kpi-report/history?metric_ids=4.1&start_date={(today - timedelta(days=1)).isoformat()}",
+        headers=admin_headers,
+    ).json()
+    assert len(window["metrics"][0]["points"]) == 1
+
+    unassigned = client.get("/kpi-report/history?team_id=0&metric_ids=4.1", headers=admin_headers).json()
+    assert len(unassigned["metrics"][0]["points"]) == 1
+
+
+def test_history_rejects_inverted_window(client, admin_headers):
+    response = client.get(
+        "/kpi-report/history?start_date=2025-02-01&end_date=2025-01-01", headers=admin_headers
+    )
+    assert response.status_code == 400
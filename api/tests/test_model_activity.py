@@ -0,0 +1,76 @@
+"""Tests for the keyset-paginated model activity stream (timeline and news feed)."""
+from datetime import datetime, timedelta
+
+from app.models.model_submission_comment import ModelSubmissionComment
+
+
+def _add_comments(db_session, model, user, count):
+    start = datetime(2026, 1, 1, 9, 0)
+    for index in range(count):
+        db_session.add(ModelSubmissionComment(
+            model_id=model.model_id,
+            user_id=user.user_id,
+            comment_text=f"Comment {index}",
+            # Pairs of comments share a timestamp to exercise the cursor tie-break
+            created_at=start + timedelta(minutes=index // 2),
+        ))
+    db_session.commit()
+
+
+def _comment_ids(activities):
+    return [a["entity_id"] for a in activities if a["activity_type"] == "comment_added"]
+
+
+def test_timeline_pages_with_cursor(client, db_session, sample_model, test_user, auth_headers):
+    _add_comments(db_session, sample_model, test_user, 5)
+    url = f"/models/{sample_model.model_id}/activity-timeline"
+
+    full = client.get(url, headers=auth_headers).json()
+    assert full["next_cursor"] is None
+
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, headers=auth_headers, params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["activities"]) <= 2
+        assert body["page_count"] == len(body["activities"])
+        assert body["total_count"] == body["page_count"]
+        pages.extend(body["activities"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == full["activities"]
+    assert len(_comment_ids(pages)) == 5
+    timestamps = [a["timestamp"] for a in pages]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+def test_timeline_rejects_invalid_cursor(client, sample_model, auth_headers):
+    response = client.get(
+        f"/models/{sample_model.model_id}/activity-timeline",
+        headers=auth_headers,
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+
+
+def test_news_feed_pages_with_entry_cursor(client, db_session, sample_model, test_user, auth_headers):
+    _add_comments(db_session, sample_model, test_user, 5)
+
+    full = client.get("/dashboard/news-feed", headers=auth_headers).json()
+    first = client.get("/dashboard/news-feed", headers=auth_headers, params={"limit": 3}).json()
+    rest = client.get(
+        "/dashboard/news-feed",
+        headers=auth_headers,
+        params={"limit": 50, "cursor": first[-1]["cursor"]},
+    ).json()
+
+    assert len(first) == 3
+    assert first + rest == full
+    assert len({entry["cursor"] for entry in full}) == len(full)
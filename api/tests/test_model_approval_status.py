@@ -7,6 +7,7 @@ from app.core.model_approval_status import (
     ApprovalStatus,
     STATUS_LABELS,
     compute_model_approval_status,
+    compute_model_approval_statuses,
     record_status_change,
     get_last_recorded_status,
     get_status_label,
@@ -17,9 +18,15 @@ from app.core.model_approval_status import (
     _is_model_overdue,
     _check_approvals_complete,
 )
+from app.core.taxonomy_registry import taxonomy_registry
 from app.models.model_approval_status_history import ModelApprovalStatusHistory
 from app.models.model import Model
-from app.models.validation import ValidationRequest, ValidationRequestModelVersion, ValidationApproval
+from app.models.validation import (
+    ValidationRequest,
+    ValidationRequestModelVersion,
+    ValidationApproval,
+    ValidationPolicy,
+)
 from app.models.taxonomy import Taxonomy, TaxonomyValue
 
 
@@ -705,6 +712,164 @@ class TestBackfillAndUtility:
         assert get_status_label(None) is None
 
 
+# =============================================================================
+# F. Batch Computation Tests
+# =============================================================================
+
+def _strip_computed_at(result):
+    status, context = result
+    return status, {k: v for k, v in context.items() if k != "computed_at"}
+
+
+def _add_validation(db_session, model, status_value, type_value, priority_value, user, days_ago):
+    validation = ValidationRequest(
+        request_date=date.today() - timedelta(days=days_ago + 30),
+        requestor_id=user.user_id,
+        validation_type_id=type_value.value_id,
+        priority_id=priority_value.value_id,
+        target_completion_date=date.today() - timedelta(days=days_ago),
+        current_status_id=status_value.value_id,
+        completion_date=date.today() - timedelta(days=days_ago) if status_value.code == "APPROVED" else None,
+    )
+    db_session.add(validation)
+    db_session.flush()
+    db_session.add(ValidationRequestModelVersion(
+        request_id=validation.request_id,
+        model_id=model.model_id
+    ))
+    db_session.flush()
+    return validation
+
+
+class TestBatchComputation:
+    """compute_model_approval_statuses must match the per-model function exactly."""
+
+    @pytest.fixture
+    def scenario_models(self, db_session, test_user, usage_frequency, risk_tier_taxonomy,
+                        status_taxonomy, validation_type_taxonomy, priority_taxonomy):
+        tier = risk_tier_taxonomy["TIER_1"]
+        db_session.add(ValidationPolicy(
+            risk_tier_id=tier.value_id,
+            frequency_months=12,
+            grace_period_months=3,
+            model_change_lead_time_days=90,
+        ))
+
+        def make_model(name, **kwargs):
+            model = Model(
+                model_name=name,
+                description="Batch approval status scenario",
+                development_type="In-House",
+                status="Active",
+                owner_id=test_user.user_id,
+                row_approval_status="approved",
+                usage_frequency_id=usage_frequency["daily"].value_id,
+                risk_tier_id=tier.value_id,
+                **kwargs
+            )
+            db_session.add(model)
+            db_session.flush()
+            return model
+
+        std = priority_taxonomy["STANDARD"]
+        approved = status_taxonomy["APPROVED"]
+        comprehensive = validation_type_taxonomy["COMPREHENSIVE"]
+
+        never = make_model("Never Validated")
+        current = make_model("Current")
+        _add_validation(db_session, current, approved, comprehensive, std, test_user, 30)
+
+        interim = make_model("Interim")
+        _add_validation(db_session, interim, approved, validation_type_taxonomy["INTERIM"], std, test_user, 10)
+
+        expired = make_model("Expired")
+        _add_validation(db_session, expired, approved, comprehensive, std, test_user, 900)
+        _add_validation(db_session, expired, status_taxonomy["INTAKE"], comprehensive, std, test_user, 1)
+
+        in_progress = make_model("In Progress")
+        _add_validation(db_session, in_progress, approved, comprehensive, std, test_user, 1000)
+        _add_validation(db_session, in_progress, approved, validation_type_taxonomy["INITIAL"], std, test_user, 2000)
+        _add_validation(db_session, in_progress, status_taxonomy["REVIEW"], comprehensive, std, test_user, 5)
+
+        pending = make_model("Pending Approvals")
+        pending_validation = _add_validation(db_session, pending, approved, comprehensive, std, test_user, 20)
+        db_session.add_all([
+            ValidationApproval(
+                request_id=pending_validation.request_id,
+                approver_role="Model Owner",
+                approval_status="Pending",
+                is_required=True,
+            ),
+            ValidationApproval(
+                request_id=pending_validation.request_id,
+                approver_role="Global Approver",
+                approval_status="Pending",
+                is_required=False,
+                assigned_approver_id=test_user.user_id,
+            ),
+        ])
+
+        no_policy = make_model("No Policy")
+        no_policy.risk_tier_id = None
+        _add_validation(db_session, no_policy, approved, comprehensive, std, test_user, 400)
+
+        non_model = make_model("Non Model", is_model=False)
+
+        db_session.commit()
+        return [never, current, interim, expired, in_progress, pending, no_policy, non_model]
+
+    def test_batch_matches_per_model(self, db_session, scenario_models):
+        """Every scenario produces the same status and context as the scalar path."""
+        batch = compute_model_approval_statuses(scenario_models, db_session)
+
+        assert set(batch.keys()) == {m.model_id for m in scenario_models}
+        for model in scenario_models:
+            expected = compute_model_approval_status(model, db_session)
+            assert _strip_computed_at(batch[model.model_id]) == _strip_computed_at(expected), model.model_name
+
+    def test_batch_covers_all_statuses(self, db_session, scenario_models):
+        """Scenario set exercises every approval status branch."""
+        batch = compute_model_approval_statuses(scenario_models, db_session)
+        statuses = {status for status, _ in batch.values()}
+
+        assert statuses >= {
+            None,
+            ApprovalStatus.NEVER_VALIDATED,
+            ApprovalStatus.APPROVED,
+            ApprovalStatus.INTERIM_APPROVED,
+            ApprovalStatus.VALIDATION_IN_PROGRESS,
+            ApprovalStatus.EXPIRED,
+        }
+
+    def test_batch_query_count_is_fixed(self, db_session, scenario_models):
+        """Query count does not grow with the number of models."""
+        from sqlalchemy import event
+
+        counter = {"value": 0}
+
+        def before_cursor_execute(*_args, **_kwargs):
+            counter["value"] += 1
+
+        # Reload models so attribute access does not trigger refresh queries
+        db_session.query(Model).all()
+        # Taxonomy registry is loaded once per process, not per call
+        taxonomy_registry.value_ids(db_session, "Validation Request Status", ["APPROVED"])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            compute_model_approval_statuses(scenario_models, db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        # Per-model path issues several queries per model; batch stays fixed
+        assert counter["value"] <= 12
+
+    def test_batch_empty(self, db_session):
+        """Empty input returns an empty dict without querying."""
+        assert compute_model_approval_statuses([], db_session) == {}
+
+
 # =============================================================================
 # API Endpoint Tests
 # =============================================================================
@@ -67,6 +67,100 @@ class TestListModels:
         assert response.status_code == 403  # FastAPI OAuth2 returns 403 for missing token
 
 
+    def _create_models(self, db_session, test_user, usage_frequency, count):
+        from app.models.model import Model
+        models = []
+        for i in range(count):
+            model = Model(
+                model_name=f"Paged Model {i}",
+                description="Pagination test model",
+                development_type="In-House",
+                status="Active",
+                owner_id=test_user.user_id,
+                row_approval_status="approved",
+                usage_frequency_id=usage_frequency["daily"].value_id,
+            )
+            db_session.add(model)
+            models.append(model)
+        db_session.commit()
+        return sorted(m.model_id for m in models)
+
+    def test_list_models_keyset_pagination(
+        self, client, admin_headers, db_session, test_user, usage_frequency
+    ):
+        """Pages chained via after_id cover every model exactly once, in model_id order."""
+        model_ids = self._create_models(db_session, test_user, usage_frequency, 5)
+
+        first = client.get("/models/?limit=2", headers=admin_headers).json()
+        assert [m["model_id"] for m in first] == model_ids[:2]
+
+        second = client.get(
+            f"/models/?limit=2&after_id={first[-1]['model_id']}", headers=admin_headers
+        ).json()
+        assert [m["model_id"] for m in second] == model_ids[2:4]
+
+        last = client.get(
+            f"/models/?limit=2&after_id={second[-1]['model_id']}", headers=admin_headers
+        ).json()
+        assert [m["model_id"] for m in last] == model_ids[4:]
+
+    def test_list_models_limit_validation(self, client, auth_headers):
+        response = client.get("/models/?limit=0", headers=auth_headers)
+        assert response.status_code == 422
+
+    def test_list_models_sparse_fields(self, client, auth_headers, sample_model):
+        """Only requested relationship fields are populated; scalars are always present."""
+        full = client.get("/models/", headers=auth_headers).json()[0]
+        assert full["owner"] is not None
+        assert full["usage_frequency"] is not None
+
+        response = client.get("/models/?fields=owner", headers=auth_headers)
+        assert response.status_code == 200
+        sparse = response.json()[0]
+        assert sparse["model_id"] == sample_model.model_id
+        assert sparse["model_name"] == "Test Model"
+        assert sparse["owner"] == full["owner"]
+        assert sparse["usage_frequency"] is None
+        assert sparse["users"] == []
+
+    def test_list_models_unknown_field_rejected(self, client, auth_headers):
+        response = client.get("/models/?fields=owner,not_a_field", headers=auth_headers)
+        assert response.status_code == 400
+        assert "not_a_field" in response.json()["detail"]
+
+    def test_list_models_exclude_sub_models(
+        self, client, admin_headers, db_session, test_user, usage_frequency
+    ):
+        """Active children are excluded; ended relationships no longer hide the child."""
+        from datetime import timedelta
+        from app.models.model_hierarchy import ModelHierarchy
+
+        parent_id, child_id, former_child_id = self._create_models(
+            db_session, test_user, usage_frequency, 3
+        )
+        rel_tax = Taxonomy(name="Model Hierarchy Type", is_system=True)
+        db_session.add(rel_tax)
+        db_session.flush()
+        sub_model = TaxonomyValue(
+            taxonomy_id=rel_tax.taxonomy_id, code="SUB_MODEL", label="Sub-Model", sort_order=1
+        )
+        db_session.add(sub_model)
+        db_session.flush()
+        db_session.add_all([
+            ModelHierarchy(parent_model_id=parent_id, child_model_id=child_id,
+                           relation_type_id=sub_model.value_id),
+            ModelHierarchy(parent_model_id=parent_id, child_model_id=former_child_id,
+                           relation_type_id=sub_model.value_id,
+                           end_date=date.today() - timedelta(days=1)),
+        ])
+        db_session.commit()
+
+        response = client.get("/models/?exclude_sub_models=true", headers=admin_headers)
+        assert response.status_code == 200
+        returned = {m["model_id"] for m in response.json()}
+        assert returned == {parent_id, former_child_id}
+
+
 class TestCreateModel:
     """Test POST /models/ endpoint."""
 
@@ -3750,6 +3750,73 @@ class TestCSVImport:
         assert results[0]["numeric_value"] == 0.25
         assert results[0]["calculated_outcome"] == "YELLOW"  # 0.25 is in yellow range
 
+    def test_csv_import_bulk_chunks(self, client, admin_headers, db_session, usage_frequency, monkeypatch):
+        """Rows are written in chunks; repeated keys update, invalid rows are skipped."""
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "MONITORING_IMPORT_CHUNK_ROWS", 2)
+        setup = self._setup_plan_with_metrics(client, admin_headers, db_session, usage_frequency)
+
+        rows = [
+            f"{setup['model_id']},{setup['metric_id']},0.05,,First",
+            "not-a-model,1,0.1,,Bad",
+            f"{setup['model_id']},{setup['metric_id']},0.35,,",
+            f"{setup['model_id']},{setup['metric_id']},0.15,,Last",
+        ]
+        csv_content = "model_id,metric_id,value,outcome,narrative\n" + "\n".join(rows)
+
+        from io import BytesIO
+        response = client.post(
+            f"/monitoring/cycles/{setup['cycle_id']}/results/import?dry_run=false",
+            headers=admin_headers,
+            files={"file": ("results.csv", BytesIO(csv_content.encode()), "text/csv")}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 1
+        assert data["updated"] == 2
+        assert data["skipped"] == 1
+        assert data["error_messages"] == ["Row 2: Invalid or missing model_id"]
+
+        results = client.get(
+            f"/monitoring/cycles/{setup['cycle_id']}/results",
+            headers=admin_headers
+        ).json()
+        assert len(results) == 1
+        assert results[0]["numeric_value"] == 0.15
+        assert results[0]["calculated_outcome"] == "GREEN"
+        assert results[0]["narrative"] == "Last"
+
+    def test_csv_import_preview_caps_rows(self, client, admin_headers, db_session, usage_frequency, monkeypatch):
+        """Dry runs list only the first preview rows but count the whole file."""
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "MONITORING_IMPORT_PREVIEW_ROWS", 1)
+        setup = self._setup_plan_with_metrics(client, admin_headers, db_session, usage_frequency)
+
+        rows = [
+            f"{setup['model_id']},{setup['metric_id']},0.05,,First",
+            "not-a-model,1,0.1,,Bad",
+            "also-bad,1,0.1,,Bad",
+            f"{setup['model_id']},{setup['metric_id']},0.15,,Second",
+        ]
+        csv_content = "model_id,metric_id,value,outcome,narrative\n" + "\n".join(rows)
+
+        from io import BytesIO
+        response = client.post(
+            f"/monitoring/cycles/{setup['cycle_id']}/results/import?dry_run=true",
+            headers=admin_headers,
+            files={"file": ("results.csv", BytesIO(csv_content.encode()), "text/csv")}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["valid_rows"]) == 1
+        assert len(data["error_rows"]) == 1
+        assert data["summary"]["total_rows"] == 4
+        assert data["summary"]["create_count"] == 2
+        assert data["summary"]["error_count"] == 2
+        assert data["summary"]["rows_truncated"] is True
+
     def test_csv_import_invalid_model_id_fails(self, client, admin_headers, db_session, usage_frequency):
         """CSV import rejects invalid model IDs."""
         setup = self._setup_plan_with_metrics(client, admin_headers, db_session, usage_frequency)
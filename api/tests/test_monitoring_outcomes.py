@@ -0,0 +1,57 @@
+"""Tests for batch monitoring outcome evaluation."""
+import itertools
+import math
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.core.monitoring_outcomes import (  # noqa: E402
+    ThresholdTable,
+    calculate_outcome,
+    evaluate_outcomes,
+)
+
+VALUES = [None, math.nan, -math.inf, math.inf, -1.0, 0.0, 0.5, 0.7, 0.8, 0.9, 1.0, 2]
+BOUNDS = [None, 0.7, 0.9]
+
+
+def _threshold_sets():
+    for yellow_min, yellow_max, red_min, red_max in itertools.product(
+        [None, 0.8], [None, 0.95], BOUNDS, [None, 1.0]
+    ):
+        yield SimpleNamespace(yellow_min=yellow_min, yellow_max=yellow_max, red_min=red_min, red_max=red_max)
+
+
+def test_batch_matches_scalar_outcomes():
+    cases = [(value, metric) for metric in _threshold_sets() for value in VALUES]
+
+    batch = evaluate_outcomes(
+        [value for value, _ in cases],
+        [metric.yellow_min for _, metric in cases],
+        [metric.yellow_max for _, metric in cases],
+        [metric.red_min for _, metric in cases],
+        [metric.red_max for _, metric in cases],
+    )
+
+    assert batch == [calculate_outcome(value, metric) for value, metric in cases]
+    assert {"N/A", "UNCONFIGURED", "GREEN", "YELLOW", "RED"} <= set(batch)
+
+
+def test_threshold_table_gathers_by_key():
+    sources = {
+        "unset": SimpleNamespace(yellow_min=None, yellow_max=None, red_min=None, red_max=None),
+        "floor": SimpleNamespace(yellow_min=0.8, yellow_max=None, red_min=0.7, red_max=None),
+        "nan_bound": SimpleNamespace(yellow_min=math.nan, yellow_max=None, red_min=None, red_max=None),
+    }
+    table = ThresholdTable(sources)
+    keys = ["floor", "unset", "floor", "floor", "nan_bound", "floor"]
+    values = [0.75, 0.5, 0.65, 0.8, 0.1, None]
+
+    assert "floor" in table and "missing" not in table
+    assert table.evaluate(keys, values) == [
+        calculate_outcome(value, sources[key]) for key, value in zip(keys, values)
+    ]
+    assert table.evaluate(keys, values) == ["YELLOW", "UNCONFIGURED", "RED", "GREEN", "GREEN", "N/A"]
+    assert table.evaluate([], []) == []
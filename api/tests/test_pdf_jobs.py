@@ -0,0 +1,116 @@
+"""Tests for background PDF jobs and the artifact store."""
+import os
+import stat
+from datetime import date, timedelta
+
+import pytest
+
+from app.core import pdf_jobs
+from app.core.pdf_jobs import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PENDING,
+    artifact_key,
+    get_pdf_job_runner,
+    render_pdf_cached,
+)
+from app.core.time import utc_now
+
+
+@pytest.fixture
+def fake_renderer(monkeypatch):
+    calls = []
+
+    def render(payload):
+        calls.append(payload)
+        if payload.get("fail"):
+            raise ValueError("bad payload")
+        return b"%PDF-" + str(payload["value"]).encode()
+
+    monkeypatch.setitem(pdf_jobs.RENDERERS, "fake", render)
+    return calls
+
+
+def test_artifact_key_depends_only_on_content():
+    payload = {"b": [1, 2], "a": date(2025, 1, 31)}
+    assert artifact_key("fake", payload) == artifact_key("fake", {"a": date(2025, 1, 31), "b": [1, 2]})
+    assert artifact_key("fake", payload) != artifact_key("fake", {**payload, "b": [2, 1]})
+    assert artifact_key("fake", payload) != artifact_key("other", payload)
+
+
+def test_job_completes_and_reuses_artifact(pdf_job_runner, fake_renderer):
+    job = pdf_job_runner.submit("fake", {"value": 1}, "one.pdf", owner_id=7)
+    finished = pdf_job_runner.wait(job["job_id"], timeout=5)
+
+    assert finished["status"] == JOB_COMPLETED
+    assert pdf_job_runner.store.get(finished["artifact_key"]) == b"%PDF-1"
+
+    repeat = pdf_job_runner.submit("fake", {"value": 1}, "one.pdf", owner_id=7)
+    assert repeat["status"] == JOB_COMPLETED
+    assert len(fake_renderer) == 1
+
+
+def test_failed_job_records_error(pdf_job_runner, fake_renderer):
+    job = pdf_job_runner.submit("fake", {"value": 1, "fail": True}, "bad.pdf", owner_id=7)
+    finished = pdf_job_runner.wait(job["job_id"], timeout=5)
+
+    assert finished["status"] == JOB_FAILED
+    assert "bad payload" in finished["error"]
+
+
+def test_stale_pending_job_is_reported_failed(pdf_job_runner):
+    # A job whose worker died never gets a completion callback
+    pdf_job_runner.store.save_job({
+        "job_id": "orphan",
+        "renderer": "fake",
+        "status": JOB_PENDING,
+        "filename": "orphan.pdf",
+        "owner_id": 7,
+        "artifact_key": "missing",
+        "error": None,
+        "created_at": (utc_now() - timedelta(seconds=pdf_job_runner.timeout_seconds + 1)).isoformat(),
+        "completed_at": None,
+    })
+
+    job = pdf_job_runner.get("orphan")
+    assert job["status"] == JOB_FAILED
+    assert "did not finish" in job["error"]
+    assert pdf_job_runner.store.load_job("orphan")["status"] == JOB_FAILED
+
+
+def test_artifact_directory_is_private(monkeypatch, tmp_path):
+    directory = tmp_path / "artifacts"
+    monkeypatch.setattr(pdf_jobs, "_runner", None)
+    monkeypatch.setattr(pdf_jobs.settings, "PDF_ARTIFACT_DIR", str(directory))
+
+    runner = get_pdf_job_runner()
+    assert runner.store.directory == str(directory)
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+
+def test_inline_render_only_stores_when_asked(pdf_job_runner, fake_renderer):
+    assert render_pdf_cached("fake", {"value": 2}) == b"%PDF-2"
+    assert render_pdf_cached("fake", {"value": 2}) == b"%PDF-2"
+    assert len(fake_renderer) == 2
+
+    render_pdf_cached("fake", {"value": 3}, store_result=True)
+    render_pdf_cached("fake", {"value": 3}, store_result=True)
+    assert len(fake_renderer) == 3
+
+
+def test_background_portfolio_pdf(client, auth_headers, admin_headers):
+    response = client.get("/reports/my-portfolio/pdf?background=true", headers=auth_headers)
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    status_response = client.get(f"/pdf-jobs/{job_id}?wait=5", headers=auth_headers)
+    assert status_response.status_code == 200
+    assert status_response.json()["status"] == JOB_COMPLETED
+
+    download = client.get(status_response.json()["download_url"], headers=auth_headers)
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/pdf"
+    assert download.content.startswith(b"%PDF")
+
+    # Jobs are private to the user who queued them
+    assert client.get(f"/pdf-jobs/{job_id}", headers=admin_headers).status_code == 404
@@ -0,0 +1,111 @@
+"""Tests for the request-level SQL query profiler."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.query_profiler import ProfileBuffer, QueryProfilerMiddleware, fingerprint
+
+
+@pytest.fixture
+def profiled_app(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+
+    buffer = ProfileBuffer(maxlen=2)
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware, buffer=buffer, slow_limit=2, repeat_threshold=3)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            return {"name": conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id}).scalar()}
+
+    @app.get("/loop")
+    def read_loop():
+        with engine.connect() as conn:
+            ids = conn.execute(text("SELECT id FROM items")).scalars().all()
+            return [
+                conn.execute(text(f"SELECT name FROM items WHERE id = {item_id}")).scalar()
+                for item_id in ids
+            ]
+
+    yield app, buffer
+    engine.dispose()
+
+
+def test_fingerprint_normalizes_literals():
+    assert fingerprint("SELECT * FROM t WHERE id = 1") == fingerprint("SELECT *\n FROM t WHERE id = 42")
+    assert fingerprint("SELECT * FROM t WHERE name = 'x'") == "SELECT * FROM t WHERE name = ?"
+    assert fingerprint("SELECT * FROM t WHERE id IN (1, 2, 3)") == "SELECT * FROM t WHERE id IN (...)"
+    assert fingerprint("SELECT * FROM t WHERE id = %(id_1)s") == "SELECT * FROM t WHERE id = ?"
+
+
+def test_server_timing_header(profiled_app):
+    app, buffer = profiled_app
+    with TestClient(app) as client:
+        response = client.get("/items/1")
+
+    assert response.json() == {"name": "a"}
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert '"1 queries"' in response.headers["server-timing"]
+
+    profile = buffer.items()[0]
+    assert profile["route"] == "GET /items/{item_id}"
+    assert profile["path"] == "/items/1"
+    assert profile["status_code"] == 200
+    assert profile["query_count"] == 1
+    assert profile["repeated_statements"] == []
+
+
+def test_repeated_statements_are_flagged(profiled_app):
+    app, buffer = profiled_app
+    with TestClient(app) as client:
+        response = client.get("/loop")
+
+    assert response.json() == ["a", "b", "c"]
+    assert "n-plus-one" in response.headers["server-timing"]
+
+    profile = buffer.items()[0]
+    assert profile["query_count"] == 4
+    assert len(profile["slowest_statements"]) == 2
+    assert profile["repeated_statements"] == [
+        {
+            "fingerprint": "SELECT name FROM items WHERE id = ?",
+            "count": 3,
+            "total_ms": profile["repeated_statements"][0]["total_ms"],
+        }
+    ]
+
+
+def test_buffer_keeps_most_recent_profiles(profiled_app):
+    app, buffer = profiled_app
+    with TestClient(app) as client:
+        for item_id in (1, 2, 3):
+            client.get(f"/items/{item_id}")
+
+    assert [profile["path"] for profile in buffer.items()] == ["/items/3", "/items/2"]
+
+
+def test_queries_outside_requests_are_not_recorded(profiled_app, tmp_path):
+    app, buffer = profiled_app
+    with TestClient(app):
+        engine = create_engine(f"sqlite:///{tmp_path / 'other.db'}")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        engine.dispose()
+
+    assert buffer.items() == []
+
+
+def test_debug_profiles_requires_admin(client, auth_headers):
+    response = client.get("/debug/profiles", headers=auth_headers)
+    assert response.status_code == 403
+
+
+def test_debug_profiles(client, admin_headers):
+    response = client.get("/debug/profiles", headers=admin_headers)
+    assert response.status_code == 200
+    assert set(response.json()) == {"enabled", "profiles"}
@@ -0,0 +1,40 @@
+"""Tests for the async-route / sync-Session startup check."""
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.route_checks import check_async_routes, find_async_routes_with_sync_session
+from app.main import app
+
+
+def _get_repository(db: Session = Depends(get_db)):
+    return db
+
+
+def test_application_has_no_async_routes_using_sync_session():
+    assert find_async_routes_with_sync_session(app.routes) == []
+
+
+def test_async_route_with_sync_session_is_reported():
+    probe = FastAPI()
+
+    @probe.get("/direct")
+    async def direct(db: Session = Depends(get_db)):
+        return {}
+
+    @probe.get("/nested")
+    async def nested(repo=Depends(_get_repository)):
+        return {}
+
+    @probe.get("/sync")
+    def sync(db: Session = Depends(get_db)):
+        return {}
+
+    @probe.get("/no-db")
+    async def no_db():
+        return {}
+
+    assert find_async_routes_with_sync_session(probe.routes) == ["GET /direct", "GET /nested"]
+    with pytest.raises(RuntimeError, match="/direct"):
+        check_async_routes(probe)
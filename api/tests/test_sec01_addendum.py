@@ -10,7 +10,7 @@ import app.api.analytics as analytics
 
 @pytest.fixture
 def mock_db_session():
-    with patch("app.api.analytics.SessionLocal") as mock:
+    with patch("app.api.analytics.ReportingSessionLocal") as mock:
         session = MagicMock()
         mock.return_value.__enter__.return_value = session
         yield session
@@ -37,11 +37,11 @@ class TestAnalyticsSecurity:
 
     def test_analytics_valid_select(self, client, admin_headers, db_session):
         """Test valid SELECT query is allowed."""
-        # Mock SessionLocal to return our proxy session
+        # Mock ReportingSessionLocal to return our proxy session
         mock_session_cls = MagicMock()
         mock_session_cls.return_value = MockAnalyticsSession(db_session)
 
-        with patch("app.api.analytics.SessionLocal", mock_session_cls):
+        with patch("app.api.analytics.ReportingSessionLocal", mock_session_cls):
             response = client.post(
                 "/analytics/query",
                 headers=admin_headers,
@@ -65,7 +65,7 @@ class TestAnalyticsSecurity:
         mock_session_cls = MagicMock()
         mock_session_cls.return_value = MockAnalyticsSession(db_session)
 
-        with patch("app.api.analytics.SessionLocal", mock_session_cls):
+        with patch("app.api.analytics.ReportingSessionLocal", mock_session_cls):
             for query in forbidden_queries:
                 response = client.post(
                     "/analytics/query",
@@ -102,7 +102,7 @@ class TestAnalyticsSecurity:
         mock_session_cls = MagicMock()
         mock_session_cls.return_value = MockAnalyticsSession(db_session)
 
-        with patch("app.api.analytics.SessionLocal", mock_session_cls):
+        with patch("app.api.analytics.ReportingSessionLocal", mock_session_cls):
             response = client.post(
                 "/analytics/query",
                 headers=admin_headers,
@@ -0,0 +1,175 @@
+"""Tests for the process-wide taxonomy value registry."""
+from sqlalchemy import event, insert, update
+
+from app.core.taxonomy_registry import TaxonomyRegistry, taxonomy_registry
+from app.core.cache_generations import current_generation
+from app.models.cache_generation import CacheGeneration
+from app.models.taxonomy import Taxonomy, TaxonomyValue
+
+
+def _count_queries(db_session, fn):
+    counter = {"value": 0}
+
+    def before_cursor_execute(*_args, **_kwargs):
+        counter["value"] += 1
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return result, counter["value"]
+
+
+def _make_taxonomy(db_session, name, codes):
+    taxonomy = Taxonomy(name=name, is_system=False)
+    db_session.add(taxonomy)
+    db_session.flush()
+    values = {}
+    for index, code in enumerate(codes):
+        value = TaxonomyValue(taxonomy_id=taxonomy.taxonomy_id, code=code, label=code.title(), sort_order=index)
+        db_session.add(value)
+        values[code] = value
+    db_session.commit()
+    return taxonomy, values
+
+
+def test_lookups_are_served_from_memory(db_session):
+    _, values = _make_taxonomy(db_session, "Model Status", ["ACTIVE", "RETIRED"])
+    registry = TaxonomyRegistry()
+
+    assert registry.value_id(db_session, "Model Status", "ACTIVE") == values["ACTIVE"].value_id
+
+    result, queries = _count_queries(db_session, lambda: (
+        registry.value_id(db_session, "Model Status", "RETIRED"),
+        registry.value_ids(db_session, "Model Status", ["RETIRED", "ACTIVE"]),
+        registry.taxonomy_id(db_session, "Model Status"),
+    ))
+    assert queries == 0
+    assert result[0] == values["RETIRED"].value_id
+    assert result[1] == [values["RETIRED"].value_id, values["ACTIVE"].value_id]
+
+
+def test_same_code_in_different_taxonomies(db_session):
+    _, first = _make_taxonomy(db_session, "First", ["SHARED"])
+    _, second = _make_taxonomy(db_session, "Second", ["SHARED"])
+    registry = TaxonomyRegistry()
+
+    assert registry.value_id(db_session, "First", "SHARED") == first["SHARED"].value_id
+    assert registry.value_id(db_session, "Second", "SHARED") == second["SHARED"].value_id
+
+
+def test_missing_values_and_taxonomies(db_session):
+    _make_taxonomy(db_session, "Model Status", ["ACTIVE"])
+    registry = TaxonomyRegistry()
+
+    assert registry.value_id(db_session, "Model Status", "MISSING") is None
+    assert registry.taxonomy_id(db_session, "No Such Taxonomy") is None
+    assert registry.get_value(db_session, "Model Status", "MISSING") is None
+
+
+def test_values_added_after_load_are_found(db_session):
+    taxonomy, _ = _make_taxonomy(db_session, "Model Status", ["ACTIVE"])
+    registry = TaxonomyRegistry()
+    registry.value_id(db_session, "Model Status", "ACTIVE")
+
+    added = TaxonomyValue(taxonomy_id=taxonomy.taxonomy_id, code="PENDING", label="Pending", sort_order=5)
+    db_session.add(added)
+    db_session.commit()
+
+    assert registry.value_id(db_session, "Model Status", "PENDING") == added.value_id
+
+
+def test_get_value_detects_recoded_values(db_session):
+    _, values = _make_taxonomy(db_session, "Model Status", ["ACTIVE", "RETIRED"])
+    registry = TaxonomyRegistry()
+    assert registry.get_value(db_session, "Model Status", "RETIRED").value_id == values["RETIRED"].value_id
+
+    values["RETIRED"].code = "DECOMMISSIONED"
+    db_session.commit()
+
+    assert registry.get_value(db_session, "Model Status", "RETIRED") is None
+    assert registry.get_value(db_session, "Model Status", "DECOMMISSIONED").value_id == values["RETIRED"].value_id
+
+
+def test_expired_snapshot_is_reloaded(db_session):
+    _, values = _make_taxonomy(db_session, "Model Status", ["ACTIVE"])
+    registry = TaxonomyRegistry(ttl_seconds=-1)
+    registry.value_id(db_session, "Model Status", "ACTIVE")
+
+    _, queries = _count_queries(db_session, lambda: registry.value_id(db_session, "Model Status", "ACTIVE"))
+    assert queries == 1
+
+
+def test_taxonomy_endpoints_invalidate_registry(client, admin_headers, db_session):
+    taxonomy, values = _make_taxonomy(db_session, "Model Status", ["ACTIVE"])
+    assert taxonomy_registry.value_id(db_session, "Model Status", "ACTIVE") == values["ACTIVE"].value_id
+
+    response = client.post(
+        f"/taxonomies/{taxonomy.taxonomy_id}/values",
+        headers=admin_headers,
+        json={"code": "PENDING", "label": "Pending", "sort_order": 2},
+    )
+    assert response.status_code == 201
+    assert taxonomy_registry._snapshot is None
+
+    _, queries = _count_queries(
+        db_session, lambda: taxonomy_registry.value_id(db_session, "Model Status", "PENDING")
+    )
+    assert queries == 1  # single reload, no miss fallback
+
+
+def test_value_ids_fall_back_to_the_database(db_session):
+    taxonomy, values = _make_taxonomy(db_session, "Model Status", ["ACTIVE"])
+    registry = TaxonomyRegistry()
+    assert registry.value_ids(db_session, "Model Status", ["ACTIVE"]) == [values["ACTIVE"].value_id]
+
+    # Inserted outside the ORM (seed script, migration): no generation bump
+    db_session.execute(insert(TaxonomyValue).values(
+        taxonomy_id=taxonomy.taxonomy_id, code="PENDING", label="Pending", sort_order=2
+    ))
+    db_session.commit()
+    pending_id = db_session.query(TaxonomyValue.value_id).filter(TaxonomyValue.code == "PENDING").scalar()
+
+    assert registry.value_ids(db_session, "Model Status", ["PENDING", "ACTIVE"]) == [
+        pending_id, values["ACTIVE"].value_id
+    ]
+    # Codes that do not exist cost one existence query and no reload
+    _, queries = _count_queries(
+        db_session, lambda: registry.value_ids(db_session, "Model Status", ["UNKNOWN"])
+    )
+    assert queries == 1
+
+
+def test_orm_writes_bump_the_shared_generation(db_session):
+    taxonomy, _ = _make_taxonomy(db_session, "Model Status", ["ACTIVE"])
+    before = current_generation(db_session, "taxonomy")
+
+    db_session.add(TaxonomyValue(taxonomy_id=taxonomy.taxonomy_id, code="X", label="X", sort_order=1))
+    db_session.flush()
+    db_session.rollback()
+    assert current_generation(db_session, "taxonomy") == before
+
+    taxonomy.description = "changed"
+    db_session.commit()
+    assert current_generation(db_session, "taxonomy") == before + 1
+
+
+def test_generation_bumped_by_another_process_reloads(db_session):
+    _, values = _make_taxonomy(db_session, "Model Status", ["ACTIVE"])
+    registry = TaxonomyRegistry()
+    registry.value_id(db_session, "Model Status", "ACTIVE")
+
+    # Another worker recodes the value; this process never saw the write
+    db_session.execute(
+        update(TaxonomyValue).where(TaxonomyValue.value_id == values["ACTIVE"].value_id).values(code="LIVE")
+    )
+    db_session.execute(
+        update(CacheGeneration).where(CacheGeneration.name == "taxonomy")
+        .values(generation=CacheGeneration.generation + 1)
+    )
+    db_session.commit()
+
+    assert registry.value_id(db_session, "Model Status", "LIVE") == values["ACTIVE"].value_id
+    assert registry._snapshot.value_ids.get(("Model Status", "ACTIVE")) is None
@@ -0,0 +1,83 @@
+"""Tests for trend chart rendering and caching in the monitoring PDF report."""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from app.core import pdf_reports
+from app.core.pdf_reports import TrendChartCache, generate_trend_chart, render_trend_charts
+
+
+def _spec(values, yellow_max=1.5):
+    return {
+        "metric_name": "Trend: AUC",
+        "data_points": [
+            {
+                "period_end_date": date(2025, month, 28),
+                "numeric_value": value,
+                "calculated_outcome": "RED" if value > 2 else "GREEN",
+            }
+            for month, value in enumerate(values, start=1)
+        ],
+        "yellow_max": yellow_max,
+        "width": 6.2,
+        "height": 2.0,
+    }
+
+
+@pytest.fixture
+def chart_cache(monkeypatch):
+    cache = TrendChartCache(max_entries=16)
+    monkeypatch.setattr(pdf_reports, "_chart_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    calls = []
+    original = pdf_reports._render_chart_spec
+
+    def counting(spec):
+        calls.append(spec)
+        return original(spec)
+
+    monkeypatch.setattr(pdf_reports, "_render_chart_spec", counting)
+    return calls
+
+
+def test_generate_trend_chart_reuses_canvas():
+    first = generate_trend_chart(**_spec([1.0, 2.5, 1.2]))
+    second = generate_trend_chart(**_spec([1.0, 2.5, 1.2]))
+
+    assert first.startswith(b"\x89PNG")
+    assert first == second
+    assert generate_trend_chart("Empty", []) == b""
+
+
+def test_render_trend_charts_serves_repeats_from_cache(chart_cache, render_calls):
+    specs = {"1_10": _spec([1.0, 2.5]), "2_10": _spec([3.0, 1.0])}
+
+    first = render_trend_charts(specs)
+    second = render_trend_charts(specs)
+
+    assert first == second
+    assert len(render_calls) == 2
+
+    # Any change to the plotted data or thresholds is a cache miss
+    render_trend_charts({"1_10": _spec([1.0, 2.5], yellow_max=1.8)})
+    assert len(render_calls) == 3
+
+
+def test_parallel_render_matches_serial(chart_cache):
+    specs = {f"{index}_1": _spec([1.0, 2.0 + index, 1.5]) for index in range(4)}
+    serial = {chart_id: generate_trend_chart(**spec) for chart_id, spec in specs.items()}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert render_trend_charts(specs, executor=executor) == serial
+
+
+def test_disk_cache_is_shared_between_instances(tmp_path):
+    key = TrendChartCache.key("1_10", _spec([1.0, 2.0]))
+    TrendChartCache(max_entries=0, directory=str(tmp_path)).set(key, b"png-bytes")
+
+    assert TrendChartCache(max_entries=4, directory=str(tmp_path)).get(key) == b"png-bytes"
@@ -0,0 +1,176 @@
+"""Tests for the authenticated-user cache used by get_current_user."""
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event, update
+
+from app.core.cache_generations import current_generation
+from app.core.config import settings
+from app.core.deps import get_current_user
+from app.core.security import create_access_token
+from app.core.time import utc_now
+from app.core.user_cache import UserPrincipalCache, user_principal_cache
+from app.models.cache_generation import CacheGeneration
+from app.models.role import Role
+from app.models.user import LocalStatus, User
+
+
+def _credentials(user):
+    token = create_access_token(data={"sub": user.email})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_cached_user_skips_queries(db_session, session_factory, test_user):
+    credentials = _credentials(test_user)
+    session = session_factory()
+    try:
+        first = get_current_user(credentials, session)
+        first_role = first.role_code
+    finally:
+        session.close()
+
+    statements = []
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    session = session_factory()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        user = get_current_user(credentials, session)
+        assert user.user_id == test_user.user_id
+        assert user.role_code == first_role
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        session.close()
+
+    # The generation read by the first request is reused, so nothing reaches the database
+    assert statements == []
+
+
+def test_disabled_user_is_locked_out_immediately(client, auth_headers, db_session, test_user):
+    assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+    test_user.local_status = LocalStatus.DISABLED.value
+    db_session.commit()
+
+    response = client.get("/auth/me", headers=auth_headers)
+    assert response.status_code == 403
+
+
+def test_role_change_takes_effect_immediately(client, auth_headers, admin_headers, test_user):
+    assert client.get("/auth/me", headers=auth_headers).json()["role_code"] == "USER"
+
+    response = client.patch(
+        f"/auth/users/{test_user.user_id}", headers=admin_headers, json={"role_code": "ADMIN"}
+    )
+    assert response.status_code == 200
+
+    assert client.get("/auth/me", headers=auth_headers).json()["role_code"] == "ADMIN"
+
+
+def test_deleted_user_is_rejected(client, auth_headers, admin_headers, test_user):
+    assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+    response = client.delete(f"/auth/users/{test_user.user_id}", headers=admin_headers)
+    assert response.status_code == 204
+
+    assert client.get("/auth/me", headers=auth_headers).status_code == 401
+
+
+def test_cache_is_size_bounded_and_expires(db_session, test_user, admin_user):
+    cache = UserPrincipalCache(ttl_seconds=30, max_size=1)
+    cache.put(test_user.email, test_user, 0)
+    cache.put(admin_user.email, admin_user, 0)
+    assert cache.get(test_user.email, 0) is None
+    assert cache.get(admin_user.email, 0).user_id == admin_user.user_id
+
+    cache.get(admin_user.email, 0).expires_at = time.monotonic() - 1
+    assert cache.get(admin_user.email, 0) is None
+
+
+def test_attached_user_behaves_like_loaded_user(db_session, session_factory, test_user):
+    user_principal_cache.put(test_user.email, test_user, 0)
+    principal = user_principal_cache.get(test_user.email, 0)
+    assert principal.role_code == "USER"
+    assert principal.local_status == LocalStatus.ENABLED.value
+    assert "password_hash" not in principal.user_values
+
+    session = session_factory()
+    try:
+        user = principal.attach(session)
+        assert user in session
+        assert not session.dirty
+        assert user.role_code == "USER"
+        assert isinstance(user.role_ref, Role)
+        assert user.lob.lob_id == test_user.lob_id
+        # Uncached columns load on demand
+        assert user.password_hash == test_user.password_hash
+        assert session.get(User, test_user.user_id) is user
+    finally:
+        session.close()
+
+
+def test_entries_from_an_older_generation_are_ignored(db_session, test_user):
+    cache = UserPrincipalCache(ttl_seconds=30, max_size=10)
+    cache.put(test_user.email, test_user, 3)
+    assert cache.get(test_user.email, 3).user_id == test_user.user_id
+    assert cache.get(test_user.email, 4) is None
+
+
+def test_write_in_another_process_locks_user_out(db_session, session_factory, test_user, monkeypatch):
+    credentials = _credentials(test_user)
+    session = session_factory()
+    try:
+        get_current_user(credentials, session)
+    finally:
+        session.close()
+
+    # Another worker disables the account: the shared generation moves even
+    # though this process's cache was never told
+    db_session.execute(
+        update(User).where(User.user_id == test_user.user_id)
+        .values(local_status=LocalStatus.DISABLED.value)
+    )
+    generation = current_generation(db_session, "users")
+    db_session.merge(CacheGeneration(name="users", generation=generation + 1, updated_at=utc_now()))
+    db_session.commit()
+
+    # Within USER_CACHE_GENERATION_SECONDS this worker still trusts its last read
+    session = session_factory()
+    try:
+        assert get_current_user(credentials, session).user_id == test_user.user_id
+    finally:
+        session.close()
+
+    # Once that reading ages out, the lock-out applies
+    monkeypatch.setattr(settings, "USER_CACHE_GENERATION_SECONDS", 0)
+    session = session_factory()
+    try:
+        with pytest.raises(HTTPException) as excinfo:
+            get_current_user(credentials, session)
+        assert excinfo.value.status_code == 403
+    finally:
+        session.close()
+
+
+def test_only_principal_columns_bump_the_generation(db_session, test_user):
+    before = current_generation(db_session, "users")
+    test_user.full_name = "Renamed User"
+    db_session.commit()
+    assert current_generation(db_session, "users") == before
+
+    test_user.local_status = LocalStatus.DISABLED.value
+    db_session.commit()
+    assert current_generation(db_session, "users") == before + 1
+
+
+def test_rolled_back_write_keeps_the_cache(db_session, test_user):
+    before = current_generation(db_session, "users")
+    test_user.local_status = LocalStatus.DISABLED.value
+    db_session.flush()
+    db_session.rollback()
+    assert current_generation(db_session, "users") == before
@@ -0,0 +1,215 @@
+"""Tests for the materialized due-date columns on ValidationRequest."""
+from datetime import date, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from app.core.validation_due_dates import refresh_validation_due_dates
+from app.models.due_date_override import ModelDueDateOverride
+from app.models.model import Model
+from app.models.taxonomy import Taxonomy, TaxonomyValue
+from app.models.validation import (
+    ValidationPolicy,
+    ValidationRequest,
+    ValidationRequestModelVersion,
+)
+
+
+@pytest.fixture
+def tiers(db_session):
+    taxonomy = Taxonomy(name="Model Risk Tier")
+    db_session.add(taxonomy)
+    db_session.flush()
+    tier1 = TaxonomyValue(taxonomy_id=taxonomy.taxonomy_id, code="TIER_1", label="Tier 1", sort_order=1)
+    tier2 = TaxonomyValue(taxonomy_id=taxonomy.taxonomy_id, code="TIER_2", label="Tier 2", sort_order=2)
+    db_session.add_all([tier1, tier2])
+    db_session.flush()
+    db_session.add_all([
+        ValidationPolicy(risk_tier_id=tier1.value_id, frequency_months=12,
+                         grace_period_months=3, model_change_lead_time_days=90),
+        ValidationPolicy(risk_tier_id=tier2.value_id, frequency_months=24,
+                         grace_period_months=6, model_change_lead_time_days=120),
+    ])
+    db_session.commit()
+    return {"TIER_1": tier1, "TIER_2": tier2}
+
+
+@pytest.fixture
+def request_taxonomies(db_session):
+    status_tax = Taxonomy(name="Validation Request Status")
+    type_tax = Taxonomy(name="Validation Type")
+    db_session.add_all([status_tax, type_tax])
+    db_session.flush()
+    intake = TaxonomyValue(taxonomy_id=status_tax.taxonomy_id, code="INTAKE", label="Intake", sort_order=1)
+    comprehensive = TaxonomyValue(
+        taxonomy_id=type_tax.taxonomy_id, code="COMPREHENSIVE", label="Comprehensive", sort_order=1
+    )
+    db_session.add_all([intake, comprehensive])
+    db_session.commit()
+    return {"intake": intake, "comprehensive": comprehensive}
+
+
+@pytest.fixture
+def tiered_model(db_session, admin_user, usage_frequency, tiers):
+    model = Model(
+        model_name="Due Date Model",
+        owner_id=admin_user.user_id,
+        row_approval_status="approved",
+        usage_frequency_id=usage_frequency["daily"].value_id,
+        risk_tier_id=tiers["TIER_1"].value_id,
+    )
+    db_session.add(model)
+    db_session.commit()
+    return model
+
+
+def _create_request(db_session, admin_user, model, taxonomies, submission_due_date):
+    request = ValidationRequest(
+        requestor_id=admin_user.user_id,
+        validation_type_id=taxonomies["comprehensive"].value_id,
+        current_status_id=taxonomies["intake"].value_id,
+        priority_id=taxonomies["intake"].value_id,
+        target_completion_date=date.today() + timedelta(days=90),
+        submission_due_date=submission_due_date,
+    )
+    db_session.add(request)
+    db_session.flush()
+    db_session.add(ValidationRequestModelVersion(request_id=request.request_id, model_id=model.model_id))
+    db_session.commit()
+    return request
+
+
+def _stored(db_session, request_id):
+    db_session.expire_all()
+    return db_session.get(ValidationRequest, request_id)
+
+
+def test_columns_match_computed_properties(db_session, admin_user, tiered_model, request_taxonomies):
+    due = date.today() + timedelta(days=30)
+    request = _create_request(db_session, admin_user, tiered_model, request_taxonomies, due)
+
+    stored = _stored(db_session, request.request_id)
+    assert stored.due_dates_refreshed_at is not None
+    assert stored.effective_submission_due_date == due
+    assert stored.grace_period_end_date == due + relativedelta(months=3)
+    assert stored.validation_due_date == due + relativedelta(months=3) + timedelta(days=90)
+    assert stored.lead_time_days == 90
+    assert stored.grace_period_end_date == stored.submission_grace_period_end
+    assert stored.validation_due_date == stored.model_validation_due_date
+
+
+def test_override_refreshes_effective_due_date(db_session, admin_user, tiered_model, request_taxonomies):
+    due = date.today() + timedelta(days=60)
+    request = _create_request(db_session, admin_user, tiered_model, request_taxonomies, due)
+
+    override_date = date.today() + timedelta(days=10)
+    db_session.add(ModelDueDateOverride(
+        model_id=tiered_model.model_id,
+        override_type="ONE_TIME",
+        target_scope="CURRENT_REQUEST",
+        override_date=override_date,
+        original_calculated_date=due,
+        reason="Accelerated review",
+        created_by_user_id=admin_user.user_id,
+        is_active=True,
+    ))
+    db_session.commit()
+
+    stored = _stored(db_session, request.request_id)
+    assert stored.effective_submission_due_date == override_date
+    assert stored.grace_period_end_date == override_date + relativedelta(months=3)
+
+
+def test_policy_and_risk_tier_changes_refresh(db_session, admin_user, tiered_model, request_taxonomies, tiers):
+    due = date.today() + timedelta(days=30)
+    request = _create_request(db_session, admin_user, tiered_model, request_taxonomies, due)
+
+    policy = db_session.query(ValidationPolicy).filter(
+        ValidationPolicy.risk_tier_id == tiers["TIER_1"].value_id
+    ).one()
+    policy.model_change_lead_time_days = 45
+    db_session.commit()
+    assert _stored(db_session, request.request_id).lead_time_days == 45
+
+    tiered_model.risk_tier_id = tiers["TIER_2"].value_id
+    db_session.commit()
+    stored = _stored(db_session, request.request_id)
+    assert stored.lead_time_days == 120
+    assert stored.grace_period_end_date == due + relativedelta(months=6)
+
+
+def test_policy_change_only_refreshes_its_tier(db_session, admin_user, tiered_model, request_taxonomies, tiers):
+    request = _create_request(
+        db_session, admin_user, tiered_model, request_taxonomies, date.today() + timedelta(days=30)
+    )
+    refreshed_at = _stored(db_session, request.request_id).due_dates_refreshed_at
+
+    other_policy = db_session.query(ValidationPolicy).filter(
+        ValidationPolicy.risk_tier_id == tiers["TIER_2"].value_id
+    ).one()
+    other_policy.model_change_lead_time_days = 30
+    db_session.commit()
+
+    assert _stored(db_session, request.request_id).due_dates_refreshed_at == refreshed_at
+
+
+def test_refresh_updates_loaded_instances_in_place(db_session, admin_user, tiered_model, request_taxonomies, tiers):
+    request = _create_request(
+        db_session, admin_user, tiered_model, request_taxonomies, date.today() + timedelta(days=30)
+    )
+    links = request.model_versions_assoc
+    status = request.current_status
+
+    policy = db_session.query(ValidationPolicy).filter(
+        ValidationPolicy.risk_tier_id == tiers["TIER_1"].value_id
+    ).one()
+    policy.model_change_lead_time_days = 45
+    db_session.flush()
+
+    # New value without a reload; loaded relationships are left alone
+    assert request.lead_time_days == 45
+    assert request.model_versions_assoc is links
+    assert request.current_status is status
+    db_session.commit()
+
+
+def test_refresh_does_not_touch_updated_at(db_session, admin_user, tiered_model, request_taxonomies):
+    request = _create_request(
+        db_session, admin_user, tiered_model, request_taxonomies, date.today() + timedelta(days=30)
+    )
+    updated_at = _stored(db_session, request.request_id).updated_at
+
+    assert refresh_validation_due_dates(db_session, [request.request_id]) == 1
+    db_session.commit()
+    assert _stored(db_session, request.request_id).updated_at == updated_at
+
+
+def test_overdue_validations_dashboard_uses_columns(
+    client, admin_headers, db_session, admin_user, tiered_model, request_taxonomies
+):
+    overdue = _create_request(
+        db_session, admin_user, tiered_model, request_taxonomies, date.today() - timedelta(days=400)
+    )
+    _create_request(
+        db_session, admin_user, tiered_model, request_taxonomies, date.today() + timedelta(days=30)
+    )
+
+    response = client.get("/validation-workflow/dashboard/overdue-validations", headers=admin_headers)
+    assert response.status_code == 200
+    assert [row["request_id"] for row in response.json()] == [overdue.request_id]
+
+
+def test_unmaterialized_rows_are_still_reported(
+    client, admin_headers, db_session, admin_user, tiered_model, request_taxonomies
+):
+    overdue = _create_request(
+        db_session, admin_user, tiered_model, request_taxonomies, date.today() - timedelta(days=400)
+    )
+    db_session.query(ValidationRequest).filter(
+        ValidationRequest.request_id == overdue.request_id
+    ).update({"due_dates_refreshed_at": None, "validation_due_date": None}, synchronize_session=False)
+    db_session.commit()
+
+    response = client.get("/validation-workflow/dashboard/overdue-validations", headers=admin_headers)
+    assert response.status_code == 200
+    assert [row["request_id"] for row in response.json()] == [overdue.request_id]
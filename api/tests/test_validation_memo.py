@@ -0,0 +1,124 @@
+"""Tests for the session-scoped validation lookup memo."""
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.validation_memo import get_validation_memo, prefetch_validation_lookups
+from app.models.due_date_override import ModelDueDateOverride
+from app.models.model import Model
+from app.models.taxonomy import Taxonomy, TaxonomyValue
+from app.models.validation import (
+    ValidationPolicy,
+    ValidationRequest,
+    ValidationRequestModelVersion,
+)
+
+
+@contextmanager
+def count_queries(engine):
+    counter = {"value": 0}
+
+    def before_cursor_execute(*_args, **_kwargs):
+        counter["value"] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def requests_with_models(db_session, admin_user, usage_frequency):
+    tier_tax = Taxonomy(name="Model Risk Tier")
+    status_tax = Taxonomy(name="Validation Request Status")
+    type_tax = Taxonomy(name="Validation Type")
+    db_session.add_all([tier_tax, status_tax, type_tax])
+    db_session.flush()
+    tier = TaxonomyValue(taxonomy_id=tier_tax.taxonomy_id, code="TIER_1", label="Tier 1", sort_order=1)
+    intake = TaxonomyValue(taxonomy_id=status_tax.taxonomy_id, code="INTAKE", label="Intake", sort_order=1)
+    comprehensive = TaxonomyValue(
+        taxonomy_id=type_tax.taxonomy_id, code="COMPREHENSIVE", label="Comprehensive", sort_order=1
+    )
+    db_session.add_all([tier, intake, comprehensive])
+    db_session.flush()
+    db_session.add(ValidationPolicy(
+        risk_tier_id=tier.value_id, frequency_months=12, grace_period_months=3, model_change_lead_time_days=90
+    ))
+
+    requests = []
+    for index in range(5):
+        model = Model(
+            model_name=f"Memo Model {index}",
+            owner_id=admin_user.user_id,
+            row_approval_status="approved",
+            usage_frequency_id=usage_frequency["daily"].value_id,
+            risk_tier_id=tier.value_id,
+        )
+        db_session.add(model)
+        db_session.flush()
+        request = ValidationRequest(
+            requestor_id=admin_user.user_id,
+            validation_type_id=comprehensive.value_id,
+            current_status_id=intake.value_id,
+            priority_id=intake.value_id,
+            target_completion_date=date.today() + timedelta(days=90),
+            submission_due_date=date.today() + timedelta(days=30 + index),
+        )
+        db_session.add(request)
+        db_session.flush()
+        db_session.add(ValidationRequestModelVersion(request_id=request.request_id, model_id=model.model_id))
+        requests.append(request)
+    db_session.commit()
+    return requests
+
+
+def _load(db_session, requests):
+    from sqlalchemy.orm import selectinload
+    return db_session.query(ValidationRequest).options(
+        selectinload(ValidationRequest.model_versions_assoc).selectinload(ValidationRequestModelVersion.model)
+    ).filter(ValidationRequest.request_id.in_([r.request_id for r in requests])).all()
+
+
+def test_prefetched_properties_issue_no_lookup_queries(db_session, requests_with_models):
+    loaded = _load(db_session, requests_with_models)
+    prefetch_validation_lookups(db_session, [r.request_id for r in loaded])
+
+    with count_queries(db_session.get_bind()) as counter:
+        for request in loaded:
+            assert request.submission_grace_period_end is not None
+            assert request.model_validation_due_date is not None
+            assert request.applicable_lead_time_days == 90
+            assert request.residual_risk is None
+
+    assert counter["value"] == 0
+
+
+def test_unflushed_override_discards_memo(db_session, requests_with_models, admin_user):
+    request = _load(db_session, requests_with_models)[0]
+    memo = get_validation_memo(db_session)
+    model_id = request.model_versions_assoc[0].model_id
+    assert request.get_submission_due_date() == request.submission_due_date
+
+    override_date = date.today() + timedelta(days=5)
+    db_session.add(ModelDueDateOverride(
+        model_id=model_id,
+        override_type="ONE_TIME",
+        target_scope="CURRENT_REQUEST",
+        override_date=override_date,
+        original_calculated_date=request.submission_due_date,
+        reason="Accelerated review",
+        created_by_user_id=admin_user.user_id,
+        is_active=True,
+    ))
+
+    assert request.get_submission_due_date() == override_date
+    assert get_validation_memo(db_session) is not memo
+
+
+def test_memo_is_dropped_on_commit(db_session, requests_with_models):
+    memo = get_validation_memo(db_session)
+    db_session.commit()
+    assert get_validation_memo(db_session) is not memo
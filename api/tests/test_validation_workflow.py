@@ -1774,6 +1774,62 @@ class TestDashboardEndpoints:
         assert validator_workload is not None
         assert validator_workload["active_assignments"] >= 1
 
+    def test_aging_report_days_in_status_and_terminal_filter(
+        self, client, admin_headers, db_session, sample_model, workflow_taxonomies
+    ):
+        """Days in status come from the latest entry into the current status; terminal requests are dropped."""
+        request_ids = []
+        for _ in range(2):
+            response = client.post(
+                "/validation-workflow/requests/",
+                headers=admin_headers,
+                json={
+                    "model_ids": [sample_model.model_id],
+                    "validation_type_id": workflow_taxonomies["type"]["initial"].value_id,
+                    "priority_id": workflow_taxonomies["priority"]["standard"].value_id,
+                    "target_completion_date": (date.today() - timedelta(days=1)).isoformat(),
+                }
+            )
+            request_ids.append(response.json()["request_id"])
+
+        aged, cancelled = (db_session.get(ValidationRequest, rid) for rid in request_ids)
+        now = utc_now()
+        aged.created_at = now - timedelta(days=30)
+        db_session.query(ValidationStatusHistory).filter(
+            ValidationStatusHistory.request_id == aged.request_id
+        ).delete()
+        db_session.add_all([
+            ValidationStatusHistory(
+                request_id=aged.request_id, new_status_id=aged.current_status_id,
+                changed_by_id=aged.requestor_id, changed_at=now - timedelta(days=20, hours=1)
+            ),
+            ValidationStatusHistory(
+                request_id=aged.request_id, new_status_id=aged.current_status_id,
+                changed_by_id=aged.requestor_id, changed_at=now - timedelta(days=7, hours=1)
+            ),
+        ])
+        cancelled.current_status_id = workflow_taxonomies["status"]["cancelled"].value_id
+        db_session.commit()
+
+        response = client.get("/validation-workflow/dashboard/aging", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [row["request_id"] for row in data] == [aged.request_id]
+        assert data[0]["days_in_status"] == 7
+        assert data[0]["model_names"] == [sample_model.model_name]
+        assert data[0]["current_status"] == "Intake"
+        assert data[0]["is_overdue"] is True
+
+    def test_workload_report_counts_only_active_assignments(
+        self, client, admin_headers, db_session, admin_user, validator_user, workflow_taxonomies
+    ):
+        """Validators without active work are listed with zero assignments."""
+        response = client.get("/validation-workflow/dashboard/workload", headers=admin_headers)
+        assert response.status_code == 200
+        data = {row["validator_id"]: row for row in response.json()}
+        assert data[validator_user.user_id]["active_assignments"] == 0
+        assert data[admin_user.user_id]["role"] == "Admin"
+
 
 class TestAuditLogging:
     """Test that validation workflow operations create audit logs."""
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 import os
 import sys
@@ -19,6 +18,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT / "api"))
 
 from app.core.security import get_password_hash  # noqa: E402
+from app.core.time import utc_now  # noqa: E402
 from app.core.roles import ROLE_CODE_TO_DISPLAY, RoleCode  # noqa: E402
 from app.models.base import Base  # noqa: E402
 from app.models.attestation import AttestationCycle, AttestationRecord  # noqa: E402
@@ -30,11 +30,19 @@ from app.models.region import Region  # noqa: E402
 from app.models.role import Role  # noqa: E402
 from app.models.taxonomy import Taxonomy, TaxonomyValue  # noqa: E402
 from app.models.user import User  # noqa: E402
-from app.api.kpi_report import get_kpi_report, _KPI_CACHE  # noqa: E402
+from app.models.validation import (  # noqa: E402
+    ValidationAssignment,
+    ValidationRequest,
+    ValidationRequestModelVersion,
+    ValidationStatusHistory,
+)
+from app.api.kpi_report import get_kpi_report  # noqa: E402
+from app.core.kpi_cache import get_kpi_cache  # noqa: E402
 from app.api.regional_compliance_report import (  # noqa: E402
     get_regional_deployment_compliance_report,
 )
 from app.api.attestations import list_cycles  # noqa: E402
+from app.api.validation_workflow import get_aging_report, get_workload_report  # noqa: E402
 
 
 @contextmanager
@@ -206,6 +214,49 @@ def seed_attestation_cycles(db, models: list[Model], user_id: int, cycles: int,
     db.commit()
 
 
+def seed_validation_requests(db, models: list[Model], user_id: int, count: int, history_per_request: int):
+    """Requests with status history and an assignment; every third one is APPROVED (terminal)."""
+    def value(taxonomy_name: str, code: str) -> TaxonomyValue:
+        return db.query(TaxonomyValue).join(Taxonomy).filter(
+            Taxonomy.name == taxonomy_name, TaxonomyValue.code == code
+        ).one()
+
+    val_type = value("Validation Type", "INITIAL")
+    priority = value("Validation Priority", "STANDARD")
+    intake = value("Validation Request Status", "INTAKE")
+    approved = value("Validation Request Status", "APPROVED")
+    now = utc_now()
+    for idx in range(count):
+        status = approved if idx % 3 == 0 else intake
+        request = ValidationRequest(
+            requestor_id=user_id,
+            validation_type_id=val_type.value_id,
+            priority_id=priority.value_id,
+            target_completion_date=date.today() + timedelta(days=(idx % 60) - 30),
+            current_status_id=status.value_id,
+            created_at=now - timedelta(days=365),
+        )
+        db.add(request)
+        db.flush()
+        db.add(ValidationRequestModelVersion(
+            request_id=request.request_id, model_id=models[idx % len(models)].model_id
+        ))
+        for step in range(history_per_request):
+            db.add(ValidationStatusHistory(
+                request_id=request.request_id,
+                old_status_id=intake.value_id,
+                new_status_id=status.value_id if step == history_per_request - 1 else intake.value_id,
+                changed_by_id=user_id,
+                changed_at=now - timedelta(days=(history_per_request - step) * 7 + idx % 7),
+            ))
+        db.add(ValidationAssignment(
+            request_id=request.request_id, validator_id=user_id, is_primary=True
+        ))
+        if idx % 500 == 0:
+            db.flush()
+    db.commit()
+
+
 def run_report(engine, session_factory, run_fn, runs: int):
     timings = []
     query_counts = []
@@ -236,6 +287,8 @@ def main() -> int:
     parser.add_argument("--regions", type=int, default=5, help="Number of regions to seed.")
     parser.add_argument("--attestation-cycles", type=int, default=2000, help="Number of attestation cycles to seed.")
     parser.add_argument("--records-per-cycle", type=int, default=10, help="Attestation records per cycle.")
+    parser.add_argument("--validation-requests", type=int, default=5000, help="Validation requests to seed.")
+    parser.add_argument("--history-per-request", type=int, default=5, help="Status history rows per request.")
     parser.add_argument("--runs", type=int, default=5, help="Runs per report.")
     args = parser.parse_args()
 
@@ -271,6 +324,9 @@ def main() -> int:
             models = seed_models(db, args.models, admin_user.user_id, usage_value.value_id)
             seed_versions_and_deployments(db, models, regions, admin_user.user_id)
             seed_attestation_cycles(db, models, admin_user.user_id, args.attestation_cycles, args.records_per_cycle)
+            seed_validation_requests(
+                db, models, admin_user.user_id, args.validation_requests, args.history_per_request
+            )
         else:
             admin_user = db.query(User).first()
             if not admin_user:
@@ -283,19 +339,29 @@ def main() -> int:
 
     def compliance_runner(db):
         current_user = db.query(User).first()
-        return asyncio.run(get_regional_deployment_compliance_report(
+        return get_regional_deployment_compliance_report(
             db=db, current_user=current_user, region_code=None, model_id=None, team_id=None, only_deployed=True
-        ))
+        )
 
     def cycles_runner(db):
         current_user = db.query(User).first()
         return list_cycles(db=db, current_user=current_user, status=None, limit=100, offset=0)
 
-    _KPI_CACHE.clear()
+    def aging_runner(db):
+        current_user = db.query(User).first()
+        return get_aging_report(db=db, current_user=current_user)
+
+    def workload_runner(db):
+        current_user = db.query(User).first()
+        return get_workload_report(db=db, current_user=current_user)
+
+    get_kpi_cache().clear()
     kpi_uncached = run_report(engine, SessionLocal, kpi_runner, args.runs)
     kpi_cached = run_report(engine, SessionLocal, kpi_runner, args.runs)
     compliance_metrics = run_report(engine, SessionLocal, compliance_runner, args.runs)
     cycles_metrics = run_report(engine, SessionLocal, cycles_runner, args.runs)
+    aging_metrics = run_report(engine, SessionLocal, aging_runner, args.runs)
+    workload_metrics = run_report(engine, SessionLocal, workload_runner, args.runs)
 
     output = {
         "dataset": {
@@ -303,6 +369,8 @@ def main() -> int:
             "regions": args.regions,
             "attestation_cycles": args.attestation_cycles,
             "records_per_cycle": args.records_per_cycle,
+            "validation_requests": args.validation_requests,
+            "history_per_request": args.history_per_request,
         },
         "kpi_report": {
             "uncached": kpi_uncached,
@@ -310,6 +378,8 @@ def main() -> int:
         },
         "regional_compliance_report": compliance_metrics,
         "attestation_cycles": cycles_metrics,
+        "validation_aging": aging_metrics,
+        "validator_workload": workload_metrics,
     }
 
     print(json.dumps(output, indent=2))
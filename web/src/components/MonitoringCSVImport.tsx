@@ -34,6 +34,7 @@ interface ImportPreview {
         update_count: number;
         skip_count: number;
         error_count: number;
+        rows_truncated: boolean;
     };
 }
 
@@ -311,7 +312,7 @@ const MonitoringCSVImport: React.FC<MonitoringCSVImportProps> = ({
                             {preview.error_rows.length > 0 && (
                                 <div className="bg-red-50 border border-red-200 rounded-lg p-4">
                                     <h4 className="font-medium text-red-900 mb-2">
-                                        Rows with Errors ({preview.error_rows.length})
+                                        Rows with Errors ({preview.summary.error_count})
                                     </h4>
                                     <div className="max-h-40 overflow-y-auto">
                                         <table className="w-full text-sm">
@@ -342,7 +343,7 @@ const MonitoringCSVImport: React.FC<MonitoringCSVImportProps> = ({
                             {preview.valid_rows.length > 0 && (
                                 <div>
                                     <h4 className="font-medium text-gray-900 mb-2">
-                                        Preview ({preview.valid_rows.length} valid rows)
+                                        Preview ({preview.summary.create_count + preview.summary.update_count} valid rows)
                                     </h4>
                                     <div className="max-h-60 overflow-y-auto border rounded-lg">
                                         <table className="w-full text-sm">
@@ -388,9 +389,9 @@ const MonitoringCSVImport: React.FC<MonitoringCSVImportProps> = ({
                                                 ))}
                                             </tbody>
                                         </table>
-                                        {preview.valid_rows.length > 50 && (
+                                        {preview.summary.create_count + preview.summary.update_count > 50 && (
                                             <div className="py-2 px-3 text-center text-sm text-gray-500 bg-gray-50">
-                                                ... and {preview.valid_rows.length - 50} more rows
+                                                ... and {preview.summary.create_count + preview.summary.update_count - 50} more rows
                                             </div>
                                         )}
                                     </div>
@@ -432,6 +433,9 @@ const MonitoringCSVImport: React.FC<MonitoringCSVImportProps> = ({
                                                 {result.error_messages.map((msg, i) => (
                                                     <li key={i}>• {msg}</li>
                                                 ))}
+                                                {result.errors > result.error_messages.length && (
+                                                    <li>... and {result.errors - result.error_messages.length} more errors</li>
+                                                )}
                                             </ul>
                                         </div>
                                     )}
@@ -480,7 +484,7 @@ const MonitoringCSVImport: React.FC<MonitoringCSVImportProps> = ({
                                 className="px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 disabled:opacity-50 flex items-center gap-2"
                             >
                                 {loading && <Spinner />}
-                                Import {preview.valid_rows.length} Results
+                                Import {preview.summary.create_count + preview.summary.update_count} Results
                             </button>
                         )}
 
@@ -285,6 +285,14 @@ interface ActivityTimelineItem {
     icon: string;
 }
 
+interface ActivityTimelineResponse {
+    model_id: number;
+    model_name: string;
+    activities: ActivityTimelineItem[];
+    page_count: number; // activities on this page, not the model's total
+    next_cursor: string | null;
+}
+
 interface NameHistoryItem {
     history_id: number;
     model_id: number;
@@ -533,6 +541,9 @@ export default function ModelDetailsPage() {
     const [submittingApproval, setSubmittingApproval] = useState(false);
     const [activities, setActivities] = useState<ActivityTimelineItem[]>([]);
     const [activitiesLoading, setActivitiesLoading] = useState(false);
+    const [activitiesCursor, setActivitiesCursor] = useState<string | null>(null);
+    // Set once older pages are loaded, so polling does not drop them
+    const activitiesExpandedRef = useRef(false);
     const [editError, setEditError] = useState<string | null>(null);
     const [pendingEditSuccess, setPendingEditSuccess] = useState<string | null>(null);
     const [overdueCommentary, setOverdueCommentary] = useState<CurrentOverdueCommentaryResponse | null>(null);
@@ -608,7 +619,9 @@ export default function ModelDetailsPage() {
     useEffect(() => {
         if (activeTab === 'activity') {
             fetchActivities();
-            const interval = setInterval(fetchActivities, 30000); // Poll every 30 seconds
+            const interval = setInterval(() => {
+                if (!activitiesExpandedRef.current) fetchActivities();
+            }, 30000); // Poll every 30 seconds
             return () => clearInterval(interval);
         }
         if (activeTab === 'recommendations') {
@@ -835,8 +848,27 @@ export default function ModelDetailsPage() {
         if (!id) return;
         setActivitiesLoading(true);
         try {
-            const response = await api.get(`/models/${id}/activity-timeline`);
+            const response = await api.get<ActivityTimelineResponse>(`/models/${id}/activity-timeline`);
             setActivities(response.data.activities);
+            setActivitiesCursor(response.data.next_cursor);
+            activitiesExpandedRef.current = false;
+        } catch (error) {
+            console.error('Failed to fetch activities:', error);
+        } finally {
+            setActivitiesLoading(false);
+        }
+    };
+
+    const loadMoreActivities = async () => {
+        if (!id || !activitiesCursor) return;
+        setActivitiesLoading(true);
+        try {
+            const response = await api.get<ActivityTimelineResponse>(`/models/${id}/activity-timeline`, {
+                params: { cursor: activitiesCursor }
+            });
+            setActivities(prev => [...prev, ...response.data.activities]);
+            setActivitiesCursor(response.data.next_cursor);
+            activitiesExpandedRef.current = true;
         } catch (error) {
             console.error('Failed to fetch activities:', error);
         } finally {
@@ -4453,6 +4485,17 @@ export default function ModelDetailsPage() {
                                     </div>
                                 </div>
                             ))}
+                            {activitiesCursor && (
+                                <div className="text-center pt-2">
+                                    <button
+                                        onClick={loadMoreActivities}
+                                        disabled={activitiesLoading}
+                                        className="text-sm text-blue-600 hover:text-blue-800 disabled:opacity-50"
+                                    >
+                                        {activitiesLoading ? 'Loading...' : 'Load older activity'}
+                                    </button>
+                                </div>
+                            )}
                         </div>
                     )}
                 </div>